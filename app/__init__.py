@@ -8,10 +8,16 @@ load_dotenv()
 def create_app():
     app = Flask(__name__)
 
+    from app.utils.json_provider import RowJSONProvider
+
+    app.json = RowJSONProvider(app)
+
     app.config["ENV"] = os.getenv("FLASK_ENV", "production")
     app.config["DEBUG"] = app.config["ENV"] == "development"
 
     from app.routes import home_bp
+    from app.routes import metrics_bp
+    from app.routes import debug_bp
     from app.routes import assignment_bp
     from app.routes import course_bp
     from app.routes import course_schedule_bp
@@ -24,6 +30,8 @@ def create_app():
 
     blueprints = [
         home_bp,
+        metrics_bp,
+        debug_bp,
         assignment_bp,
         course_bp,
         course_schedule_bp,
@@ -37,4 +45,27 @@ def create_app():
     for blueprint in blueprints:
         app.register_blueprint(blueprint)
 
+    from app.utils import (
+        init_query_stats,
+        init_read_routing,
+        init_metrics,
+        init_server_timing,
+        init_request_profiler,
+        init_route_allocations,
+        init_tracing,
+        init_traffic_capture,
+        init_admission_control,
+    )
+
+    init_tracing(app)
+    init_query_stats(app)
+    init_read_routing(app)
+    init_metrics(app)
+    init_server_timing(app)
+    init_request_profiler(app)
+    init_route_allocations(app)
+    init_traffic_capture(app)
+    # Last, so that shed requests still show up in metrics and traffic capture
+    init_admission_control(app)
+
     return app
@@ -0,0 +1,44 @@
+"""
+Optional asyncio stack: the API served over ASGI (see asgi.py).
+
+create_asgi_app() serves the same resource routes and response bodies as
+the Flask app, but every database round trip is awaited on an
+AsyncDatabase pool, so one process keeps many slow requests in flight
+instead of one per worker. The debug and metrics endpoints and the
+per-request instrumentation (Server-Timing, tracing, traffic capture) are
+only available on the Flask app. A request whose client disconnects is
+canceled together with its query (CancelOnDisconnect).
+"""
+
+from contextlib import asynccontextmanager
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.routing import Route
+from db.async_database import AsyncDatabase
+from .disconnect import CancelOnDisconnect
+from .entities import ENTITIES
+from .models import AsyncModel
+from .routes import entity_routes, index
+
+
+def create_asgi_app(db=None):
+    """db defaults to an AsyncDatabase with the usual connection settings."""
+    db = AsyncDatabase() if db is None else db
+
+    @asynccontextmanager
+    async def lifespan(app):
+        await db.open()
+        try:
+            yield
+        finally:
+            await db.close()
+
+    routes = [Route("/", index)]
+    for entity in ENTITIES:
+        routes += entity_routes(entity, AsyncModel(db, entity.table))
+
+    app = Starlette(
+        routes=routes, middleware=[Middleware(CancelOnDisconnect)], lifespan=lifespan
+    )
+    app.state.db = db
+    return app
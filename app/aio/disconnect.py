@@ -0,0 +1,54 @@
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class CancelOnDisconnect:
+    """
+    ASGI middleware: cancel a request's handler when the client disconnects
+    before the response has started. psycopg cancels the statement the
+    handler was awaiting on the server too, so its connection goes back to
+    the pool instead of finishing work nobody will read.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # The watcher reads every message; the app gets them from the queue
+        messages = asyncio.Queue()
+        started = False
+        disconnected = False
+
+        async def send_response(message):
+            nonlocal started
+            started = True
+            await send(message)
+
+        handler = asyncio.create_task(self.app(scope, messages.get, send_response))
+
+        async def watch():
+            nonlocal disconnected
+            while True:
+                message = await receive()
+                await messages.put(message)
+                if message["type"] == "http.disconnect":
+                    if not started:
+                        disconnected = True
+                        handler.cancel()
+                    return
+
+        watcher = asyncio.create_task(watch())
+        try:
+            await handler
+        except asyncio.CancelledError:
+            if not disconnected:
+                raise  # this request itself is being cancelled
+            logger.info(f"Client disconnected, canceled {scope['path']}")
+        finally:
+            watcher.cancel()
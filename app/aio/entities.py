@@ -0,0 +1,72 @@
+from app.utils import (
+    assignment_dict_to_row,
+    course_dict_to_row,
+    course_schedule_dict_to_row,
+    department_dict_to_row,
+    enrollment_dict_to_row,
+    instructor_dict_to_row,
+    program_dict_to_row,
+    student_dict_to_row,
+    term_dict_to_row,
+)
+
+
+class Entity:
+    """Names, messages and row conversion for one resource of the API."""
+
+    __slots__ = ("name", "table", "label", "plural", "to_row")
+
+    def __init__(self, name, table, label, plural, to_row):
+        self.name = name  # "course_schedule"
+        self.table = table  # statement catalog prefix, "course_schedule"
+        self.label = label  # "Course schedule", used in messages
+        self.plural = plural  # "course schedules", used in messages
+        self.to_row = to_row  # <name>_dict_to_row
+
+    @property
+    def path(self):
+        return f"/{self.name}s"
+
+
+# Mirrors the Flask blueprints in app/routes
+ENTITIES = [
+    Entity(
+        "assignment",
+        "assignments",
+        "Assignment",
+        "assignments",
+        assignment_dict_to_row,
+    ),
+    Entity("course", "courses", "Course", "courses", course_dict_to_row),
+    Entity(
+        "course_schedule",
+        "course_schedule",
+        "Course schedule",
+        "course schedules",
+        course_schedule_dict_to_row,
+    ),
+    Entity(
+        "department",
+        "departments",
+        "Department",
+        "departments",
+        department_dict_to_row,
+    ),
+    Entity(
+        "enrollment",
+        "enrollments",
+        "Enrollment",
+        "enrollments",
+        enrollment_dict_to_row,
+    ),
+    Entity(
+        "instructor",
+        "instructors",
+        "Instructor",
+        "instructors",
+        instructor_dict_to_row,
+    ),
+    Entity("program", "programs", "Program", "programs", program_dict_to_row),
+    Entity("student", "students", "Student", "students", student_dict_to_row),
+    Entity("term", "terms", "Term", "terms", term_dict_to_row),
+]
@@ -0,0 +1,81 @@
+"""
+Async variants of the app.models functions.
+
+Every model module declares the same statements under <table>_<operation>
+names, so one AsyncModel per table covers its <entity>_db_* functions:
+AsyncModel(db, "students").read_by_ids(ids) is the coroutine version of
+student_db_read_by_ids(ids), with the same arguments and return values.
+"""
+
+import app.models  # noqa: F401 - declares the statement catalog
+from db.db_utils import handle_insert_result, handle_returned_ids, to_column_arrays
+from db.statements import get_statement
+
+
+class AsyncModel:
+    __slots__ = ("db", "table")
+
+    def __init__(self, db, table):
+        self.db = db  # db.async_database.AsyncDatabase
+        self.table = table
+
+    def _statement(self, operation):
+        return get_statement(f"{self.table}_{operation}")
+
+    async def read_all(self, active_only=False):
+        operation = "read_all_active" if active_only else "read_all"
+        result = await self.db.execute_query(self._statement(operation))
+        return result if result else []
+
+    async def read_by_id(self, entity_id):
+        result = await self.db.execute_query(
+            self._statement("read_by_id"), (entity_id,)
+        )
+        return result[0] if result else None
+
+    async def read_by_ids(self, entity_ids):
+        if not entity_ids:
+            return []
+        result = await self.db.execute_query(
+            self._statement("read_by_ids"), (list(entity_ids),)
+        )
+        return result if result else []
+
+    async def insert(self, row):
+        result = await self.db.execute_query(self._statement("insert"), row)
+        return handle_insert_result(result)
+
+    async def update(self, entity_id, row):
+        cursor = await self.db.execute_query(
+            self._statement("update"), row + (entity_id,)
+        )
+        return cursor.rowcount if cursor else 0
+
+    async def archive(self, entity_id):
+        cursor = await self.db.execute_query(self._statement("archive"), (entity_id,))
+        return cursor.rowcount if cursor else 0
+
+    async def insert_many(self, rows):
+        if not rows:
+            return []
+        result = await self.db.execute_query(
+            self._statement("insert_many"), to_column_arrays(rows)
+        )
+        return handle_returned_ids(result)
+
+    async def update_many(self, entity_ids, rows):
+        if not rows:
+            return []
+        values = [(entity_id, *row) for entity_id, row in zip(entity_ids, rows)]
+        result = await self.db.execute_query(
+            self._statement("update_many"), to_column_arrays(values)
+        )
+        return handle_returned_ids(result)
+
+    async def archive_many(self, entity_ids):
+        if not entity_ids:
+            return []
+        result = await self.db.execute_query(
+            self._statement("archive_many"), (list(entity_ids),)
+        )
+        return handle_returned_ids(result)
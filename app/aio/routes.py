@@ -0,0 +1,152 @@
+import json
+import logging
+from functools import wraps
+from starlette.responses import Response
+from starlette.routing import Route
+from app.utils import build_bulk_response
+from app.utils.handle_exceptions import QUERY_TIMEOUT_MESSAGE
+from db.deadlines import QueryTimeout
+from app.utils.json_provider import RowJSONProvider
+from . import services
+
+
+def json_response(payload, status_code=200):
+    """Encode like Flask's jsonify in production: sorted keys, compact, newline."""
+    body = json.dumps(
+        payload,
+        default=RowJSONProvider.default,
+        ensure_ascii=True,
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return Response(body + "\n", status_code, media_type="application/json")
+
+
+def api_response(data, message="Success", status_code=200):
+    return json_response({"message": message, "data": data}, status_code)
+
+
+def api_response_error(message, status_code=500):
+    payload = {"error": message} if isinstance(message, str) else message
+    return json_response(payload, status_code)
+
+
+def handle_exceptions_read(func):
+    @wraps(func)
+    async def wrapper(request):
+        try:
+            return await func(request)
+        except QueryTimeout as e:
+            logging.warning(f"Read operation timed out: {e}")
+            return api_response_error(QUERY_TIMEOUT_MESSAGE, 504)
+        except Exception as e:
+            logging.exception("Unexpected error in read operation.")
+            return api_response_error(f"Internal server error: {str(e)}.", 500)
+
+    return wrapper
+
+
+def handle_exceptions_write(func):
+    @wraps(func)
+    async def wrapper(request):
+        try:
+            return await func(request)
+        except KeyError as e:
+            logging.warning(f"Missing required field: {str(e)}")
+            return api_response_error(f"Missing required field: {str(e)}.", 400)
+        except QueryTimeout as e:
+            logging.warning(f"Write operation timed out: {e}")
+            return api_response_error(QUERY_TIMEOUT_MESSAGE, 504)
+        except Exception as e:
+            logging.exception("Unexpected error in write operation.")
+            return api_response_error(f"Internal server error: {str(e)}.", 500)
+
+    return wrapper
+
+
+async def index(request):
+    return json_response(
+        {
+            "message": "Welcome to the Student API",
+            "status": "OK",
+            "version": "1.0",
+            "available_routes": [
+                "/assignments",
+                "/course_schedule",
+                "/courses",
+                "/departments",
+                "/enrollments",
+                "/instructors",
+                "/programs",
+                "/students",
+                "/terms",
+            ],
+        }
+    )
+
+
+def entity_routes(entity, model):
+    """GET, GET by id, POST, PUT and PATCH for one entity, as in app/routes."""
+    label = entity.label
+    plural = entity.plural
+
+    def bulk_response(results, action, created=False):
+        payload, status_code = build_bulk_response(
+            success_list=results,
+            success_msg_single=f"{label} {action} successfully.",
+            success_msg_bulk=f"{{}} {plural} {action} successfully.",
+            created=created,
+        )
+        return json_response(payload, status_code)
+
+    @handle_exceptions_read
+    async def read_all(request):
+        active_only = request.query_params.get("active_only", "false").lower()
+        rows = await services.get_all(model, entity, active_only == "true")
+        return api_response(rows, f"{plural.capitalize()} fetched successfully.")
+
+    @handle_exceptions_read
+    async def read_one(request):
+        row = await services.get_by_id(model, request.path_params["entity_id"])
+        if row is None:
+            return api_response_error(f"{label} not found.", 404)
+        return api_response(row, f"{label} fetched successfully.")
+
+    @handle_exceptions_write
+    async def create(request):
+        results, error_data, status_code = await services.bulk_create(
+            model, entity, await request.json()
+        )
+        if error_data:
+            return api_response_error(error_data, status_code)
+        return bulk_response(results, "created", created=True)
+
+    @handle_exceptions_write
+    async def update(request):
+        results, error_data, status_code = await services.bulk_update(
+            model, entity, await request.json()
+        )
+        if error_data:
+            return api_response_error(error_data, status_code)
+        return bulk_response(results, "updated")
+
+    @handle_exceptions_write
+    async def archive(request):
+        payload = await request.json()
+        if not payload or "ids" not in payload:
+            raise KeyError("ids")
+
+        results, error_data, status_code = await services.bulk_archive(
+            model, entity, payload["ids"]
+        )
+        if error_data:
+            return api_response_error(error_data, status_code)
+        return bulk_response(results, "archived")
+
+    return [
+        Route(entity.path, read_all, methods=["GET"]),
+        Route(f"{entity.path}/{{entity_id:int}}", read_one, methods=["GET"]),
+        Route(entity.path, create, methods=["POST"]),
+        Route(entity.path, update, methods=["PUT"]),
+        Route(entity.path, archive, methods=["PATCH"]),
+    ]
@@ -0,0 +1,108 @@
+"""
+Async versions of the app.services functions.
+
+The bulk writes follow app.utils.service_helper step for step and share its
+validation, merging and result helpers, so only the awaiting of database
+calls differs: one *_many statement per request, falling back to row by row
+only when the batch fails on a bad row (ValueError).
+"""
+
+from app.utils import normalize_to_list
+from app.utils.service_helper import (
+    INSERT_FAILED_MSG,
+    archive_ids,
+    clean_item,
+    create_failure,
+    merge_updates,
+    record_result,
+    requested_ids,
+    rows_to_create,
+    split_by_result,
+)
+
+
+async def get_all(model, entity, active_only):
+    results = await model.read_all(active_only=active_only)
+    if results is None:
+        raise RuntimeError(f"Failed to fetch {entity.plural}.")
+    return results
+
+
+async def get_by_id(model, entity_id):
+    return await model.read_by_id(entity_id)
+
+
+async def bulk_create(model, entity, data):
+    items = normalize_to_list(data)
+    created_ids = []
+
+    rows, errors = rows_to_create(items, entity.to_row)
+    try:
+        created_ids = await model.insert_many(rows)
+    except ValueError:
+        for row in rows:
+            try:
+                new_id = await model.insert(row)
+                record_result(new_id, new_id, created_ids, errors, INSERT_FAILED_MSG)
+            except ValueError as e:
+                errors.append({"message": str(e)})
+
+    if not created_ids:
+        return [], create_failure(errors, f"No {entity.plural} were created."), 400
+
+    return await model.read_by_ids(created_ids), None, 201
+
+
+async def bulk_update(model, entity, data):
+    items = [clean_item(item) for item in normalize_to_list(data)]
+    not_updated_msg = f"{entity.label} ID {{id}} not updated."
+    updated_ids = []
+
+    update_ids = requested_ids(items)
+    existing_rows = await model.read_by_ids(update_ids) if update_ids else []
+    ids, rows, errors = merge_updates(
+        items,
+        existing_rows,
+        to_row_func=entity.to_row,
+        to_dict_func=dict,
+        missing_id_msg=f"Missing {entity.label.lower()} ID for update.",
+        not_found_msg=f"{entity.label} ID {{id}} not found.",
+    )
+
+    try:
+        changed = await model.update_many(ids, rows) if rows else []
+    except ValueError:
+        for entity_id, row in zip(ids, rows):
+            try:
+                updated = await model.update(entity_id, row)
+                record_result(entity_id, updated, updated_ids, errors, not_updated_msg)
+            except ValueError as e:
+                errors.append({"message": str(e)})
+    else:
+        updated_ids = split_by_result(ids, changed, errors, not_updated_msg)
+
+    if not updated_ids:
+        return [], errors, 400
+
+    updated_rows = await model.read_by_ids(updated_ids)
+    return updated_rows, errors if errors else None, 200
+
+
+async def bulk_archive(model, entity, ids):
+    unique_ids, errors = archive_ids(normalize_to_list(ids), int)
+    if errors:
+        return [], errors, 400
+
+    try:
+        archived = await model.archive_many(unique_ids)
+    except ValueError as e:
+        return [], [{"message": str(e)}], 422
+
+    not_found_msg = f"{entity.label} ID {{id}} not found or already archived."
+    archived_ids = split_by_result(unique_ids, archived, errors, not_found_msg)
+
+    if not archived_ids:
+        return [], errors, 422
+
+    archived_rows = await model.read_by_ids(archived_ids)
+    return archived_rows, errors if errors else None, 200
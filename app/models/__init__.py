@@ -5,6 +5,9 @@ from .course import (
     course_db_insert,
     course_db_update,
     course_db_archive,
+    course_db_insert_many,
+    course_db_update_many,
+    course_db_archive_many,
 )
 from .department import (
     department_db_read_all,
@@ -13,6 +16,9 @@ from .department import (
     department_db_insert,
     department_db_update,
     department_db_archive,
+    department_db_insert_many,
+    department_db_update_many,
+    department_db_archive_many,
 )
 
 from .instructor import (
@@ -22,6 +28,9 @@ from .instructor import (
     instructor_db_insert,
     instructor_db_update,
     instructor_db_archive,
+    instructor_db_insert_many,
+    instructor_db_update_many,
+    instructor_db_archive_many,
 )
 from .program import (
     program_db_read_all,
@@ -30,6 +39,9 @@ from .program import (
     program_db_insert,
     program_db_update,
     program_db_archive,
+    program_db_insert_many,
+    program_db_update_many,
+    program_db_archive_many,
 )
 from .student import (
     student_db_read_all,
@@ -38,6 +50,9 @@ from .student import (
     student_db_insert,
     student_db_update,
     student_db_archive,
+    student_db_insert_many,
+    student_db_update_many,
+    student_db_archive_many,
 )
 from .term import (
     term_db_read_all,
@@ -46,6 +61,9 @@ from .term import (
     term_db_insert,
     term_db_update,
     term_db_archive,
+    term_db_insert_many,
+    term_db_update_many,
+    term_db_archive_many,
 )
 
 from .enrollment import (
@@ -55,6 +73,9 @@ from .enrollment import (
     enrollment_db_insert,
     enrollment_db_update,
     enrollment_db_archive,
+    enrollment_db_insert_many,
+    enrollment_db_update_many,
+    enrollment_db_archive_many,
 )
 
 from .assignment import (
@@ -64,6 +85,9 @@ from .assignment import (
     assignment_db_insert,
     assignment_db_update,
     assignment_db_archive,
+    assignment_db_insert_many,
+    assignment_db_update_many,
+    assignment_db_archive_many,
 )
 
 from .course_schedule import (
@@ -73,4 +97,7 @@ from .course_schedule import (
     course_schedule_db_insert,
     course_schedule_db_update,
     course_schedule_db_archive,
+    course_schedule_db_insert_many,
+    course_schedule_db_update_many,
+    course_schedule_db_archive_many,
 )
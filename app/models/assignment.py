@@ -1,64 +1,137 @@
 from db.database import Database
 from db.db_utils import (
     get_insert_returning_query,
+    get_insert_many_returning_query,
+    get_update_many_returning_query,
     handle_insert_result,
+    handle_returned_ids,
+    to_column_arrays,
     get_archived_condition,
     BOOLEAN_TRUE,
 )
+from db.statements import declare_statement, FETCH_ALL
 
 db = Database()
 
+ASSIGNMENT_COLUMNS = ["instructor_id", "course_id"]
+ASSIGNMENT_COLUMN_TYPES = ["integer", "integer"]
+
+READ_ALL = declare_statement(
+    "assignments_read_all", "SELECT * FROM assignments;", FETCH_ALL
+)
+READ_ALL_ACTIVE = declare_statement(
+    "assignments_read_all_active",
+    f"SELECT * FROM assignments WHERE {get_archived_condition(False)};",
+    FETCH_ALL,
+)
+READ_BY_ID = declare_statement(
+    "assignments_read_by_id", "SELECT * FROM assignments WHERE id = %s;", FETCH_ALL
+)
+READ_BY_IDS = declare_statement(
+    "assignments_read_by_ids",
+    "SELECT * FROM assignments WHERE id = ANY(%s);",
+    FETCH_ALL,
+)
+INSERT = declare_statement(
+    "assignments_insert",
+    get_insert_returning_query("assignments", ASSIGNMENT_COLUMNS),
+    FETCH_ALL,
+)
+UPDATE = declare_statement(
+    "assignments_update",
+    f"""
+    UPDATE assignments
+    SET instructor_id = %s, course_id = %s, updated_at = CURRENT_TIMESTAMP
+    WHERE id = %s AND {get_archived_condition(False)};
+    """,
+)
+ARCHIVE = declare_statement(
+    "assignments_archive",
+    f"""
+    UPDATE assignments
+    SET is_archived = {BOOLEAN_TRUE}, updated_at = CURRENT_TIMESTAMP
+    WHERE id = %s AND {get_archived_condition(False)};
+    """,
+)
+INSERT_MANY = declare_statement(
+    "assignments_insert_many",
+    get_insert_many_returning_query(
+        "assignments", ASSIGNMENT_COLUMNS, ASSIGNMENT_COLUMN_TYPES
+    ),
+    FETCH_ALL,
+)
+UPDATE_MANY = declare_statement(
+    "assignments_update_many",
+    get_update_many_returning_query(
+        "assignments", ASSIGNMENT_COLUMNS, ASSIGNMENT_COLUMN_TYPES
+    ),
+    FETCH_ALL,
+)
+ARCHIVE_MANY = declare_statement(
+    "assignments_archive_many",
+    f"""
+    UPDATE assignments
+    SET is_archived = {BOOLEAN_TRUE}, updated_at = CURRENT_TIMESTAMP
+    WHERE id = ANY(%s) AND {get_archived_condition(False)}
+    RETURNING id;
+    """,
+    FETCH_ALL,
+)
+
 
 def assignment_db_read_all(active_only=False):
-    query = "SELECT * FROM assignments"
-    if active_only:
-        query += f" WHERE {get_archived_condition()}"
-    query += ";"
-    result = db.execute_query(query)
-    # Convert all rows to regular dicts for consistency
-    return [dict(row) for row in result] if result else []
+    result = db.execute_query(READ_ALL_ACTIVE if active_only else READ_ALL)
+    return result if result else []
 
 
 def assignment_db_read_by_id(assignment_id):
-    query = "SELECT * FROM assignments WHERE id = ?;"
-    result = db.execute_query(query, (assignment_id,))
-    return dict(result[0]) if result else None
+    result = db.execute_query(READ_BY_ID, (assignment_id,))
+    return result[0] if result else None
 
 
 def assignment_db_read_by_ids(assignment_ids):
     if not assignment_ids:
         return []
-    placeholders = ",".join("?" for _ in assignment_ids)
-    query = f"SELECT * FROM assignments WHERE id IN ({placeholders});"
-    result = db.execute_query(query, assignment_ids)
-    return [dict(row) for row in result] if result else []
+    result = db.execute_query(READ_BY_IDS, (list(assignment_ids),))
+    return result if result else []
 
 
 def assignment_db_insert(assignment_data):
-    columns = ["instructor_id", "course_id"]
-    query = get_insert_returning_query("assignments", columns)
-    cursor_or_result = db.execute_query(query, assignment_data)
+    cursor_or_result = db.execute_query(INSERT, assignment_data)
     return handle_insert_result(cursor_or_result)
 
 
 def assignment_db_update(assignment_id, assignment_data):
-    archived_condition = get_archived_condition(False)
-    query = f"""
-    UPDATE assignments
-    SET instructor_id = ?, course_id = ?, updated_at = CURRENT_TIMESTAMP
-    WHERE id = ? AND {archived_condition};
-    """
     values = assignment_data + (assignment_id,)
-    cursor = db.execute_query(query, values)
+    cursor = db.execute_query(UPDATE, values)
     return cursor.rowcount if cursor else 0
 
 
 def assignment_db_archive(assignment_id):
-    archived_condition_false = get_archived_condition(False)
-    query = f"""
-    UPDATE assignments
-    SET is_archived = {BOOLEAN_TRUE}, updated_at = CURRENT_TIMESTAMP
-    WHERE id = ? AND {archived_condition_false};
-    """
-    cursor = db.execute_query(query, (assignment_id,))
+    cursor = db.execute_query(ARCHIVE, (assignment_id,))
     return cursor.rowcount if cursor else 0
+
+
+def assignment_db_insert_many(assignment_rows):
+    if not assignment_rows:
+        return []
+    result = db.execute_query(INSERT_MANY, to_column_arrays(assignment_rows))
+    return handle_returned_ids(result)
+
+
+def assignment_db_update_many(assignment_ids, assignment_rows):
+    if not assignment_rows:
+        return []
+    values = [
+        (assignment_id, *row)
+        for assignment_id, row in zip(assignment_ids, assignment_rows)
+    ]
+    result = db.execute_query(UPDATE_MANY, to_column_arrays(values))
+    return handle_returned_ids(result)
+
+
+def assignment_db_archive_many(assignment_ids):
+    if not assignment_ids:
+        return []
+    result = db.execute_query(ARCHIVE_MANY, (list(assignment_ids),))
+    return handle_returned_ids(result)
@@ -1,64 +1,126 @@
 from db.database import Database
 from db.db_utils import (
     get_insert_returning_query,
+    get_insert_many_returning_query,
+    get_update_many_returning_query,
     handle_insert_result,
+    handle_returned_ids,
+    to_column_arrays,
     get_archived_condition,
     BOOLEAN_TRUE,
 )
+from db.statements import declare_statement, FETCH_ALL
 
 db = Database()
 
+COURSE_COLUMNS = ["title", "code", "term_id", "department_id"]
+COURSE_COLUMN_TYPES = ["text", "text", "integer", "integer"]
+
+READ_ALL = declare_statement("courses_read_all", "SELECT * FROM courses;", FETCH_ALL)
+READ_ALL_ACTIVE = declare_statement(
+    "courses_read_all_active",
+    f"SELECT * FROM courses WHERE {get_archived_condition(False)};",
+    FETCH_ALL,
+)
+READ_BY_ID = declare_statement(
+    "courses_read_by_id", "SELECT * FROM courses WHERE id = %s;", FETCH_ALL
+)
+READ_BY_IDS = declare_statement(
+    "courses_read_by_ids", "SELECT * FROM courses WHERE id = ANY(%s);", FETCH_ALL
+)
+INSERT = declare_statement(
+    "courses_insert",
+    get_insert_returning_query("courses", COURSE_COLUMNS),
+    FETCH_ALL,
+)
+UPDATE = declare_statement(
+    "courses_update",
+    f"""
+    UPDATE courses
+    SET title = %s, code = %s, term_id = %s, department_id = %s, updated_at = CURRENT_TIMESTAMP
+    WHERE id = %s AND {get_archived_condition(False)};
+    """,
+)
+ARCHIVE = declare_statement(
+    "courses_archive",
+    f"""
+    UPDATE courses
+    SET is_archived = {BOOLEAN_TRUE}, updated_at = CURRENT_TIMESTAMP
+    WHERE id = %s AND {get_archived_condition(False)};
+    """,
+)
+INSERT_MANY = declare_statement(
+    "courses_insert_many",
+    get_insert_many_returning_query("courses", COURSE_COLUMNS, COURSE_COLUMN_TYPES),
+    FETCH_ALL,
+)
+UPDATE_MANY = declare_statement(
+    "courses_update_many",
+    get_update_many_returning_query("courses", COURSE_COLUMNS, COURSE_COLUMN_TYPES),
+    FETCH_ALL,
+)
+ARCHIVE_MANY = declare_statement(
+    "courses_archive_many",
+    f"""
+    UPDATE courses
+    SET is_archived = {BOOLEAN_TRUE}, updated_at = CURRENT_TIMESTAMP
+    WHERE id = ANY(%s) AND {get_archived_condition(False)}
+    RETURNING id;
+    """,
+    FETCH_ALL,
+)
+
 
 def course_db_read_all(active_only=False):
-    query = "SELECT * FROM courses"
-    if active_only:
-        archived_condition = get_archived_condition(False)
-        query += f" WHERE {archived_condition}"
-    query += ";"
-    result = db.execute_query(query)
-    return [dict(row) for row in result] if result else []
+    result = db.execute_query(READ_ALL_ACTIVE if active_only else READ_ALL)
+    return result if result else []
 
 
 def course_db_read_by_id(course_id):
-    query = "SELECT * FROM courses WHERE id = %s;"
-    result = db.execute_query(query, (course_id,))
-    return dict(result[0]) if result else None
+    result = db.execute_query(READ_BY_ID, (course_id,))
+    return result[0] if result else None
 
 
 def course_db_read_by_ids(course_ids):
     if not course_ids:
         return []
-    placeholders = ",".join("%s" for _ in course_ids)
-    query = f"SELECT * FROM courses WHERE id IN ({placeholders});"
-    result = db.execute_query(query, course_ids)
-    return [dict(row) for row in result] if result else []
+    result = db.execute_query(READ_BY_IDS, (list(course_ids),))
+    return result if result else []
 
 
 def course_db_insert(course_data):
-    columns = ["title", "code", "term_id", "department_id"]
-    query = get_insert_returning_query("courses", columns)
-    cursor_or_result = db.execute_query(query, course_data)
+    cursor_or_result = db.execute_query(INSERT, course_data)
     return handle_insert_result(cursor_or_result)
 
 
 def course_db_update(course_id, course_data):
-    archived_condition = get_archived_condition(False)
-    query = f"""
-    UPDATE courses
-    SET title = %s, code = %s, term_id = %s, department_id = %s, updated_at = CURRENT_TIMESTAMP
-    WHERE id = %s AND {archived_condition};
-    """
     values = course_data + (course_id,)
-    cursor = db.execute_query(query, values)
+    cursor = db.execute_query(UPDATE, values)
     return cursor.rowcount if cursor else 0
 
 
 def course_db_archive(course_id):
-    archived_condition_false = get_archived_condition(False)
-    query = f"""
-    UPDATE courses
-    SET is_archived = {BOOLEAN_TRUE}, updated_at = CURRENT_TIMESTAMP
-    WHERE id = %s AND {archived_condition_false};
-    """
-    cursor = db.execute_query(query, (course_id,))
+    cursor = db.execute_query(ARCHIVE, (course_id,))
     return cursor.rowcount if cursor else 0
+
+
+def course_db_insert_many(course_rows):
+    if not course_rows:
+        return []
+    result = db.execute_query(INSERT_MANY, to_column_arrays(course_rows))
+    return handle_returned_ids(result)
+
+
+def course_db_update_many(course_ids, course_rows):
+    if not course_rows:
+        return []
+    values = [(course_id, *row) for course_id, row in zip(course_ids, course_rows)]
+    result = db.execute_query(UPDATE_MANY, to_column_arrays(values))
+    return handle_returned_ids(result)
+
+
+def course_db_archive_many(course_ids):
+    if not course_ids:
+        return []
+    result = db.execute_query(ARCHIVE_MANY, (list(course_ids),))
+    return handle_returned_ids(result)
@@ -1,64 +1,139 @@
 from db.database import Database
 from db.db_utils import (
     get_insert_returning_query,
+    get_insert_many_returning_query,
+    get_update_many_returning_query,
     handle_insert_result,
+    handle_returned_ids,
+    to_column_arrays,
     get_archived_condition,
     BOOLEAN_TRUE,
 )
+from db.statements import declare_statement, FETCH_ALL
 
 db = Database()
 
+COURSE_SCHEDULE_COLUMNS = ["course_id", "day", "time", "room"]
+COURSE_SCHEDULE_COLUMN_TYPES = ["integer", "text", "text", "text"]
+
+READ_ALL = declare_statement(
+    "course_schedule_read_all", "SELECT * FROM course_schedule;", FETCH_ALL
+)
+READ_ALL_ACTIVE = declare_statement(
+    "course_schedule_read_all_active",
+    f"SELECT * FROM course_schedule WHERE {get_archived_condition(False)};",
+    FETCH_ALL,
+)
+READ_BY_ID = declare_statement(
+    "course_schedule_read_by_id",
+    "SELECT * FROM course_schedule WHERE id = %s;",
+    FETCH_ALL,
+)
+READ_BY_IDS = declare_statement(
+    "course_schedule_read_by_ids",
+    "SELECT * FROM course_schedule WHERE id = ANY(%s);",
+    FETCH_ALL,
+)
+INSERT = declare_statement(
+    "course_schedule_insert",
+    get_insert_returning_query("course_schedule", COURSE_SCHEDULE_COLUMNS),
+    FETCH_ALL,
+)
+UPDATE = declare_statement(
+    "course_schedule_update",
+    f"""
+    UPDATE course_schedule
+    SET course_id = %s, day = %s, time = %s, room = %s, updated_at = CURRENT_TIMESTAMP
+    WHERE id = %s AND {get_archived_condition(False)};
+    """,
+)
+ARCHIVE = declare_statement(
+    "course_schedule_archive",
+    f"""
+    UPDATE course_schedule
+    SET is_archived = {BOOLEAN_TRUE}, updated_at = CURRENT_TIMESTAMP
+    WHERE id = %s AND {get_archived_condition(False)};
+    """,
+)
+INSERT_MANY = declare_statement(
+    "course_schedule_insert_many",
+    get_insert_many_returning_query(
+        "course_schedule", COURSE_SCHEDULE_COLUMNS, COURSE_SCHEDULE_COLUMN_TYPES
+    ),
+    FETCH_ALL,
+)
+UPDATE_MANY = declare_statement(
+    "course_schedule_update_many",
+    get_update_many_returning_query(
+        "course_schedule", COURSE_SCHEDULE_COLUMNS, COURSE_SCHEDULE_COLUMN_TYPES
+    ),
+    FETCH_ALL,
+)
+ARCHIVE_MANY = declare_statement(
+    "course_schedule_archive_many",
+    f"""
+    UPDATE course_schedule
+    SET is_archived = {BOOLEAN_TRUE}, updated_at = CURRENT_TIMESTAMP
+    WHERE id = ANY(%s) AND {get_archived_condition(False)}
+    RETURNING id;
+    """,
+    FETCH_ALL,
+)
+
 
 def course_schedule_db_read_all(active_only=False):
-    query = "SELECT * FROM course_schedule"
-    if active_only:
-        archived_condition = get_archived_condition(False)
-        query += f" WHERE {archived_condition}"
-    query += ";"
-    result = db.execute_query(query)
-    return [dict(row) for row in result] if result else []
+    result = db.execute_query(READ_ALL_ACTIVE if active_only else READ_ALL)
+    return result if result else []
 
 
 def course_schedule_db_read_by_id(course_schedule_id):
-    query = "SELECT * FROM course_schedule WHERE id = %s;"
-    result = db.execute_query(query, (course_schedule_id,))
-    return dict(result[0]) if result else None
+    result = db.execute_query(READ_BY_ID, (course_schedule_id,))
+    return result[0] if result else None
 
 
 def course_schedule_db_read_by_ids(course_schedule_ids):
     if not course_schedule_ids:
         return []
-    placeholders = ",".join("%s" for _ in course_schedule_ids)
-    query = f"SELECT * FROM course_schedule WHERE id IN ({placeholders});"
-    result = db.execute_query(query, course_schedule_ids)
-    return [dict(row) for row in result] if result else []
+    result = db.execute_query(READ_BY_IDS, (list(course_schedule_ids),))
+    return result if result else []
 
 
 def course_schedule_db_insert(course_schedule_data):
-    columns = ["course_id", "day", "time", "room"]
-    query = get_insert_returning_query("course_schedule", columns)
-    cursor_or_result = db.execute_query(query, course_schedule_data)
+    cursor_or_result = db.execute_query(INSERT, course_schedule_data)
     return handle_insert_result(cursor_or_result)
 
 
 def course_schedule_db_update(course_schedule_id, course_schedule_data):
-    archived_condition = get_archived_condition(False)
-    query = f"""
-    UPDATE course_schedule
-    SET course_id = %s, day = %s, time = %s, room = %s, updated_at = CURRENT_TIMESTAMP
-    WHERE id = %s AND {archived_condition};
-    """
     values = course_schedule_data + (course_schedule_id,)
-    cursor = db.execute_query(query, values)
+    cursor = db.execute_query(UPDATE, values)
     return cursor.rowcount if cursor else 0
 
 
 def course_schedule_db_archive(course_schedule_id):
-    archived_condition_false = get_archived_condition(False)
-    query = f"""
-    UPDATE course_schedule
-    SET is_archived = {BOOLEAN_TRUE}, updated_at = CURRENT_TIMESTAMP
-    WHERE id = %s AND {archived_condition_false};
-    """
-    cursor = db.execute_query(query, (course_schedule_id,))
+    cursor = db.execute_query(ARCHIVE, (course_schedule_id,))
     return cursor.rowcount if cursor else 0
+
+
+def course_schedule_db_insert_many(course_schedule_rows):
+    if not course_schedule_rows:
+        return []
+    result = db.execute_query(INSERT_MANY, to_column_arrays(course_schedule_rows))
+    return handle_returned_ids(result)
+
+
+def course_schedule_db_update_many(course_schedule_ids, course_schedule_rows):
+    if not course_schedule_rows:
+        return []
+    values = [
+        (course_schedule_id, *row)
+        for course_schedule_id, row in zip(course_schedule_ids, course_schedule_rows)
+    ]
+    result = db.execute_query(UPDATE_MANY, to_column_arrays(values))
+    return handle_returned_ids(result)
+
+
+def course_schedule_db_archive_many(course_schedule_ids):
+    if not course_schedule_ids:
+        return []
+    result = db.execute_query(ARCHIVE_MANY, (list(course_schedule_ids),))
+    return handle_returned_ids(result)
@@ -1,64 +1,137 @@
 from db.database import Database
 from db.db_utils import (
     get_insert_returning_query,
+    get_insert_many_returning_query,
+    get_update_many_returning_query,
     handle_insert_result,
+    handle_returned_ids,
+    to_column_arrays,
     get_archived_condition,
     BOOLEAN_TRUE,
 )
+from db.statements import declare_statement, FETCH_ALL
 
 db = Database()
 
+DEPARTMENT_COLUMNS = ["name"]
+DEPARTMENT_COLUMN_TYPES = ["text"]
+
+READ_ALL = declare_statement(
+    "departments_read_all", "SELECT * FROM departments;", FETCH_ALL
+)
+READ_ALL_ACTIVE = declare_statement(
+    "departments_read_all_active",
+    f"SELECT * FROM departments WHERE {get_archived_condition(False)};",
+    FETCH_ALL,
+)
+READ_BY_ID = declare_statement(
+    "departments_read_by_id", "SELECT * FROM departments WHERE id = %s;", FETCH_ALL
+)
+READ_BY_IDS = declare_statement(
+    "departments_read_by_ids",
+    "SELECT * FROM departments WHERE id = ANY(%s);",
+    FETCH_ALL,
+)
+INSERT = declare_statement(
+    "departments_insert",
+    get_insert_returning_query("departments", DEPARTMENT_COLUMNS),
+    FETCH_ALL,
+)
+UPDATE = declare_statement(
+    "departments_update",
+    f"""
+    UPDATE departments
+    SET name = %s, updated_at = CURRENT_TIMESTAMP
+    WHERE id = %s AND {get_archived_condition(False)};
+    """,
+)
+ARCHIVE = declare_statement(
+    "departments_archive",
+    f"""
+    UPDATE departments
+    SET is_archived = {BOOLEAN_TRUE}, updated_at = CURRENT_TIMESTAMP
+    WHERE id = %s AND {get_archived_condition(False)};
+    """,
+)
+INSERT_MANY = declare_statement(
+    "departments_insert_many",
+    get_insert_many_returning_query(
+        "departments", DEPARTMENT_COLUMNS, DEPARTMENT_COLUMN_TYPES
+    ),
+    FETCH_ALL,
+)
+UPDATE_MANY = declare_statement(
+    "departments_update_many",
+    get_update_many_returning_query(
+        "departments", DEPARTMENT_COLUMNS, DEPARTMENT_COLUMN_TYPES
+    ),
+    FETCH_ALL,
+)
+ARCHIVE_MANY = declare_statement(
+    "departments_archive_many",
+    f"""
+    UPDATE departments
+    SET is_archived = {BOOLEAN_TRUE}, updated_at = CURRENT_TIMESTAMP
+    WHERE id = ANY(%s) AND {get_archived_condition(False)}
+    RETURNING id;
+    """,
+    FETCH_ALL,
+)
+
 
 def department_db_read_all(active_only=False):
-    query = "SELECT * FROM departments"
-    if active_only:
-        archived_condition = get_archived_condition(False)
-        query += f" WHERE {archived_condition}"
-    query += ";"
-    result = db.execute_query(query)
-    return [dict(row) for row in result] if result else []
+    result = db.execute_query(READ_ALL_ACTIVE if active_only else READ_ALL)
+    return result if result else []
 
 
 def department_db_read_by_id(department_id):
-    query = "SELECT * FROM departments WHERE id = %s;"
-    result = db.execute_query(query, (department_id,))
-    return dict(result[0]) if result else None
+    result = db.execute_query(READ_BY_ID, (department_id,))
+    return result[0] if result else None
 
 
 def department_db_read_by_ids(department_ids):
     if not department_ids:
         return []
-    placeholders = ",".join("%s" for _ in department_ids)
-    query = f"SELECT * FROM departments WHERE id IN ({placeholders});"
-    result = db.execute_query(query, department_ids)
-    return [dict(row) for row in result] if result else []
+    result = db.execute_query(READ_BY_IDS, (list(department_ids),))
+    return result if result else []
 
 
 def department_db_insert(department_data):
-    columns = ["name"]
-    query = get_insert_returning_query("departments", columns)
-    cursor_or_result = db.execute_query(query, department_data)
+    cursor_or_result = db.execute_query(INSERT, department_data)
     return handle_insert_result(cursor_or_result)
 
 
 def department_db_update(department_id, department_data):
-    archived_condition = get_archived_condition(False)
-    query = f"""
-    UPDATE departments
-    SET name = %s, updated_at = CURRENT_TIMESTAMP
-    WHERE id = %s AND {archived_condition};
-    """
     values = department_data + (department_id,)
-    cursor = db.execute_query(query, values)
+    cursor = db.execute_query(UPDATE, values)
     return cursor.rowcount if cursor else 0
 
 
 def department_db_archive(department_id):
-    archived_condition_false = get_archived_condition(False)
-    query = f"""
-    UPDATE departments
-    SET is_archived = {BOOLEAN_TRUE}, updated_at = CURRENT_TIMESTAMP
-    WHERE id = %s AND {archived_condition_false};
-    """
-    cursor = db.execute_query(query, (department_id,))
+    cursor = db.execute_query(ARCHIVE, (department_id,))
     return cursor.rowcount if cursor else 0
+
+
+def department_db_insert_many(department_rows):
+    if not department_rows:
+        return []
+    result = db.execute_query(INSERT_MANY, to_column_arrays(department_rows))
+    return handle_returned_ids(result)
+
+
+def department_db_update_many(department_ids, department_rows):
+    if not department_rows:
+        return []
+    values = [
+        (department_id, *row)
+        for department_id, row in zip(department_ids, department_rows)
+    ]
+    result = db.execute_query(UPDATE_MANY, to_column_arrays(values))
+    return handle_returned_ids(result)
+
+
+def department_db_archive_many(department_ids):
+    if not department_ids:
+        return []
+    result = db.execute_query(ARCHIVE_MANY, (list(department_ids),))
+    return handle_returned_ids(result)
@@ -1,64 +1,137 @@
 from db.database import Database
 from db.db_utils import (
     get_insert_returning_query,
+    get_insert_many_returning_query,
+    get_update_many_returning_query,
     handle_insert_result,
+    handle_returned_ids,
+    to_column_arrays,
     get_archived_condition,
     BOOLEAN_TRUE,
 )
+from db.statements import declare_statement, FETCH_ALL
 
 db = Database()
 
+ENROLLMENT_COLUMNS = ["student_id", "course_id", "grade"]
+ENROLLMENT_COLUMN_TYPES = ["integer", "integer", "text"]
+
+READ_ALL = declare_statement(
+    "enrollments_read_all", "SELECT * FROM enrollments;", FETCH_ALL
+)
+READ_ALL_ACTIVE = declare_statement(
+    "enrollments_read_all_active",
+    f"SELECT * FROM enrollments WHERE {get_archived_condition(False)};",
+    FETCH_ALL,
+)
+READ_BY_ID = declare_statement(
+    "enrollments_read_by_id", "SELECT * FROM enrollments WHERE id = %s;", FETCH_ALL
+)
+READ_BY_IDS = declare_statement(
+    "enrollments_read_by_ids",
+    "SELECT * FROM enrollments WHERE id = ANY(%s);",
+    FETCH_ALL,
+)
+INSERT = declare_statement(
+    "enrollments_insert",
+    get_insert_returning_query("enrollments", ENROLLMENT_COLUMNS),
+    FETCH_ALL,
+)
+UPDATE = declare_statement(
+    "enrollments_update",
+    f"""
+    UPDATE enrollments
+    SET student_id = %s, course_id = %s, grade = %s, updated_at = CURRENT_TIMESTAMP
+    WHERE id = %s AND {get_archived_condition(False)};
+    """,
+)
+ARCHIVE = declare_statement(
+    "enrollments_archive",
+    f"""
+    UPDATE enrollments
+    SET is_archived = {BOOLEAN_TRUE}, updated_at = CURRENT_TIMESTAMP
+    WHERE id = %s AND {get_archived_condition(False)};
+    """,
+)
+INSERT_MANY = declare_statement(
+    "enrollments_insert_many",
+    get_insert_many_returning_query(
+        "enrollments", ENROLLMENT_COLUMNS, ENROLLMENT_COLUMN_TYPES
+    ),
+    FETCH_ALL,
+)
+UPDATE_MANY = declare_statement(
+    "enrollments_update_many",
+    get_update_many_returning_query(
+        "enrollments", ENROLLMENT_COLUMNS, ENROLLMENT_COLUMN_TYPES
+    ),
+    FETCH_ALL,
+)
+ARCHIVE_MANY = declare_statement(
+    "enrollments_archive_many",
+    f"""
+    UPDATE enrollments
+    SET is_archived = {BOOLEAN_TRUE}, updated_at = CURRENT_TIMESTAMP
+    WHERE id = ANY(%s) AND {get_archived_condition(False)}
+    RETURNING id;
+    """,
+    FETCH_ALL,
+)
+
 
 def enrollment_db_read_all(active_only=False):
-    query = "SELECT * FROM enrollments"
-    if active_only:
-        archived_condition = get_archived_condition(False)
-        query += f" WHERE {archived_condition}"
-    query += ";"
-    result = db.execute_query(query)
-    return [dict(row) for row in result] if result else []
+    result = db.execute_query(READ_ALL_ACTIVE if active_only else READ_ALL)
+    return result if result else []
 
 
 def enrollment_db_read_by_id(enrollment_id):
-    query = "SELECT * FROM enrollments WHERE id = %s;"
-    result = db.execute_query(query, (enrollment_id,))
-    return dict(result[0]) if result else None
+    result = db.execute_query(READ_BY_ID, (enrollment_id,))
+    return result[0] if result else None
 
 
 def enrollment_db_read_by_ids(enrollment_ids):
     if not enrollment_ids:
         return []
-    placeholders = ",".join("%s" for _ in enrollment_ids)
-    query = f"SELECT * FROM enrollments WHERE id IN ({placeholders});"
-    result = db.execute_query(query, enrollment_ids)
-    return [dict(row) for row in result] if result else []
+    result = db.execute_query(READ_BY_IDS, (list(enrollment_ids),))
+    return result if result else []
 
 
 def enrollment_db_insert(enrollment_data):
-    columns = ["student_id", "course_id", "grade"]
-    query = get_insert_returning_query("enrollments", columns)
-    cursor_or_result = db.execute_query(query, enrollment_data)
+    cursor_or_result = db.execute_query(INSERT, enrollment_data)
     return handle_insert_result(cursor_or_result)
 
 
 def enrollment_db_update(enrollment_id, enrollment_data):
-    archived_condition = get_archived_condition(False)
-    query = f"""
-    UPDATE enrollments
-    SET student_id = %s, course_id = %s, grade = %s, updated_at = CURRENT_TIMESTAMP
-    WHERE id = %s AND {archived_condition};
-    """
     values = enrollment_data + (enrollment_id,)
-    cursor = db.execute_query(query, values)
+    cursor = db.execute_query(UPDATE, values)
     return cursor.rowcount if cursor else 0
 
 
 def enrollment_db_archive(enrollment_id):
-    archived_condition_false = get_archived_condition(False)
-    query = f"""
-    UPDATE enrollments
-    SET is_archived = {BOOLEAN_TRUE}, updated_at = CURRENT_TIMESTAMP
-    WHERE id = %s AND {archived_condition_false};
-    """
-    cursor = db.execute_query(query, (enrollment_id,))
+    cursor = db.execute_query(ARCHIVE, (enrollment_id,))
     return cursor.rowcount if cursor else 0
+
+
+def enrollment_db_insert_many(enrollment_rows):
+    if not enrollment_rows:
+        return []
+    result = db.execute_query(INSERT_MANY, to_column_arrays(enrollment_rows))
+    return handle_returned_ids(result)
+
+
+def enrollment_db_update_many(enrollment_ids, enrollment_rows):
+    if not enrollment_rows:
+        return []
+    values = [
+        (enrollment_id, *row)
+        for enrollment_id, row in zip(enrollment_ids, enrollment_rows)
+    ]
+    result = db.execute_query(UPDATE_MANY, to_column_arrays(values))
+    return handle_returned_ids(result)
+
+
+def enrollment_db_archive_many(enrollment_ids):
+    if not enrollment_ids:
+        return []
+    result = db.execute_query(ARCHIVE_MANY, (list(enrollment_ids),))
+    return handle_returned_ids(result)
@@ -1,72 +1,146 @@
 from db.database import Database
 from db.db_utils import (
     get_insert_returning_query,
+    get_insert_many_returning_query,
+    get_update_many_returning_query,
     handle_insert_result,
+    handle_returned_ids,
+    to_column_arrays,
     get_archived_condition,
     BOOLEAN_TRUE,
 )
+from db.statements import declare_statement, FETCH_ALL
 
 db = Database()
 
+INSTRUCTOR_COLUMNS = [
+    "first_name",
+    "last_name",
+    "email",
+    "address",
+    "province",
+    "employment",
+    "status",
+    "department_id",
+]
+INSTRUCTOR_COLUMN_TYPES = ["text"] * 7 + ["integer"]
+
+READ_ALL = declare_statement(
+    "instructors_read_all", "SELECT * FROM instructors;", FETCH_ALL
+)
+READ_ALL_ACTIVE = declare_statement(
+    "instructors_read_all_active",
+    "SELECT * FROM instructors WHERE status = 'active';",
+    FETCH_ALL,
+)
+READ_BY_ID = declare_statement(
+    "instructors_read_by_id", "SELECT * FROM instructors WHERE id = %s;", FETCH_ALL
+)
+READ_BY_IDS = declare_statement(
+    "instructors_read_by_ids",
+    "SELECT * FROM instructors WHERE id = ANY(%s);",
+    FETCH_ALL,
+)
+INSERT = declare_statement(
+    "instructors_insert",
+    get_insert_returning_query("instructors", INSTRUCTOR_COLUMNS),
+    FETCH_ALL,
+)
+UPDATE = declare_statement(
+    "instructors_update",
+    f"""
+    UPDATE instructors
+    SET first_name = %s, last_name = %s, email = %s, address = %s, province = %s, employment = %s, status = %s, department_id = %s, updated_at = CURRENT_TIMESTAMP
+    WHERE id = %s AND {get_archived_condition(False)};
+    """,
+)
+ARCHIVE = declare_statement(
+    "instructors_archive",
+    f"""
+    UPDATE instructors
+    SET is_archived = {BOOLEAN_TRUE}, status = 'inactive', updated_at = CURRENT_TIMESTAMP
+    WHERE id = %s AND {get_archived_condition(False)};
+    """,
+)
+INSERT_MANY = declare_statement(
+    "instructors_insert_many",
+    get_insert_many_returning_query(
+        "instructors", INSTRUCTOR_COLUMNS, INSTRUCTOR_COLUMN_TYPES
+    ),
+    FETCH_ALL,
+)
+UPDATE_MANY = declare_statement(
+    "instructors_update_many",
+    get_update_many_returning_query(
+        "instructors", INSTRUCTOR_COLUMNS, INSTRUCTOR_COLUMN_TYPES
+    ),
+    FETCH_ALL,
+)
+ARCHIVE_MANY = declare_statement(
+    "instructors_archive_many",
+    f"""
+    UPDATE instructors
+    SET is_archived = {BOOLEAN_TRUE}, status = 'inactive', updated_at = CURRENT_TIMESTAMP
+    WHERE id = ANY(%s) AND {get_archived_condition(False)}
+    RETURNING id;
+    """,
+    FETCH_ALL,
+)
+
 
 def instructor_db_read_all(active_only=False):
-    query = "SELECT * FROM instructors"
-    if active_only:
-        query += " WHERE status = 'active'"
-    query += ";"
-    result = db.execute_query(query)
-    return [dict(row) for row in result] if result else []
+    result = db.execute_query(READ_ALL_ACTIVE if active_only else READ_ALL)
+    return result if result else []
 
 
 def instructor_db_read_by_id(instructor_id):
-    query = "SELECT * FROM instructors WHERE id = %s;"
-    result = db.execute_query(query, (instructor_id,))
-    return dict(result[0]) if result else None
+    result = db.execute_query(READ_BY_ID, (instructor_id,))
+    return result[0] if result else None
 
 
 def instructor_db_read_by_ids(instructor_ids):
     if not instructor_ids:
         return []
-    placeholders = ",".join("%s" for _ in instructor_ids)
-    query = f"SELECT * FROM instructors WHERE id IN ({placeholders});"
-    result = db.execute_query(query, instructor_ids)
-    return [dict(row) for row in result] if result else []
+    result = db.execute_query(READ_BY_IDS, (list(instructor_ids),))
+    return result if result else []
 
 
 def instructor_db_insert(instructor_data):
-    columns = [
-        "first_name",
-        "last_name",
-        "email",
-        "address",
-        "province",
-        "employment",
-        "status",
-        "department_id",
-    ]
-    query = get_insert_returning_query("instructors", columns)
-    cursor_or_result = db.execute_query(query, instructor_data)
+    cursor_or_result = db.execute_query(INSERT, instructor_data)
     return handle_insert_result(cursor_or_result)
 
 
 def instructor_db_update(instructor_id, instructor_data):
-    archived_condition = get_archived_condition(False)
-    query = f"""
-    UPDATE instructors
-    SET first_name = %s, last_name = %s, email = %s, address = %s, province = %s, employment = %s, status = %s, department_id = %s, updated_at = CURRENT_TIMESTAMP
-    WHERE id = %s AND {archived_condition};
-    """
     values = instructor_data + (instructor_id,)
-    cursor = db.execute_query(query, values)
+    cursor = db.execute_query(UPDATE, values)
     return cursor.rowcount if cursor else 0
 
 
 def instructor_db_archive(instructor_id):
-    archived_condition_false = get_archived_condition(False)
-    query = f"""
-    UPDATE instructors
-    SET is_archived = {BOOLEAN_TRUE}, status = 'inactive', updated_at = CURRENT_TIMESTAMP
-    WHERE id = %s AND {archived_condition_false};
-    """
-    cursor = db.execute_query(query, (instructor_id,))
+    cursor = db.execute_query(ARCHIVE, (instructor_id,))
     return cursor.rowcount if cursor else 0
+
+
+def instructor_db_insert_many(instructor_rows):
+    if not instructor_rows:
+        return []
+    result = db.execute_query(INSERT_MANY, to_column_arrays(instructor_rows))
+    return handle_returned_ids(result)
+
+
+def instructor_db_update_many(instructor_ids, instructor_rows):
+    if not instructor_rows:
+        return []
+    values = [
+        (instructor_id, *row)
+        for instructor_id, row in zip(instructor_ids, instructor_rows)
+    ]
+    result = db.execute_query(UPDATE_MANY, to_column_arrays(values))
+    return handle_returned_ids(result)
+
+
+def instructor_db_archive_many(instructor_ids):
+    if not instructor_ids:
+        return []
+    result = db.execute_query(ARCHIVE_MANY, (list(instructor_ids),))
+    return handle_returned_ids(result)
@@ -1,64 +1,126 @@
 from db.database import Database
 from db.db_utils import (
     get_insert_returning_query,
+    get_insert_many_returning_query,
+    get_update_many_returning_query,
     handle_insert_result,
+    handle_returned_ids,
+    to_column_arrays,
     get_archived_condition,
     BOOLEAN_TRUE,
 )
+from db.statements import declare_statement, FETCH_ALL
 
 db = Database()
 
+PROGRAM_COLUMNS = ["name", "type", "department_id"]
+PROGRAM_COLUMN_TYPES = ["text", "text", "integer"]
+
+READ_ALL = declare_statement("programs_read_all", "SELECT * FROM programs;", FETCH_ALL)
+READ_ALL_ACTIVE = declare_statement(
+    "programs_read_all_active",
+    f"SELECT * FROM programs WHERE {get_archived_condition(False)};",
+    FETCH_ALL,
+)
+READ_BY_ID = declare_statement(
+    "programs_read_by_id", "SELECT * FROM programs WHERE id = %s;", FETCH_ALL
+)
+READ_BY_IDS = declare_statement(
+    "programs_read_by_ids", "SELECT * FROM programs WHERE id = ANY(%s);", FETCH_ALL
+)
+INSERT = declare_statement(
+    "programs_insert",
+    get_insert_returning_query("programs", PROGRAM_COLUMNS),
+    FETCH_ALL,
+)
+UPDATE = declare_statement(
+    "programs_update",
+    f"""
+    UPDATE programs
+    SET name = %s, type = %s, department_id = %s, updated_at = CURRENT_TIMESTAMP
+    WHERE id = %s AND {get_archived_condition(False)};
+    """,
+)
+ARCHIVE = declare_statement(
+    "programs_archive",
+    f"""
+    UPDATE programs
+    SET is_archived = {BOOLEAN_TRUE}, updated_at = CURRENT_TIMESTAMP
+    WHERE id = %s AND {get_archived_condition(False)};
+    """,
+)
+INSERT_MANY = declare_statement(
+    "programs_insert_many",
+    get_insert_many_returning_query("programs", PROGRAM_COLUMNS, PROGRAM_COLUMN_TYPES),
+    FETCH_ALL,
+)
+UPDATE_MANY = declare_statement(
+    "programs_update_many",
+    get_update_many_returning_query("programs", PROGRAM_COLUMNS, PROGRAM_COLUMN_TYPES),
+    FETCH_ALL,
+)
+ARCHIVE_MANY = declare_statement(
+    "programs_archive_many",
+    f"""
+    UPDATE programs
+    SET is_archived = {BOOLEAN_TRUE}, updated_at = CURRENT_TIMESTAMP
+    WHERE id = ANY(%s) AND {get_archived_condition(False)}
+    RETURNING id;
+    """,
+    FETCH_ALL,
+)
+
 
 def program_db_read_all(active_only=False):
-    query = "SELECT * FROM programs"
-    if active_only:
-        archived_condition = get_archived_condition(False)
-        query += f" WHERE {archived_condition}"
-    query += ";"
-    result = db.execute_query(query)
-    return [dict(row) for row in result] if result else []
+    result = db.execute_query(READ_ALL_ACTIVE if active_only else READ_ALL)
+    return result if result else []
 
 
 def program_db_read_by_id(program_id):
-    query = "SELECT * FROM programs WHERE id = %s;"
-    result = db.execute_query(query, (program_id,))
-    return dict(result[0]) if result else None
+    result = db.execute_query(READ_BY_ID, (program_id,))
+    return result[0] if result else None
 
 
 def program_db_read_by_ids(program_ids):
     if not program_ids:
         return []
-    placeholders = ",".join("%s" for _ in program_ids)
-    query = f"SELECT * FROM programs WHERE id IN ({placeholders});"
-    result = db.execute_query(query, program_ids)
-    return [dict(row) for row in result] if result else []
+    result = db.execute_query(READ_BY_IDS, (list(program_ids),))
+    return result if result else []
 
 
 def program_db_insert(program_data):
-    columns = ["name", "type", "department_id"]
-    query = get_insert_returning_query("programs", columns)
-    cursor_or_result = db.execute_query(query, program_data)
+    cursor_or_result = db.execute_query(INSERT, program_data)
     return handle_insert_result(cursor_or_result)
 
 
 def program_db_update(program_id, program_data):
-    archived_condition = get_archived_condition(False)
-    query = f"""
-    UPDATE programs
-    SET name = %s, type = %s, department_id = %s, updated_at = CURRENT_TIMESTAMP
-    WHERE id = %s AND {archived_condition};
-    """
     values = program_data + (program_id,)
-    cursor = db.execute_query(query, values)
+    cursor = db.execute_query(UPDATE, values)
     return cursor.rowcount if cursor else 0
 
 
 def program_db_archive(program_id):
-    archived_condition_false = get_archived_condition(False)
-    query = f"""
-    UPDATE programs
-    SET is_archived = {BOOLEAN_TRUE}, updated_at = CURRENT_TIMESTAMP
-    WHERE id = %s AND {archived_condition_false};
-    """
-    cursor = db.execute_query(query, (program_id,))
+    cursor = db.execute_query(ARCHIVE, (program_id,))
     return cursor.rowcount if cursor else 0
+
+
+def program_db_insert_many(program_rows):
+    if not program_rows:
+        return []
+    result = db.execute_query(INSERT_MANY, to_column_arrays(program_rows))
+    return handle_returned_ids(result)
+
+
+def program_db_update_many(program_ids, program_rows):
+    if not program_rows:
+        return []
+    values = [(program_id, *row) for program_id, row in zip(program_ids, program_rows)]
+    result = db.execute_query(UPDATE_MANY, to_column_arrays(values))
+    return handle_returned_ids(result)
+
+
+def program_db_archive_many(program_ids):
+    if not program_ids:
+        return []
+    result = db.execute_query(ARCHIVE_MANY, (list(program_ids),))
+    return handle_returned_ids(result)
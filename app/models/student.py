@@ -1,77 +1,140 @@
 from db.database import Database
 from db.db_utils import (
     get_insert_returning_query,
+    get_insert_many_returning_query,
+    get_update_many_returning_query,
     handle_insert_result,
+    handle_returned_ids,
+    to_column_arrays,
     get_archived_condition,
     BOOLEAN_TRUE,
 )
+from db.statements import declare_statement, FETCH_ALL
 
 db = Database()
 
+STUDENT_COLUMNS = [
+    "first_name",
+    "last_name",
+    "email",
+    "address",
+    "city",
+    "province",
+    "country",
+    "address_type",
+    "status",
+    "coop",
+    "is_international",
+    "program_id",
+]
+STUDENT_COLUMN_TYPES = ["text"] * 9 + ["boolean", "boolean", "integer"]
+
+READ_ALL = declare_statement("students_read_all", "SELECT * FROM students;", FETCH_ALL)
+READ_ALL_ACTIVE = declare_statement(
+    "students_read_all_active",
+    "SELECT * FROM students WHERE status = 'active';",
+    FETCH_ALL,
+)
+READ_BY_ID = declare_statement(
+    "students_read_by_id", "SELECT * FROM students WHERE id = %s;", FETCH_ALL
+)
+READ_BY_IDS = declare_statement(
+    "students_read_by_ids", "SELECT * FROM students WHERE id = ANY(%s);", FETCH_ALL
+)
+INSERT = declare_statement(
+    "students_insert",
+    get_insert_returning_query("students", STUDENT_COLUMNS),
+    FETCH_ALL,
+)
+UPDATE = declare_statement(
+    "students_update",
+    f"""
+    UPDATE students
+    SET first_name = %s, last_name = %s, email = %s, address = %s, city = %s, province = %s, country = %s,
+        address_type = %s, status = %s, coop = %s, is_international = %s, program_id = %s, updated_at = CURRENT_TIMESTAMP
+    WHERE id = %s AND {get_archived_condition(False)};
+    """,
+)
+ARCHIVE = declare_statement(
+    "students_archive",
+    f"""
+    UPDATE students
+    SET is_archived = {BOOLEAN_TRUE}, status = 'inactive', updated_at = CURRENT_TIMESTAMP
+    WHERE id = %s AND {get_archived_condition(False)};
+    """,
+)
+INSERT_MANY = declare_statement(
+    "students_insert_many",
+    get_insert_many_returning_query("students", STUDENT_COLUMNS, STUDENT_COLUMN_TYPES),
+    FETCH_ALL,
+)
+UPDATE_MANY = declare_statement(
+    "students_update_many",
+    get_update_many_returning_query("students", STUDENT_COLUMNS, STUDENT_COLUMN_TYPES),
+    FETCH_ALL,
+)
+ARCHIVE_MANY = declare_statement(
+    "students_archive_many",
+    f"""
+    UPDATE students
+    SET is_archived = {BOOLEAN_TRUE}, status = 'inactive', updated_at = CURRENT_TIMESTAMP
+    WHERE id = ANY(%s) AND {get_archived_condition(False)}
+    RETURNING id;
+    """,
+    FETCH_ALL,
+)
+
 
 def student_db_read_all(active_only=False):
-    query = "SELECT * FROM students"
-    if active_only:
-        query += " WHERE status = 'active'"
-    query += ";"
-    result = db.execute_query(query)
-    return [dict(row) for row in result] if result else []
+    result = db.execute_query(READ_ALL_ACTIVE if active_only else READ_ALL)
+    return result if result else []
 
 
 def student_db_read_by_id(student_id):
-    query = "SELECT * FROM students WHERE id = %s;"
-    result = db.execute_query(query, (student_id,))
-    return dict(result[0]) if result else None
+    result = db.execute_query(READ_BY_ID, (student_id,))
+    return result[0] if result else None
 
 
 def student_db_read_by_ids(student_ids):
     if not student_ids:
         return []
-    placeholders = ",".join("%s" for _ in student_ids)
-    query = f"SELECT * FROM students WHERE id IN ({placeholders});"
-    result = db.execute_query(query, student_ids)
-    return [dict(row) for row in result] if result else []
+    result = db.execute_query(READ_BY_IDS, (list(student_ids),))
+    return result if result else []
 
 
 def student_db_insert(student_data):
-    columns = [
-        "first_name",
-        "last_name",
-        "email",
-        "address",
-        "city",
-        "province",
-        "country",
-        "address_type",
-        "status",
-        "coop",
-        "is_international",
-        "program_id",
-    ]
-    query = get_insert_returning_query("students", columns)
-    cursor_or_result = db.execute_query(query, student_data)
+    cursor_or_result = db.execute_query(INSERT, student_data)
     return handle_insert_result(cursor_or_result)
 
 
 def student_db_update(student_id, student_data):
-    archived_condition = get_archived_condition(False)
-    query = f"""
-    UPDATE students
-    SET first_name = %s, last_name = %s, email = %s, address = %s, city = %s, province = %s, country = %s,
-        address_type = %s, status = %s, coop = %s, is_international = %s, program_id = %s, updated_at = CURRENT_TIMESTAMP
-    WHERE id = %s AND {archived_condition};
-    """
     values = student_data + (student_id,)
-    cursor = db.execute_query(query, values)
+    cursor = db.execute_query(UPDATE, values)
     return cursor.rowcount if cursor else 0
 
 
 def student_db_archive(student_id):
-    archived_condition_false = get_archived_condition(False)
-    query = f"""
-    UPDATE students
-    SET is_archived = {BOOLEAN_TRUE}, status = 'inactive', updated_at = CURRENT_TIMESTAMP
-    WHERE id = %s AND {archived_condition_false};
-    """
-    cursor = db.execute_query(query, (student_id,))
+    cursor = db.execute_query(ARCHIVE, (student_id,))
     return cursor.rowcount if cursor else 0
+
+
+def student_db_insert_many(student_rows):
+    if not student_rows:
+        return []
+    result = db.execute_query(INSERT_MANY, to_column_arrays(student_rows))
+    return handle_returned_ids(result)
+
+
+def student_db_update_many(student_ids, student_rows):
+    if not student_rows:
+        return []
+    values = [(student_id, *row) for student_id, row in zip(student_ids, student_rows)]
+    result = db.execute_query(UPDATE_MANY, to_column_arrays(values))
+    return handle_returned_ids(result)
+
+
+def student_db_archive_many(student_ids):
+    if not student_ids:
+        return []
+    result = db.execute_query(ARCHIVE_MANY, (list(student_ids),))
+    return handle_returned_ids(result)
@@ -1,64 +1,126 @@
 from db.database import Database
 from db.db_utils import (
     get_insert_returning_query,
+    get_insert_many_returning_query,
+    get_update_many_returning_query,
     handle_insert_result,
+    handle_returned_ids,
+    to_column_arrays,
     get_archived_condition,
     BOOLEAN_TRUE,
 )
+from db.statements import declare_statement, FETCH_ALL
 
 db = Database()
 
+TERM_COLUMNS = ["name", "start_date", "end_date"]
+TERM_COLUMN_TYPES = ["text", "date", "date"]
+
+READ_ALL = declare_statement("terms_read_all", "SELECT * FROM terms;", FETCH_ALL)
+READ_ALL_ACTIVE = declare_statement(
+    "terms_read_all_active",
+    f"SELECT * FROM terms WHERE {get_archived_condition(False)};",
+    FETCH_ALL,
+)
+READ_BY_ID = declare_statement(
+    "terms_read_by_id", "SELECT * FROM terms WHERE id = %s;", FETCH_ALL
+)
+READ_BY_IDS = declare_statement(
+    "terms_read_by_ids", "SELECT * FROM terms WHERE id = ANY(%s);", FETCH_ALL
+)
+INSERT = declare_statement(
+    "terms_insert",
+    get_insert_returning_query("terms", TERM_COLUMNS),
+    FETCH_ALL,
+)
+UPDATE = declare_statement(
+    "terms_update",
+    f"""
+    UPDATE terms
+    SET name = %s, start_date = %s, end_date = %s, updated_at = CURRENT_TIMESTAMP
+    WHERE id = %s AND {get_archived_condition(False)};
+    """,
+)
+ARCHIVE = declare_statement(
+    "terms_archive",
+    f"""
+    UPDATE terms
+    SET is_archived = {BOOLEAN_TRUE}, updated_at = CURRENT_TIMESTAMP
+    WHERE id = %s AND {get_archived_condition(False)};
+    """,
+)
+INSERT_MANY = declare_statement(
+    "terms_insert_many",
+    get_insert_many_returning_query("terms", TERM_COLUMNS, TERM_COLUMN_TYPES),
+    FETCH_ALL,
+)
+UPDATE_MANY = declare_statement(
+    "terms_update_many",
+    get_update_many_returning_query("terms", TERM_COLUMNS, TERM_COLUMN_TYPES),
+    FETCH_ALL,
+)
+ARCHIVE_MANY = declare_statement(
+    "terms_archive_many",
+    f"""
+    UPDATE terms
+    SET is_archived = {BOOLEAN_TRUE}, updated_at = CURRENT_TIMESTAMP
+    WHERE id = ANY(%s) AND {get_archived_condition(False)}
+    RETURNING id;
+    """,
+    FETCH_ALL,
+)
+
 
 def term_db_read_all(active_only=False):
-    query = "SELECT * FROM terms"
-    if active_only:
-        archived_condition = get_archived_condition(False)
-        query += f" WHERE {archived_condition}"
-    query += ";"
-    result = db.execute_query(query)
-    return [dict(row) for row in result] if result else []
+    result = db.execute_query(READ_ALL_ACTIVE if active_only else READ_ALL)
+    return result if result else []
 
 
 def term_db_read_by_id(term_id):
-    query = "SELECT * FROM terms WHERE id = %s;"
-    result = db.execute_query(query, (term_id,))
-    return dict(result[0]) if result else None
+    result = db.execute_query(READ_BY_ID, (term_id,))
+    return result[0] if result else None
 
 
 def term_db_read_by_ids(term_ids):
     if not term_ids:
         return []
-    placeholders = ",".join("%s" for _ in term_ids)
-    query = f"SELECT * FROM terms WHERE id IN ({placeholders});"
-    result = db.execute_query(query, term_ids)
-    return [dict(row) for row in result] if result else []
+    result = db.execute_query(READ_BY_IDS, (list(term_ids),))
+    return result if result else []
 
 
 def term_db_insert(term_data):
-    columns = ["name", "start_date", "end_date"]
-    query = get_insert_returning_query("terms", columns)
-    cursor_or_result = db.execute_query(query, term_data)
+    cursor_or_result = db.execute_query(INSERT, term_data)
     return handle_insert_result(cursor_or_result)
 
 
 def term_db_update(term_id, term_data):
-    archived_condition = get_archived_condition(False)
-    query = f"""
-    UPDATE terms
-    SET name = %s, start_date = %s, end_date = %s, updated_at = CURRENT_TIMESTAMP
-    WHERE id = %s AND {archived_condition};
-    """
     values = term_data + (term_id,)
-    cursor = db.execute_query(query, values)
+    cursor = db.execute_query(UPDATE, values)
     return cursor.rowcount if cursor else 0
 
 
 def term_db_archive(term_id):
-    archived_condition_false = get_archived_condition(False)
-    query = f"""
-    UPDATE terms
-    SET is_archived = {BOOLEAN_TRUE}, updated_at = CURRENT_TIMESTAMP
-    WHERE id = %s AND {archived_condition_false};
-    """
-    cursor = db.execute_query(query, (term_id,))
+    cursor = db.execute_query(ARCHIVE, (term_id,))
     return cursor.rowcount if cursor else 0
+
+
+def term_db_insert_many(term_rows):
+    if not term_rows:
+        return []
+    result = db.execute_query(INSERT_MANY, to_column_arrays(term_rows))
+    return handle_returned_ids(result)
+
+
+def term_db_update_many(term_ids, term_rows):
+    if not term_rows:
+        return []
+    values = [(term_id, *row) for term_id, row in zip(term_ids, term_rows)]
+    result = db.execute_query(UPDATE_MANY, to_column_arrays(values))
+    return handle_returned_ids(result)
+
+
+def term_db_archive_many(term_ids):
+    if not term_ids:
+        return []
+    result = db.execute_query(ARCHIVE_MANY, (list(term_ids),))
+    return handle_returned_ids(result)
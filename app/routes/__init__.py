@@ -1,4 +1,6 @@
 from .home import home_bp
+from .metrics import metrics_bp
+from .debug import debug_bp
 from .assignment import assignment_bp
 from .course_schedule import course_schedule_bp
 from .course import course_bp
@@ -0,0 +1,121 @@
+from flask import Blueprint, Response, current_app, request
+from app.utils import (
+    api_response,
+    api_response_error,
+    handle_exceptions_read,
+    handle_exceptions_write,
+    require_admin_token,
+    sample_stacks,
+    format_collapsed,
+    write_collapsed,
+    heap_status,
+    start_tracing,
+    stop_tracing,
+    take_snapshot,
+    diff_snapshots,
+    set_traced_route,
+    route_allocations,
+)
+
+debug_bp = Blueprint("debug", __name__, url_prefix="/debug")
+
+MAX_PROFILE_SECONDS = 300
+HEAP_GROUPS = ("lineno", "filename", "traceback")
+
+
+@debug_bp.route("/profile", methods=["GET"])
+@require_admin_token
+def handle_sampling_profile():
+    seconds = request.args.get("seconds", 30, type=float)
+    interval_ms = request.args.get("interval_ms", 5, type=float)
+    if not 0 < seconds <= MAX_PROFILE_SECONDS or interval_ms <= 0:
+        return api_response_error(
+            f"seconds must be between 0 and {MAX_PROFILE_SECONDS}, interval_ms > 0.",
+            400,
+        )
+
+    stacks = sample_stacks(seconds, interval_ms / 1000)
+    response = Response(
+        format_collapsed(stacks), content_type="text/plain; charset=utf-8"
+    )
+    path = write_collapsed(stacks)
+    if path:
+        response.headers["X-Profile-File"] = path
+    return response
+
+
+@debug_bp.route("/heap", methods=["GET"])
+@require_admin_token
+@handle_exceptions_read()
+def handle_heap_status():
+    return api_response(heap_status(), "Heap status fetched successfully.")
+
+
+@debug_bp.route("/heap/start", methods=["POST"])
+@require_admin_token
+@handle_exceptions_write()
+def handle_heap_start():
+    frames = request.args.get("frames", 1, type=int)
+    return api_response(start_tracing(frames), "tracemalloc started.")
+
+
+@debug_bp.route("/heap/stop", methods=["POST"])
+@require_admin_token
+@handle_exceptions_write()
+def handle_heap_stop():
+    return api_response(stop_tracing(), "tracemalloc stopped.")
+
+
+@debug_bp.route("/heap/snapshot", methods=["POST"])
+@require_admin_token
+@handle_exceptions_write()
+def handle_heap_snapshot():
+    group_by = request.args.get("group_by", "lineno")
+    if group_by not in HEAP_GROUPS:
+        return api_response_error(f"group_by must be one of {HEAP_GROUPS}.", 400)
+    if not heap_status()["tracing"]:
+        return api_response_error("tracemalloc is not tracing.", 409)
+    limit = request.args.get("limit", 20, type=int)
+    return api_response(
+        take_snapshot(group_by, limit), "Snapshot taken successfully.", 201
+    )
+
+
+@debug_bp.route("/heap/diff", methods=["GET"])
+@require_admin_token
+@handle_exceptions_read()
+def handle_heap_diff():
+    old_id = request.args.get("from", type=int)
+    new_id = request.args.get("to", type=int)
+    group_by = request.args.get("group_by", "lineno")
+    if old_id is None or new_id is None or group_by not in HEAP_GROUPS:
+        return api_response_error(
+            f"from and to snapshot ids are required; group_by one of {HEAP_GROUPS}.",
+            400,
+        )
+    limit = request.args.get("limit", 20, type=int)
+    try:
+        diff = diff_snapshots(old_id, new_id, group_by, limit)
+    except KeyError as e:
+        return api_response_error(f"Unknown {e.args[0]}.", 404)
+    return api_response(diff, "Snapshots compared successfully.")
+
+
+@debug_bp.route("/heap/route", methods=["GET"])
+@require_admin_token
+@handle_exceptions_read()
+def handle_heap_route():
+    return api_response(route_allocations(), "Route allocations fetched.")
+
+
+@debug_bp.route("/heap/route", methods=["PUT"])
+@require_admin_token
+@handle_exceptions_write()
+def handle_set_heap_route():
+    payload = request.get_json()
+    if not payload or "endpoint" not in payload:
+        raise KeyError("endpoint")
+    endpoint = payload["endpoint"]
+    if endpoint is not None and endpoint not in current_app.view_functions:
+        return api_response_error(f"Unknown endpoint {endpoint}.", 404)
+    return api_response(set_traced_route(endpoint), "Traced route updated.")
@@ -0,0 +1,10 @@
+from flask import Blueprint, Response
+from app.utils import generate_metrics
+
+metrics_bp = Blueprint("metrics", __name__)
+
+
+@metrics_bp.route("/metrics")
+def metrics():
+    payload, content_type = generate_metrics()
+    return Response(payload, content_type=content_type)
@@ -4,13 +4,16 @@ from app.models import (
     assignment_db_read_by_ids,
     assignment_db_insert,
     assignment_db_update,
-    assignment_db_archive,
+    assignment_db_insert_many,
+    assignment_db_update_many,
+    assignment_db_archive_many,
 )
 from app.utils import (
     assignment_dict_to_row,
     bulk_create_entities,
     bulk_update_entities,
     bulk_archive_entities,
+    traced,
 )
 
 
@@ -18,6 +21,7 @@ def assignment_row_to_dict(row):
     return row if isinstance(row, dict) else row
 
 
+@traced
 def get_all_assignments(active_only):
     results = assignment_db_read_all(active_only=active_only)
     if results is None:
@@ -25,14 +29,17 @@ def get_all_assignments(active_only):
     return results
 
 
+@traced
 def get_assignment_by_id(assignment_id: int):
     assignment = assignment_db_read_by_id(assignment_id)
     return assignment
 
 
+@traced
 def create_new_assignments(data):
     return bulk_create_entities(
         data,
+        insert_many_func=assignment_db_insert_many,
         insert_func=assignment_db_insert,
         to_row_func=assignment_dict_to_row,
         to_dict_func=assignment_row_to_dict,
@@ -43,11 +50,12 @@ def create_new_assignments(data):
     )
 
 
+@traced
 def update_assignments(data):
     return bulk_update_entities(
         data,
+        update_many_func=assignment_db_update_many,
         update_func=assignment_db_update,
-        get_existing_func=assignment_db_read_by_id,
         to_row_func=assignment_dict_to_row,
         to_dict_func=assignment_row_to_dict,
         read_by_ids_func=assignment_db_read_by_ids,
@@ -60,16 +68,15 @@ def update_assignments(data):
     )
 
 
+@traced
 def archive_assignments(ids):
     return bulk_archive_entities(
         ids,
-        archive_func=assignment_db_archive,
-        get_existing_func=assignment_db_read_by_id,
+        archive_many_func=assignment_db_archive_many,
         to_dict_func=assignment_row_to_dict,
         read_by_ids_func=assignment_db_read_by_ids,
         no_success_msg="No assignments were archived.",
         not_found_msg="Assignment ID {id} not found or already archived.",
-        not_updated_msg="Assignment ID {id} not archived.",
         failure_status_code=422,
         success_status_code=200,
     )
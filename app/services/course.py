@@ -4,13 +4,16 @@ from app.models import (
     course_db_read_by_ids,
     course_db_insert,
     course_db_update,
-    course_db_archive,
+    course_db_insert_many,
+    course_db_update_many,
+    course_db_archive_many,
 )
 from app.utils import (
     course_dict_to_row,
     bulk_create_entities,
     bulk_update_entities,
     bulk_archive_entities,
+    traced,
 )
 
 
@@ -18,6 +21,7 @@ def course_row_to_dict(row):
     return row if isinstance(row, dict) else row
 
 
+@traced
 def get_all_courses(active_only):
     results = course_db_read_all(active_only=active_only)
     if results is None:
@@ -25,14 +29,17 @@ def get_all_courses(active_only):
     return results
 
 
+@traced
 def get_course_by_id(course_id: int):
     course = course_db_read_by_id(course_id)
     return course
 
 
+@traced
 def create_new_courses(data):
     return bulk_create_entities(
         data,
+        insert_many_func=course_db_insert_many,
         insert_func=course_db_insert,
         to_row_func=course_dict_to_row,
         to_dict_func=course_row_to_dict,
@@ -43,11 +50,12 @@ def create_new_courses(data):
     )
 
 
+@traced
 def update_courses(data):
     return bulk_update_entities(
         data,
+        update_many_func=course_db_update_many,
         update_func=course_db_update,
-        get_existing_func=course_db_read_by_id,
         to_row_func=course_dict_to_row,
         to_dict_func=course_row_to_dict,
         read_by_ids_func=course_db_read_by_ids,
@@ -60,16 +68,15 @@ def update_courses(data):
     )
 
 
+@traced
 def archive_courses(ids):
     return bulk_archive_entities(
         ids,
-        archive_func=course_db_archive,
-        get_existing_func=course_db_read_by_id,
+        archive_many_func=course_db_archive_many,
         to_dict_func=course_row_to_dict,
         read_by_ids_func=course_db_read_by_ids,
         no_success_msg="No courses were archived.",
         not_found_msg="Course ID {id} not found or already archived.",
-        not_updated_msg="Course ID {id} not archived.",
         failure_status_code=422,
         success_status_code=200,
     )
@@ -4,13 +4,16 @@ from app.models import (
     department_db_read_by_ids,
     department_db_insert,
     department_db_update,
-    department_db_archive,
+    department_db_insert_many,
+    department_db_update_many,
+    department_db_archive_many,
 )
 from app.utils import (
     department_dict_to_row,
     bulk_create_entities,
     bulk_update_entities,
     bulk_archive_entities,
+    traced,
 )
 
 
@@ -18,6 +21,7 @@ def department_row_to_dict(row):
     return row if isinstance(row, dict) else row
 
 
+@traced
 def get_all_departments(active_only):
     results = department_db_read_all(active_only=active_only)
     if results is None:
@@ -25,14 +29,17 @@ def get_all_departments(active_only):
     return results
 
 
+@traced
 def get_department_by_id(department_id: int):
     department = department_db_read_by_id(department_id)
     return department
 
 
+@traced
 def create_new_departments(data):
     return bulk_create_entities(
         data,
+        insert_many_func=department_db_insert_many,
         insert_func=department_db_insert,
         to_row_func=department_dict_to_row,
         to_dict_func=department_row_to_dict,
@@ -43,11 +50,12 @@ def create_new_departments(data):
     )
 
 
+@traced
 def update_departments(data):
     return bulk_update_entities(
         data,
+        update_many_func=department_db_update_many,
         update_func=department_db_update,
-        get_existing_func=department_db_read_by_id,
         to_row_func=department_dict_to_row,
         to_dict_func=department_row_to_dict,
         read_by_ids_func=department_db_read_by_ids,
@@ -60,16 +68,15 @@ def update_departments(data):
     )
 
 
+@traced
 def archive_departments(ids):
     return bulk_archive_entities(
         ids,
-        archive_func=department_db_archive,
-        get_existing_func=department_db_read_by_id,
+        archive_many_func=department_db_archive_many,
         to_dict_func=department_row_to_dict,
         read_by_ids_func=department_db_read_by_ids,
         no_success_msg="No departments were archived.",
         not_found_msg="Department ID {id} not found or already archived.",
-        not_updated_msg="Department ID {id} not archived.",
         failure_status_code=422,
         success_status_code=200,
     )
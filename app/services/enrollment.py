@@ -4,13 +4,16 @@ from app.models import (
     enrollment_db_read_by_ids,
     enrollment_db_insert,
     enrollment_db_update,
-    enrollment_db_archive,
+    enrollment_db_insert_many,
+    enrollment_db_update_many,
+    enrollment_db_archive_many,
 )
 from app.utils import (
     enrollment_dict_to_row,
     bulk_create_entities,
     bulk_update_entities,
     bulk_archive_entities,
+    traced,
 )
 
 
@@ -18,6 +21,7 @@ def enrollment_row_to_dict(row):
     return row if isinstance(row, dict) else row
 
 
+@traced
 def get_all_enrollments(active_only):
     results = enrollment_db_read_all(active_only=active_only)
     if results is None:
@@ -25,14 +29,17 @@ def get_all_enrollments(active_only):
     return results
 
 
+@traced
 def get_enrollment_by_id(enrollment_id: int):
     enrollment = enrollment_db_read_by_id(enrollment_id)
     return enrollment
 
 
+@traced
 def create_new_enrollments(data):
     return bulk_create_entities(
         data,
+        insert_many_func=enrollment_db_insert_many,
         insert_func=enrollment_db_insert,
         to_row_func=enrollment_dict_to_row,
         to_dict_func=enrollment_row_to_dict,
@@ -43,11 +50,12 @@ def create_new_enrollments(data):
     )
 
 
+@traced
 def update_enrollments(data):
     return bulk_update_entities(
         data,
+        update_many_func=enrollment_db_update_many,
         update_func=enrollment_db_update,
-        get_existing_func=enrollment_db_read_by_id,
         to_row_func=enrollment_dict_to_row,
         to_dict_func=enrollment_row_to_dict,
         read_by_ids_func=enrollment_db_read_by_ids,
@@ -60,16 +68,15 @@ def update_enrollments(data):
     )
 
 
+@traced
 def archive_enrollments(ids):
     return bulk_archive_entities(
         ids,
-        archive_func=enrollment_db_archive,
-        get_existing_func=enrollment_db_read_by_id,
+        archive_many_func=enrollment_db_archive_many,
         to_dict_func=enrollment_row_to_dict,
         read_by_ids_func=enrollment_db_read_by_ids,
         no_success_msg="No enrollments were archived.",
         not_found_msg="Enrollment ID {id} not found or already archived.",
-        not_updated_msg="Enrollment ID {id} not archived.",
         failure_status_code=422,
         success_status_code=200,
     )
@@ -4,13 +4,16 @@ from app.models import (
     instructor_db_read_by_ids,
     instructor_db_insert,
     instructor_db_update,
-    instructor_db_archive,
+    instructor_db_insert_many,
+    instructor_db_update_many,
+    instructor_db_archive_many,
 )
 from app.utils import (
     instructor_dict_to_row,
     bulk_create_entities,
     bulk_update_entities,
     bulk_archive_entities,
+    traced,
 )
 
 
@@ -18,6 +21,7 @@ def instructor_row_to_dict(row):
     return row if isinstance(row, dict) else row
 
 
+@traced
 def get_all_instructors(active_only):
     results = instructor_db_read_all(active_only=active_only)
     if results is None:
@@ -25,14 +29,17 @@ def get_all_instructors(active_only):
     return results
 
 
+@traced
 def get_instructor_by_id(instructor_id: int):
     instructor = instructor_db_read_by_id(instructor_id)
     return instructor
 
 
+@traced
 def create_new_instructors(data):
     return bulk_create_entities(
         data,
+        insert_many_func=instructor_db_insert_many,
         insert_func=instructor_db_insert,
         to_row_func=instructor_dict_to_row,
         to_dict_func=instructor_row_to_dict,
@@ -43,11 +50,12 @@ def create_new_instructors(data):
     )
 
 
+@traced
 def update_instructors(data):
     return bulk_update_entities(
         data,
+        update_many_func=instructor_db_update_many,
         update_func=instructor_db_update,
-        get_existing_func=instructor_db_read_by_id,
         to_row_func=instructor_dict_to_row,
         to_dict_func=instructor_row_to_dict,
         read_by_ids_func=instructor_db_read_by_ids,
@@ -60,16 +68,15 @@ def update_instructors(data):
     )
 
 
+@traced
 def archive_instructors(ids):
     return bulk_archive_entities(
         ids,
-        archive_func=instructor_db_archive,
-        get_existing_func=instructor_db_read_by_id,
+        archive_many_func=instructor_db_archive_many,
         to_dict_func=instructor_row_to_dict,
         read_by_ids_func=instructor_db_read_by_ids,
         no_success_msg="No instructors were archived.",
         not_found_msg="Instructor ID {id} not found or already archived.",
-        not_updated_msg="Instructor ID {id} not archived.",
         failure_status_code=422,
         success_status_code=200,
     )
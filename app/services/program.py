@@ -4,13 +4,16 @@ from app.models import (
     program_db_read_by_ids,
     program_db_insert,
     program_db_update,
-    program_db_archive,
+    program_db_insert_many,
+    program_db_update_many,
+    program_db_archive_many,
 )
 from app.utils import (
     program_dict_to_row,
     bulk_create_entities,
     bulk_update_entities,
     bulk_archive_entities,
+    traced,
 )
 
 
@@ -18,6 +21,7 @@ def program_row_to_dict(row):
     return row if isinstance(row, dict) else row
 
 
+@traced
 def get_all_programs(active_only):
     results = program_db_read_all(active_only=active_only)
     if results is None:
@@ -25,14 +29,17 @@ def get_all_programs(active_only):
     return results
 
 
+@traced
 def get_program_by_id(program_id: int):
     program = program_db_read_by_id(program_id)
     return program
 
 
+@traced
 def create_new_programs(data):
     return bulk_create_entities(
         data,
+        insert_many_func=program_db_insert_many,
         insert_func=program_db_insert,
         to_row_func=program_dict_to_row,
         to_dict_func=program_row_to_dict,
@@ -43,11 +50,12 @@ def create_new_programs(data):
     )
 
 
+@traced
 def update_programs(data):
     return bulk_update_entities(
         data,
+        update_many_func=program_db_update_many,
         update_func=program_db_update,
-        get_existing_func=program_db_read_by_id,
         to_row_func=program_dict_to_row,
         to_dict_func=program_row_to_dict,
         read_by_ids_func=program_db_read_by_ids,
@@ -60,16 +68,15 @@ def update_programs(data):
     )
 
 
+@traced
 def archive_programs(ids):
     return bulk_archive_entities(
         ids,
-        archive_func=program_db_archive,
-        get_existing_func=program_db_read_by_id,
+        archive_many_func=program_db_archive_many,
         to_dict_func=program_row_to_dict,
         read_by_ids_func=program_db_read_by_ids,
         no_success_msg="No programs were archived.",
         not_found_msg="Program ID {id} not found or already archived.",
-        not_updated_msg="Program ID {id} not archived.",
         failure_status_code=422,
         success_status_code=200,
     )
@@ -4,13 +4,16 @@ from app.models import (
     student_db_read_by_ids,
     student_db_insert,
     student_db_update,
-    student_db_archive,
+    student_db_insert_many,
+    student_db_update_many,
+    student_db_archive_many,
 )
 from app.utils import (
     student_dict_to_row,
     bulk_create_entities,
     bulk_update_entities,
     bulk_archive_entities,
+    traced,
 )
 
 
@@ -18,6 +21,7 @@ def student_row_to_dict(row):
     return row if isinstance(row, dict) else row
 
 
+@traced
 def get_all_students(active_only):
     results = student_db_read_all(active_only=active_only)
     if results is None:
@@ -25,14 +29,17 @@ def get_all_students(active_only):
     return results
 
 
+@traced
 def get_student_by_id(student_id: int):
     student = student_db_read_by_id(student_id)
     return student
 
 
+@traced
 def create_new_students(data):
     return bulk_create_entities(
         data,
+        insert_many_func=student_db_insert_many,
         insert_func=student_db_insert,
         to_row_func=student_dict_to_row,
         to_dict_func=student_row_to_dict,
@@ -43,11 +50,12 @@ def create_new_students(data):
     )
 
 
+@traced
 def update_students(data):
     return bulk_update_entities(
         data,
+        update_many_func=student_db_update_many,
         update_func=student_db_update,
-        get_existing_func=student_db_read_by_id,
         to_row_func=student_dict_to_row,
         to_dict_func=student_row_to_dict,
         read_by_ids_func=student_db_read_by_ids,
@@ -60,16 +68,15 @@ def update_students(data):
     )
 
 
+@traced
 def archive_students(ids):
     return bulk_archive_entities(
         ids,
-        archive_func=student_db_archive,
-        get_existing_func=student_db_read_by_id,
+        archive_many_func=student_db_archive_many,
         to_dict_func=student_row_to_dict,
         read_by_ids_func=student_db_read_by_ids,
         no_success_msg="No students were archived.",
         not_found_msg="Student ID {id} not found or already archived.",
-        not_updated_msg="Student ID {id} not archived.",
         failure_status_code=422,
         success_status_code=200,
     )
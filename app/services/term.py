@@ -4,13 +4,16 @@ from app.models import (
     term_db_read_by_ids,
     term_db_insert,
     term_db_update,
-    term_db_archive,
+    term_db_insert_many,
+    term_db_update_many,
+    term_db_archive_many,
 )
 from app.utils import (
     term_dict_to_row,
     bulk_create_entities,
     bulk_update_entities,
     bulk_archive_entities,
+    traced,
 )
 
 
@@ -18,6 +21,7 @@ def term_row_to_dict(row):
     return row if isinstance(row, dict) else row
 
 
+@traced
 def get_all_terms(active_only):
     results = term_db_read_all(active_only=active_only)
     if results is None:
@@ -25,14 +29,17 @@ def get_all_terms(active_only):
     return results
 
 
+@traced
 def get_term_by_id(term_id: int):
     term = term_db_read_by_id(term_id)
     return term
 
 
+@traced
 def create_new_terms(data):
     return bulk_create_entities(
         data,
+        insert_many_func=term_db_insert_many,
         insert_func=term_db_insert,
         to_row_func=term_dict_to_row,
         to_dict_func=term_row_to_dict,
@@ -43,11 +50,12 @@ def create_new_terms(data):
     )
 
 
+@traced
 def update_terms(data):
     return bulk_update_entities(
         data,
+        update_many_func=term_db_update_many,
         update_func=term_db_update,
-        get_existing_func=term_db_read_by_id,
         to_row_func=term_dict_to_row,
         to_dict_func=term_row_to_dict,
         read_by_ids_func=term_db_read_by_ids,
@@ -60,16 +68,15 @@ def update_terms(data):
     )
 
 
+@traced
 def archive_terms(ids):
     return bulk_archive_entities(
         ids,
-        archive_func=term_db_archive,
-        get_existing_func=term_db_read_by_id,
+        archive_many_func=term_db_archive_many,
         to_dict_func=term_row_to_dict,
         read_by_ids_func=term_db_read_by_ids,
         no_success_msg="No terms were archived.",
         not_found_msg="Term ID {id} not found or already archived.",
-        not_updated_msg="Term ID {id} not archived.",
         failure_status_code=422,
         success_status_code=200,
     )
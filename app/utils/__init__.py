@@ -23,8 +23,69 @@ from .handle_exceptions import (
     handle_exceptions_write,
 )
 
+from .server_timing import (
+    init_server_timing,
+    add_timing,
+    timed,
+    timed_service,
+)
+
+from .tracing import (
+    init_tracing,
+    start_span,
+    traced,
+)
+
 from .service_helper import (
     bulk_create_entities,
     bulk_update_entities,
     bulk_archive_entities,
 )
+
+from .query_stats import (
+    init_query_stats,
+    get_request_query_stats,
+)
+
+from .read_routing import init_read_routing
+
+from .deadlines import query_deadline
+
+from .admission import (
+    init_admission_control,
+    shed_response,
+)
+
+from .metrics import (
+    init_metrics,
+    generate_metrics,
+)
+
+from .admin import (
+    is_admin_request,
+    require_admin_token,
+)
+
+from .profiling import (
+    init_request_profiler,
+    sample_stacks,
+    format_collapsed,
+    write_collapsed,
+)
+
+from .heap import (
+    init_route_allocations,
+    heap_status,
+    start_tracing,
+    stop_tracing,
+    take_snapshot,
+    diff_snapshots,
+    set_traced_route,
+    route_allocations,
+)
+
+from .traffic_capture import (
+    init_traffic_capture,
+    body_shape,
+    sanitize_query,
+)
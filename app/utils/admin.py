@@ -0,0 +1,26 @@
+import hmac
+import logging
+import os
+from functools import wraps
+from flask import request
+from .routes_helpers import api_response_error
+
+
+def is_admin_request():
+    """True if the request carries X-Admin-Token matching ADMIN_TOKEN."""
+    expected = os.getenv("ADMIN_TOKEN")
+    provided = request.headers.get("X-Admin-Token", "")
+    return bool(expected) and hmac.compare_digest(provided, expected)
+
+
+def require_admin_token(func):
+    """Reject the request with 403 unless it carries a valid admin token."""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not is_admin_request():
+            logging.warning(f"Rejected unauthorized request to {request.path}")
+            return api_response_error("Forbidden.", 403)
+        return func(*args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,137 @@
+import logging
+import os
+import threading
+import time
+from flask import g, request
+from db.database import _pool_size
+from app.utils.query_stats import get_request_query_stats
+from app.utils.routes_helpers import api_response_error
+
+logger = logging.getLogger(__name__)
+
+# Share of a lowered concurrency limit each kind of request may fill. Writes
+# can use all of it, reads of one row most, and collection reads (the bulk,
+# export-like ones) only half, so they are shed first.
+PRIORITY_SHARES = {"write": 1.0, "read": 0.8, "bulk": 0.5}
+
+# Blueprints that never queue for a database connection, and must keep
+# answering (metrics, debug) while the API is overloaded
+EXEMPT_BLUEPRINTS = {"home", "metrics", "debug"}
+
+# AIMD: on overload the limit is multiplied by DECREASE, at most once per
+# COOLDOWN seconds so that one burst of slow requests counts once
+DECREASE = 0.7
+COOLDOWN = 1.0
+
+
+class AdaptiveLimit:
+    """
+    Concurrency limit for one worker process, adapted with AIMD (additive
+    increase, multiplicative decrease) like TCP congestion control. Each
+    request that finishes without a sign of overload raises the limit by
+    1 / limit, about one per round of `limit` requests, as long as the
+    limit is actually in use. Overload cuts it by DECREASE.
+
+    At its maximum the limit is open to every request. Once overload has
+    lowered it, a request only gets its share of what is left.
+    """
+
+    def __init__(self, maximum, minimum=1):
+        self.maximum = maximum
+        self.minimum = minimum
+        self.limit = float(maximum)
+        self.in_flight = 0
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+
+    def try_acquire(self, share=1.0):
+        """Admit a request unless that would exceed its share of the limit."""
+        with self._lock:
+            if self.limit < self.maximum:
+                allowed = max(self.minimum, int(self.limit * share))
+            else:
+                allowed = self.maximum
+            if self.in_flight >= allowed:
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self, overloaded=False):
+        with self._lock:
+            busy = self.in_flight >= self.limit / 2
+            self.in_flight -= 1
+            now = time.monotonic()
+            if overloaded:
+                if now - self._last_decrease >= COOLDOWN:
+                    self.limit = max(self.minimum, self.limit * DECREASE)
+                    self._last_decrease = now
+            elif busy:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+
+
+def _enabled():
+    return os.getenv("ADMISSION_CONTROL", "true").lower() != "false"
+
+
+def _target_pool_wait():
+    """Seconds of pool wait per request beyond which the worker counts as overloaded."""
+    return float(os.getenv("ADMISSION_TARGET_WAIT_MS", "50")) / 1000
+
+
+def _retry_after():
+    return os.getenv("ADMISSION_RETRY_AFTER", "1")
+
+
+def shed_response(message="The server is busy. Please try again shortly."):
+    """503 with Retry-After, for requests turned away under overload."""
+    response, status_code = api_response_error(message, 503)
+    response.headers["Retry-After"] = _retry_after()
+    return response, status_code
+
+
+def _priority():
+    if request.method not in ("GET", "HEAD"):
+        return "write"
+    return "read" if request.view_args else "bulk"
+
+
+def init_admission_control(app):
+    """
+    Shed requests with 503 Retry-After before they queue for a pooled
+    connection, once the worker's adaptive limit (AdaptiveLimit, starting
+    at DB_POOL_MAX) is reached. A request that waited longer than
+    ADMISSION_TARGET_WAIT_MS for connections, or failed with 503/504
+    (exhausted pool, query timeout), lowers the limit. Set
+    ADMISSION_CONTROL=false to turn it off.
+    """
+    if not _enabled():
+        return
+    limit = app.extensions["admission_limit"] = AdaptiveLimit(_pool_size()[1])
+
+    @app.before_request
+    def admit_request():
+        if request.blueprint in EXEMPT_BLUEPRINTS or request.endpoint is None:
+            return None
+        priority = _priority()
+        if not limit.try_acquire(PRIORITY_SHARES[priority]):
+            logger.warning(
+                f"Shedding {request.method} {request.path} ({priority}): "
+                f"{limit.in_flight} in flight, limit {limit.limit:.1f}"
+            )
+            return shed_response()
+        g.admitted = True
+        return None
+
+    @app.after_request
+    def check_overload(response):
+        if g.get("admitted"):
+            stats = get_request_query_stats()
+            g.overloaded = response.status_code in (503, 504) or (
+                stats is not None and stats.pool_wait > _target_pool_wait()
+            )
+        return response
+
+    @app.teardown_request
+    def release_request(exc):
+        if g.pop("admitted", False):
+            limit.release(g.pop("overloaded", False))
@@ -0,0 +1,25 @@
+from functools import wraps
+from db import deadlines
+
+
+def query_deadline(seconds):
+    """
+    Route decorator: the route's database statements share a budget of
+    `seconds` instead of DB_STATEMENT_TIMEOUT_MS each, for endpoints known to
+    need more (exports) or less time than the default. Goes below
+    handle_exceptions_read / handle_exceptions_write, which answer a
+    statement that runs out of time with 504.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            token = deadlines.begin(seconds)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                deadlines.end(token)
+
+        return wrapper
+
+    return decorator
@@ -1,6 +1,12 @@
 import logging
 from functools import wraps
+from psycopg2.pool import PoolError
 from app.utils import api_response_error
+from app.utils.admission import shed_response
+from db.deadlines import QueryTimeout
+
+# Statements that run out of time (db.deadlines) fail the request with 504
+QUERY_TIMEOUT_MESSAGE = "The database took too long to respond. Please try again."
 
 
 def handle_exceptions_read(default_status_code=500):
@@ -9,6 +15,12 @@ def handle_exceptions_read(default_status_code=500):
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
+            except QueryTimeout as e:
+                logging.warning(f"Read operation timed out: {e}")
+                return api_response_error(QUERY_TIMEOUT_MESSAGE, 504)
+            except PoolError as e:
+                logging.warning(f"No pooled connection for read operation: {e}")
+                return shed_response()
             except Exception as e:
                 logging.exception("Unexpected error in read operation.")
                 return api_response_error(
@@ -29,6 +41,12 @@ def handle_exceptions_write(default_status_code=500):
             except KeyError as e:
                 logging.warning(f"Missing required field: {str(e)}")
                 return api_response_error(f"Missing required field: {str(e)}.", 400)
+            except QueryTimeout as e:
+                logging.warning(f"Write operation timed out: {e}")
+                return api_response_error(QUERY_TIMEOUT_MESSAGE, 504)
+            except PoolError as e:
+                logging.warning(f"No pooled connection for write operation: {e}")
+                return shed_response()
             except Exception as e:
                 logging.exception("Unexpected error in write operation.")
                 return api_response_error(
@@ -0,0 +1,151 @@
+import threading
+import tracemalloc
+from collections import deque
+from flask import g, request
+
+# Snapshots are large, keep only the most recent few
+MAX_SNAPSHOTS = 5
+MAX_ROUTE_SAMPLES = 100
+
+_lock = threading.Lock()
+_snapshots = {}  # id -> tracemalloc.Snapshot, insertion ordered
+_next_snapshot_id = 1
+_route = {"endpoint": None, "samples": deque(maxlen=MAX_ROUTE_SAMPLES)}
+
+_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def _stat_to_dict(stat):
+    frame = stat.traceback[0]
+    return {
+        "file": frame.filename,
+        "line": frame.lineno,
+        "size_kb": round(stat.size / 1024, 1),
+        "count": stat.count,
+    }
+
+
+def _diff_to_dict(stat):
+    data = _stat_to_dict(stat)
+    data["size_diff_kb"] = round(stat.size_diff / 1024, 1)
+    data["count_diff"] = stat.count_diff
+    return data
+
+
+def heap_status():
+    current, peak = tracemalloc.get_traced_memory()
+    return {
+        "tracing": tracemalloc.is_tracing(),
+        "frames": tracemalloc.get_traceback_limit(),
+        "current_kb": round(current / 1024, 1),
+        "peak_kb": round(peak / 1024, 1),
+        "snapshots": list(_snapshots),
+        "route": _route["endpoint"],
+    }
+
+
+def start_tracing(frames=1):
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+    return heap_status()
+
+
+def stop_tracing():
+    with _lock:
+        _snapshots.clear()
+        _route["endpoint"] = None
+        _route["samples"].clear()
+    tracemalloc.stop()
+    return heap_status()
+
+
+def take_snapshot(group_by="lineno", limit=20):
+    """Store a snapshot and return its id with the top allocation sites."""
+    global _next_snapshot_id
+    if not tracemalloc.is_tracing():
+        raise RuntimeError("tracemalloc is not tracing; start it first.")
+
+    snapshot = tracemalloc.take_snapshot().filter_traces(_FILTERS)
+    with _lock:
+        snapshot_id = _next_snapshot_id
+        _next_snapshot_id += 1
+        _snapshots[snapshot_id] = snapshot
+        while len(_snapshots) > MAX_SNAPSHOTS:
+            _snapshots.pop(next(iter(_snapshots)))
+
+    stats = snapshot.statistics(group_by)
+    return {
+        "id": snapshot_id,
+        "total_kb": round(sum(stat.size for stat in stats) / 1024, 1),
+        "top": [_stat_to_dict(stat) for stat in stats[:limit]],
+    }
+
+
+def diff_snapshots(old_id, new_id, group_by="lineno", limit=20):
+    """Compare two stored snapshots by file or line, largest growth first."""
+    try:
+        old, new = _snapshots[old_id], _snapshots[new_id]
+    except KeyError as e:
+        raise KeyError(f"snapshot {e.args[0]}") from None
+    stats = new.compare_to(old, group_by)
+    return {
+        "from": old_id,
+        "to": new_id,
+        "size_diff_kb": round(sum(stat.size_diff for stat in stats) / 1024, 1),
+        "top": [_diff_to_dict(stat) for stat in stats[:limit]],
+    }
+
+
+def set_traced_route(endpoint):
+    """Record per-request peak allocation for the given Flask endpoint."""
+    with _lock:
+        _route["endpoint"] = endpoint
+        _route["samples"].clear()
+    return route_allocations()
+
+
+def route_allocations():
+    samples = list(_route["samples"])
+    peaks = [sample["peak_kb"] for sample in samples]
+    return {
+        "endpoint": _route["endpoint"],
+        "requests": len(samples),
+        "max_peak_kb": max(peaks) if peaks else None,
+        "avg_peak_kb": round(sum(peaks) / len(peaks), 1) if peaks else None,
+        "samples": samples,
+    }
+
+
+def init_route_allocations(app):
+    """
+    For the endpoint chosen via set_traced_route(), measure how far each
+    request pushes tracemalloc's peak above the memory traced when it started.
+    The peak is process-wide, so concurrent requests inflate each other.
+    """
+
+    @app.before_request
+    def start_route_allocation():
+        endpoint = _route["endpoint"]
+        if endpoint is None or request.endpoint != endpoint:
+            return
+        if not tracemalloc.is_tracing():
+            return
+        tracemalloc.reset_peak()
+        g.alloc_start = tracemalloc.get_traced_memory()[0]
+
+    @app.after_request
+    def finish_route_allocation(response):
+        started = g.pop("alloc_start", None)
+        if started is None or not tracemalloc.is_tracing():
+            return response
+        peak = tracemalloc.get_traced_memory()[1] - started
+        peak_kb = round(peak / 1024, 1)
+        _route["samples"].append(
+            {"path": request.full_path.rstrip("?"), "peak_kb": peak_kb}
+        )
+        response.headers["X-Alloc-Peak-KB"] = str(peak_kb)
+        return response
@@ -0,0 +1,17 @@
+from flask.json.provider import DefaultJSONProvider
+from db.rows import Row
+from .server_timing import timed
+
+
+class RowJSONProvider(DefaultJSONProvider):
+    """JSON provider that encodes db.rows.Row objects returned by the models."""
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, Row):
+            return o.as_dict()
+        return DefaultJSONProvider.default(o)
+
+    def dumps(self, obj, **kwargs):
+        with timed("json"):
+            return super().dumps(obj, **kwargs)
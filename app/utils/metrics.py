@@ -0,0 +1,100 @@
+import os
+import time
+from flask import g, request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from db.database import Database
+from db.instrumentation import add_query_listener
+
+# When PROMETHEUS_MULTIPROC_DIR is set (see entrypoint.sh) every gunicorn
+# worker writes its samples to mmap'd files in that directory and /metrics
+# merges them, so numbers aggregate across workers.
+
+REQUEST_LABELS = ["blueprint", "endpoint", "method", "status"]
+
+REQUEST_COUNT = Counter("http_requests_total", "HTTP requests handled.", REQUEST_LABELS)
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP request latency.", REQUEST_LABELS
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Time spent executing SQL statements.",
+    ["statement"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting for a pooled connection.",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5),
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Pooled connections by state.",
+    ["state"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_MAX = Gauge(
+    "db_pool_max_connections",
+    "Maximum pooled connections.",
+    multiprocess_mode="livesum",
+)
+# Hit ratio = rate(db_statement_cache_total{result="hit"}) / rate(db_statement_cache_total)
+DB_STATEMENT_CACHE = Counter(
+    "db_statement_cache",
+    "Prepared statement lookups per pooled connection.",
+    ["result"],
+)
+
+
+def _on_query(event):
+    DB_QUERY_DURATION.labels(event.name or "adhoc").observe(event.duration)
+    DB_POOL_WAIT.observe(event.pool_wait)
+    if event.cache:
+        DB_STATEMENT_CACHE.labels(event.cache).inc()
+
+
+def update_pool_gauges():
+    stats = Database.pool_stats()
+    DB_POOL_CONNECTIONS.labels("in_use").set(stats["in_use"])
+    DB_POOL_CONNECTIONS.labels("idle").set(stats["idle"])
+    DB_POOL_MAX.set(stats["max"])
+
+
+def generate_metrics():
+    """Return (payload, content type) for the /metrics endpoint."""
+    update_pool_gauges()
+    registry = REGISTRY
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def init_metrics(app):
+    """Record request count and latency for every endpoint except /metrics."""
+    add_query_listener(_on_query)
+
+    @app.after_request
+    def record_request_metrics(response):
+        started = g.get("request_started")
+        if started is None or request.endpoint == "metrics.metrics":
+            return response
+
+        labels = (
+            request.blueprint or "",
+            request.endpoint or "unmatched",
+            request.method,
+            str(response.status_code),
+        )
+        REQUEST_COUNT.labels(*labels).inc()
+        REQUEST_LATENCY.labels(*labels).observe(time.perf_counter() - started)
+        update_pool_gauges()
+        return response
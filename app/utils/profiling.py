@@ -0,0 +1,142 @@
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from flask import Response, g, request
+from .admin import is_admin_request
+from .routes_helpers import api_response_error
+
+
+def _profile_dir():
+    return os.getenv("PROFILE_DIR")
+
+
+def _timestamped_path(directory, suffix):
+    os.makedirs(directory, exist_ok=True)
+    name = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{time.time_ns() % 10**6}"
+    return os.path.join(directory, f"{name}{suffix}")
+
+
+# =======================
+# cProfile per request
+# =======================
+
+# cProfile hooks the whole process (sys.monitoring on 3.12+), so only one
+# request per worker can be profiled at a time
+_request_profiler_lock = threading.Lock()
+
+
+def init_request_profiler(app):
+    """
+    Run requests sent with "X-Profile: 1" and a valid admin token under
+    cProfile. The pstats report replaces the response body, or, when
+    PROFILE_DIR is set, is written there and named in X-Profile-File.
+    A profiled request that arrives while another is running gets 409.
+    """
+
+    @app.before_request
+    def start_request_profiler():
+        if request.headers.get("X-Profile") != "1" or not is_admin_request():
+            return None
+        if not _request_profiler_lock.acquire(blocking=False):
+            return api_response_error(
+                "Another request is being profiled. Try again when it finishes.",
+                409,
+            )
+        profiler = cProfile.Profile()
+        g.request_profiler = profiler
+        profiler.enable()
+        return None
+
+    @app.after_request
+    def finish_request_profiler(response):
+        profiler = g.get("request_profiler")
+        if profiler is None:
+            return response
+        profiler.disable()
+
+        directory = _profile_dir()
+        if directory:
+            path = _timestamped_path(directory, ".prof")
+            profiler.dump_stats(path)
+            response.headers["X-Profile-File"] = path
+            return response
+
+        output = io.StringIO()
+        stats = pstats.Stats(profiler, stream=output)
+        stats.sort_stats("cumulative").print_stats(50)
+        return Response(
+            output.getvalue(),
+            status=response.status_code,
+            content_type="text/plain; charset=utf-8",
+        )
+
+    @app.teardown_request
+    def release_request_profiler(exc):
+        profiler = g.pop("request_profiler", None)
+        if profiler is not None:
+            profiler.disable()
+            _request_profiler_lock.release()
+
+
+# =======================
+# Sampling profiler
+# =======================
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    filename = code.co_filename.replace(";", ":")
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+def _collapse(frame):
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+def sample_stacks(seconds, interval=0.005):
+    """
+    Sample every thread's stack via sys._current_frames() for the given
+    duration and return a Counter of collapsed stacks ("root;...;leaf").
+    The sampling thread itself is skipped.
+    """
+    own_thread = threading.get_ident()
+    thread_names = {}
+    stacks = Counter()
+    deadline = time.monotonic() + seconds
+
+    while time.monotonic() < deadline:
+        if len(thread_names) != threading.active_count():
+            thread_names = {t.ident: t.name for t in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_thread:
+                continue
+            thread_name = thread_names.get(thread_id, str(thread_id))
+            stacks[f"{thread_name};{_collapse(frame)}"] += 1
+        time.sleep(interval)
+
+    return stacks
+
+
+def format_collapsed(stacks):
+    """Render stacks in the collapsed format used by flamegraph.pl/speedscope."""
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+def write_collapsed(stacks):
+    """Write collapsed stacks under PROFILE_DIR and return the path, if configured."""
+    directory = _profile_dir()
+    if not directory:
+        return None
+    path = _timestamped_path(directory, ".collapsed")
+    with open(path, "w") as f:
+        f.write(format_collapsed(stacks))
+    return path
@@ -0,0 +1,91 @@
+import logging
+import os
+import time
+from flask import g, has_request_context, request
+from db.instrumentation import add_query_listener, normalize_sql
+
+logger = logging.getLogger(__name__)
+
+
+class RequestQueryStats:
+    """Database totals for the current Flask request."""
+
+    __slots__ = ("queries", "db_time", "pool_wait", "rows", "errors", "statements")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0  # seconds executing statements
+        self.pool_wait = 0.0  # seconds waiting for pooled connections
+        self.rows = 0
+        self.errors = 0
+        self.statements = {}  # statement name or normalised SQL -> count
+
+    def add(self, event):
+        self.queries += 1
+        self.db_time += event.duration
+        self.pool_wait += event.pool_wait
+        self.rows += event.rows
+        if event.error is not None:
+            self.errors += 1
+        key = event.name or normalize_sql(event.sql)
+        self.statements[key] = self.statements.get(key, 0) + 1
+
+    def repeated(self, threshold):
+        """Statements executed at least threshold times (likely N+1 patterns)."""
+        return {
+            key: count for key, count in self.statements.items() if count >= threshold
+        }
+
+
+def _repeated_query_threshold():
+    return int(os.getenv("DB_REPEATED_QUERY_WARN", "10"))
+
+
+def _on_query(event):
+    if not has_request_context():
+        return
+    stats = g.get("query_stats")
+    if stats is None:
+        stats = g.query_stats = RequestQueryStats()
+    stats.add(event)
+
+
+def get_request_query_stats():
+    """
+    Return the RequestQueryStats for the current request, or None outside a
+    request. Other middleware (metrics, Server-Timing) read the totals here.
+    """
+    if not has_request_context():
+        return None
+    stats = g.get("query_stats")
+    if stats is None:
+        stats = g.query_stats = RequestQueryStats()
+    return stats
+
+
+def init_query_stats(app):
+    """Aggregate db.instrumentation events per request for this app."""
+    add_query_listener(_on_query)
+
+    @app.before_request
+    def start_query_stats():
+        # request_started is shared with the metrics and Server-Timing middleware
+        g.request_started = time.perf_counter()
+        g.query_stats = RequestQueryStats()
+
+    @app.after_request
+    def report_query_stats(response):
+        stats = get_request_query_stats()
+        if stats and stats.queries:
+            repeated = stats.repeated(_repeated_query_threshold())
+            if repeated:
+                logger.warning(
+                    f"{request.method} {request.path} ran {stats.queries} queries; "
+                    f"repeated statements: {repeated}"
+                )
+            logger.debug(
+                f"{request.method} {request.path}: {stats.queries} queries, "
+                f"{stats.rows} rows, db {stats.db_time * 1000:.1f} ms, "
+                f"pool wait {stats.pool_wait * 1000:.1f} ms"
+            )
+        return response
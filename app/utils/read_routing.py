@@ -0,0 +1,75 @@
+import logging
+import os
+import re
+import psycopg2
+from flask import g, request
+from db import routing
+from db.database import Database
+
+# The client's last write, sent back on later requests
+LSN_COOKIE = "db_lsn"
+LSN_HEADER = "X-DB-LSN"
+_LSN = re.compile(r"[0-9A-F]{1,8}/[0-9A-F]{1,8}")
+
+# Requests whose reads may go to a replica; the others read what they update
+READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+CURRENT_LSN = "SELECT pg_current_wal_lsn()::text AS lsn;"
+
+logger = logging.getLogger(__name__)
+
+
+def _lsn_max_age():
+    """Seconds a client keeps reading its writes from caught-up replicas only."""
+    return int(os.getenv("DB_LSN_COOKIE_MAX_AGE", "60"))
+
+
+def _client_lsn():
+    lsn = request.headers.get(LSN_HEADER) or request.cookies.get(LSN_COOKIE)
+    if lsn and _LSN.fullmatch(lsn.upper()):
+        return lsn.upper()
+    return None
+
+
+def init_read_routing(app):
+    """
+    Run each request in a db.routing scope, for read-your-writes consistency
+    when DB_REPLICA_URLS is set. After a request writes, the response
+    carries the primary's WAL position in the db_lsn cookie and the
+    X-DB-LSN header. A client that sends either back only reads from
+    replicas that have replayed that far (the header wins over the cookie).
+    """
+
+    @app.before_request
+    def start_routing_scope():
+        g.routing_token = routing.begin(
+            primary=request.method not in READ_METHODS, min_lsn=_client_lsn()
+        )
+
+    @app.after_request
+    def send_write_lsn(response):
+        scope = routing.current()
+        if scope is not None and scope.wrote and routing.replica_urls():
+            try:
+                lsn = Database().execute_query(CURRENT_LSN)[0]["lsn"]
+            except (psycopg2.Error, RuntimeError) as e:
+                # The write went through, so the response must not fail: the
+                # client only loses its read-your-writes marker. psycopg2.Error
+                # covers PoolError and connection failures on checkout.
+                logger.warning(f"Could not read the primary's WAL position: {e}")
+                return response
+            response.headers[LSN_HEADER] = lsn
+            response.set_cookie(
+                LSN_COOKIE,
+                lsn,
+                max_age=_lsn_max_age(),
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+    @app.teardown_request
+    def end_routing_scope(exc):
+        token = g.pop("routing_token", None)
+        if token is not None:
+            routing.end(token)
@@ -0,0 +1,95 @@
+import os
+import time
+from contextlib import contextmanager
+from functools import wraps
+from flask import g, has_request_context, request
+from .query_stats import get_request_query_stats
+
+# Server-Timing metric name -> description shown in browser devtools
+TIMING_DESCRIPTIONS = {
+    "pool": "Pool acquire",
+    "db": "SQL execution",
+    "service": "Service logic (excl. SQL)",
+    "json": "JSON encoding",
+    "total": "Total",
+}
+
+
+def _db_seconds():
+    stats = get_request_query_stats()
+    return stats.db_time + stats.pool_wait if stats else 0.0
+
+
+def add_timing(name, seconds):
+    """Add seconds to a named Server-Timing bucket for the current request."""
+    if not has_request_context():
+        return
+    timings = g.get("timings")
+    if timings is None:
+        timings = g.timings = {}
+    timings[name] = timings.get(name, 0.0) + seconds
+
+
+@contextmanager
+def timed(name, exclude_db=False):
+    """
+    Time a block into a Server-Timing bucket. With exclude_db the SQL and pool
+    time spent inside the block is subtracted, since it is reported separately.
+    """
+    started = time.perf_counter()
+    db_before = _db_seconds() if exclude_db else 0.0
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        if exclude_db:
+            elapsed -= _db_seconds() - db_before
+        add_timing(name, max(elapsed, 0.0))
+
+
+def timed_service(func):
+    """Report a service helper's own time in the "service" bucket."""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with timed("service", exclude_db=True):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _server_timing_enabled(app):
+    return app.config["SERVER_TIMING"] or request.headers.get("X-Server-Timing") == "1"
+
+
+def build_server_timing_header(total):
+    timings = dict(g.get("timings") or {})
+    stats = get_request_query_stats()
+    if stats:
+        timings["pool"] = stats.pool_wait
+        timings["db"] = stats.db_time
+    timings["total"] = total
+
+    return ", ".join(
+        f'{name};dur={timings[name] * 1000:.2f};desc="{desc}"'
+        for name, desc in TIMING_DESCRIPTIONS.items()
+        if name in timings
+    )
+
+
+def init_server_timing(app):
+    """
+    Add a Server-Timing header when SERVER_TIMING is enabled, or when the
+    request carries "X-Server-Timing: 1".
+    """
+    app.config["SERVER_TIMING"] = os.getenv("SERVER_TIMING", "false").lower() == "true"
+
+    @app.after_request
+    def add_server_timing(response):
+        started = g.get("request_started")
+        if started is None or not _server_timing_enabled(app):
+            return response
+        response.headers["Server-Timing"] = build_server_timing_header(
+            time.perf_counter() - started
+        )
+        return response
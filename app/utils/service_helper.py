@@ -1,9 +1,131 @@
 from .routes_helpers import normalize_to_list
+from .server_timing import timed_service
+from .tracing import start_span, traced
 
 
+def clean_item(item):
+    # Clean string fields
+    if isinstance(item, dict):
+        return {k: (v.strip() if isinstance(v, str) else v) for k, v in item.items()}
+    return item
+
+
+def update_id(item):
+    """
+    The update item's ID as an int, also when sent as a string of digits
+    ("7"); None when it is missing or not a whole number.
+    """
+    entity_id = item.get("id")
+    if isinstance(entity_id, str) and entity_id.isascii() and entity_id.isdigit():
+        return int(entity_id)
+    if isinstance(entity_id, int) and not isinstance(entity_id, bool):
+        return entity_id
+    return None
+
+
+def requested_ids(items):
+    """Distinct IDs of the update items, in order of first appearance."""
+    return list(dict.fromkeys(update_id(item) for item in items if update_id(item)))
+
+
+def merge_updates(
+    items, existing_rows, *, to_row_func, to_dict_func, missing_id_msg, not_found_msg
+):
+    """
+    Merge each update item over the existing row with its ID and convert the
+    result to a DB row. Returns (ids, rows, errors).
+    """
+    existing_by_id = {row["id"]: row for row in existing_rows}
+    errors = []
+
+    # Merge incoming data over existing data; repeated IDs merge in order,
+    # as if the items had been applied one after another.
+    merged_by_id = {}
+    for item in items:
+        if not item.get("id"):
+            errors.append({"message": missing_id_msg})
+            continue
+
+        entity_id = update_id(item)
+        existing = merged_by_id.get(entity_id) or existing_by_id.get(entity_id)
+        if not existing:
+            errors.append({"message": not_found_msg.format(id=item["id"])})
+            continue
+
+        if not isinstance(existing, dict):
+            existing = to_dict_func(existing)
+        merged_by_id[entity_id] = {**existing, **item, "id": entity_id}
+
+    ids = []
+    rows = []
+    for entity_id, merged in merged_by_id.items():
+        try:
+            rows.append(to_row_func(merged))
+            ids.append(entity_id)
+        except (ValueError, RuntimeError) as e:
+            errors.append({"message": str(e)})
+    return ids, rows, errors
+
+
+INSERT_FAILED_MSG = "Failed to insert entity (unknown DB error)."
+
+
+def rows_to_create(items, to_row_func):
+    """Clean each create item and convert it to a DB row. Returns (rows, errors)."""
+    rows = []
+    errors = []
+    for item in items:
+        try:
+            rows.append(to_row_func(clean_item(item)))
+        except (ValueError, RuntimeError) as e:
+            errors.append({"message": str(e)})
+    return rows, errors
+
+
+def record_result(entity_id, done, done_ids, errors, failed_msg):
+    """
+    Record the outcome of writing one row on its own: its ID goes to
+    done_ids, or failed_msg (formatted with the ID) to errors.
+    """
+    if done:
+        done_ids.append(entity_id)
+    else:
+        errors.append({"message": failed_msg.format(id=entity_id)})
+
+
+def split_by_result(ids, returned_ids, errors, failed_msg):
+    """
+    Split the IDs a batch statement was given by whether it returned them.
+    Returns the ones it did; failed_msg is added to errors for the rest.
+    """
+    returned = set(returned_ids)
+    done_ids = []
+    for entity_id in ids:
+        record_result(entity_id, entity_id in returned, done_ids, errors, failed_msg)
+    return done_ids
+
+
+def archive_ids(ids, id_type):
+    """
+    Distinct IDs to archive, in order. Returns (ids, errors); errors is
+    non-empty when any ID is not an id_type.
+    """
+    if not all(isinstance(i, id_type) for i in ids):
+        return [], [{"message": f"All IDs must be of type {id_type.__name__}"}]
+    return list(dict.fromkeys(ids)), []
+
+
+def create_failure(errors, no_success_msg):
+    """Error payload for a create request that created nothing."""
+    return {"message": no_success_msg, "details": errors}
+
+
+@traced
+@timed_service
 def bulk_create_entities(
     data,
     *,
+    insert_many_func,  # function to insert a list of rows, returns new IDs
     insert_func,  # function to insert a single row, returns new ID
     to_row_func,  # converts dict to DB row format
     to_dict_func,  # converts DB row to dict for response
@@ -14,29 +136,28 @@ def bulk_create_entities(
 ):
     items = normalize_to_list(data)
     created_ids = []
-    errors = []
-
-    for item in items:
-        # Clean string fields
-        if isinstance(item, dict):
-            item = {
-                k: (v.strip() if isinstance(v, str) else v) for k, v in item.items()
-            }
 
+    with start_span("bulk_create_entities.items", {"items": len(items)}):
+        rows, errors = rows_to_create(items, to_row_func)
         try:
-            row = to_row_func(item)
-            new_id = insert_func(row)
-            if new_id:
-                created_ids.append(new_id)
-            else:
-                errors.append(
-                    {"message": "Failed to insert entity (unknown DB error)."}
-                )
-        except (ValueError, RuntimeError) as e:
-            errors.append({"message": str(e)})
+            created_ids = insert_many_func(rows)
+        except ValueError:
+            # One bad row fails the whole batch; insert row by row so every
+            # valid item is still created and each failure is reported.
+            # Anything else (a timeout, a lost connection, an exhausted pool)
+            # propagates, from the batch or any row: more statements would
+            # only add load, and the route answers 504/503/500.
+            for row in rows:
+                try:
+                    new_id = insert_func(row)
+                    record_result(
+                        new_id, new_id, created_ids, errors, INSERT_FAILED_MSG
+                    )
+                except ValueError as e:
+                    errors.append({"message": str(e)})
 
     if not created_ids:
-        return [], {"message": no_success_msg, "details": errors}, failure_status_code
+        return [], create_failure(errors, no_success_msg), failure_status_code
 
     created_rows = read_by_ids_func(created_ids)
     created_entities = [to_dict_func(row) for row in created_rows]
@@ -44,11 +165,13 @@ def bulk_create_entities(
     return created_entities, None, success_status_code
 
 
+@traced
+@timed_service
 def bulk_update_entities(
     data,
     *,
+    update_many_func,  # function to update rows by IDs, returns updated IDs
     update_func,  # function to update entity by ID and row, returns True/False
-    get_existing_func,  # function to read existing entity by ID
     to_row_func,  # converts dict to DB row format
     to_dict_func,  # converts DB row to dict for response
     read_by_ids_func,  # reads rows by list of IDs
@@ -59,41 +182,36 @@ def bulk_update_entities(
     success_status_code=200,
     failure_status_code=400,
 ):
-    items = normalize_to_list(data)
+    items = [clean_item(item) for item in normalize_to_list(data)]
     updated_ids = []
-    errors = []
-
-    for item in items:
-        # Clean string fields
-        if isinstance(item, dict):
-            item = {
-                k: (v.strip() if isinstance(v, str) else v) for k, v in item.items()
-            }
-
-        entity_id = item.get("id")
-        if not entity_id:
-            errors.append({"message": missing_id_msg})
-            continue
-
-        existing = get_existing_func(entity_id)
-        if not existing:
-            errors.append({"message": not_found_msg.format(id=entity_id)})
-            continue
 
-        # Merge incoming data over existing data
-        if not isinstance(existing, dict):
-            existing = to_dict_func(existing)
-        merged = {**existing, **item}
+    with start_span("bulk_update_entities.items", {"items": len(items)}):
+        update_ids = requested_ids(items)
+        existing_rows = read_by_ids_func(update_ids) if update_ids else []
+        ids, rows, errors = merge_updates(
+            items,
+            existing_rows,
+            to_row_func=to_row_func,
+            to_dict_func=to_dict_func,
+            missing_id_msg=missing_id_msg,
+            not_found_msg=not_found_msg,
+        )
 
         try:
-            row = to_row_func(merged)
-            success = update_func(entity_id, row)
-            if success:
-                updated_ids.append(entity_id)
-            else:
-                errors.append({"message": not_updated_msg.format(id=entity_id)})
-        except (ValueError, RuntimeError) as e:
-            errors.append({"message": str(e)})
+            changed = update_many_func(ids, rows) if rows else []
+        except ValueError:
+            # One bad row fails the whole batch; update row by row so every
+            # valid item is still applied and each failure is reported.
+            for entity_id, row in zip(ids, rows):
+                try:
+                    updated = update_func(entity_id, row)
+                    record_result(
+                        entity_id, updated, updated_ids, errors, not_updated_msg
+                    )
+                except ValueError as e:
+                    errors.append({"message": str(e)})
+        else:
+            updated_ids = split_by_result(ids, changed, errors, not_updated_msg)
 
     if not updated_ids:
         return [], errors, failure_status_code
@@ -104,42 +222,32 @@ def bulk_update_entities(
     return updated_entities, errors if errors else None, success_status_code
 
 
+@traced
+@timed_service
 def bulk_archive_entities(
     ids,
     *,
-    archive_func,  # function to archive entity by ID, returns rows updated count
-    get_existing_func,  # function to read existing entity by ID
+    archive_many_func,  # function to archive entities by IDs, returns archived IDs
     to_dict_func,  # converts DB row to dict for response
     read_by_ids_func,  # reads rows by list of IDs
     no_success_msg="No entities were archived.",
     id_type=int,
     missing_id_msg="Invalid ID.",
     not_found_msg="Entity ID {id} not found or already archived.",
-    not_updated_msg="Entity ID {id} not archived.",
     success_status_code=200,
     failure_status_code=422,
 ):
     normalized_ids = normalize_to_list(ids)
-    if not all(isinstance(i, id_type) for i in normalized_ids):
-        return [], [{"message": f"All IDs must be of type {id_type.__name__}"}], 400
-
-    archived_ids = []
-    errors = []
-
-    for entity_id in normalized_ids:
-        existing = get_existing_func(entity_id)
-        if not existing:
-            errors.append({"message": not_found_msg.format(id=entity_id)})
-            continue
+    unique_ids, errors = archive_ids(normalized_ids, id_type)
+    if errors:
+        return [], errors, 400
 
+    with start_span("bulk_archive_entities.items", {"items": len(normalized_ids)}):
         try:
-            rows_updated = archive_func(entity_id)
-            if rows_updated > 0:
-                archived_ids.append(entity_id)
-            else:
-                errors.append({"message": not_updated_msg.format(id=entity_id)})
-        except Exception as e:
-            errors.append({"message": str(e)})
+            archived = archive_many_func(unique_ids)
+        except ValueError as e:
+            return [], [{"message": str(e)}], failure_status_code
+        archived_ids = split_by_result(unique_ids, archived, errors, not_found_msg)
 
     if not archived_ids:
         return [], errors, failure_status_code
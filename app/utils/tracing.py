@@ -0,0 +1,340 @@
+"""
+Lightweight OpenTelemetry-compatible tracing.
+
+Each sampled Flask request gets a SERVER span; service functions decorated
+with @traced, bulk helper items and every Database statement nest below it.
+Finished traces are exported in OTLP/JSON, either appended to TRACE_FILE or
+POSTed to TRACE_OTLP_ENDPOINT (e.g. http://localhost:4318/v1/traces).
+
+Sampling is decided once per request (TRACE_SAMPLE_RATE, or the sampled flag
+of an incoming W3C traceparent header). Unsampled requests never create span
+objects, so the cost when tracing is off is one context variable lookup.
+"""
+
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from functools import wraps
+from flask import g, request
+from db.instrumentation import add_query_listener
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "school-flask-api"
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+_current_span = ContextVar("current_span", default=None)
+_exporter = None
+_exporter_lock = threading.Lock()
+
+
+class Span:
+    __slots__ = (
+        "trace",
+        "span_id",
+        "parent_span_id",
+        "name",
+        "kind",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "status",
+    )
+
+    def __init__(self, trace, name, parent_span_id=None, kind=SPAN_KIND_INTERNAL):
+        self.trace = trace
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_span_id = parent_span_id
+        self.name = name
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.attributes = {}
+        self.status = None
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def end(self, end_ns=None):
+        self.end_ns = end_ns or time.time_ns()
+        self.trace.spans.append(self)
+
+    def to_otlp(self):
+        span = {
+            "traceId": self.trace.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.status:
+            span["status"] = {"code": self.status}
+        return span
+
+
+class Trace:
+    """Spans finished so far for one sampled request."""
+
+    __slots__ = ("trace_id", "spans")
+
+    def __init__(self, trace_id=None):
+        self.trace_id = trace_id or f"{random.getrandbits(128):032x}"
+        self.spans = []
+
+
+def _otlp_attribute(key, value):
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+def to_otlp_payload(spans):
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [_otlp_attribute("service.name", SERVICE_NAME)]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": __name__},
+                        "spans": [span.to_otlp() for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+# =======================
+# Exporters
+# =======================
+
+
+class FileExporter:
+    """Append one OTLP/JSON payload per trace to a file."""
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+
+    def export(self, spans):
+        line = json.dumps(to_otlp_payload(spans), separators=(",", ":"))
+        with self.lock, open(self.path, "a") as f:
+            f.write(line + "\n")
+
+
+class OTLPHttpExporter:
+    """POST OTLP/JSON to a collector from a background thread."""
+
+    def __init__(self, endpoint, max_queue=1000):
+        self.endpoint = endpoint
+        self.queue = queue.Queue(maxsize=max_queue)
+        threading.Thread(target=self._run, name="otlp-exporter", daemon=True).start()
+
+    def export(self, spans):
+        try:
+            self.queue.put_nowait(spans)
+        except queue.Full:
+            logger.warning("Trace export queue full; dropping trace.")
+
+    def _run(self):
+        while True:
+            spans = self.queue.get()
+            body = json.dumps(to_otlp_payload(spans)).encode()
+            req = urllib.request.Request(
+                self.endpoint,
+                data=body,
+                headers={"Content-Type": "application/json"},
+                method="POST",
+            )
+            try:
+                urllib.request.urlopen(req, timeout=5).close()
+            except Exception as e:
+                logger.warning(f"Failed to export trace: {e}")
+
+
+def get_exporter():
+    """Exporter configured by TRACE_OTLP_ENDPOINT or TRACE_FILE, or None."""
+    global _exporter
+    if _exporter is None:
+        with _exporter_lock:
+            if _exporter is None:
+                if os.getenv("TRACE_OTLP_ENDPOINT"):
+                    _exporter = OTLPHttpExporter(os.getenv("TRACE_OTLP_ENDPOINT"))
+                elif os.getenv("TRACE_FILE"):
+                    _exporter = FileExporter(os.getenv("TRACE_FILE"))
+    return _exporter
+
+
+def set_exporter(exporter):
+    global _exporter
+    _exporter = exporter
+
+
+# =======================
+# Span API
+# =======================
+
+
+def current_span():
+    return _current_span.get()
+
+
+@contextmanager
+def _span(parent, name, attributes, kind):
+    span = Span(parent.trace, name, parent.span_id, kind)
+    if attributes:
+        span.attributes.update(attributes)
+    token = _current_span.set(span)
+    try:
+        yield span
+    except Exception:
+        span.status = STATUS_ERROR
+        raise
+    finally:
+        _current_span.reset(token)
+        span.end()
+
+
+def start_span(name, attributes=None, kind=SPAN_KIND_INTERNAL):
+    """
+    Context manager for a child of the current span. Outside a sampled
+    request it is a no-op and yields None.
+    """
+    parent = _current_span.get()
+    if parent is None:
+        return nullcontext()
+    return _span(parent, name, attributes, kind)
+
+
+def traced(func):
+    """Wrap a function in a span named after it."""
+    name = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if _current_span.get() is None:
+            return func(*args, **kwargs)
+        with start_span(name):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def _on_query(event):
+    parent = _current_span.get()
+    if parent is None:
+        return
+    end_ns = time.time_ns()
+    span = Span(parent.trace, f"db.{event.name or 'query'}", parent.span_id)
+    span.kind = SPAN_KIND_CLIENT
+    span.start_ns = end_ns - int(event.duration * 1e9)
+    span.attributes.update(
+        {
+            "db.system": "postgresql",
+            "db.statement": str(event.sql),
+            "db.rows": event.rows,
+            "db.pool_wait_ms": round(event.pool_wait * 1000, 3),
+        }
+    )
+    if event.error is not None:
+        span.status = STATUS_ERROR
+    span.end(end_ns)
+
+
+# =======================
+# Flask integration
+# =======================
+
+
+def _sample_rate():
+    return float(os.getenv("TRACE_SAMPLE_RATE", "0"))
+
+
+def _should_sample(traceparent):
+    if traceparent:
+        return traceparent.group(3) == "01"
+    rate = _sample_rate()
+    return rate > 0 and random.random() < rate
+
+
+def init_tracing(app):
+    """Start a SERVER span per sampled request and export it when done."""
+    add_query_listener(_on_query)
+
+    @app.before_request
+    def start_request_span():
+        traceparent = _TRACEPARENT.match(request.headers.get("traceparent", ""))
+        if not _should_sample(traceparent):
+            return
+        if get_exporter() is None:
+            return
+
+        trace = Trace(traceparent.group(1) if traceparent else None)
+        parent_id = traceparent.group(2) if traceparent else None
+        span = Span(trace, f"{request.method} {request.path}", parent_id)
+        span.kind = SPAN_KIND_SERVER
+        span.attributes.update(
+            {
+                "http.request.method": request.method,
+                "url.path": request.path,
+                "http.route": str(request.url_rule or ""),
+            }
+        )
+        g.trace_span = span
+        g.trace_token = _current_span.set(span)
+
+    @app.after_request
+    def record_response_status(response):
+        span = g.get("trace_span")
+        if span is not None:
+            span.set_attribute("http.response.status_code", response.status_code)
+            span.status = STATUS_ERROR if response.status_code >= 500 else STATUS_OK
+            response.headers["traceparent"] = (
+                f"00-{span.trace.trace_id}-{span.span_id}-01"
+            )
+        return response
+
+    @app.teardown_request
+    def finish_request_span(exc):
+        span = g.pop("trace_span", None)
+        if span is None:
+            return
+        try:
+            _current_span.reset(g.pop("trace_token"))
+        except ValueError:
+            # Torn down from a different context (e.g. preserved test context)
+            _current_span.set(None)
+        if exc is not None:
+            span.status = STATUS_ERROR
+        span.end()
+        exporter = get_exporter()
+        if exporter is not None:
+            exporter.export(span.trace.spans)
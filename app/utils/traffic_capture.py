@@ -0,0 +1,159 @@
+"""
+Opt-in capture of sanitized request logs for replay (benchmarks/replay.py).
+
+When TRAFFIC_CAPTURE_FILE is set, a sample of requests (set by
+TRAFFIC_CAPTURE_SAMPLE_RATE, default 1.0) is appended to that file as JSON
+lines with:
+
+- method, path and the matched route
+- the query string, with sensitive parameters redacted
+- a hash of the body and its shape
+- status, duration and statement count
+
+Bodies are never stored. The shape records the structure, list lengths
+and value types. Integer IDs (keys "id", "ids" and "*_id", and a body that
+is a bare list of integers) are kept, for every item of a list, so a
+replay touches the same rows. Headers are not recorded.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from flask import g, request
+from .query_stats import get_request_query_stats
+
+logger = logging.getLogger(__name__)
+
+SKIPPED_BLUEPRINTS = {"metrics", "debug"}
+
+_SENSITIVE = re.compile(r"pass|token|secret|key|auth|email", re.IGNORECASE)
+_ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+_lock = threading.Lock()
+
+
+def _is_id_key(key):
+    return key in ("id", "ids") or key.endswith("_id")
+
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _list_shape(items):
+    """
+    {"$list": n, "item": shape} for a list, the item shape taken from the
+    first item. For a list of objects, the ID keys are left out of "item"
+    and recorded for every item under "$ids": {key: [shape per item]},
+    with None where an item does not have the key.
+    """
+    if not items:
+        return {"$list": 0, "item": None}
+    first = items[0]
+    if not all(isinstance(item, dict) for item in items):
+        return {"$list": len(items), "item": body_shape(first)}
+
+    id_keys = list(dict.fromkeys(k for item in items for k in item if _is_id_key(k)))
+    shape = {
+        "$list": len(items),
+        "item": {k: body_shape(v, k) for k, v in first.items() if not _is_id_key(k)},
+    }
+    if id_keys:
+        shape["$ids"] = {
+            k: [body_shape(item[k], k) if k in item else None for item in items]
+            for k in id_keys
+        }
+    return shape
+
+
+def body_shape(value, key=None):
+    """
+    Describe a JSON value without its contents: "str", "date", "int",
+    "float", "bool" and "null" for scalars, {"$list": n, "item": shape}
+    for lists (see _list_shape) and a dict of shapes for objects. IDs are
+    kept as numbers, as is a top-level list of integers (the IDs of an
+    archive request).
+    """
+    if isinstance(value, dict):
+        return {k: body_shape(v, k) for k, v in value.items()}
+    if isinstance(value, list):
+        if (key is None or _is_id_key(key)) and value and all(map(_is_int, value)):
+            return value
+        return _list_shape(value)
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return value if key is not None and _is_id_key(key) else "int"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, str):
+        return "date" if _ISO_DATE.match(value) else "str"
+    return "null"
+
+
+def sanitize_query(args):
+    return {
+        key: "[redacted]" if _SENSITIVE.search(key) else args.getlist(key)
+        for key in args
+    }
+
+
+def _capture_file():
+    return os.getenv("TRAFFIC_CAPTURE_FILE")
+
+
+def _sample_rate():
+    return float(os.getenv("TRAFFIC_CAPTURE_SAMPLE_RATE", "1"))
+
+
+def build_record(response, duration):
+    raw = request.get_data(cache=True)
+    shape = None
+    if raw and request.is_json:
+        shape = body_shape(request.get_json(silent=True))
+    stats = get_request_query_stats()
+    return {
+        "ts": round(time.time() - duration, 6),
+        "method": request.method,
+        "path": request.path,
+        "route": str(request.url_rule) if request.url_rule else None,
+        "query": sanitize_query(request.args),
+        "body_sha256": hashlib.sha256(raw).hexdigest()[:16] if raw else None,
+        "body_shape": shape,
+        "body_bytes": len(raw),
+        "status": response.status_code,
+        "duration_ms": round(duration * 1000, 3),
+        "db_queries": stats.queries,
+    }
+
+
+def write_record(path, record):
+    line = json.dumps(record, separators=(",", ":")) + "\n"
+    # One write per line in append mode keeps lines whole across workers
+    with _lock, open(path, "a") as f:
+        f.write(line)
+
+
+def init_traffic_capture(app):
+    """Append a sanitized record per sampled request to TRAFFIC_CAPTURE_FILE."""
+
+    @app.after_request
+    def capture_request(response):
+        path = _capture_file()
+        if not path or request.blueprint in SKIPPED_BLUEPRINTS:
+            return response
+        if random.random() >= _sample_rate():
+            return response
+
+        started = g.get("request_started")
+        duration = time.perf_counter() - started if started is not None else 0.0
+        try:
+            write_record(path, build_record(response, duration))
+        except Exception as e:
+            logger.warning(f"Failed to capture request: {e}")
+        return response
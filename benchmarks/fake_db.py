@@ -0,0 +1,213 @@
+"""
+In-memory stand-in for db.database.Database.
+
+FakeDatabase answers the statements declared in the db.statements catalog
+by name ("<table>_read_all", "<table>_insert", ...), keeps table rows in
+dicts and optionally sleeps for a fixed latency per round trip. It lets the
+real service and model functions run without PostgreSQL, while counting
+every statement they issue.
+"""
+
+import importlib
+import re
+import time
+from collections import Counter
+from db.rows import row_class
+from db.statements import Statement
+
+MODEL_MODULES = [
+    "assignment",
+    "course",
+    "course_schedule",
+    "department",
+    "enrollment",
+    "instructor",
+    "program",
+    "student",
+    "term",
+]
+
+_INSERT_COLUMNS = re.compile(r"INSERT INTO \w+ \(([^)]*)\)")
+_SET_COLUMNS = re.compile(r"(\w+) = %s")
+_SET_FROM_COLUMNS = re.compile(r"(\w+) = v\.\w+")
+_ARRAY_TYPES = re.compile(r"%s::(\w+)\[\]")
+_ARRAY_ITEM = re.compile(r'NULL|"((?:[^"\\]|\\.)*)"')
+_OPERATIONS = (
+    "read_all_active",
+    "read_all",
+    "read_by_ids",
+    "read_by_id",
+    "insert_many",
+    "insert",
+    "update_many",
+    "update",
+    "archive_many",
+    "archive",
+)
+
+
+class FakeCursor:
+    def __init__(self, rowcount):
+        self.rowcount = rowcount
+
+
+class FakeDatabase:
+    def __init__(self, latency=0.0):
+        self.latency = latency  # seconds slept per round trip
+        self.tables = {}  # table -> {id: row dict}
+        self.next_ids = Counter()
+        self.queries = Counter()  # statement name -> executions
+
+    @property
+    def query_count(self):
+        return sum(self.queries.values())
+
+    def reset_counts(self):
+        self.queries.clear()
+
+    def seed(self, table, rows):
+        """Insert row dicts directly (no round trips); ids are assigned if absent."""
+        data = self.tables.setdefault(table, {})
+        for row in rows:
+            row = dict(row)
+            if "id" not in row:
+                self.next_ids[table] += 1
+                row["id"] = self.next_ids[table]
+            row.setdefault("is_archived", False)
+            data[row["id"]] = row
+            self.next_ids[table] = max(self.next_ids[table], row["id"])
+
+    # Database API
+
+    def execute_query(self, query, params=()):
+        if not isinstance(query, Statement):
+            raise NotImplementedError("FakeDatabase only runs catalog statements")
+        query.check_params(params)
+        self.queries[query.name] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        table, operation = _split_name(query.name)
+        rows = self.tables.setdefault(table, {})
+        return getattr(self, f"_{operation}")(table, rows, query, params)
+
+    def execute_many(self, query, param_list):
+        for params in param_list:
+            self.execute_query(query, params)
+        return FakeCursor(len(param_list))
+
+    # Statement handlers
+
+    def _rows(self, rows):
+        return [row_class(row.keys())(tuple(row.values())) for row in rows]
+
+    def _read_all(self, table, rows, query, params):
+        return self._rows(list(rows.values()))
+
+    def _read_all_active(self, table, rows, query, params):
+        if "status = 'active'" in query:
+            active = [row for row in rows.values() if row.get("status") == "active"]
+        else:
+            active = [row for row in rows.values() if not row["is_archived"]]
+        return self._rows(active)
+
+    def _read_by_id(self, table, rows, query, params):
+        row = rows.get(params[0])
+        return self._rows([row] if row else [])
+
+    def _read_by_ids(self, table, rows, query, params):
+        return self._rows([rows[i] for i in params[0] if i in rows])
+
+    def _insert(self, table, rows, query, params):
+        columns = [c.strip() for c in _INSERT_COLUMNS.search(query).group(1).split(",")]
+        self.seed(table, [dict(zip(columns, params))])
+        return self._rows([{"id": self.next_ids[table]}])
+
+    def _update(self, table, rows, query, params):
+        *values, entity_id = params
+        row = rows.get(entity_id)
+        if row is None or row["is_archived"]:
+            return FakeCursor(0)
+        columns = [c for c in _SET_COLUMNS.findall(query) if c != "id"]
+        row.update(zip(columns, values))
+        return FakeCursor(1)
+
+    def _insert_many(self, table, rows, query, params):
+        columns = [c.strip() for c in _INSERT_COLUMNS.search(query).group(1).split(",")]
+        new_ids = []
+        for values in zip(*_parse_arrays(query, params)):
+            self.seed(table, [dict(zip(columns, values))])
+            new_ids.append({"id": self.next_ids[table]})
+        return self._rows(new_ids)
+
+    def _update_many(self, table, rows, query, params):
+        columns = _SET_FROM_COLUMNS.findall(query)
+        updated = []
+        for entity_id, *values in zip(*_parse_arrays(query, params)):
+            row = rows.get(entity_id)
+            if row is None or row["is_archived"]:
+                continue
+            row.update(zip(columns, values))
+            updated.append({"id": entity_id})
+        return self._rows(updated)
+
+    def _archive_many(self, table, rows, query, params):
+        archived = []
+        for entity_id in params[0]:
+            if self._archive(table, rows, query, (entity_id,)).rowcount:
+                archived.append({"id": entity_id})
+        return self._rows(archived)
+
+    def _archive(self, table, rows, query, params):
+        row = rows.get(params[0])
+        if row is None or row["is_archived"]:
+            return FakeCursor(0)
+        row["is_archived"] = True
+        if "status = 'inactive'" in query:
+            row["status"] = "inactive"
+        return FakeCursor(1)
+
+
+def _parse_arrays(query, params):
+    """Decode the array literals sent by db.db_utils.to_column_arrays()."""
+    arrays = []
+    for array_type, literal in zip(_ARRAY_TYPES.findall(query), params):
+        values = []
+        for match in _ARRAY_ITEM.finditer(literal):
+            if match.group(1) is None:
+                values.append(None)
+                continue
+            text = re.sub(r"\\(.)", r"\1", match.group(1))
+            if array_type == "integer":
+                values.append(int(text))
+            elif array_type == "boolean":
+                values.append(text == "t")
+            else:
+                values.append(text)
+        arrays.append(values)
+    return arrays
+
+
+def _split_name(name):
+    for operation in _OPERATIONS:
+        suffix = f"_{operation}"
+        if name.endswith(suffix):
+            return name[: -len(suffix)], operation
+    raise NotImplementedError(f"FakeDatabase cannot run statement {name}")
+
+
+def install(fake):
+    """
+    Point every app.models module at the fake and return a function that
+    restores the real Database instances.
+    """
+    modules = [importlib.import_module(f"app.models.{m}") for m in MODEL_MODULES]
+    originals = [module.db for module in modules]
+    for module in modules:
+        module.db = fake
+
+    def restore():
+        for module, original in zip(modules, originals):
+            module.db = original
+
+    return restore
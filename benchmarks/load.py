@@ -0,0 +1,428 @@
+"""
+HTTP load generator for a running API (e.g. the docker-compose stack).
+
+Drives a weighted mix of real endpoints over keep-alive connections
+(httpx.AsyncClient, at most --concurrency of them) and reports throughput,
+error rate and p50/p95/p99 latency per endpoint. Two load models are
+supported:
+
+- closed loop (default): --concurrency clients send requests back to back
+- open loop: --rps requests per second are scheduled on a fixed clock; each
+  latency is measured from the scheduled start, so time spent waiting for
+  a free connection counts against the server (no coordinated omission)
+
+Usage:
+    python -m benchmarks.load --url http://localhost:5000 --duration 30
+    python -m benchmarks.load --rps 200 --concurrency 50
+    python -m benchmarks.load --mix mix.json --output results.json
+    python -m benchmarks.load --baseline results.json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import sys
+import time
+from collections import Counter
+import httpx
+
+# Endpoint mix used when --mix is not given. IDs match the sample data
+# loaded by db/init.py. Strings in bodies may use "{seq}" (a counter unique
+# within the run) and "{randint:A:B}" (a whole-string placeholder replaced
+# by an int); {"$repeat": N, "item": ...} expands to a list of N items, in
+# which "{index}" is the item's position.
+#
+# Bulk inserts go to /students: live enrollments are unique per student and
+# course, and the sample data has only 50 such pairs, so posting enrollments
+# would mostly measure the duplicate-key fallback.
+DEFAULT_MIX = [
+    {"name": "GET /students", "method": "GET", "path": "/students", "weight": 30},
+    {
+        "name": "GET /students/<id>",
+        "method": "GET",
+        "path": "/students/{randint:1:10}",
+        "weight": 10,
+    },
+    {
+        "name": "GET /courses?active_only",
+        "method": "GET",
+        "path": "/courses?active_only=true",
+        "weight": 20,
+    },
+    {"name": "GET /enrollments", "method": "GET", "path": "/enrollments", "weight": 15},
+    {
+        "name": "POST /students",
+        "method": "POST",
+        "path": "/students",
+        "weight": 5,
+        "body": [
+            {
+                "first_name": "Load",
+                "last_name": "Test{seq}",
+                "email": "load.{run}.{seq}@example.com",
+                "program_id": "{randint:1:4}",
+            }
+        ],
+        "expect": [201],
+    },
+    {
+        "name": "POST /students (bulk 20)",
+        "method": "POST",
+        "path": "/students",
+        "weight": 10,
+        "body": {
+            "$repeat": 20,
+            "item": {
+                "first_name": "Load",
+                "last_name": "Bulk{seq}",
+                "email": "load.{run}.{seq}.{index}@example.com",
+                "program_id": "{randint:1:4}",
+            },
+        },
+        "expect": [201],
+    },
+    {
+        "name": "PUT /enrollments (bulk 10)",
+        "method": "PUT",
+        "path": "/enrollments",
+        "weight": 5,
+        "body": {"$repeat": 10, "item": {"id": "{randint:1:10}", "grade": "B"}},
+        "expect": [200],
+    },
+    {
+        "name": "PATCH /courses",
+        "method": "PATCH",
+        "path": "/courses",
+        "weight": 2,
+        "body": {"ids": ["{randint:1:5}"]},
+        # Archiving an already archived course is reported as 422
+        "expect": [200, 422],
+    },
+]
+
+_RANDINT = re.compile(r"^\{randint:(-?\d+):(-?\d+)\}$")
+
+
+# =======================
+# HTTP client
+# =======================
+
+
+def http_client(url, concurrency, timeout=10.0):
+    """
+    Client for url keeping up to concurrency connections alive. Requests
+    beyond that wait for a free connection, however long it takes, so the
+    wait counts against the latency measured by the caller.
+    """
+    return httpx.AsyncClient(
+        base_url=url,
+        headers={"Accept": "application/json"},
+        limits=httpx.Limits(
+            max_connections=concurrency, max_keepalive_connections=concurrency
+        ),
+        timeout=httpx.Timeout(timeout, pool=None),
+    )
+
+
+async def send(client, recorder, endpoint, path, body, started):
+    """Send one request and record its status, or the error, and latency."""
+    try:
+        response = await client.request(endpoint.method, path, json=body)
+    except httpx.HTTPError as e:
+        recorder.record(endpoint, time.perf_counter() - started, error=e)
+    else:
+        recorder.record(endpoint, time.perf_counter() - started, response.status_code)
+
+
+# =======================
+# Endpoint mix
+# =======================
+
+
+class Endpoint:
+    def __init__(self, name, method, path, weight=1, body=None, expect=None):
+        self.name = name
+        self.method = method.upper()
+        self.path = path
+        self.weight = weight
+        self.body = body
+        self.expect = set(expect or ([200] if self.method == "GET" else [200, 201]))
+
+    @classmethod
+    def from_dict(cls, spec):
+        return cls(
+            name=spec.get("name") or f"{spec['method'].upper()} {spec['path']}",
+            method=spec["method"],
+            path=spec["path"],
+            weight=spec.get("weight", 1),
+            body=spec.get("body"),
+            expect=spec.get("expect"),
+        )
+
+
+def load_mix(path=None):
+    """Endpoints from a JSON file (a list of endpoint specs) or the default mix."""
+    specs = DEFAULT_MIX
+    if path:
+        with open(path) as f:
+            specs = json.load(f)
+    return [Endpoint.from_dict(spec) for spec in specs]
+
+
+def render(template, context, rng):
+    """Expand placeholders in a path or request body template."""
+    if isinstance(template, str):
+        match = _RANDINT.match(template)
+        if match:
+            return rng.randint(int(match.group(1)), int(match.group(2)))
+        for key, value in context.items():
+            template = template.replace(f"{{{key}}}", str(value))
+        return re.sub(
+            r"\{randint:(-?\d+):(-?\d+)\}",
+            lambda m: str(rng.randint(int(m.group(1)), int(m.group(2)))),
+            template,
+        )
+    if isinstance(template, list):
+        return [render(item, context, rng) for item in template]
+    if isinstance(template, dict):
+        if "$repeat" in template:
+            return [
+                render(template["item"], {**context, "index": index}, rng)
+                for index in range(template["$repeat"])
+            ]
+        return {key: render(value, context, rng) for key, value in template.items()}
+    return template
+
+
+# =======================
+# Results
+# =======================
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list (p in 0..100)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * p // 100))
+    return sorted_values[int(rank) - 1]
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies = {}  # endpoint name -> [seconds]
+        self.statuses = {}  # endpoint name -> Counter of status codes / errors
+        self.errors = Counter()
+
+    def record(self, endpoint, latency, status=None, error=None):
+        self.latencies.setdefault(endpoint.name, []).append(latency)
+        statuses = self.statuses.setdefault(endpoint.name, Counter())
+        if error is not None:
+            statuses[type(error).__name__] += 1
+            self.errors[endpoint.name] += 1
+        else:
+            statuses[str(status)] += 1
+            if status not in endpoint.expect:
+                self.errors[endpoint.name] += 1
+
+    def summary(self, elapsed):
+        endpoints = {
+            name: _stats(latencies, self.errors[name], self.statuses[name], elapsed)
+            for name, latencies in self.latencies.items()
+        }
+        every = [value for values in self.latencies.values() for value in values]
+        total = _stats(every, sum(self.errors.values()), Counter(), elapsed)
+        del total["statuses"]
+        return {"endpoints": endpoints, "total": total}
+
+
+def _stats(latencies, errors, statuses, elapsed):
+    ordered = sorted(latencies)
+    count = len(ordered)
+    return {
+        "requests": count,
+        "errors": errors,
+        "error_rate": round(errors / count, 4) if count else 0.0,
+        "rps": round(count / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(sum(ordered) / count * 1000, 2) if count else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 2),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 2),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 2),
+        "max_ms": round(ordered[-1] * 1000, 2) if count else 0.0,
+        "statuses": dict(sorted(statuses.items())),
+    }
+
+
+# =======================
+# Runner
+# =======================
+
+
+class LoadTest:
+    def __init__(
+        self,
+        url,
+        endpoints,
+        duration=30.0,
+        concurrency=10,
+        rps=None,
+        timeout=10.0,
+        seed=None,
+    ):
+        self.url = url
+        self.endpoints = endpoints
+        self.weights = [endpoint.weight for endpoint in endpoints]
+        self.duration = duration
+        self.concurrency = concurrency
+        self.rps = rps
+        self.timeout = timeout
+        self.rng = random.Random(seed)
+        self.context = {"run": int(time.time()), "seq": 0}
+        self.recorder = Recorder()
+
+    def _next_request(self):
+        endpoint = self.rng.choices(self.endpoints, self.weights)[0]
+        self.context["seq"] += 1
+        path = render(endpoint.path, self.context, self.rng)
+        body = render(endpoint.body, self.context, self.rng)
+        return endpoint, path, body
+
+    async def _send(self, client, started):
+        endpoint, path, body = self._next_request()
+        await send(client, self.recorder, endpoint, path, body, started)
+
+    async def _closed_loop(self, client, deadline):
+        async def worker():
+            while time.perf_counter() < deadline:
+                await self._send(client, time.perf_counter())
+
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+
+    async def _open_loop(self, client, started, deadline):
+        tasks = set()
+        interval = 1 / self.rps
+        sent = 0
+        while True:
+            scheduled = started + sent * interval
+            if scheduled >= deadline:
+                break
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            task = asyncio.create_task(self._send(client, scheduled))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            sent += 1
+
+        await asyncio.gather(*tasks)
+
+    async def run(self):
+        async with http_client(self.url, self.concurrency, self.timeout) as client:
+            started = time.perf_counter()
+            deadline = started + self.duration
+            if self.rps:
+                await self._open_loop(client, started, deadline)
+            else:
+                await self._closed_loop(client, deadline)
+            return self.recorder.summary(time.perf_counter() - started)
+
+
+def run_load_test(url, endpoints, **options):
+    """Run a load test and return the summary dict."""
+    return asyncio.run(LoadTest(url, endpoints, **options).run())
+
+
+def compare(results, baseline, tolerance):
+    """
+    Return regressions against a baseline summary: p95/p99 latency may grow
+    by tolerance, throughput may drop by tolerance, error rate may not grow.
+    """
+    regressions = []
+    for name, current in results["endpoints"].items():
+        base = baseline["endpoints"].get(name)
+        if base is None:
+            continue
+        for metric in ("p95_ms", "p99_ms"):
+            # Ignore sub-millisecond noise
+            if (
+                current[metric] > base[metric] * (1 + tolerance)
+                and current[metric] - base[metric] > 1
+            ):
+                regressions.append(
+                    f"{name}: {metric} {base[metric]} -> {current[metric]}"
+                )
+        if current["rps"] < base["rps"] * (1 - tolerance):
+            regressions.append(f"{name}: rps {base['rps']} -> {current['rps']}")
+        if current["error_rate"] > base["error_rate"]:
+            regressions.append(
+                f"{name}: error_rate {base['error_rate']} -> {current['error_rate']}"
+            )
+    return regressions
+
+
+def print_results(summary):
+    print(
+        f"{'endpoint':<32} {'reqs':>7} {'rps':>8} {'err %':>6} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}"
+    )
+    rows = list(summary["endpoints"].items()) + [("TOTAL", summary["total"])]
+    for name, r in rows:
+        print(
+            f"{name:<32} {r['requests']:>7} {r['rps']:>8.1f} "
+            f"{r['error_rate'] * 100:>6.2f} {r['p50_ms']:>8.2f} "
+            f"{r['p95_ms']:>8.2f} {r['p99_ms']:>8.2f} {r['max_ms']:>8.2f}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://127.0.0.1:5000")
+    parser.add_argument("--mix", help="JSON file with endpoint specs")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--rps", type=float, help="open loop target rate")
+    parser.add_argument("--timeout", type=float, default=10.0, help="seconds")
+    parser.add_argument("--seed", type=int, help="seed for the endpoint mix")
+    parser.add_argument("--output", help="write results JSON to this path")
+    parser.add_argument("--baseline", help="compare against this results JSON")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    summary = run_load_test(
+        args.url,
+        load_mix(args.mix),
+        duration=args.duration,
+        concurrency=args.concurrency,
+        rps=args.rps,
+        timeout=args.timeout,
+        seed=args.seed,
+    )
+    summary["config"] = {
+        "url": args.url,
+        "mix": args.mix or "default",
+        "duration": args.duration,
+        "concurrency": args.concurrency,
+        "rps": args.rps,
+    }
+    print_results(summary)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(summary, json.load(f), args.tolerance)
+        if regressions:
+            print("\nRegressions against baseline:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print("\nNo regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+"""
+Replay captured production traffic against a running instance.
+
+Reads the JSON lines written by app.utils.traffic_capture, rebuilds each
+request (bodies are synthesized from the captured shape, IDs are reused)
+and re-issues it at the original pace, scaled by --speed, so bursts such
+as term-start enrollment spikes are reproduced. Results use the same
+format as benchmarks.load, so two builds can be compared.
+
+Usage:
+    python -m benchmarks.replay capture.jsonl --url http://localhost:5000 --output a.json
+    python -m benchmarks.replay capture.jsonl --speed 4 --baseline a.json
+    python -m benchmarks.replay --diff a.json b.json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from urllib.parse import urlencode
+from benchmarks.load import (
+    Endpoint,
+    Recorder,
+    compare,
+    http_client,
+    print_results,
+    send,
+)
+
+SYNTHETIC_DATE = "2025-01-01"
+
+
+def load_capture(path, limit=None):
+    """Captured records ordered by start time."""
+    records = []
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                records.append(json.loads(line))
+    records.sort(key=lambda record: record["ts"])
+    return records[:limit] if limit else records
+
+
+def synthesize(shape, context, key=None):
+    """Build a request body matching a shape from traffic_capture.body_shape()."""
+    if isinstance(shape, dict):
+        if "$list" in shape:
+            return _synthesize_list(shape, context)
+        return {k: synthesize(v, context, k) for k, v in shape.items()}
+    if isinstance(shape, list):
+        return list(shape)  # captured IDs
+    if isinstance(shape, (int, float)):
+        return shape
+    if shape == "str":
+        context["seq"] += 1
+        if key and "email" in key:
+            return f"replay.{context['run']}.{context['seq']}@example.com"
+        return f"replay-{context['seq']}"
+    return {"date": SYNTHETIC_DATE, "int": 1, "float": 0.0, "bool": False}.get(shape)
+
+
+def _synthesize_list(shape, context):
+    """One item per captured item, each with its own captured IDs."""
+    items = [synthesize(shape["item"], context) for _ in range(shape["$list"])]
+    for key, values in (shape.get("$ids") or {}).items():
+        for item, value in zip(items, values):
+            if value is not None:
+                item[key] = synthesize(value, context, key)
+    return items
+
+
+def build_request(record, context):
+    """Return (endpoint name, method, path with query, body) for a record."""
+    query = {
+        key: values
+        for key, values in (record.get("query") or {}).items()
+        if values != "[redacted]"
+    }
+    path = record["path"]
+    if query:
+        path = f"{path}?{urlencode(query, doseq=True)}"
+    body = None
+    if record.get("body_shape") is not None:
+        body = synthesize(record["body_shape"], context)
+    name = f"{record['method']} {record.get('route') or record['path']}"
+    return name, record["method"], path, body
+
+
+def endpoints_for(records):
+    """One Endpoint per route; statuses seen in the capture count as expected."""
+    endpoints = {}
+    for record in records:
+        name = f"{record['method']} {record.get('route') or record['path']}"
+        endpoint = endpoints.get(name)
+        if endpoint is None:
+            endpoint = endpoints[name] = Endpoint(name, record["method"], name)
+            endpoint.expect = set()
+        endpoint.expect.add(record["status"])
+    return endpoints
+
+
+async def _replay(url, records, speed, concurrency, timeout):
+    endpoints = endpoints_for(records)
+    recorder = Recorder()
+    context = {"run": int(time.time()), "seq": 0}
+
+    async with http_client(url, concurrency, timeout) as client:
+        started = time.perf_counter()
+        first_ts = records[0]["ts"] if records else 0
+        tasks = set()
+        for record in records:
+            name, _, path, body = build_request(record, context)
+            scheduled = time.perf_counter()
+            if speed > 0:
+                scheduled = started + (record["ts"] - first_ts) / speed
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            task = asyncio.create_task(
+                send(client, recorder, endpoints[name], path, body, scheduled)
+            )
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        await asyncio.gather(*tasks)
+        return recorder.summary(time.perf_counter() - started)
+
+
+def replay(url, records, speed=1.0, concurrency=50, timeout=10.0):
+    """
+    Re-issue records against url. speed scales the original pacing
+    (2.0 = twice as fast); 0 sends as fast as concurrency allows.
+    """
+    return asyncio.run(_replay(url, records, speed, concurrency, timeout))
+
+
+def diff_results(a, b):
+    """Rows of (endpoint, metric, a, b, change %) for endpoints in both results."""
+    rows = []
+    for name, stats_a in a["endpoints"].items():
+        stats_b = b["endpoints"].get(name)
+        if stats_b is None:
+            continue
+        for metric in ("p50_ms", "p95_ms", "p99_ms", "error_rate"):
+            before, after = stats_a[metric], stats_b[metric]
+            change = (after - before) / before * 100 if before else 0.0
+            rows.append((name, metric, before, after, round(change, 1)))
+    return rows
+
+
+def print_diff(rows):
+    print(f"{'endpoint':<40} {'metric':<10} {'A':>9} {'B':>9} {'change':>8}")
+    for name, metric, before, after, change in rows:
+        print(f"{name:<40} {metric:<10} {before:>9} {after:>9} {change:>+7.1f}%")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("capture", nargs="?", help="capture file (JSON lines)")
+    parser.add_argument("--url", default="http://127.0.0.1:5000")
+    parser.add_argument("--speed", type=float, default=1.0, help="0 = no pacing")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--timeout", type=float, default=10.0, help="seconds")
+    parser.add_argument("--limit", type=int, help="replay only the first N records")
+    parser.add_argument("--output", help="write results JSON to this path")
+    parser.add_argument("--baseline", help="compare against this results JSON")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument(
+        "--diff", nargs=2, metavar=("A", "B"), help="compare two results files"
+    )
+    args = parser.parse_args(argv)
+
+    if args.diff:
+        with open(args.diff[0]) as fa, open(args.diff[1]) as fb:
+            print_diff(diff_results(json.load(fa), json.load(fb)))
+        return 0
+    if not args.capture:
+        parser.error("a capture file is required unless --diff is given")
+
+    records = load_capture(args.capture, args.limit)
+    summary = replay(args.url, records, args.speed, args.concurrency, args.timeout)
+    summary["config"] = {
+        "url": args.url,
+        "capture": args.capture,
+        "records": len(records),
+        "speed": args.speed,
+        "concurrency": args.concurrency,
+    }
+    print_results(summary)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(summary, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(summary, json.load(f), args.tolerance)
+        if regressions:
+            print("\nRegressions against baseline:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print("\nNo regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
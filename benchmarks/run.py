@@ -0,0 +1,255 @@
+"""
+Benchmarks for the service and data-access layers.
+
+Runs the real service functions against benchmarks.fake_db.FakeDatabase
+and reports wall time, statements per item and peak allocations for each
+batch size. Results can be saved and compared against a baseline.
+
+benchmarks/baseline.json holds statement counts only, which are the same
+on every machine. Wall time and allocations are compared only against a
+baseline that has them, such as one saved with --output on the same
+machine before a change.
+
+Usage:
+    python -m benchmarks.run
+    python -m benchmarks.run --sizes 1,100 --latency-ms 1
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --baseline results.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json
+    python -m benchmarks.run --output benchmarks/baseline.json --counts-only
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from benchmarks.fake_db import FakeDatabase, install
+
+DEFAULT_SIZES = (1, 100, 10_000)
+
+# Result fields that do not depend on the machine the benchmarks run on
+COUNTS = ("queries", "queries_per_item")
+
+
+# =======================
+# Scenarios
+# =======================
+
+
+def student_row(i):
+    return {
+        "id": i,
+        "first_name": f"First{i}",
+        "last_name": f"Last{i}",
+        "email": f"student{i}@school.edu",
+        "address": f"{i} Main St",
+        "city": "Toronto",
+        "province": "ON",
+        "country": "Canada",
+        "address_type": "local",
+        "status": "active",
+        "coop": False,
+        "is_international": i % 5 == 0,
+        "program_id": 1,
+    }
+
+
+def enrollment_row(i):
+    return {"id": i, "student_id": i, "course_id": i % 50 + 1, "grade": None}
+
+
+def course_row(i):
+    return {
+        "id": i,
+        "title": f"Course {i}",
+        "code": f"C{i:05d}",
+        "term_id": 1,
+        "department_id": 1,
+    }
+
+
+def setup_get_all_students(fake, size):
+    fake.seed("students", (student_row(i) for i in range(1, size + 1)))
+    return False
+
+
+def setup_get_all_enrollments(fake, size):
+    fake.seed("enrollments", (enrollment_row(i) for i in range(1, size + 1)))
+    return True
+
+
+def setup_create_new_students(fake, size):
+    payload = []
+    for i in range(1, size + 1):
+        row = student_row(i)
+        del row["id"]
+        payload.append(row)
+    return payload
+
+
+def setup_update_enrollments(fake, size):
+    fake.seed("enrollments", (enrollment_row(i) for i in range(1, size + 1)))
+    return [{"id": i, "grade": "A"} for i in range(1, size + 1)]
+
+
+def setup_archive_courses(fake, size):
+    fake.seed("courses", (course_row(i) for i in range(1, size + 1)))
+    return list(range(1, size + 1))
+
+
+def scenarios():
+    """name -> (setup(fake, size) -> argument, service function)."""
+    from app import services
+
+    return {
+        "get_all_students": (setup_get_all_students, services.get_all_students),
+        "get_all_enrollments": (
+            setup_get_all_enrollments,
+            services.get_all_enrollments,
+        ),
+        "create_new_students": (
+            setup_create_new_students,
+            services.create_new_students,
+        ),
+        "update_enrollments": (setup_update_enrollments, services.update_enrollments),
+        "archive_courses": (setup_archive_courses, services.archive_courses),
+    }
+
+
+# =======================
+# Runner
+# =======================
+
+
+def _run_once(setup, func, size, latency, trace_alloc=False):
+    fake = FakeDatabase(latency=latency)
+    restore = install(fake)
+    try:
+        argument = setup(fake, size)
+        fake.reset_counts()
+        if trace_alloc:
+            tracemalloc.start()
+        started = time.perf_counter()
+        func(argument)
+        elapsed = time.perf_counter() - started
+        peak = 0
+        if trace_alloc:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        return elapsed, fake.query_count, peak
+    finally:
+        restore()
+
+
+def run_benchmarks(names, sizes, latency=0.0, repeat=3):
+    """Return {"<scenario>[<size>]": {...}} with the best wall time of repeat runs."""
+    available = scenarios()
+    results = {}
+    for name in names:
+        setup, func = available[name]
+        for size in sizes:
+            walls = []
+            for _ in range(repeat):
+                elapsed, queries, _ = _run_once(setup, func, size, latency)
+                walls.append(elapsed)
+            _, _, peak = _run_once(setup, func, size, latency, trace_alloc=True)
+            results[f"{name}[{size}]"] = {
+                "wall_ms": round(min(walls) * 1000, 3),
+                "queries": queries,
+                "queries_per_item": round(queries / size, 3),
+                "alloc_peak_kb": round(peak / 1024, 1),
+            }
+    return results
+
+
+def counts_only(results):
+    """Results without the machine-dependent wall time and allocations."""
+    return {
+        key: {field: result[field] for field in COUNTS}
+        for key, result in results.items()
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    Return a list of regressions against the baseline. Statements per item
+    must not grow at all; wall time and allocations, where the baseline
+    has them, may grow by tolerance.
+    """
+    regressions = []
+    for key, current in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        if current["queries_per_item"] > base["queries_per_item"]:
+            regressions.append(
+                f"{key}: queries/item {base['queries_per_item']} -> "
+                f"{current['queries_per_item']}"
+            )
+        for metric in ("wall_ms", "alloc_peak_kb"):
+            if metric not in base:
+                continue
+            limit = base[metric] * (1 + tolerance)
+            # Ignore noise on sub-millisecond / sub-kilobyte measurements
+            if current[metric] > limit and current[metric] - base[metric] > 1:
+                regressions.append(
+                    f"{key}: {metric} {base[metric]} -> {current[metric]} "
+                    f"(> {tolerance:.0%} tolerance)"
+                )
+    return regressions
+
+
+def print_results(results):
+    print(
+        f"{'benchmark':<32} {'wall ms':>10} {'queries':>8} "
+        f"{'q/item':>7} {'alloc KB':>10}"
+    )
+    for key, r in results.items():
+        print(
+            f"{key:<32} {r['wall_ms']:>10.2f} {r['queries']:>8} "
+            f"{r['queries_per_item']:>7} {r['alloc_peak_kb']:>10.1f}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    parser.add_argument("--scenarios", help="comma separated, default: all")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write results JSON to this path")
+    parser.add_argument(
+        "--counts-only",
+        action="store_true",
+        help="write only statement counts to --output",
+    )
+    parser.add_argument("--baseline", help="compare against this results JSON")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    names = args.scenarios.split(",") if args.scenarios else list(scenarios())
+    results = run_benchmarks(names, sizes, args.latency_ms / 1000, args.repeat)
+    print_results(results)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            saved = counts_only(results) if args.counts_only else results
+            json.dump(saved, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\nRegressions against baseline:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print("\nNo regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
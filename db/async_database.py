@@ -0,0 +1,178 @@
+"""
+asyncio counterpart of db.database.Database.
+
+AsyncDatabase runs the same catalog statements on a psycopg 3
+AsyncConnectionPool, so a single event loop can keep many requests waiting
+on PostgreSQL at once instead of tying up one worker per round trip. It
+reads the same connection settings as Database, reports every statement to
+db.instrumentation and maps driver errors to ValueError / RuntimeError the
+same way, so callers handle both interchangeably.
+
+psycopg 3 prepares statements on its own once they have run a few times on
+a connection; DB_PREPARED_STATEMENTS=false turns that off as well. These are
+protocol-level prepared statements, which PgBouncer 1.21+ keeps working in
+transaction mode (DB_POOL_MODE=transaction) when its max_prepared_statements
+is set; with an older PgBouncer, turn them off.
+"""
+
+import logging
+import os
+import time
+import psycopg
+from psycopg.conninfo import conninfo_to_dict, make_conninfo
+from psycopg_pool import AsyncConnectionPool
+from db import deadlines
+from db.database import (
+    _connection_options,
+    _is_production,
+    _use_prepared_statements,
+    database_config,
+)
+from db.instrumentation import QueryEvent, record_query
+from db.rows import rows_from_cursor
+from db.statements import Statement, FETCH_ALL
+
+logger = logging.getLogger(__name__)
+
+# Executions of the same statement on a connection before psycopg 3
+# prepares it server-side (its default)
+PREPARE_THRESHOLD = 5
+
+
+def _pool_size():
+    return (
+        int(os.getenv("DB_ASYNC_POOL_MIN", "1")),
+        int(os.getenv("DB_ASYNC_POOL_MAX", "10")),
+    )
+
+
+def _fetches_rows(query):
+    if isinstance(query, Statement):
+        return query.fetch == FETCH_ALL
+    return query.strip().lower().startswith("select") or "returning" in query.lower()
+
+
+class AsyncDatabase:
+    def __init__(self, conninfo=None, min_size=None, max_size=None):
+        """
+        conninfo defaults to the FLASK_ENV dependent settings Database uses.
+        Pool sizes default to DB_ASYNC_POOL_MIN / DB_ASYNC_POOL_MAX. The pool
+        is created by open(), inside the event loop that will use it.
+        """
+        default_min, default_max = _pool_size()
+        if conninfo is None:
+            config = database_config()
+            # libpq calls it dbname; psycopg2 accepts either
+            config["dbname"] = config.pop("database")
+            conninfo = make_conninfo(**config)
+        self.conninfo = conninfo
+        self.min_size = default_min if min_size is None else min_size
+        self.max_size = default_max if max_size is None else max_size
+        self.pool = None
+
+    async def open(self, wait=False):
+        """Create the pool; with wait=True, block until min_size connections exist."""
+        if self.pool is not None:
+            return
+        self.pool = AsyncConnectionPool(
+            self.conninfo,
+            min_size=self.min_size,
+            max_size=self.max_size,
+            kwargs={
+                "prepare_threshold": (
+                    PREPARE_THRESHOLD if _use_prepared_statements() else None
+                ),
+                **_connection_options(
+                    conninfo_to_dict(self.conninfo).get("options", "")
+                ),
+            },
+            open=False,
+        )
+        await self.pool.open(wait=wait)
+        logger.info(
+            f"Async database connection pool created "
+            f"({self.min_size}-{self.max_size} connections)"
+        )
+
+    async def close(self):
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+
+    def pool_stats(self):
+        """Snapshot of the pool: connections in use, idle and the maximum."""
+        if self.pool is None:
+            return {"in_use": 0, "idle": 0, "max": 0}
+        stats = self.pool.get_stats()
+        idle = stats.get("pool_available", 0)
+        return {
+            "in_use": stats.get("pool_size", 0) - idle,
+            "idle": idle,
+            "max": self.max_size,
+        }
+
+    async def execute_query(self, query, params=()):
+        """
+        Execute a single SQL query, like Database.execute_query: rows for
+        FETCH_ALL statements (and plain SELECT / RETURNING SQL), otherwise
+        the cursor after committing, for its rowcount. Timeouts raise
+        db.deadlines.QueryTimeout, and cancelling the calling task cancels
+        the statement on the server too.
+        """
+        if isinstance(query, Statement):
+            query.check_params(params)
+        timeout = deadlines.local_timeout_ms()
+        await self.open()
+
+        started = time.perf_counter()
+        pool_wait = 0.0
+        result = None
+        error = None
+        try:
+            async with self.pool.connection() as conn:
+                pool_wait = time.perf_counter() - started
+                async with conn.cursor() as cursor:
+                    if timeout is not None:
+                        await cursor.execute(
+                            deadlines.SET_STATEMENT_TIMEOUT, (str(timeout),)
+                        )
+                    await cursor.execute(query, params or None)
+                    if _fetches_rows(query):
+                        result = rows_from_cursor(cursor, await cursor.fetchall())
+                    else:
+                        result = cursor
+
+            if not _is_production():
+                logger.info(f"Executed query: {query}")
+            return result
+        except psycopg.IntegrityError as e:
+            error = e
+            logger.warning(f"Integrity error: {e}")
+            raise ValueError(f"Integrity error: {str(e)}")
+        except psycopg.DataError as e:
+            error = e
+            logger.warning(f"Invalid data: {e}")
+            raise ValueError(f"Invalid data: {str(e)}")
+        except psycopg.errors.QueryCanceled as e:
+            error = e
+            logger.warning(f"Query canceled: {e}")
+            raise deadlines.QueryTimeout(f"Query timed out: {str(e)}")
+        except psycopg.Error as e:
+            error = e
+            logger.error(f"Error executing query: {e}")
+            raise RuntimeError(f"Database error: {str(e)}")
+        finally:
+            if isinstance(result, list):
+                rows = len(result)
+            else:
+                rows = max(getattr(result, "rowcount", 0), 0)
+            record_query(
+                QueryEvent(
+                    getattr(query, "name", None),
+                    query,
+                    time.perf_counter() - started - pool_wait,
+                    pool_wait=pool_wait,
+                    rows=rows,
+                    error=error,
+                )
+            )
@@ -0,0 +1,57 @@
+"""
+Streaming input for PostgreSQL COPY ... FROM STDIN.
+
+CopyStream wraps an iterator of row tuples in the file-like object that
+cursor.copy_expert() reads from. Rows are encoded in COPY text format
+only as each chunk is requested, so loading millions of generated rows
+needs no more memory than one chunk.
+"""
+
+COPY_CHUNK_SIZE = 1 << 16
+
+_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def copy_value(value):
+    """Encode one value for COPY text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, int):
+        return str(value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value).translate(_ESCAPES)
+
+
+def copy_line(row):
+    return "\t".join([copy_value(value) for value in row]) + "\n"
+
+
+class CopyStream:
+    """Readable byte stream of COPY text lines produced from rows on demand."""
+
+    def __init__(self, rows):
+        self._rows = iter(rows)
+        self._buffer = b""
+        self.rows = 0  # rows encoded so far
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = float("inf")
+        chunks = [self._buffer]
+        length = len(self._buffer)
+        for row in self._rows:
+            line = copy_line(row).encode()
+            chunks.append(line)
+            length += len(line)
+            self.rows += 1
+            if length >= size:
+                break
+        data = b"".join(chunks)
+        if length <= size:
+            self._buffer = b""
+            return data
+        self._buffer = data[size:]
+        return data[:size]
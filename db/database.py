@@ -1,9 +1,18 @@
 import psycopg2
-import psycopg2.extras
 from psycopg2 import pool
 import logging
 import os
+import random
+import threading
+import time
+import weakref
 from dotenv import load_dotenv
+from db import deadlines, routing
+from db.copy_stream import COPY_CHUNK_SIZE, CopyStream
+from db.db_utils import split_sql_statements
+from db.statements import Statement, FETCH_ALL
+from db.rows import rows_from_cursor
+from db.instrumentation import QueryEvent, record_query
 
 # Ensure environment variables from .env are loaded as early as possible so
 # Database() instances pick them up no matter the import order elsewhere in
@@ -38,95 +47,285 @@ def _is_production():
     return os.getenv("FLASK_ENV", "development") == "production"
 
 
-class Database:
+def _use_prepared_statements():
+    """Server-side prepared statements are on unless explicitly disabled."""
+    return os.getenv("DB_PREPARED_STATEMENTS", "true").lower() != "false"
+
+
+def _transaction_pooling():
+    """
+    DB_POOL_MODE=transaction: connections go through PgBouncer in transaction
+    mode, which may run each transaction of a client connection on a
+    different server session. Nothing may outlive a transaction: no PREPARE
+    and no session-level SET.
+    """
+    return os.getenv("DB_POOL_MODE", "session").lower() == "transaction"
+
+
+def _connection_options(options=""):
+    """
+    connect() arguments for pooled connections: the default statement_timeout
+    (see db.deadlines), ahead of the connection string's own options so
+    those win. PgBouncer refuses the options startup parameter, so with
+    transaction pooling the default must be set on the role instead.
+    """
+    timeout = deadlines.statement_timeout_ms()
+    if not timeout or _transaction_pooling():
+        return {}
+    return {"options": f"-c statement_timeout={timeout} {options}".strip()}
+
+
+def _check_after():
+    """Seconds a pooled connection may sit idle before checkout checks it is alive."""
+    return float(os.getenv("DB_POOL_CHECK_AFTER", "30"))
+
+
+def _read_retries():
+    """Times a catalog read is retried after its connection was lost."""
+    return int(os.getenv("DB_READ_RETRIES", "2"))
+
+
+def _retry_delay(attempt):
+    """Full jitter: anywhere up to DB_RETRY_BACKOFF_MS, doubled per attempt."""
+    backoff = float(os.getenv("DB_RETRY_BACKOFF_MS", "50")) / 1000
+    return random.uniform(0, backoff * 2**attempt)
+
+
+def _is_alive(conn):
+    """SELECT 1 in autocommit mode: one round trip and no transaction left open."""
+    try:
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT 1;")
+        conn.autocommit = False
+        return True
+    except psycopg2.Error:
+        return False
+
+
+def _pool_size():
+    """
+    (minimum, maximum) pooled connections per process, from DB_POOL_MIN and
+    DB_POOL_MAX. gunicorn.conf.py sets DB_POOL_MAX to the threads per worker.
+    """
+    return int(os.getenv("DB_POOL_MIN", "1")), int(os.getenv("DB_POOL_MAX", "3"))
+
+
+def database_config():
+    """
+    Connection settings from the environment: Azure Database for PostgreSQL
+    in production, the local database otherwise. Shared by Database and
+    db.async_database.AsyncDatabase.
+    """
+    if _is_production():
+        required_vars = [
+            "AZURE_PG_HOST",
+            "AZURE_PG_NAME",
+            "AZURE_PG_USER",
+            "AZURE_PG_PASSWORD",
+        ]
+        _check_required_env_vars(required_vars, "Azure")
+        return {
+            "host": os.getenv("AZURE_PG_HOST"),
+            "port": os.getenv("AZURE_PG_PORT", "5432"),
+            "database": os.getenv("AZURE_PG_NAME"),
+            "user": os.getenv("AZURE_PG_USER"),
+            "password": os.getenv("AZURE_PG_PASSWORD"),
+            "sslmode": os.getenv("AZURE_PG_SSLMODE", "require"),
+        }
+
+    required_vars = [
+        "LOCAL_DB_HOST",
+        "LOCAL_DB_NAME",
+        "LOCAL_DB_USER",
+        "LOCAL_DB_PASSWORD",
+    ]
+    _check_required_env_vars(required_vars, "local")
+    return {
+        "host": os.getenv("LOCAL_DB_HOST"),
+        "port": os.getenv("LOCAL_DB_PORT", "5432"),
+        "database": os.getenv("LOCAL_DB_NAME"),
+        "user": os.getenv("LOCAL_DB_USER"),
+        "password": os.getenv("LOCAL_DB_PASSWORD"),
+    }
+
+
+class Database(threading.local):
+    """
+    Connections come from a process-wide pool. The connection and cursor a
+    call is using are per thread, so threaded workers can share the
+    module-level instances in app.models.
+    """
+
     # Class-level flags to track if we've already logged the database type
     _logged_azure = False
     _logged_local = False
     _pool = None  # Connection pool
+    _replica_pools = {}  # Replica URL -> connection pool, see db.routing
+    _pool_lock = threading.Lock()  # Serializes opening and closing the pool
     _db_config = None  # Store config for pool creation
+    # Names of statements already PREPAREd on each pooled connection. Prepared
+    # statements live as long as the server session, so entries disappear
+    # together with the connection object.
+    _prepared = weakref.WeakKeyDictionary()
+    # When each idle pooled connection was last returned (time.monotonic())
+    _idle_since = weakref.WeakKeyDictionary()
 
     def __init__(self):
         """
-        Initialize the Database class for PostgreSQL with connection pooling.
-        Automatically switches between local and Azure database based on FLASK_ENV.
-        """
-        # Only create config and pool once
-        if Database._db_config is None:
-            if _is_production():
-                # Azure Database configuration
-                required_vars = [
-                    "AZURE_PG_HOST",
-                    "AZURE_PG_NAME",
-                    "AZURE_PG_USER",
-                    "AZURE_PG_PASSWORD",
-                ]
-                _check_required_env_vars(required_vars, "Azure")
-
-                Database._db_config = {
-                    "host": os.getenv("AZURE_PG_HOST"),
-                    "port": os.getenv("AZURE_PG_PORT", "5432"),
-                    "database": os.getenv("AZURE_PG_NAME"),
-                    "user": os.getenv("AZURE_PG_USER"),
-                    "password": os.getenv("AZURE_PG_PASSWORD"),
-                    "sslmode": os.getenv("AZURE_PG_SSLMODE", "require"),
-                }
+        Initialize the per-thread connection state. Nothing reads the
+        connection settings or reaches PostgreSQL until the first query
+        opens the shared pool (see open_pool), so importing app.models and
+        create_app() work without a database.
+        """
+        self.conn = None
+        self.conn_pool = None  # Pool self.conn came from
+        self.cursor = None
+        self.pool_wait = 0.0
 
-                # Only log once per application lifecycle
-                if not Database._logged_azure:
-                    logger.info("Using Azure Database for PostgreSQL (production)")
-                    Database._logged_azure = True
-            else:
-                # Local Database configuration
-                required_vars = [
-                    "LOCAL_DB_HOST",
-                    "LOCAL_DB_NAME",
-                    "LOCAL_DB_USER",
-                    "LOCAL_DB_PASSWORD",
-                ]
-                _check_required_env_vars(required_vars, "local")
-
-                Database._db_config = {
-                    "host": os.getenv("LOCAL_DB_HOST"),
-                    "port": os.getenv("LOCAL_DB_PORT", "5432"),
-                    "database": os.getenv("LOCAL_DB_NAME"),
-                    "user": os.getenv("LOCAL_DB_USER"),
-                    "password": os.getenv("LOCAL_DB_PASSWORD"),
-                }
+    @classmethod
+    def open_pool(cls):
+        """
+        Create the connection pool unless it is already open. The first
+        query calls this; gunicorn.conf.py prewarms it in every worker after
+        the fork, so each process has connections of its own. Automatically
+        switches between local and Azure database based on FLASK_ENV.
+        """
+        with cls._pool_lock:
+            if cls._pool is not None:
+                return
+            if cls._db_config is None:
+                cls._db_config = database_config()
 
                 # Only log once per application lifecycle
-                if not Database._logged_local:
+                if _is_production() and not cls._logged_azure:
+                    logger.info("Using Azure Database for PostgreSQL (production)")
+                    cls._logged_azure = True
+                elif not _is_production() and not cls._logged_local:
                     logger.info("Using Local Database (development)")
-                    Database._logged_local = True
+                    cls._logged_local = True
 
-            # Create connection pool once
+            minconn, maxconn = _pool_size()
             try:
-                Database._pool = pool.SimpleConnectionPool(
-                    1,  # minimum connections
-                    3,  # maximum connections (reduced for memory constraints)
-                    **Database._db_config,
+                cls._pool = pool.ThreadedConnectionPool(
+                    minconn, maxconn, **cls._db_config, **_connection_options()
+                )
+                now = time.monotonic()
+                for conn in cls._pool._pool:
+                    cls._idle_since[conn] = now
+                logger.info(
+                    f"Database connection pool created ({minconn}-{maxconn} connections)"
                 )
-                logger.info("Database connection pool created (1-3 connections)")
             except Exception as e:
                 logger.error(f"Failed to create connection pool: {e}")
                 raise
 
-        self.conn = None
-        self.cursor = None
+    @classmethod
+    def prewarm(cls):
+        """
+        Open the pool in a background thread, so the first request does not
+        wait for the connection. A failure is only logged; the first query
+        tries again. Returns the thread.
+        """
+
+        def run():
+            try:
+                cls.open_pool()
+            except Exception:
+                pass  # logged by open_pool
+
+        thread = threading.Thread(target=run, name="db-prewarm", daemon=True)
+        thread.start()
+        return thread
 
-    def connect(self):
+    @classmethod
+    def close_pool(cls):
         """
-        Get a connection from the connection pool.
+        Close every pooled connection. gunicorn.conf.py calls this in the
+        master before forking, so no worker inherits its sockets; a pool
+        shared across processes interleaves their traffic on one session.
+        """
+        with cls._pool_lock:
+            if cls._pool is not None:
+                cls._pool.closeall()
+                cls._pool = None
+            for replica_pool in cls._replica_pools.values():
+                replica_pool.closeall()
+            cls._replica_pools = {}
+            cls._prepared = weakref.WeakKeyDictionary()
+            cls._idle_since = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def _replica_pool(cls, url):
+        """The pool for a replica in DB_REPLICA_URLS, created on first use."""
+        with cls._pool_lock:
+            if url not in cls._replica_pools:
+                minconn, maxconn = _pool_size()
+                options = psycopg2.extensions.parse_dsn(url).get("options", "")
+                cls._replica_pools[url] = pool.ThreadedConnectionPool(
+                    minconn, maxconn, url, **_connection_options(options)
+                )
+                logger.info(
+                    f"Replica connection pool created ({minconn}-{maxconn} connections)"
+                )
+            return cls._replica_pools[url]
+
+    @classmethod
+    def _checkout(cls, from_pool):
+        """
+        Take a connection from the pool. One that has been idle for longer
+        than DB_POOL_CHECK_AFTER seconds must pass a SELECT 1 first (Azure
+        drops idle connections); closed or dead ones are discarded and
+        replaced.
+        """
+        for _ in range(from_pool.maxconn + 1):
+            conn = from_pool.getconn()
+            idle_since = cls._idle_since.pop(conn, None)
+            if (
+                idle_since is None
+                or not conn.closed
+                and (time.monotonic() - idle_since < _check_after() or _is_alive(conn))
+            ):
+                return conn
+            logger.warning("Discarding a pooled connection the server has closed")
+            from_pool.putconn(conn, close=True)
+        raise psycopg2.OperationalError("No live connection in the pool")
+
+    @classmethod
+    def pool_stats(cls):
+        """Snapshot of the connection pool: connections in use, idle and the maximum."""
+        if cls._pool is None:
+            return {"in_use": 0, "idle": 0, "max": 0}
+        return {
+            "in_use": len(cls._pool._used),
+            "idle": len(cls._pool._pool),
+            "max": cls._pool.maxconn,
+        }
+
+    def connect(self, replica=False):
+        """
+        Get a connection from the connection pool, or with replica=True from
+        the pool of a read replica (see db.routing).
         """
         if self.conn is None:
             try:
-                self.conn = Database._pool.getconn()
-                self.cursor = self.conn.cursor(
-                    cursor_factory=psycopg2.extras.RealDictCursor
-                )
+                started = time.perf_counter()
+                if replica:
+                    from_pool = Database._replica_pool(routing.choose_replica())
+                else:
+                    if Database._pool is None:
+                        Database.open_pool()
+                    from_pool = Database._pool
+                self.conn = Database._checkout(from_pool)
+                self.conn_pool = from_pool
+                self.pool_wait = time.perf_counter() - started
+                # Plain tuple cursor; results are wrapped in compact Row objects
+                self.cursor = self.conn.cursor()
                 # Reduce connection logging in production to minimize log volume
                 if not _is_production():
+                    database = "replica" if replica else Database._db_config["database"]
                     logger.info(
-                        f"Successfully connected to PostgreSQL database: {Database._db_config['database']}"
+                        f"Successfully connected to PostgreSQL database: {database}"
                     )
             except psycopg2.Error as e:
                 logger.error(f"Error connecting to database: {e}")
@@ -134,30 +333,171 @@ class Database:
 
     def close(self):
         """
-        Return the connection to the pool.
+        Return the connection to the pool, or close it if it is broken.
         """
         if self.conn:
+            conn = self.conn
             try:
-                self.conn.commit()
-                if self.cursor:
-                    self.cursor.close()
-                # Return connection to pool instead of closing
-                Database._pool.putconn(self.conn)
-                # Reduce connection logging in production to minimize log volume
-                if not _is_production():
-                    logger.info(f"Connection returned to pool.")
+                if not conn.closed:
+                    conn.commit()
+                    if self.cursor:
+                        self.cursor.close()
             except psycopg2.Error as e:
                 logger.error(f"Error returning connection to pool: {e}")
             finally:
+                from_pool = self.conn_pool
                 self.conn = None
+                self.conn_pool = None
                 self.cursor = None
+                # Return connection to pool instead of closing, unless the
+                # server has dropped it
+                broken = bool(conn.closed)
+                from_pool.putconn(conn, close=broken)
+                if broken:
+                    logger.warning("Discarded a connection the server has closed")
+                else:
+                    Database._idle_since[conn] = time.monotonic()
+                    # Reduce connection logging in production to minimize log volume
+                    if not _is_production():
+                        logger.info(f"Connection returned to pool.")
+
+    def _record(self, query, started, result, error=None, cache=None):
+        """Report a finished statement to db.instrumentation."""
+        if isinstance(result, list):
+            rows = len(result)
+        else:
+            rowcount = getattr(result, "rowcount", 0)
+            rows = rowcount if isinstance(rowcount, int) and rowcount > 0 else 0
+        record_query(
+            QueryEvent(
+                getattr(query, "name", None),
+                query,
+                time.perf_counter() - started,
+                pool_wait=self.pool_wait,
+                rows=rows,
+                error=error,
+                cache=cache,
+            )
+        )
+
+    def _fetch_rows(self):
+        return rows_from_cursor(self.cursor, self.cursor.fetchall())
+
+    def _execute_statement(self, statement, params):
+        """
+        Run a catalog statement, PREPAREing it on this connection first if needed.
+        Returns "hit" or "miss" for the per-connection prepared statement cache,
+        or None when prepared statements are disabled. PgBouncer does not
+        track SQL-level PREPARE, so transaction pooling sends plain queries.
+        """
+        statement.check_params(params)
+        if not _use_prepared_statements() or _transaction_pooling():
+            self.cursor.execute(statement, params)
+            return None
+
+        cache = "hit"
+        prepared = Database._prepared.setdefault(self.conn, set())
+        if statement.name not in prepared:
+            self.cursor.execute(statement.prepare_sql)
+            prepared.add(statement.name)
+            cache = "miss"
+        self.cursor.execute(statement.execute_sql, params)
+        return cache
 
     def execute_query(self, query, params=()):
         """
         Execute a single SQL query (PostgreSQL only).
+
+        Catalog statements (db.statements.Statement) are executed as prepared
+        statements and fetched according to their declared fetch mode. Plain
+        strings fall back to inspecting the SQL text.
+
+        Catalog reads whose connection is lost (or cannot be opened) are
+        retried on a fresh connection, up to DB_READ_RETRIES times with
+        jittered backoff. Writes are not: the server may already have
+        applied them.
+
+        With read replicas configured, db.routing decides whether a catalog
+        read starts on one. If the replica fails, the read moves to the
+        primary, where the retries above apply.
+
+        A statement canceled by statement_timeout, or started after its
+        deadline (db.deadlines), raises db.deadlines.QueryTimeout.
         """
-        self.connect()
+        read_only = getattr(query, "read_only", False)
+        on_replica = read_only and routing.use_replica()
+        attempts = 1 + (_read_retries() if read_only else 0) + on_replica
+        for attempt in range(attempts):
+            retry = attempt + 1 < attempts
+            replica = on_replica and attempt == 0
+            try:
+                return self._execute_query(query, params, retry, replica)
+            except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+                if replica:
+                    routing.replica_failed()
+                if not retry:
+                    raise
+                delay = _retry_delay(attempt)
+                logger.warning(
+                    f"Connection lost running {query.name}, retrying in "
+                    f"{delay * 1000:.0f} ms: {e}"
+                )
+                time.sleep(delay)
+
+    def _replica_caught_up(self):
+        """
+        Whether this replica connection can serve the routing scope's reads:
+        it has replayed the WAL up to the scope's min_lsn. Checked once per
+        scope.
+        """
+        scope = routing.current()
+        if scope is None or scope.min_lsn is None:
+            return True
+        if scope.caught_up is None:
+            self.cursor.execute(
+                "SELECT pg_last_wal_replay_lsn() >= %s::pg_lsn;", (scope.min_lsn,)
+            )
+            scope.caught_up = bool(self.cursor.fetchone()[0])
+        return scope.caught_up
+
+    def _execute_query(self, query, params, retry=False, replica=False):
+        """
+        execute_query for one connection. With retry, connection errors
+        propagate as they are for the caller to retry.
+        """
+        timeout = deadlines.local_timeout_ms()
+        self.connect(replica)
+        if replica:
+            try:
+                caught_up = self._replica_caught_up()
+            except psycopg2.Error:
+                self.close()
+                raise
+            if not caught_up:
+                self.close()
+                self.connect()
+        started = time.perf_counter()
+        result = None
+        error = None
+        cache = None
         try:
+            if timeout is not None:
+                self.cursor.execute(deadlines.SET_STATEMENT_TIMEOUT, (str(timeout),))
+            if isinstance(query, Statement):
+                cache = self._execute_statement(query, params)
+
+                if not _is_production():
+                    logger.info(f"Executed statement {query.name}: {query}")
+
+                if query.fetch == FETCH_ALL:
+                    result = self._fetch_rows()
+                else:
+                    self.conn.commit()
+                    result = self.cursor
+                if not query.read_only:
+                    routing.note_write()
+                return result
+
             if "?" in query:
                 query = query.replace("?", "%s")
             self.cursor.execute(query, params)
@@ -170,17 +510,33 @@ class Database:
                 query.strip().lower().startswith("select")
                 or "returning" in query.lower()
             ):
-                return self.cursor.fetchall()
+                result = self._fetch_rows()
             else:
                 self.conn.commit()
-                return self.cursor
+                result = self.cursor
+            if not query.strip().lower().startswith("select"):
+                routing.note_write()
+            return result
         except psycopg2.IntegrityError as e:
+            error = e
             logger.warning(f"Integrity error: {e}")
             raise ValueError(f"Integrity error: {str(e)}")
+        except psycopg2.DataError as e:
+            error = e
+            logger.warning(f"Invalid data: {e}")
+            raise ValueError(f"Invalid data: {str(e)}")
+        except psycopg2.extensions.QueryCanceledError as e:
+            error = e
+            logger.warning(f"Query canceled: {e}")
+            raise deadlines.QueryTimeout(f"Query timed out: {str(e)}")
         except psycopg2.Error as e:
+            error = e
+            if retry and self.conn.closed:
+                raise
             logger.error(f"Error executing query: {e}")
             raise RuntimeError(f"Database error: {str(e)}")
         finally:
+            self._record(query, started, result, error, cache)
             self.close()
 
     def execute_many(self, query, param_list):
@@ -188,6 +544,9 @@ class Database:
         Execute a query with multiple sets of parameters (bulk insert, PostgreSQL only).
         """
         self.connect()
+        started = time.perf_counter()
+        result = None
+        error = None
         try:
             if "?" in query:
                 query = query.replace("?", "%s")
@@ -198,10 +557,66 @@ class Database:
             if not _is_production():
                 logger.info(f"Executed many: {query}")
 
-            return self.cursor
+            result = self.cursor
+            return result
         except psycopg2.Error as e:
+            error = e
             logger.error(f"Error executing many: {e}")
             return None
+        finally:
+            self._record(query, started, result, error)
+            self.close()
+
+    def copy_rows(self, table, columns, rows):
+        """
+        Bulk load an iterable of row tuples into table with COPY FROM STDIN.
+        Returns the number of rows copied.
+        """
+        return self.copy_tables([(table, columns, rows)])[table]
+
+    def copy_tables(self, loads, before=(), after=()):
+        """
+        Bulk load several tables in a single transaction. Runs the `before`
+        statements, COPYs each (table, columns, rows) load from STDIN, runs
+        the `after` statements and commits once; any failure rolls back the
+        whole load. Rows are encoded chunk by chunk as PostgreSQL reads them,
+        so memory use does not grow with the number of rows. Bulk loads are
+        exempt from statement_timeout.
+        Returns {table: rows copied}.
+        """
+        self.connect()
+        counts = {}
+        sql = None
+        try:
+            self.cursor.execute(deadlines.SET_STATEMENT_TIMEOUT, ("0",))
+            for sql in before:
+                self.cursor.execute(sql)
+            for table, columns, rows in loads:
+                sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN"
+                stream = CopyStream(rows)
+                started = time.perf_counter()
+                try:
+                    self.cursor.copy_expert(sql, stream, size=COPY_CHUNK_SIZE)
+                except psycopg2.Error as e:
+                    self._record(sql, started, None, e)
+                    raise
+                self._record(sql, started, self.cursor)
+                counts[table] = stream.rows
+
+                if not _is_production():
+                    logger.info(f"Copied {stream.rows} rows into {table}")
+            for sql in after:
+                self.cursor.execute(sql)
+            self.conn.commit()
+            return counts
+        except psycopg2.IntegrityError as e:
+            self.conn.rollback()
+            logger.warning(f"Integrity error: {e}")
+            raise ValueError(f"Integrity error: {str(e)}")
+        except psycopg2.Error as e:
+            self.conn.rollback()
+            logger.error(f"Error bulk loading ({sql}): {e}")
+            raise RuntimeError(f"Database error: {str(e)}")
         finally:
             self.close()
 
@@ -211,10 +626,8 @@ class Database:
         """
         self.connect()
         try:
-            statements = [stmt.strip() for stmt in script.split(";") if stmt.strip()]
-            for statement in statements:
-                if statement:
-                    self.cursor.execute(statement)
+            for statement in split_sql_statements(script):
+                self.cursor.execute(statement)
             self.conn.commit()
 
             # Only log in development to reduce log volume in production
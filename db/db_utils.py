@@ -1,3 +1,5 @@
+import re
+
 # PostgreSQL boolean constants
 BOOLEAN_TRUE = "TRUE"
 
@@ -24,3 +26,116 @@ def get_archived_condition(archived_value=False):
     Get the appropriate condition for checking archived status (PostgreSQL only)
     """
     return f"is_archived = {str(archived_value).upper()}"
+
+
+def get_unnest_source(columns, types, alias="v"):
+    """
+    FROM item that expands one array parameter per column into rows, e.g.
+    unnest(%s::integer[], %s::text[]) AS v(id, name). Pair it with
+    to_column_arrays() to send a whole batch in a single statement.
+    """
+    arrays = ", ".join(f"%s::{column_type}[]" for column_type in types)
+    return f"unnest({arrays}) AS {alias}({', '.join(columns)})"
+
+
+def get_insert_many_returning_query(table, columns, types, returning_column="id"):
+    """
+    Get a multi-row INSERT taking one array parameter per column
+    """
+    column_names = ", ".join(columns)
+    source = get_unnest_source(columns, types)
+    base_query = f"INSERT INTO {table} ({column_names}) SELECT * FROM {source}"
+    return f"{base_query} RETURNING {returning_column};"
+
+
+def get_update_many_returning_query(table, columns, types):
+    """
+    Get a multi-row UPDATE of active rows, taking an id array followed by one
+    array per column. Returns the ids that were actually updated.
+    """
+    assignments = ", ".join(f"{column} = v.{column}" for column in columns)
+    source = get_unnest_source(["id", *columns], ["integer", *types])
+    return (
+        f"UPDATE {table} AS t SET {assignments}, updated_at = CURRENT_TIMESTAMP "
+        f"FROM {source} WHERE t.id = v.id AND t.{get_archived_condition(False)} "
+        "RETURNING t.id;"
+    )
+
+
+def to_array_literal(values):
+    """
+    Format values as a PostgreSQL array literal ('{"a",NULL,"t"}').
+
+    The literal is sent as an untyped string, so the server parses it with
+    the input function of the declared array type. That works the same for
+    prepared and plain statements, and for dates passed as ISO strings.
+    """
+    items = []
+    for value in values:
+        if value is None:
+            items.append("NULL")
+            continue
+        if isinstance(value, bool):
+            text = "t" if value else "f"
+        elif hasattr(value, "isoformat"):
+            text = value.isoformat()
+        else:
+            text = str(value)
+        items.append('"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"')
+    return "{" + ",".join(items) + "}"
+
+
+def to_column_arrays(rows):
+    """Transpose row tuples into one array literal per column."""
+    return tuple(to_array_literal(column) for column in zip(*rows))
+
+
+def handle_returned_ids(result):
+    """
+    Collect the ids from a RETURNING id result
+    """
+    return [row["id"] for row in result] if result else []
+
+
+def get_reset_sequences_query(tables):
+    """
+    Single statement moving each table's id sequence past its largest id,
+    for after rows were loaded with explicit IDs. Empty tables restart at 1.
+    """
+    resets = ", ".join(
+        f"setval('{table}_id_seq', COALESCE((SELECT MAX(id) FROM {table}), 0) + 1, false)"
+        for table in tables
+    )
+    return f"SELECT {resets};"
+
+
+_SQL_TOKEN = re.compile(
+    r"""
+    '(?:[^']|'')*'              # string literal
+    | "(?:[^"]|"")*"            # quoted identifier
+    | \$(\w*)\$.*?\$\1\$        # dollar-quoted body, e.g. $$ ... $$
+    | --[^\n]*                  # line comment
+    | /\*.*?\*/                 # block comment
+    | ;
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+_SQL_COMMENT = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+
+
+def split_sql_statements(script):
+    """
+    Split a SQL script on top-level semicolons. Semicolons inside quotes,
+    dollar-quoted function bodies and comments are left alone, and
+    fragments holding only comments are dropped.
+    """
+    statements = []
+    start = 0
+    for match in _SQL_TOKEN.finditer(script + ";"):
+        if match.group() != ";":
+            continue
+        statement = (script + ";")[start : match.start()].strip()
+        start = match.end()
+        if _SQL_COMMENT.sub("", statement).strip():
+            statements.append(statement)
+    return statements
@@ -0,0 +1,63 @@
+"""
+Statement timeouts and per-route query deadlines.
+
+No statement may hold a pooled connection for longer than
+DB_STATEMENT_TIMEOUT_MS (default 5000; 0 turns the limit off). Database and
+AsyncDatabase open their connections with it as PostgreSQL's
+statement_timeout. PgBouncer in transaction mode (DB_POOL_MODE=transaction)
+refuses connection options; there the default comes from the role instead
+(ALTER ROLE ... SET statement_timeout, see README.md), so that reads do not
+pay an extra round trip to set it.
+
+A deadline scope gives the statements inside it a shared budget instead,
+for routes known to be heavier (or lighter) than the default; see
+app.utils.deadlines.query_deadline. Each statement runs with
+statement_timeout set to what is left of the budget, and once it is used up
+the next statement fails with QueryTimeout without running.
+"""
+
+import contextvars
+import os
+import time
+
+# Transaction-scoped, and takes a bound parameter unlike SET LOCAL
+SET_STATEMENT_TIMEOUT = "SELECT set_config('statement_timeout', %s, true);"
+
+_deadline = contextvars.ContextVar("db_deadline", default=None)
+
+
+class QueryTimeout(RuntimeError):
+    """A statement was canceled by statement_timeout, or its deadline had passed."""
+
+
+def statement_timeout_ms():
+    return int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "5000"))
+
+
+def begin(seconds):
+    """Start a deadline `seconds` from now; pass the returned token to end()."""
+    return _deadline.set(time.monotonic() + seconds)
+
+
+def end(token):
+    _deadline.reset(token)
+
+
+def remaining():
+    """Seconds left until the current deadline, or None outside one."""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def local_timeout_ms():
+    """
+    statement_timeout (ms) to set for the next transaction, or None to keep
+    the connection's default. Inside a deadline that is what is left of it.
+    Raises QueryTimeout once the deadline has passed.
+    """
+    left = remaining()
+    if left is None:
+        return None
+    if left <= 0:
+        raise QueryTimeout("Query deadline exceeded")
+    return max(1, int(left * 1000))
@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+Synthetic Dataset Generator
+Generates school data at any size for local development, benchmarks and
+EXPLAIN plans, as a scalable counterpart to the hand-written rows in
+db/data.py.
+
+Output is deterministic for a given seed and scale: every table draws from
+its own random.Random, so changing one table's rules does not reshuffle the
+others. Rows are produced lazily and loaded with COPY in a single transaction
+(db.init.load_tables), so memory stays constant even at millions of rows.
+
+Usage:
+    python -m db.generate --students 500000 --seed 42 --truncate
+"""
+
+import argparse
+import bisect
+import itertools
+import random
+import sys
+from datetime import date, timedelta
+
+sys.path.append(".")
+
+from db.database import Database
+from db.init import load_tables
+
+FIRST_NAMES = [
+    "Alice", "Bob", "Charlie", "Diana", "Evan", "Fay", "George", "Hannah",
+    "Isaac", "Julia", "Kenji", "Layla", "Mateo", "Nadia", "Omar", "Priya",
+    "Quinn", "Rosa", "Samir", "Tara", "Uma", "Victor", "Wei", "Ximena",
+    "Yusuf", "Zoe", "Amara", "Liam", "Noah", "Olivia", "Sofia", "Arjun",
+]  # fmt: skip
+LAST_NAMES = [
+    "Wong", "Smith", "Kim", "Lopez", "Brown", "Zhao", "Tanaka", "Nguyen",
+    "Lee", "Martinez", "Singh", "Patel", "Garcia", "Chen", "Cohen", "Haddad",
+    "Okafor", "Rossi", "Dubois", "Muller", "Silva", "Novak", "Ahmed", "Walsh",
+]  # fmt: skip
+STREETS = ["Maple", "Oak", "Pine", "Birch", "Cedar", "Spruce", "Elm", "Fir", "Ash"]
+# (city, province, relative population)
+CITIES = [
+    ("Toronto", "ON", 30),
+    ("Montreal", "QC", 20),
+    ("Vancouver", "BC", 15),
+    ("Calgary", "AB", 10),
+    ("Edmonton", "AB", 8),
+    ("Ottawa", "ON", 8),
+    ("Winnipeg", "MB", 5),
+    ("Halifax", "NS", 3),
+    ("Saskatoon", "SK", 2),
+    ("Victoria", "BC", 2),
+    ("Fredericton", "NB", 1),
+]
+DEPARTMENTS = [
+    ("Computer Science", "CS"),
+    ("Cybersecurity", "CY"),
+    ("Software Engineering", "SE"),
+    ("Data Science", "DS"),
+    ("Cloud Computing", "CL"),
+    ("Mathematics", "MA"),
+    ("Business", "BU"),
+    ("Design", "DE"),
+]
+PROGRAM_TYPES = [("bachelor", 5), ("diploma", 3), ("certificate", 2)]
+TOPICS = [
+    "Programming", "Databases", "Networks", "Algorithms", "Security",
+    "Operating Systems", "Statistics", "Cloud Infrastructure", "Design",
+    "Machine Learning", "Web Development", "Ethics", "Project Management",
+]  # fmt: skip
+LEVELS = ["Introduction to", "Applied", "Advanced", "Topics in", "Foundations of"]
+# None is a course still in progress
+GRADES = [
+    ("A+", 4), ("A", 10), ("A-", 10), ("B+", 12), ("B", 14), ("B-", 10),
+    ("C+", 8), ("C", 7), ("D", 4), ("F", 3), (None, 18),
+]  # fmt: skip
+EMPLOYMENT = [("full-time", 5), ("part-time", 3), ("adjunct", 2)]
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
+TIMES = ["8:00 AM", "9:30 AM", "11:00 AM", "1:00 PM", "2:30 PM", "4:00 PM", "6:00 PM"]
+SEASONS = [("Winter", (1, 10), (4, 30)), ("Summer", (5, 5), (8, 20)), ("Fall", (9, 1), (12, 20))]  # fmt: skip
+
+# created_at/updated_at fall on one of these days
+FIRST_DAY = date(2022, 1, 1)
+DAYS_SPAN = 1096
+TIMESTAMP_DAYS = [
+    (FIRST_DAY + timedelta(days=n)).isoformat() + " 09:00:00" for n in range(DAYS_SPAN)
+]
+
+ARCHIVED_RATE = 0.02
+
+COLUMNS = {
+    "departments": ["id", "name", "created_at", "updated_at", "is_archived"],
+    "programs": [
+        "id", "name", "type", "department_id", "created_at", "updated_at",
+        "is_archived",
+    ],
+    "instructors": [
+        "id", "first_name", "last_name", "email", "address", "province",
+        "employment", "status", "department_id", "created_at", "updated_at",
+        "is_archived",
+    ],
+    "terms": [
+        "id", "name", "start_date", "end_date", "created_at", "updated_at",
+        "is_archived",
+    ],
+    "courses": [
+        "id", "title", "code", "term_id", "department_id", "created_at",
+        "updated_at", "is_archived",
+    ],
+    "students": [
+        "id", "first_name", "last_name", "email", "address", "city", "province",
+        "country", "address_type", "status", "coop", "is_international",
+        "program_id", "created_at", "updated_at", "is_archived",
+    ],
+    "enrollments": [
+        "id", "student_id", "course_id", "grade", "created_at", "updated_at",
+        "is_archived",
+    ],
+    "assignments": [
+        "id", "instructor_id", "course_id", "created_at", "updated_at",
+        "is_archived",
+    ],
+    "course_schedule": [
+        "id", "course_id", "day", "time", "room", "created_at", "updated_at",
+        "is_archived",
+    ],
+}  # fmt: skip
+
+# Tables in foreign key order
+TABLES = list(COLUMNS)
+
+
+class Scale:
+    """Row counts per table. Anything not given is derived from the student count."""
+
+    __slots__ = (
+        "students",
+        "departments",
+        "programs_per_department",
+        "terms",
+        "courses",
+        "instructors",
+        "enrollments_per_student",
+    )
+
+    def __init__(
+        self,
+        students=1000,
+        departments=None,
+        programs_per_department=4,
+        terms=12,
+        courses=None,
+        instructors=None,
+        enrollments_per_student=10,
+    ):
+        self.students = students
+        self.departments = departments or max(3, students // 25_000)
+        self.programs_per_department = programs_per_department
+        self.terms = terms
+        self.courses = courses or max(5, students // 50)
+        # Every department needs at least one instructor to teach its courses
+        self.instructors = max(instructors or self.courses // 3, self.departments)
+        self.enrollments_per_student = enrollments_per_student
+
+    @property
+    def programs(self):
+        return self.departments * self.programs_per_department
+
+    def __repr__(self):
+        counts = ", ".join(f"{name}={getattr(self, name)}" for name in self.__slots__)
+        return f"Scale({counts})"
+
+
+def _rng(seed, table):
+    return random.Random(f"{seed}:{table}")
+
+
+def _weighted(rng, pairs):
+    """Return a function picking a value from (value, weight) pairs."""
+    values = [value for value, _ in pairs]
+    cumulative = list(itertools.accumulate(weight for _, weight in pairs))
+    total = cumulative[-1]
+    return lambda: values[bisect.bisect(cumulative, rng.random() * total)]
+
+
+def _zipf_picker(rng, count, exponent):
+    """Pick 1..count with a long-tailed popularity, most popular IDs shuffled."""
+    ids = list(range(1, count + 1))
+    rng.shuffle(ids)
+    cumulative = list(
+        itertools.accumulate(1 / rank**exponent for rank in range(1, count + 1))
+    )
+    total = cumulative[-1]
+    return lambda: ids[bisect.bisect(cumulative, rng.random() * total)]
+
+
+def _timestamps(rng):
+    day = TIMESTAMP_DAYS[rng.randrange(DAYS_SPAN)]
+    return day, day
+
+
+def _department_name(department_id):
+    name, _ = DEPARTMENTS[(department_id - 1) % len(DEPARTMENTS)]
+    cycle = (department_id - 1) // len(DEPARTMENTS)
+    return f"{name} {cycle + 1}" if cycle else name
+
+
+def departments(scale, seed):
+    rng = _rng(seed, "departments")
+    for department_id in range(1, scale.departments + 1):
+        yield (department_id, _department_name(department_id), *_timestamps(rng), False)
+
+
+def programs(scale, seed):
+    rng = _rng(seed, "programs")
+    program_type = _weighted(rng, PROGRAM_TYPES)
+    for program_id in range(1, scale.programs + 1):
+        department_id = (program_id - 1) // scale.programs_per_department + 1
+        kind = program_type()
+        name = f"{_department_name(department_id)} {kind.title()} {program_id}"
+        archived = rng.random() < ARCHIVED_RATE
+        yield (program_id, name, kind, department_id, *_timestamps(rng), archived)
+
+
+def _person(rng, city):
+    first_name = rng.choice(FIRST_NAMES)
+    last_name = rng.choice(LAST_NAMES)
+    address = f"{rng.randint(1, 9999)} {rng.choice(STREETS)} St"
+    return first_name, last_name, address, city()
+
+
+def instructors(scale, seed):
+    rng = _rng(seed, "instructors")
+    city = _weighted(rng, [((c, p), w) for c, p, w in CITIES])
+    employment = _weighted(rng, EMPLOYMENT)
+    for instructor_id in range(1, scale.instructors + 1):
+        first_name, last_name, address, (_, province) = _person(rng, city)
+        email = f"{first_name}.{last_name}.{instructor_id}@school.edu".lower()
+        status = "active" if rng.random() < 0.9 else "inactive"
+        # Round-robin so each department has instructors (see _instructor_for)
+        department_id = (instructor_id - 1) % scale.departments + 1
+        archived = rng.random() < ARCHIVED_RATE
+        yield (
+            instructor_id,
+            first_name,
+            last_name,
+            email,
+            address,
+            province,
+            employment(),
+            status,
+            department_id,
+            *_timestamps(rng),
+            archived,
+        )
+
+
+def _term(term_id, scale):
+    """Name and dates of a term; the last term is Fall 2025."""
+    offset = scale.terms - term_id
+    season, start, end = SEASONS[(2 - offset) % 3]
+    year = 2025 + (2 - offset) // 3
+    return (
+        f"{season} {year}",
+        date(year, *start).isoformat(),
+        date(year, *end).isoformat(),
+    )
+
+
+def terms(scale, seed):
+    rng = _rng(seed, "terms")
+    for term_id in range(1, scale.terms + 1):
+        yield (term_id, *_term(term_id, scale), *_timestamps(rng), False)
+
+
+def courses(scale, seed):
+    rng = _rng(seed, "courses")
+    # Later terms offer more courses
+    term = _weighted(rng, [(t, t) for t in range(1, scale.terms + 1)])
+    for course_id in range(1, scale.courses + 1):
+        department_id = rng.randint(1, scale.departments)
+        _, prefix = DEPARTMENTS[(department_id - 1) % len(DEPARTMENTS)]
+        title = f"{rng.choice(LEVELS)} {rng.choice(TOPICS)}"
+        code = f"{prefix}{department_id}-{course_id}"
+        archived = rng.random() < ARCHIVED_RATE
+        yield (
+            course_id,
+            title,
+            code,
+            term(),
+            department_id,
+            *_timestamps(rng),
+            archived,
+        )
+
+
+def students(scale, seed):
+    rng = _rng(seed, "students")
+    city = _weighted(rng, [((c, p), w) for c, p, w in CITIES])
+    program = _zipf_picker(rng, scale.programs, exponent=0.8)
+    for student_id in range(1, scale.students + 1):
+        first_name, last_name, address, (city_name, province) = _person(rng, city)
+        email = f"{first_name}.{last_name}.{student_id}@school.edu".lower()
+        yield (
+            student_id,
+            first_name,
+            last_name,
+            email,
+            address,
+            city_name,
+            province,
+            "Canada",
+            "local" if rng.random() < 0.7 else "permanent",
+            "active" if rng.random() < 0.92 else "inactive",
+            rng.random() < 0.3,  # coop
+            rng.random() < 0.15,  # is_international
+            program(),
+            *_timestamps(rng),
+            rng.random() < ARCHIVED_RATE,
+        )
+
+
+def enrollments(scale, seed):
+    """
+    Per student, a normally distributed number of distinct courses (mean
+    enrollments_per_student) drawn with a long-tailed course popularity.
+    """
+    rng = _rng(seed, "enrollments")
+    course = _zipf_picker(rng, scale.courses, exponent=0.6)
+    grade = _weighted(rng, GRADES)
+    mean = scale.enrollments_per_student
+    limit = min(scale.courses, 2 * mean)
+    enrollment_id = itertools.count(1)
+    for student_id in range(1, scale.students + 1):
+        count = min(limit, max(0, round(rng.gauss(mean, mean / 3))))
+        chosen = set()
+        while len(chosen) < count:
+            chosen.add(course())
+        for course_id in sorted(chosen):
+            yield (
+                next(enrollment_id),
+                student_id,
+                course_id,
+                grade(),
+                *_timestamps(rng),
+                rng.random() < ARCHIVED_RATE,
+            )
+
+
+def _instructor_for(rng, scale, department_id):
+    """A random instructor from the department (instructors are round-robin)."""
+    in_department = (scale.instructors - department_id) // scale.departments + 1
+    return department_id + rng.randrange(in_department) * scale.departments
+
+
+def assignments(scale, seed):
+    # Course departments are regenerated rather than stored
+    course_rows = courses(scale, seed)
+    rng = _rng(seed, "assignments")
+    assignment_id = itertools.count(1)
+    for course_id, _, _, _, department_id, *_ in course_rows:
+        teachers = 2 if rng.random() < 0.15 else 1
+        for instructor_id in {
+            _instructor_for(rng, scale, department_id) for _ in range(teachers)
+        }:
+            yield (
+                next(assignment_id),
+                instructor_id,
+                course_id,
+                *_timestamps(rng),
+                rng.random() < ARCHIVED_RATE,
+            )
+
+
+def course_schedule(scale, seed):
+    rng = _rng(seed, "course_schedule")
+    schedule_id = itertools.count(1)
+    for course_id in range(1, scale.courses + 1):
+        time = rng.choice(TIMES)
+        room = f"Room {rng.randint(1, 40)}{rng.randint(0, 20):02d}"
+        for day in sorted(rng.sample(range(len(DAYS)), rng.randint(1, 3))):
+            yield (
+                next(schedule_id),
+                course_id,
+                DAYS[day],
+                time,
+                room,
+                *_timestamps(rng),
+                False,
+            )
+
+
+GENERATORS = {
+    "departments": departments,
+    "programs": programs,
+    "instructors": instructors,
+    "terms": terms,
+    "courses": courses,
+    "students": students,
+    "enrollments": enrollments,
+    "assignments": assignments,
+    "course_schedule": course_schedule,
+}
+
+
+def generate(scale, seed=0):
+    """Yield (table, columns, rows) in foreign key order; rows are lazy iterators."""
+    for table in TABLES:
+        yield table, COLUMNS[table], GENERATORS[table](scale, seed)
+
+
+def load(db, scale, seed=0, truncate=False):
+    """
+    COPY a generated dataset into db in one transaction, rebuilding indexes
+    after the load, and return the row count per table.
+    """
+    if truncate:
+        db.execute_query(f"TRUNCATE {', '.join(TABLES)} RESTART IDENTITY CASCADE;")
+
+    counts = load_tables(db, generate(scale, seed), defer_indexes=True)
+    for table, count in counts.items():
+        print(f"  - {table}: {count} rows")
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load a synthetic dataset")
+    parser.add_argument("--students", type=int, default=1000)
+    parser.add_argument("--enrollments-per-student", type=int, default=10)
+    parser.add_argument("--courses", type=int, help="default: students / 50")
+    parser.add_argument("--instructors", type=int, help="default: courses / 3")
+    parser.add_argument("--departments", type=int, help="default: students / 25000")
+    parser.add_argument("--terms", type=int, default=12)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--truncate", action="store_true", help="empty all tables before loading"
+    )
+    args = parser.parse_args(argv)
+
+    scale = Scale(
+        students=args.students,
+        departments=args.departments,
+        terms=args.terms,
+        courses=args.courses,
+        instructors=args.instructors,
+        enrollments_per_student=args.enrollments_per_student,
+    )
+    print(f"🌱 Generating {scale} with seed {args.seed}...")
+    try:
+        load(Database(), scale, args.seed, args.truncate)
+    except (ValueError, RuntimeError) as e:
+        print(f"❌ Error loading synthetic data: {e}")
+        return 1
+    print("✅ Synthetic data loaded successfully!")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,15 +5,26 @@ This script initializes the database with the schema and sample data.
 """
 
 import os
+import re
 import sys
 
 sys.path.append(".")
 
 from db.database import Database
+from db.db_utils import get_reset_sequences_query
+from db.migrate import Migrator, load_migrations
+
+_CREATE_INDEX = re.compile(
+    r"CREATE (?:UNIQUE )?INDEX (CONCURRENTLY )?IF NOT EXISTS (\w+)\s+ON [^;]+;",
+    re.IGNORECASE,
+)
+_DROP_INDEX = re.compile(
+    r"DROP INDEX (?:CONCURRENTLY )?(?:IF EXISTS )?(\w+);", re.IGNORECASE
+)
 
 
 def init_database():
-    """Initialize database with schema"""
+    """Initialize database by applying pending schema migrations"""
     print("Initializing database...")
 
     # Use environment variables already set by docker-compose
@@ -22,13 +33,9 @@ def init_database():
     try:
         db = Database()
 
-        # Read and execute schema
-        with open("db/schema.sql", "r") as f:
-            schema_sql = f.read()
-
-        # Execute the schema
-        db.execute_script(schema_sql)
-        print("✅ Schema created successfully!")
+        # Apply db/migrations in order (see db/migrate.py)
+        applied = Migrator(db).migrate()
+        print(f"✅ Schema up to date ({len(applied)} migrations applied)")
 
         # Verify tables were created
         tables_query = """
@@ -51,148 +58,66 @@ def init_database():
         return False
 
 
+def schema_indexes():
+    """
+    (name, CREATE INDEX statement) for each secondary index the migrations
+    leave in place, in creation order. CONCURRENTLY is removed so the
+    statement can run inside the bulk load transaction.
+    """
+    indexes = {}
+    for migration in load_migrations():
+        for statement in migration.statements:
+            statement += ";"
+            for match in _DROP_INDEX.finditer(statement):
+                indexes.pop(match.group(1), None)
+            for match in _CREATE_INDEX.finditer(statement):
+                create_sql = match.group(0)
+                if match.group(1):
+                    create_sql = create_sql.replace(match.group(1), "", 1)
+                indexes[match.group(2)] = create_sql
+    return list(indexes.items())
+
+
+def load_tables(db, loads, defer_indexes=False):
+    """
+    COPY (table, columns, rows) loads into the database in one transaction,
+    then reset the id sequences with a single statement and ANALYZE the
+    tables. With defer_indexes the schema's secondary indexes are dropped
+    before the load and rebuilt once afterwards, which is much faster than
+    maintaining them row by row for large datasets.
+    """
+    loads = list(loads)
+    tables = [table for table, _, _ in loads]
+    before, after = [], []
+    if defer_indexes:
+        indexes = schema_indexes()
+        before = [f"DROP INDEX IF EXISTS {name};" for name, _ in indexes]
+        after = [create_sql for _, create_sql in indexes]
+    after += [get_reset_sequences_query(tables), f"ANALYZE {', '.join(tables)};"]
+    return db.copy_tables(loads, before=before, after=after)
+
+
 def populate_sample_data():
     """Populate database with sample data"""
     print("\n🌱 Populating sample data...")
 
     try:
+        from db import data
+        from db.generate import COLUMNS, TABLES
+
         db = Database()
-        from db.data import (
-            departments,
-            programs,
-            instructors,
-            terms,
-            courses,
-            students,
-            enrollments,
-            assignments,
-            course_schedule,
-        )
-
-        # Insert departments (convert boolean)
-        departments_pg = [
-            tuple(bool(v) if i == 4 else v for i, v in enumerate(row))
-            for row in departments
-        ]
-        db.execute_many(
-            "INSERT INTO departments (id, name, created_at, updated_at, is_archived) VALUES (%s, %s, %s, %s, %s)",
-            departments_pg,
-        )
-
-        db.execute_query(
-            "SELECT setval('departments_id_seq', (SELECT MAX(id) FROM departments));"
-        )
-
-        # Insert programs (convert boolean)
-        programs_pg = [
-            tuple(bool(v) if i == 6 else v for i, v in enumerate(row))
-            for row in programs
-        ]
-        db.execute_many(
-            "INSERT INTO programs (id, name, type, department_id, created_at, updated_at, is_archived) VALUES (%s, %s, %s, %s, %s, %s, %s)",
-            programs_pg,
-        )
-
-        db.execute_query(
-            "SELECT setval('programs_id_seq', (SELECT MAX(id) FROM programs));"
-        )
-
-        # Insert instructors (convert boolean)
-        instructors_pg = [
-            tuple(bool(v) if i == 11 else v for i, v in enumerate(row))
-            for row in instructors
-        ]
-        db.execute_many(
-            "INSERT INTO instructors (id, first_name, last_name, email, address, province, employment, status, department_id, created_at, updated_at, is_archived) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
-            instructors_pg,
-        )
-
-        db.execute_query(
-            "SELECT setval('instructors_id_seq', (SELECT MAX(id) FROM instructors));"
-        )
-
-        # Insert terms
-        db.execute_many(
-            "INSERT INTO terms (id, name, start_date, end_date, created_at, updated_at) VALUES (%s, %s, %s, %s, %s, %s)",
-            terms,
-        )
-
-        db.execute_query("SELECT setval('terms_id_seq', (SELECT MAX(id) FROM terms));")
-
-        # Insert courses (convert boolean)
-        courses_pg = [
-            tuple(bool(v) if i == 7 else v for i, v in enumerate(row))
-            for row in courses
-        ]
-        db.execute_many(
-            "INSERT INTO courses (id, title, code, term_id, department_id, created_at, updated_at, is_archived) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)",
-            courses_pg,
-        )
-
-        db.execute_query(
-            "SELECT setval('courses_id_seq', (SELECT MAX(id) FROM courses));"
-        )
-
-        # Insert students (convert Python bools to PostgreSQL bools, force is_archived to False)
-        # Map sample data to database schema structure
-        students_pg = [
-            tuple(
-                list(row[:10])  # First 10 fields (id through status)
-                + [bool(row[10])]  # coop (convert to bool)
-                + [bool(row[11])]  # is_international (convert to bool)
-                + [row[12]]  # program_id
-                + list(row[13:15])  # created_at, updated_at
-                + [False]  # is_archived (force to False)
-            )
-            for row in students
-        ]
-        db.execute_many(
-            "INSERT INTO students (id, first_name, last_name, email, address, city, province, country, address_type, status, coop, is_international, program_id, created_at, updated_at, is_archived) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)",
-            students_pg,
-        )
-
-        # Reset students sequence to max ID after inserting with explicit IDs
-        db.execute_query(
-            "SELECT setval('students_id_seq', (SELECT MAX(id) FROM students));"
-        )
-
-        # Insert enrollments
-        db.execute_many(
-            "INSERT INTO enrollments (id, student_id, course_id, grade, created_at, updated_at) VALUES (%s, %s, %s, %s, %s, %s)",
-            enrollments,
-        )
-
-        db.execute_query(
-            "SELECT setval('enrollments_id_seq', (SELECT MAX(id) FROM enrollments));"
-        )
-
-        # Insert assignments (convert boolean)
-        assignments_pg = [
-            tuple(bool(v) if i == 5 else v for i, v in enumerate(row))
-            for row in assignments
-        ]
-        db.execute_many(
-            "INSERT INTO assignments (id, instructor_id, course_id, created_at, updated_at, is_archived) VALUES (%s, %s, %s, %s, %s, %s)",
-            assignments_pg,
-        )
-
-        db.execute_query(
-            "SELECT setval('assignments_id_seq', (SELECT MAX(id) FROM assignments));"
-        )
-
-        # Insert course_schedule (convert boolean)
-        course_schedule_pg = [
-            tuple(bool(v) if i == 7 else v for i, v in enumerate(row))
-            for row in course_schedule
-        ]
-        db.execute_many(
-            "INSERT INTO course_schedule (id, course_id, day, time, room, created_at, updated_at, is_archived) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)",
-            course_schedule_pg,
-        )
-
-        db.execute_query(
-            "SELECT setval('course_schedule_id_seq', (SELECT MAX(id) FROM course_schedule));"
-        )
+        if db.execute_query("SELECT id FROM departments LIMIT 1;"):
+            print("ℹ️  Sample data already present, skipping.")
+            return True
+
+        # db/data.py rows follow the schema column order (terms and
+        # enrollments leave out is_archived); 0/1 is valid boolean COPY input
+        loads = []
+        for table in TABLES:
+            rows = getattr(data, table)
+            loads.append((table, COLUMNS[table][: len(rows[0])], rows))
+
+        load_tables(db, loads)
 
         print("✅ Sample data populated successfully!")
         return True
@@ -0,0 +1,78 @@
+"""
+Query instrumentation hooks for Database.
+
+Database reports every executed statement as a QueryEvent. Listeners
+registered with add_query_listener() receive the events (for example the
+per-request aggregation in app.utils.query_stats), and statements slower
+than DB_SLOW_QUERY_MS are logged with their normalised SQL.
+"""
+
+import logging
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+_listeners = []
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|\$\d+|\?")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*\?\s*,?)+\)", re.IGNORECASE)
+
+
+class QueryEvent:
+    """Timing and size of a single statement execution."""
+
+    __slots__ = ("name", "sql", "duration", "pool_wait", "rows", "error", "cache")
+
+    def __init__(
+        self, name, sql, duration, pool_wait=0.0, rows=0, error=None, cache=None
+    ):
+        self.name = name  # catalog statement name, or None for ad-hoc SQL
+        self.sql = sql
+        self.duration = duration  # seconds spent executing and fetching
+        self.pool_wait = pool_wait  # seconds spent waiting for a connection
+        self.rows = rows  # rows returned, or affected for writes
+        self.error = error  # exception raised by the driver, if any
+        self.cache = cache  # prepared statement cache: "hit", "miss" or None
+
+
+def normalize_sql(sql):
+    """Collapse whitespace and replace literals and placeholders with '?'."""
+    sql = _STRING_LITERAL.sub("?", str(sql))
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _PLACEHOLDER.sub("?", sql)
+    sql = _IN_LIST.sub("IN (...)", sql)
+    return " ".join(sql.split())
+
+
+def slow_query_threshold():
+    """Threshold in seconds above which statements are logged as slow."""
+    return float(os.getenv("DB_SLOW_QUERY_MS", "500")) / 1000
+
+
+def add_query_listener(listener):
+    """Register a callable taking a QueryEvent. Registering twice is a no-op."""
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def remove_query_listener(listener):
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def record_query(event):
+    """Log the event if it is slow and hand it to every listener."""
+    if event.duration >= slow_query_threshold():
+        logger.warning(
+            f"Slow query ({event.duration * 1000:.1f} ms, {event.rows} rows, "
+            f"pool wait {event.pool_wait * 1000:.1f} ms): {normalize_sql(event.sql)}"
+        )
+
+    for listener in list(_listeners):
+        try:
+            listener(event)
+        except Exception:
+            logger.exception("Query listener failed.")
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Schema Migration Runner
+Applies the numbered SQL files in db/migrations (0001_initial_schema.sql,
+0002_..., ...) in order and records each one in the schema_migrations table.
+
+- A migration runs in a single transaction together with its
+  schema_migrations row, so it either applies completely or not at all.
+- Files starting with "-- migrate: no-transaction" run statement by
+  statement in autocommit mode, for statements PostgreSQL refuses inside a
+  transaction such as CREATE INDEX CONCURRENTLY. Online index builds do not
+  block writes to hot tables like enrollments. Write these statements to be
+  re-runnable (DROP INDEX CONCURRENTLY IF EXISTS before CREATE INDEX
+  CONCURRENTLY), since a failure leaves earlier statements applied.
+- lock_timeout (DB_MIGRATION_LOCK_TIMEOUT, default 5s) makes a migration
+  that cannot get its lock fail fast instead of queueing every request
+  behind it. statement_timeout (DB_STATEMENT_TIMEOUT_MS) does not apply:
+  index builds may take as long as they need.
+- An advisory lock keeps two runners (e.g. two deploying instances) from
+  applying migrations at the same time.
+- Applied files are checksummed; editing one afterwards is an error.
+- The advisory lock and lock_timeout belong to the session, so migrations
+  refuse to run with DB_POOL_MODE=transaction. Point them at PostgreSQL
+  directly instead of PgBouncer.
+
+Usage:
+    python -m db.migrate              # apply pending migrations
+    python -m db.migrate --dry-run    # print what would run
+    python -m db.migrate status
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+
+sys.path.append(".")
+
+import psycopg2
+from db.database import Database, _transaction_pooling
+from db.db_utils import split_sql_statements
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+
+# pg_advisory_lock key shared by all runners ("migr" in ASCII)
+ADVISORY_LOCK_ID = 0x6D696772
+
+_FILENAME = re.compile(r"^(\d+)_(\w+)\.sql$")
+_NO_TRANSACTION = re.compile(r"^\s*--\s*migrate:\s*no-transaction\b", re.IGNORECASE)
+_CONCURRENTLY = re.compile(r"\bCONCURRENTLY\b", re.IGNORECASE)
+
+CREATE_MIGRATIONS_TABLE = """
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version INTEGER PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    checksum VARCHAR(64) NOT NULL,
+    applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+"""
+SELECT_APPLIED = "SELECT version, checksum FROM schema_migrations ORDER BY version;"
+INSERT_APPLIED = (
+    "INSERT INTO schema_migrations (version, name, checksum) VALUES (%s, %s, %s);"
+)
+
+
+class MigrationError(RuntimeError):
+    pass
+
+
+def _lock_timeout():
+    return os.getenv("DB_MIGRATION_LOCK_TIMEOUT", "5s")
+
+
+class Migration:
+    """One migration file."""
+
+    __slots__ = ("version", "name", "filename", "sql", "checksum", "transactional")
+
+    def __init__(self, version, name, filename, sql):
+        self.version = version
+        self.name = name
+        self.filename = filename
+        self.sql = sql
+        self.checksum = hashlib.sha256(sql.encode()).hexdigest()
+        self.transactional = not _NO_TRANSACTION.match(sql)
+
+    @property
+    def statements(self):
+        return split_sql_statements(self.sql)
+
+
+def load_migrations(directory=MIGRATIONS_DIR):
+    """Migration files in directory, ordered by version."""
+    migrations = {}
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(".sql"):
+            continue
+        match = _FILENAME.match(filename)
+        if not match:
+            raise MigrationError(
+                f"{filename}: migration files must be named <version>_<name>.sql"
+            )
+        version = int(match.group(1))
+        if version in migrations:
+            raise MigrationError(
+                f"{filename}: version {version} is already used by "
+                f"{migrations[version].filename}"
+            )
+        with open(os.path.join(directory, filename), "r") as f:
+            migration = Migration(version, match.group(2), filename, f.read())
+        if migration.transactional and any(
+            _CONCURRENTLY.search(statement) for statement in migration.statements
+        ):
+            raise MigrationError(
+                f"{filename}: CONCURRENTLY cannot run inside a transaction; "
+                "start the file with '-- migrate: no-transaction'"
+            )
+        migrations[version] = migration
+    return [migrations[version] for version in sorted(migrations)]
+
+
+class Migrator:
+    def __init__(self, db, directory=MIGRATIONS_DIR, lock_timeout=None, out=print):
+        self.db = db
+        self.migrations = load_migrations(directory)
+        self.lock_timeout = lock_timeout or _lock_timeout()
+        self.out = out
+
+    def _applied(self, cursor):
+        """{version: checksum} of applied migrations, empty before the first run."""
+        cursor.execute("SELECT to_regclass('schema_migrations');")
+        if cursor.fetchone()[0] is None:
+            return {}
+        cursor.execute(SELECT_APPLIED)
+        return dict(cursor.fetchall())
+
+    def _check_changed(self, applied):
+        changed = [
+            m.filename
+            for m in self.migrations
+            if m.version in applied and applied[m.version] != m.checksum
+        ]
+        if changed:
+            raise MigrationError(
+                f"Applied migrations were modified: {', '.join(changed)}. "
+                "Add a new migration instead of editing an applied one."
+            )
+
+    def status(self):
+        """[(migration, "applied" | "pending" | "changed")] for every file."""
+        self.db.connect()
+        try:
+            applied = self._applied(self.db.cursor)
+        finally:
+            self.db.close()
+        states = []
+        for m in self.migrations:
+            if m.version not in applied:
+                states.append((m, "pending"))
+            elif applied[m.version] != m.checksum:
+                states.append((m, "changed"))
+            else:
+                states.append((m, "applied"))
+        return states
+
+    def migrate(self, target=None, dry_run=False):
+        """
+        Apply pending migrations up to and including version target (all
+        when None) and return them. With dry_run nothing is written; the
+        pending migrations and their statements are printed instead.
+        """
+        if _transaction_pooling() and not dry_run:
+            raise MigrationError(
+                "Migrations need a database session of their own (advisory "
+                "lock, lock_timeout), which transaction pooling does not keep. "
+                "Run them against PostgreSQL directly, without "
+                "DB_POOL_MODE=transaction."
+            )
+        db = self.db
+        db.connect()
+        conn, cursor = db.conn, db.cursor
+        locked = False
+        try:
+            if not dry_run:
+                cursor.execute("SET statement_timeout = 0;")
+                cursor.execute(CREATE_MIGRATIONS_TABLE)
+                cursor.execute("SELECT pg_advisory_lock(%s);", (ADVISORY_LOCK_ID,))
+                conn.commit()
+                locked = True
+
+            applied = self._applied(cursor)
+            conn.commit()
+            self._check_changed(applied)
+            pending = [
+                m
+                for m in self.migrations
+                if m.version not in applied and (target is None or m.version <= target)
+            ]
+            for migration in pending:
+                if dry_run:
+                    self._describe(migration)
+                elif migration.transactional:
+                    self._apply_in_transaction(conn, cursor, migration)
+                else:
+                    self._apply_without_transaction(conn, cursor, migration)
+            return pending
+        finally:
+            if locked:
+                try:
+                    cursor.execute(
+                        "SELECT pg_advisory_unlock(%s);", (ADVISORY_LOCK_ID,)
+                    )
+                except psycopg2.Error:
+                    pass  # the lock goes away with the session anyway
+            if not dry_run:
+                try:
+                    cursor.execute("RESET statement_timeout;")
+                except psycopg2.Error:
+                    pass
+            db.close()
+
+    def _describe(self, migration):
+        mode = "transaction" if migration.transactional else "no transaction"
+        self.out(f"-- {migration.filename} ({mode})")
+        for statement in migration.statements:
+            self.out(f"{statement};")
+
+    def _apply_in_transaction(self, conn, cursor, migration):
+        self.out(f"Applying {migration.filename}...")
+        try:
+            cursor.execute("SET LOCAL lock_timeout = %s;", (self.lock_timeout,))
+            for statement in migration.statements:
+                cursor.execute(statement)
+            cursor.execute(
+                INSERT_APPLIED, (migration.version, migration.name, migration.checksum)
+            )
+            conn.commit()
+        except psycopg2.Error as e:
+            conn.rollback()
+            raise MigrationError(
+                f"{migration.filename} failed and was rolled back: {e}"
+            )
+
+    def _apply_without_transaction(self, conn, cursor, migration):
+        self.out(f"Applying {migration.filename} (no transaction)...")
+        statements = migration.statements
+        conn.autocommit = True
+        try:
+            cursor.execute("SET lock_timeout = %s;", (self.lock_timeout,))
+            for number, statement in enumerate(statements, 1):
+                try:
+                    cursor.execute(statement)
+                except psycopg2.Error as e:
+                    raise MigrationError(
+                        f"{migration.filename} failed at statement {number} of "
+                        f"{len(statements)}; earlier statements stay applied. "
+                        f"Fix the cause and re-run: {e}"
+                    )
+            cursor.execute(
+                INSERT_APPLIED, (migration.version, migration.name, migration.checksum)
+            )
+        finally:
+            try:
+                cursor.execute("RESET lock_timeout;")
+            except psycopg2.Error:
+                pass
+            conn.autocommit = False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply schema migrations")
+    parser.add_argument("command", nargs="?", choices=["up", "status"], default="up")
+    parser.add_argument("--dry-run", action="store_true", help="print, do not apply")
+    parser.add_argument("--target", type=int, help="stop after this version")
+    parser.add_argument("--lock-timeout", help="e.g. 5s (DB_MIGRATION_LOCK_TIMEOUT)")
+    args = parser.parse_args(argv)
+
+    try:
+        migrator = Migrator(Database(), lock_timeout=args.lock_timeout)
+        if args.command == "status":
+            for migration, state in migrator.status():
+                print(f"{state:<8} {migration.filename}")
+            return 0
+        pending = migrator.migrate(target=args.target, dry_run=args.dry_run)
+    except (MigrationError, psycopg2.Error) as e:
+        print(f"❌ Migration failed: {e}")
+        return 1
+
+    if args.dry_run:
+        print(f"\n{len(pending)} migration(s) pending.")
+    else:
+        print(f"✅ Applied {len(pending)} migration(s).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
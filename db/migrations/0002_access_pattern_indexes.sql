@@ -0,0 +1,87 @@
+-- migrate: no-transaction
+-- Index set designed from the statement catalog in app/models, built online
+-- so enrollments and students stay writable. Each DROP ... IF EXISTS makes
+-- the file re-runnable after a failed build left an invalid index behind.
+-- tests/explain_test.py checks the plans that use these indexes, under
+-- default planner settings.
+--
+-- No partial indexes for <table>_read_all_active: most rows are live, so
+-- the planner reads the whole table for those listings anyway, and by id
+-- the primary key serves as well. They would only slow down writes.
+
+-- A student takes a course, and an instructor teaches it, at most once
+-- among live rows. Archived rows may repeat so archived work can be redone.
+--
+-- Building a unique index fails on rows that already repeat, so each build
+-- is preceded by a check that lists them instead. Archive all but one of
+-- each, for example keeping the newest:
+--
+--   UPDATE enrollments SET is_archived = TRUE, updated_at = CURRENT_TIMESTAMP
+--   WHERE id IN (
+--       SELECT id FROM (
+--           SELECT id, row_number() OVER (
+--               PARTITION BY student_id, course_id ORDER BY id DESC) AS n
+--           FROM enrollments WHERE is_archived = FALSE
+--       ) ranked
+--       WHERE n > 1
+--   );
+--
+-- (and the same for assignments over instructor_id, course_id), then run
+-- the migration again.
+DO $$
+DECLARE
+    repeated TEXT;
+BEGIN
+    SELECT string_agg(format('student %s, course %s: ids %s', student_id, course_id, ids), '; ')
+    INTO repeated
+    FROM (
+        SELECT student_id, course_id, array_agg(id ORDER BY id) AS ids
+        FROM enrollments
+        WHERE is_archived = FALSE
+        GROUP BY student_id, course_id
+        HAVING count(*) > 1
+        ORDER BY student_id, course_id
+        LIMIT 20
+    ) duplicates;
+    IF repeated IS NOT NULL THEN
+        RAISE EXCEPTION 'Live enrollments repeat a student and course: %', repeated
+            USING HINT = 'Archive all but one of each, see 0002_access_pattern_indexes.sql.';
+    END IF;
+END $$;
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_enrollments_student_course;
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS idx_enrollments_student_course
+    ON enrollments (student_id, course_id) WHERE is_archived = FALSE;
+
+DO $$
+DECLARE
+    repeated TEXT;
+BEGIN
+    SELECT string_agg(format('instructor %s, course %s: ids %s', instructor_id, course_id, ids), '; ')
+    INTO repeated
+    FROM (
+        SELECT instructor_id, course_id, array_agg(id ORDER BY id) AS ids
+        FROM assignments
+        WHERE is_archived = FALSE
+        GROUP BY instructor_id, course_id
+        HAVING count(*) > 1
+        ORDER BY instructor_id, course_id
+        LIMIT 20
+    ) duplicates;
+    IF repeated IS NOT NULL THEN
+        RAISE EXCEPTION 'Live assignments repeat an instructor and course: %', repeated
+            USING HINT = 'Archive all but one of each, see 0002_access_pattern_indexes.sql.';
+    END IF;
+END $$;
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_assignments_instructor_course;
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS idx_assignments_instructor_course
+    ON assignments (instructor_id, course_id) WHERE is_archived = FALSE;
+
+-- Redundant: email and code already have the indexes behind their UNIQUE
+-- constraints, and a boolean index is never selective enough to be used.
+DROP INDEX CONCURRENTLY IF EXISTS idx_students_email;
+DROP INDEX CONCURRENTLY IF EXISTS idx_instructors_email;
+DROP INDEX CONCURRENTLY IF EXISTS idx_courses_code;
+DROP INDEX CONCURRENTLY IF EXISTS idx_terms_is_archived;
+DROP INDEX CONCURRENTLY IF EXISTS idx_enrollments_is_archived;
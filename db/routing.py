@@ -0,0 +1,96 @@
+"""
+Read routing between the primary and read replicas.
+
+With DB_REPLICA_URLS set (comma-separated libpq URLs or DSNs), Database runs
+catalog reads (Statement.read_only) on a replica and everything else on the
+primary. A routing scope keeps reads consistent with writes. Each Flask
+request opens one (app.utils.read_routing); outside a scope every read may
+use a replica.
+
+- primary=True keeps all reads in the scope on the primary. This is used
+  for write requests, whose reads feed the rows they update.
+- Once the scope has written, its remaining reads stay on the primary.
+- With min_lsn (the position of the client's last write), a replica is only
+  used if it has replayed the WAL that far. Otherwise the read goes to the
+  primary.
+
+A scope sticks to one replica, so a catch-up check holds for all of its
+reads.
+"""
+
+import contextvars
+import os
+import random
+import time
+
+# Seconds to leave the replicas alone after one could not be reached
+REPLICA_RETRY_AFTER = 30
+
+_scope = contextvars.ContextVar("db_routing_scope", default=None)
+_replicas_down_until = 0.0
+
+
+class RoutingScope:
+    __slots__ = ("primary", "min_lsn", "wrote", "replica", "caught_up")
+
+    def __init__(self, primary=False, min_lsn=None):
+        self.primary = primary
+        self.min_lsn = min_lsn
+        self.wrote = False
+        self.replica = None  # URL chosen for this scope
+        self.caught_up = None  # replica replayed min_lsn? None until checked
+
+
+def replica_urls():
+    return [
+        url.strip()
+        for url in os.getenv("DB_REPLICA_URLS", "").split(",")
+        if url.strip()
+    ]
+
+
+def begin(primary=False, min_lsn=None):
+    """Start a routing scope; pass the returned token to end()."""
+    return _scope.set(RoutingScope(primary, min_lsn))
+
+
+def end(token):
+    _scope.reset(token)
+
+
+def current():
+    """The active RoutingScope, or None."""
+    return _scope.get()
+
+
+def note_write():
+    scope = _scope.get()
+    if scope is not None:
+        scope.wrote = True
+
+
+def use_replica():
+    """Whether the next read may go to a replica."""
+    if not replica_urls() or time.monotonic() < _replicas_down_until:
+        return False
+    scope = _scope.get()
+    return scope is None or not (
+        scope.primary or scope.wrote or scope.caught_up is False
+    )
+
+
+def choose_replica():
+    """The scope's replica URL, picked at random the first time."""
+    urls = replica_urls()
+    scope = _scope.get()
+    if scope is None:
+        return random.choice(urls)
+    if scope.replica not in urls:
+        scope.replica = random.choice(urls)
+    return scope.replica
+
+
+def replica_failed():
+    """Send reads to the primary for a while; the replica could not serve one."""
+    global _replicas_down_until
+    _replicas_down_until = time.monotonic() + REPLICA_RETRY_AFTER
@@ -0,0 +1,76 @@
+"""
+Compact row objects for query results.
+
+Rows are fetched with a plain tuple cursor and wrapped in a Row subclass
+generated once per distinct column list. Each row only holds its values
+tuple; the column names and name -> index lookup live on the class and are
+shared by every row of the result.
+"""
+
+from collections.abc import Mapping
+
+# column tuple -> Row subclass
+_row_classes = {}
+
+
+class Row(Mapping):
+    """
+    Read-only mapping over a values tuple.
+
+    Supports row["column"], dict(row), {**row} and .get(), so callers that
+    used RealDictRow keep working. The JSON provider encodes it via as_dict().
+    """
+
+    __slots__ = ("_values",)
+    _fields = ()
+    _index = {}
+
+    def __init__(self, values):
+        self._values = values
+
+    def __getitem__(self, key):
+        return self._values[self._index[key]]
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __repr__(self):
+        return f"Row({self.as_dict()!r})"
+
+    def values(self):
+        return self._values
+
+    def as_dict(self):
+        return dict(zip(self._fields, self._values))
+
+
+def row_class(columns):
+    """Return the Row subclass for a column tuple, creating it on first use."""
+    columns = tuple(columns)
+    cls = _row_classes.get(columns)
+    if cls is None:
+        cls = type(
+            "Row",
+            (Row,),
+            {
+                "__slots__": (),
+                "_fields": columns,
+                "_index": {name: i for i, name in enumerate(columns)},
+            },
+        )
+        _row_classes[columns] = cls
+    return cls
+
+
+def rows_from_cursor(cursor, records):
+    """Wrap records fetched from a tuple cursor in Row objects."""
+    if not records or not cursor.description:
+        return records
+    cls = row_class(column.name for column in cursor.description)
+    return [cls(record) for record in records]
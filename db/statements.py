@@ -0,0 +1,86 @@
+"""
+Statement catalog for the data-access layer.
+
+Every query in app.models is declared once at import time through
+declare_statement(). Each Statement knows its fetch mode and parameter
+arity up front, so Database does not have to sniff the SQL text on every
+call, and can run it as a server-side prepared statement (PREPARE/EXECUTE)
+that is planned once per pooled connection.
+"""
+
+import re
+
+# Fetch modes
+FETCH_ALL = "all"  # return cursor.fetchall()
+FETCH_NONE = "none"  # commit and return the cursor (rowcount)
+
+_PLACEHOLDER = re.compile(r"%s")
+
+# name -> Statement, filled in as app.models modules are imported
+_catalog = {}
+
+
+class Statement(str):
+    """
+    SQL text plus the metadata Database needs to execute it.
+
+    Statement subclasses str so it can still be passed anywhere a query
+    string is expected (logging, comparisons, plain cursor.execute).
+    """
+
+    def __new__(cls, name, sql, fetch):
+        if fetch not in (FETCH_ALL, FETCH_NONE):
+            raise ValueError(f"Unknown fetch mode for statement {name}: {fetch}")
+        text = " ".join(sql.replace("?", "%s").split())
+        stmt = super().__new__(cls, text)
+        stmt.name = name
+        stmt.fetch = fetch
+        stmt.arity = len(_PLACEHOLDER.findall(text))
+        # Safe to run again if the connection drops mid-statement
+        stmt.read_only = text.split(None, 1)[0].upper() == "SELECT"
+        stmt.prepare_sql = _to_prepare_sql(name, text)
+        stmt.execute_sql = _to_execute_sql(name, stmt.arity)
+        return stmt
+
+    def check_params(self, params):
+        """Raise ValueError if params does not match the declared arity."""
+        count = len(params) if params else 0
+        if count != self.arity:
+            raise ValueError(
+                f"Statement {self.name} expects {self.arity} parameters, got {count}"
+            )
+
+
+def _to_prepare_sql(name, text):
+    counter = iter(range(1, text.count("%s") + 1))
+    body = _PLACEHOLDER.sub(lambda _: f"${next(counter)}", text).rstrip(";")
+    return f"PREPARE {name} AS {body}"
+
+
+def _to_execute_sql(name, arity):
+    if not arity:
+        return f"EXECUTE {name}"
+    return f"EXECUTE {name} ({', '.join('%s' for _ in range(arity))})"
+
+
+def declare_statement(name, sql, fetch=FETCH_NONE):
+    """
+    Register a statement in the catalog. Names must be unique and valid
+    SQL identifiers since they double as the server-side statement name.
+    """
+    if not re.fullmatch(r"[a-z_][a-z0-9_]*", name):
+        raise ValueError(f"Invalid statement name: {name}")
+    if name in _catalog:
+        raise ValueError(f"Statement {name} is already declared")
+    stmt = Statement(name, sql, fetch)
+    _catalog[name] = stmt
+    return stmt
+
+
+def get_statement(name):
+    return _catalog[name]
+
+
+def all_statements():
+    """Return every declared statement, in declaration order."""
+    return list(_catalog.values())
@@ -17,6 +17,17 @@ else
   python3 db/init.py
 fi
 
-# Start the Flask application using Gunicorn
+# Shared directory for per-worker Prometheus metrics (aggregated by /metrics)
+export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus}"
+rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
+# APP_SERVER=asgi serves the async stack (asgi.py) with Uvicorn instead
+if [ "$APP_SERVER" = "asgi" ]; then
+  echo "Starting ASGI application..."
+  exec uvicorn asgi:app --host 0.0.0.0 --port 5000
+fi
+
+# Start the Flask application using Gunicorn (workers and threads: gunicorn.conf.py)
 echo "Starting Flask application..."
-exec gunicorn --workers 1 --bind 0.0.0.0:5000 run:app
+exec gunicorn --config gunicorn.conf.py run:app
@@ -0,0 +1,64 @@
+"""
+Gunicorn settings for production, used by entrypoint.sh.
+
+The app is imported once in the master (preload_app) and workers are forked
+from it: they boot without re-importing anything and share the imported
+modules copy-on-write. gc.freeze() before each fork keeps the collector
+away from those objects, so a worker's first collection does not touch (and
+copy) every page. Database connections are never shared: the master closes
+its pool (if anything opened it) before forking and each worker opens its
+own in the background as it starts.
+
+Workers run THREADS gthread threads each and size their pool to match.
+There are 2 * CPUs + 1 workers, fewer if workers * threads would exceed
+DB_MAX_CONNECTIONS; WEB_CONCURRENCY overrides the count.
+"""
+
+import gc
+import os
+
+
+def cpu_count():
+    """CPUs this process may run on, which can be fewer than the host has."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def worker_count(cpus, threads, connection_budget):
+    """2 * cpus + 1, capped so every thread can hold a connection; at least 1."""
+    return max(1, min(2 * cpus + 1, connection_budget // threads))
+
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+preload_app = True
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+workers = int(
+    os.getenv("WEB_CONCURRENCY")
+    or worker_count(cpu_count(), threads, int(os.getenv("DB_MAX_CONNECTIONS", "20")))
+)
+
+# A thread holds at most one connection at a time
+os.environ["DB_POOL_MAX"] = str(threads)
+
+
+def pre_fork(server, worker):
+    from db.database import Database
+
+    Database.close_pool()
+    gc.collect()
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    from db.database import Database
+
+    Database.prewarm()
+
+
+def child_exit(server, worker):
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,192 @@
+import threading
+import time
+import pytest
+from flask import Blueprint, Flask
+from psycopg2.pool import PoolError
+from app.utils import (
+    api_response,
+    handle_exceptions_read,
+    init_admission_control,
+    init_query_stats,
+)
+from app.utils import admission
+from app.utils.admission import AdaptiveLimit
+from db.instrumentation import QueryEvent, record_query
+
+
+class TestAdaptiveLimit:
+    def test_overload_cuts_the_limit_once_per_cooldown(self):
+        limit = AdaptiveLimit(10)
+        for _ in range(3):
+            assert limit.try_acquire()
+            limit.release(overloaded=True)
+
+        assert limit.limit == pytest.approx(10 * admission.DECREASE)
+        assert limit.in_flight == 0
+
+    def test_limit_never_drops_below_minimum(self, monkeypatch):
+        monkeypatch.setattr(admission, "COOLDOWN", 0)
+        limit = AdaptiveLimit(4)
+        for _ in range(20):
+            limit.try_acquire()
+            limit.release(overloaded=True)
+        assert limit.limit == 1
+
+    def test_busy_limit_grows_back(self):
+        limit = AdaptiveLimit(4)
+        limit.limit = 2.0
+        for _ in range(10):
+            limit.try_acquire()
+            limit.release()
+        assert 2.0 < limit.limit <= 4
+
+    def test_idle_limit_does_not_grow(self):
+        limit = AdaptiveLimit(8)
+        limit.limit = 4.0
+        limit.try_acquire()
+        limit.release()
+        assert limit.limit == 4.0
+
+    def test_shares_apply_once_lowered(self):
+        limit = AdaptiveLimit(4)
+        assert all(limit.try_acquire(share=0.5) for _ in range(4))
+        assert not limit.try_acquire()
+
+        lowered = AdaptiveLimit(10)
+        lowered.limit = 4.0
+        assert lowered.try_acquire(share=0.5)
+        assert lowered.try_acquire(share=0.5)
+        assert not lowered.try_acquire(share=0.5)
+        assert lowered.try_acquire(share=1.0)
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setenv("DB_POOL_MAX", "4")
+    app = Flask(__name__)
+    init_query_stats(app)
+    init_admission_control(app)
+    metrics = Blueprint("metrics", __name__)
+    state = {"pool_wait": 0.0, "status": 200}
+
+    @app.route("/things", methods=["GET", "POST"])
+    @app.route("/things/<int:thing_id>")
+    def things(thing_id=None):
+        record_query(QueryEvent("things", "SELECT 1", 0.001, state["pool_wait"]))
+        return api_response([], "ok", state["status"])
+
+    @app.route("/pool")
+    @handle_exceptions_read()
+    def pool():
+        raise PoolError("connection pool exhausted")
+
+    @metrics.route("/metrics")
+    def scrape():
+        return "ok"
+
+    app.register_blueprint(metrics)
+    return app, app.extensions["admission_limit"], state
+
+
+class TestAdmissionControl:
+    def test_requests_are_admitted_and_released(self, app):
+        flask_app, limit, _ = app
+        assert flask_app.test_client().get("/things").status_code == 200
+        assert limit.in_flight == 0
+        assert limit.limit == 4
+
+    def test_bulk_reads_are_shed_before_writes(self, app):
+        flask_app, limit, _ = app
+        client = flask_app.test_client()
+        limit.limit = 2.0
+        limit.in_flight = 1
+
+        shed = client.get("/things")
+        assert shed.status_code == 503
+        assert shed.headers["Retry-After"] == "1"
+        assert client.get("/things/1").status_code == 503
+        assert client.post("/things").status_code == 200
+        assert limit.in_flight == 1
+
+    def test_metrics_are_never_shed(self, app):
+        flask_app, limit, _ = app
+        limit.limit = 1.0
+        limit.in_flight = 4
+        assert flask_app.test_client().get("/metrics").status_code == 200
+
+    @pytest.mark.parametrize("pool_wait, status", [(0.2, 200), (0.0, 504)])
+    def test_overload_lowers_the_limit(self, app, pool_wait, status):
+        flask_app, limit, state = app
+        state.update(pool_wait=pool_wait, status=status)
+        flask_app.test_client().get("/things/1")
+        assert limit.limit < 4
+
+    def test_exhausted_pool_is_a_503(self, app):
+        flask_app, limit, _ = app
+        response = flask_app.test_client().get("/pool")
+
+        assert response.status_code == 503
+        assert "Retry-After" in response.headers
+        assert limit.limit < 4
+
+    def test_can_be_turned_off(self, monkeypatch):
+        monkeypatch.setenv("ADMISSION_CONTROL", "false")
+        app = Flask(__name__)
+        init_admission_control(app)
+        assert "admission_limit" not in app.extensions
+
+
+class TestOverload:
+    """
+    Twice as many concurrent clients as a worker has connections. Without
+    admission control every request queues behind the others; with it, the
+    excess is shed and the requests that are served stay fast.
+    """
+
+    CONNECTIONS = 2
+    SERVICE_TIME = 0.05
+
+    def serve(self, monkeypatch, enabled):
+        monkeypatch.setenv("ADMISSION_CONTROL", "true" if enabled else "false")
+        monkeypatch.setenv("DB_POOL_MAX", str(self.CONNECTIONS))
+        monkeypatch.setenv("ADMISSION_TARGET_WAIT_MS", "10")
+        app = Flask(__name__)
+        init_query_stats(app)
+        init_admission_control(app)
+        connections = threading.Semaphore(self.CONNECTIONS)
+
+        @app.route("/things")
+        def things():
+            started = time.perf_counter()
+            with connections:
+                waited = time.perf_counter() - started
+                time.sleep(self.SERVICE_TIME)
+            record_query(QueryEvent("things", "SELECT 1", self.SERVICE_TIME, waited))
+            return "ok"
+
+        results = []
+        start = threading.Barrier(4 * self.CONNECTIONS)
+
+        def client():
+            start.wait()
+            for _ in range(5):
+                started = time.perf_counter()
+                status = app.test_client().get("/things").status_code
+                results.append((status, time.perf_counter() - started))
+
+        threads = [threading.Thread(target=client) for _ in range(start.parties)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_admitted_latency_stays_bounded(self, monkeypatch):
+        queued = self.serve(monkeypatch, enabled=False)
+        shed = self.serve(monkeypatch, enabled=True)
+
+        assert {status for status, _ in queued} == {200}
+        served = [latency for status, latency in shed if status == 200]
+        assert any(status == 503 for status, _ in shed)
+        assert max(served) < max(latency for _, latency in queued)
+        assert max(served) < 3 * self.SERVICE_TIME
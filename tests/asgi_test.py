@@ -0,0 +1,232 @@
+import asyncio
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+import httpx
+import psycopg
+import pytest
+from psycopg.conninfo import make_conninfo
+from app.aio import create_asgi_app
+from app.aio.models import AsyncModel
+from benchmarks.fake_db import FakeDatabase
+from db.async_database import AsyncDatabase
+from db.instrumentation import add_query_listener, remove_query_listener
+from db.statements import get_statement
+from tests.query_budget import QueryCounter
+
+STUDENT = {
+    "first_name": "Grace",
+    "last_name": "Hopper",
+    "email": "grace@example.com",
+    "status": "active",
+    "coop": True,
+    "program_id": 1,
+}
+TERM = {"name": "Fall 2025", "start_date": "2025-09-01", "end_date": "2025-12-19"}
+
+# Sent in order to both apps; later requests see the earlier writes
+PARITY_CASES = [
+    ("GET", "/", None),
+    ("GET", "/students", None),
+    ("GET", "/students?active_only=true", None),
+    ("GET", "/students/1", None),
+    ("GET", "/students/99", None),
+    ("GET", "/course_schedules", None),
+    ("POST", "/students", [STUDENT, {**STUDENT, "email": "g2@example.com"}]),
+    ("POST", "/terms", TERM),
+    ("PUT", "/students", [{"id": 1, "city": "Paris"}, {"city": "x"}, {"id": 99}]),
+    ("PUT", "/terms", {"id": 1, "name": "Winter 2026"}),
+    ("PATCH", "/enrollments", {"ids": [1, 2, 99]}),
+    ("PATCH", "/enrollments", {"ids": [1]}),
+    ("PATCH", "/terms", {}),
+    ("PATCH", "/terms", {"ids": ["x"]}),
+]
+
+
+class AsyncFakeDatabase:
+    """FakeDatabase behind the AsyncDatabase interface, with awaited latency."""
+
+    def __init__(self, fake, latency=0.0):
+        self.fake = fake
+        self.latency = latency
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def execute_query(self, query, params=()):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self.fake.execute_query(query, params)
+
+
+def seeded_fake():
+    fake = FakeDatabase()
+    fake.seed("students", [STUDENT, {**STUDENT, "status": "inactive"}])
+    fake.seed("terms", [TERM])
+    fake.seed("enrollments", [{"student_id": 1, "course_id": 1, "grade": "A"}] * 2)
+    fake.seed("course_schedule", [{"course_id": 1, "day": "Monday", "time": "09:00"}])
+    return fake
+
+
+def fake_pool(rows=(), error=None):
+    cursor = MagicMock()
+    cursor.__aenter__.return_value = cursor
+    cursor.execute = AsyncMock(side_effect=error)
+    cursor.fetchall = AsyncMock(return_value=list(rows))
+    cursor.description = [SimpleNamespace(name="id")]
+    cursor.rowcount = len(rows)
+    conn = MagicMock()
+    conn.__aenter__.return_value = conn
+    conn.cursor.return_value = cursor
+    pool = MagicMock()
+    pool.connection.return_value = conn
+    return pool
+
+
+async def send(app, requests):
+    """Send (method, url, json body) requests to an ASGI app, in order."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        return [
+            await http.request(method, url, json=body) for method, url, body in requests
+        ]
+
+
+class TestAsgiApp:
+    def test_responses_match_flask(self, client):
+        flask_backend = seeded_fake()
+        with QueryCounter(flask_backend):
+            expected = [
+                client.open(url, method=method, json=body)
+                for method, url, body in PARITY_CASES
+            ]
+
+        app = create_asgi_app(AsyncFakeDatabase(seeded_fake()))
+        responses = asyncio.run(send(app, PARITY_CASES))
+
+        for case, response, flask_response in zip(PARITY_CASES, responses, expected):
+            assert response.status_code == flask_response.status_code, case
+            assert response.json() == flask_response.get_json(), case
+
+    def test_slow_requests_overlap(self):
+        app = create_asgi_app(AsyncFakeDatabase(seeded_fake(), latency=0.2))
+
+        async def send_all():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as http:
+                return await asyncio.gather(
+                    *(http.get("/students/1") for _ in range(200))
+                )
+
+        started = time.perf_counter()
+        responses = asyncio.run(send_all())
+        elapsed = time.perf_counter() - started
+
+        assert {response.status_code for response in responses} == {200}
+        # One at a time, 200 requests of 0.2 s would take 40 s
+        assert elapsed < 5
+
+    def test_lifespan_opens_and_closes_database(self):
+        db = AsyncFakeDatabase(seeded_fake())
+        db.open = AsyncMock()
+        db.close = AsyncMock()
+        app = create_asgi_app(db)
+
+        async def serve():
+            async with app.router.lifespan_context(app):
+                db.open.assert_awaited_once()
+                db.close.assert_not_awaited()
+
+        asyncio.run(serve())
+        db.close.assert_awaited_once()
+
+
+class TestAsyncDatabase:
+    def test_settings_from_environment(self, monkeypatch):
+        monkeypatch.setenv("DB_ASYNC_POOL_MAX", "50")
+        db = AsyncDatabase()
+
+        assert "dbname=test_school_api" in db.conninfo
+        assert "host=localhost" in db.conninfo
+        assert (db.min_size, db.max_size) == (1, 50)
+
+    def test_fetch_all_statement_returns_rows(self):
+        db = AsyncDatabase("dbname=test")
+        db.pool = fake_pool(rows=[(1,), (2,)])
+        events = []
+        add_query_listener(events.append)
+        try:
+            rows = asyncio.run(
+                db.execute_query(get_statement("students_read_by_ids"), ([1, 2],))
+            )
+        finally:
+            remove_query_listener(events.append)
+
+        assert [row["id"] for row in rows] == [1, 2]
+        assert events[0].name == "students_read_by_ids"
+        assert events[0].rows == 2
+
+    def test_write_returns_cursor(self):
+        db = AsyncDatabase("dbname=test")
+        db.pool = fake_pool(rows=[(1,)])
+
+        cursor = asyncio.run(db.execute_query(get_statement("students_archive"), (1,)))
+        assert cursor.rowcount == 1
+
+    @pytest.mark.parametrize(
+        "error, expected",
+        [
+            (psycopg.errors.UniqueViolation("duplicate"), ValueError),
+            (psycopg.OperationalError("server closed the connection"), RuntimeError),
+        ],
+    )
+    def test_driver_errors_are_mapped(self, error, expected):
+        db = AsyncDatabase("dbname=test")
+        db.pool = fake_pool(error=error)
+
+        with pytest.raises(expected):
+            asyncio.run(db.execute_query(get_statement("students_archive"), (1,)))
+
+    def test_parameter_count_is_checked(self):
+        db = AsyncDatabase("dbname=test")
+        db.pool = fake_pool()
+
+        with pytest.raises(ValueError, match="expects 1 parameters"):
+            asyncio.run(db.execute_query(get_statement("students_archive"), ()))
+        db.pool.connection.assert_not_called()
+
+
+class TestAsyncModelOnPostgres:
+    def test_catalog_statements(self, pg):
+        with pg.cursor() as cursor:
+            cursor.execute("SELECT current_schema(), count(*) FROM departments;")
+            schema, departments = cursor.fetchone()
+        conninfo = make_conninfo(
+            os.environ["TEST_DATABASE_URL"], options=f"-c search_path={schema}"
+        )
+
+        async def run():
+            db = AsyncDatabase(conninfo, min_size=1, max_size=2)
+            model = AsyncModel(db, "departments")
+            try:
+                ids = await model.insert_many([("Async A",), ("Async B",)])
+                updated = await model.update_many(ids, [("Async C",), ("Async D",)])
+                archived = await model.archive_many(ids)
+                return ids, updated, archived, await model.read_by_ids(ids)
+            finally:
+                await db.close()
+
+        ids, updated, archived, rows = asyncio.run(run())
+
+        assert len(ids) == 2 and min(ids) > departments
+        assert sorted(updated) == sorted(archived) == sorted(ids)
+        assert [(row["name"], row["is_archived"]) for row in rows] == [
+            ("Async C", True),
+            ("Async D", True),
+        ]
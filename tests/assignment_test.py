@@ -1,6 +1,6 @@
 import pytest
 from datetime import date
-from unittest.mock import patch
+from unittest.mock import call, patch
 from app.models import (
     assignment_db_read_all,
     assignment_db_read_by_id,
@@ -106,20 +106,20 @@ def mock_db_read_many():
 
 
 @pytest.fixture
-def mock_db_create():
-    with patch("app.services.assignment.assignment_db_insert") as mock:
+def mock_db_create_many():
+    with patch("app.services.assignment.assignment_db_insert_many") as mock:
         yield mock
 
 
 @pytest.fixture
-def mock_db_update():
-    with patch("app.services.assignment.assignment_db_update") as mock:
+def mock_db_update_many():
+    with patch("app.services.assignment.assignment_db_update_many") as mock:
         yield mock
 
 
 @pytest.fixture
-def mock_db_archive():
-    with patch("app.services.assignment.assignment_db_archive") as mock:
+def mock_db_archive_many():
+    with patch("app.services.assignment.assignment_db_archive_many") as mock:
         yield mock
 
 
@@ -156,12 +156,12 @@ class TestAssignmentReadService:
 class TestAssignmentCreateService:
     def test_create_new_assignments(
         self,
-        mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_assignment_create_data,
         valid_assignment_rows,
     ):
-        mock_db_create.side_effect = [1, 2]
+        mock_db_create_many.return_value = [1, 2]
         mock_db_read_many.return_value = valid_assignment_rows
 
         results, error, status_code = create_new_assignments(
@@ -171,13 +171,13 @@ class TestAssignmentCreateService:
         assert len(results) == 2
         assert error is None
         assert status_code == 201
-        assert mock_db_create.call_count == 2
+        mock_db_create_many.assert_called_once()
         mock_db_read_many.assert_called_once_with([1, 2])
 
     def test_create_new_assignments_failure(
-        self, mock_db_create, mock_db_read_many, valid_assignment_create_data
+        self, mock_db_create_many, mock_db_read_many, valid_assignment_create_data
     ):
-        mock_db_create.side_effect = [None, None]
+        mock_db_create_many.return_value = []
         results, error, status_code = create_new_assignments(
             valid_assignment_create_data
         )
@@ -195,18 +195,15 @@ class TestAssignmentUpdateService:
         self,
         mock_dict_to_row,
         mock_db_instance,
-        mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_assignment_update_data,
         valid_assignment_row,
     ):
         # This test is fully mocked and does not require a real DB connection
-        mock_db_update.return_value = 1
+        mock_db_update_many.return_value = [1]
         mock_db_read_many.return_value = [valid_assignment_row]
 
-        mock_db_read_one.return_value = valid_assignment_row
-
         mock_dict_to_row.return_value = (1, 1)  # Mock conversion
 
         results, error, status_code = update_assignments(valid_assignment_update_data)
@@ -214,8 +211,8 @@ class TestAssignmentUpdateService:
         assert len(results) == 1
         assert error in (None, [])
         assert status_code == 200
-        assert mock_db_update.call_count == 1
-        mock_db_read_many.assert_called_once_with([1])
+        mock_db_update_many.assert_called_once()
+        assert mock_db_read_many.call_args_list == [call([1]), call([1])]
 
     @patch("app.models.assignment.db")  # Mock the db instance
     @patch("app.services.assignment.assignment_dict_to_row")
@@ -223,15 +220,14 @@ class TestAssignmentUpdateService:
         self,
         mock_dict_to_row,
         mock_db_instance,
-        mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_assignment_update_data,
         valid_assignment_row,
     ):
-        mock_db_update.return_value = 0  # Simulate no update
+        mock_db_update_many.return_value = []  # Simulate no update
 
-        mock_db_read_one.return_value = valid_assignment_row
+        mock_db_read_many.return_value = [valid_assignment_row]
 
         mock_dict_to_row.return_value = (1, 1)  # Mock conversion
 
@@ -240,8 +236,8 @@ class TestAssignmentUpdateService:
         assert results == []
         assert error == [{"message": "Assignment ID 1 not updated."}]
         assert status_code == 400
-        assert mock_db_update.call_count == 1
-        mock_db_read_many.assert_not_called()
+        mock_db_update_many.assert_called_once()
+        mock_db_read_many.assert_called_once_with([1])
 
     @patch("app.models.assignment.db")  # Mock the db instance
     @patch("app.services.assignment.assignment_dict_to_row")
@@ -249,9 +245,8 @@ class TestAssignmentUpdateService:
         self,
         mock_dict_to_row,
         mock_db_instance,
-        mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         assignment_missing_id,
     ):
         results, error, status_code = update_assignments(assignment_missing_id)
@@ -259,7 +254,7 @@ class TestAssignmentUpdateService:
         assert results == []
         assert error == [{"message": "Missing assignment ID for update."}]
         assert status_code == 400
-        mock_db_update.assert_not_called()
+        mock_db_update_many.assert_not_called()
         mock_db_read_many.assert_not_called()
 
 
@@ -268,14 +263,12 @@ class TestAssignmentArchiveService:
     def test_archive_assignments(
         self,
         mock_db_instance,
-        mock_db_archive,
-        mock_db_read_one,
+        mock_db_archive_many,
         mock_db_read_many,
         valid_assignment_ids,
         valid_assignment_row,
     ):
-        mock_db_archive.side_effect = [1, 1]
-        mock_db_read_one.return_value = valid_assignment_row  # Mock get_existing_func
+        mock_db_archive_many.return_value = [1, 2]
         mock_db_read_many.return_value = [
             valid_assignment_row,
             valid_assignment_row,
@@ -283,20 +276,18 @@ class TestAssignmentArchiveService:
         archived = archive_assignments(valid_assignment_ids)
 
         assert len(archived[0]) == 2
-        assert mock_db_archive.call_count == 2
+        mock_db_archive_many.assert_called_once_with([1, 2])
 
     @patch("app.models.assignment.db")  # Mock the db instance
     def test_archive_assignments_none_archived(
         self,
         mock_db_instance,
-        mock_db_archive,
-        mock_db_read_one,
+        mock_db_archive_many,
         mock_db_read_many,
         valid_assignment_ids,
         valid_assignment_row,
     ):
-        mock_db_archive.return_value = 0
-        mock_db_read_one.return_value = valid_assignment_row  # Mock get_existing_func
+        mock_db_archive_many.return_value = []
         archived = archive_assignments(valid_assignment_ids)
 
         assert archived[0] == []
@@ -335,7 +326,7 @@ class TestAssignmentModel:
         result = assignment_db_read_by_id(1)
         assert result == {"id": 1, "instructor_id": 1}
         mock_execute.assert_called_once_with(
-            "SELECT * FROM assignments WHERE id = ?;", (1,)
+            "SELECT * FROM assignments WHERE id = %s;", (1,)
         )
 
     @patch("app.models.assignment.db.execute_query")
@@ -360,8 +351,8 @@ class TestAssignmentModel:
         mock_execute.assert_called_once()
 
         query_call = mock_execute.call_args.args[0]
-        assert "IN (?,?)" in query_call
-        assert mock_execute.call_args.args[1] == [1, 2]
+        assert "= ANY(%s)" in query_call
+        assert mock_execute.call_args.args[1] == ([1, 2],)
 
     @patch("app.models.assignment.db.execute_query")
     def test_assignment_db_insert_success(self, mock_execute, valid_assignment_row):
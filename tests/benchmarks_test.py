@@ -0,0 +1,257 @@
+import json
+import os
+import random
+import threading
+import pytest
+from werkzeug.serving import make_server
+from app import create_app
+from app.models import student_db_read_all
+from app.utils import body_shape
+from benchmarks.fake_db import FakeDatabase, install
+from benchmarks.load import (
+    Endpoint,
+    Recorder,
+    compare as compare_load,
+    load_mix,
+    percentile,
+    render,
+    run_load_test,
+)
+from benchmarks.replay import diff_results, load_capture, replay, synthesize
+from benchmarks.run import COUNTS, compare, counts_only, run_benchmarks, scenarios
+
+BASELINE = os.path.join(os.path.dirname(__file__), "..", "benchmarks", "baseline.json")
+
+
+class TestFakeDatabase:
+    def test_install_and_restore(self):
+        fake = FakeDatabase()
+        fake.seed("students", [{"id": 1, "status": "active"}])
+        restore = install(fake)
+        try:
+            rows = student_db_read_all(active_only=True)
+        finally:
+            restore()
+
+        assert rows == [{"id": 1, "status": "active", "is_archived": False}]
+        assert fake.queries == {"students_read_all_active": 1}
+
+
+class TestBenchmarks:
+    def test_run_benchmarks(self):
+        results = run_benchmarks(["update_enrollments"], [10], repeat=1)
+
+        result = results["update_enrollments[10]"]
+        assert result["queries"] > 0
+        assert result["queries_per_item"] == result["queries"] / 10
+        assert result["wall_ms"] > 0
+
+    def test_compare_flags_query_regressions(self):
+        base = {"x[10]": {"queries_per_item": 1.0, "wall_ms": 10, "alloc_peak_kb": 5}}
+        same = {"x[10]": {"queries_per_item": 1.0, "wall_ms": 11, "alloc_peak_kb": 5}}
+        worse = {"x[10]": {"queries_per_item": 2.0, "wall_ms": 30, "alloc_peak_kb": 5}}
+
+        assert compare(same, base, tolerance=0.25) == []
+        regressions = compare(worse, base, tolerance=0.25)
+        assert len(regressions) == 2
+        assert "queries/item" in regressions[0]
+
+    def test_compare_without_timings_checks_counts_only(self):
+        base = {"x[10]": {"queries": 2, "queries_per_item": 0.2}}
+        slower = {"x[10]": {"queries": 2, "queries_per_item": 0.2, "wall_ms": 900}}
+        worse = {"x[10]": {"queries": 20, "queries_per_item": 2.0, "wall_ms": 1}}
+
+        assert compare(slower, base, tolerance=0.25) == []
+        assert len(compare(worse, base, tolerance=0.25)) == 1
+
+    def test_committed_baseline_holds_counts_only(self):
+        with open(BASELINE) as f:
+            baseline = json.load(f)
+        assert {field for result in baseline.values() for field in result} == set(
+            COUNTS
+        )
+        results = run_benchmarks(list(scenarios()), [1, 100], repeat=1)
+        assert results.keys() <= baseline.keys()
+        assert compare(results, baseline, tolerance=0.25) == []
+        assert counts_only(results) == {key: baseline[key] for key in results}
+
+
+@pytest.fixture
+def live_server():
+    app = create_app()
+    # Requests are served one at a time: conftest hands every connection the
+    # same mock cursor, which is not safe to use from several threads at once
+    server = make_server("127.0.0.1", 0, app)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+class TestLoadTool:
+    def test_percentile(self):
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 99) == 99
+        assert percentile([7], 95) == 7
+        assert percentile([], 95) == 0.0
+
+    def test_render(self):
+        rng = random.Random(1)
+        body = render(
+            {
+                "$repeat": 3,
+                "item": {"id": "{randint:5:5}", "email": "u{seq}@x.com"},
+            },
+            {"seq": 7},
+            rng,
+        )
+        assert body == [{"id": 5, "email": "u7@x.com"}] * 3
+        assert render("/students/{randint:2:2}", {}, rng) == "/students/2"
+
+    def test_default_mix_creates_distinct_rows(self):
+        [bulk] = [e for e in load_mix() if e.name == "POST /students (bulk 20)"]
+        rng = random.Random(1)
+        emails = [
+            item["email"]
+            for seq in range(3)
+            for item in render(bulk.body, {"run": 1, "seq": seq}, rng)
+        ]
+        assert len(set(emails)) == len(emails) == 60
+        assert not any(
+            e.path == "/enrollments" and e.method == "POST" for e in load_mix()
+        )
+
+    def test_recorder_counts_unexpected_statuses_as_errors(self):
+        endpoint = Endpoint("PATCH /courses", "PATCH", "/courses", expect=[200, 422])
+        recorder = Recorder()
+        recorder.record(endpoint, 0.010, 200)
+        recorder.record(endpoint, 0.020, 422)
+        recorder.record(endpoint, 0.030, 500)
+        recorder.record(endpoint, 0.040, error=ConnectionResetError())
+
+        stats = recorder.summary(elapsed=2.0)["endpoints"]["PATCH /courses"]
+        assert stats["requests"] == 4
+        assert stats["errors"] == 2
+        assert stats["error_rate"] == 0.5
+        assert stats["rps"] == 2.0
+        assert stats["p50_ms"] == 20.0
+        assert stats["statuses"] == {
+            "200": 1,
+            "422": 1,
+            "500": 1,
+            "ConnectionResetError": 1,
+        }
+
+    @pytest.mark.parametrize("rps", [None, 50])
+    def test_run_against_live_server(self, live_server, rps):
+        endpoints = [
+            Endpoint("GET /", "GET", "/", weight=1),
+            Endpoint("GET /students", "GET", "/students", weight=1),
+        ]
+        summary = run_load_test(
+            live_server, endpoints, duration=0.3, concurrency=2, rps=rps, seed=1
+        )
+
+        assert summary["total"]["requests"] > 0
+        assert summary["total"]["errors"] == 0
+        for stats in summary["endpoints"].values():
+            assert stats["statuses"] == {"200": stats["requests"]}
+            assert 0 < stats["p50_ms"] <= stats["p99_ms"] <= stats["max_ms"]
+
+    def test_connection_errors_are_recorded(self):
+        endpoints = [Endpoint("GET /", "GET", "/")]
+        # Nothing listens on port 9 (discard) in the test environment
+        summary = run_load_test(
+            "http://127.0.0.1:9", endpoints, duration=0.05, concurrency=1
+        )
+        assert summary["total"]["errors"] == summary["total"]["requests"] > 0
+        assert set(summary["endpoints"]["GET /"]["statuses"]) == {"ConnectError"}
+
+    def test_compare_load_results(self):
+        base = {"endpoints": {"GET /": _load_stats(p95=10, p99=20, rps=100)}}
+        same = {"endpoints": {"GET /": _load_stats(p95=11, p99=21, rps=95)}}
+        worse = {"endpoints": {"GET /": _load_stats(p95=30, p99=20, rps=50)}}
+
+        assert compare_load(same, base, tolerance=0.25) == []
+        regressions = compare_load(worse, base, tolerance=0.25)
+        assert len(regressions) == 2
+        assert "p95_ms" in regressions[0]
+
+
+class TestReplayTool:
+    def test_synthesize(self):
+        shape = {
+            "$list": 2,
+            "item": {"email": "str", "name": "str", "start": "date", "program_id": 3},
+        }
+        body = synthesize(shape, {"run": 1, "seq": 0})
+        assert body == [
+            {
+                "email": "replay.1.1@example.com",
+                "name": "replay-2",
+                "start": "2025-01-01",
+                "program_id": 3,
+            },
+            {
+                "email": "replay.1.3@example.com",
+                "name": "replay-4",
+                "start": "2025-01-01",
+                "program_id": 3,
+            },
+        ]
+        assert synthesize({"ids": [1, 2]}, {"run": 1, "seq": 0}) == {"ids": [1, 2]}
+
+    def test_replayed_bulk_bodies_touch_the_captured_rows(self):
+        update = [{"id": 1, "city": "Oslo"}, {"id": 2, "city": "Rome"}, {"id": 3}]
+        body = synthesize(body_shape(update), {"run": 1, "seq": 0})
+        assert [item["id"] for item in body] == [1, 2, 3]
+        assert synthesize(body_shape([4, 5, 6]), {"run": 1, "seq": 0}) == [4, 5, 6]
+
+    def test_load_capture_orders_by_timestamp(self, tmp_path):
+        path = tmp_path / "capture.jsonl"
+        path.write_text('{"ts": 2}\n\n{"ts": 1}\n{"ts": 3}\n')
+        assert [r["ts"] for r in load_capture(path)] == [1, 2, 3]
+        assert [r["ts"] for r in load_capture(path, limit=1)] == [1]
+
+    @pytest.mark.parametrize("speed", [0, 20])
+    def test_replay_against_live_server(self, live_server, speed):
+        records = [
+            _capture("GET", "/", ts=0.0),
+            _capture("GET", "/students", ts=0.05, query={"active_only": ["true"]}),
+            _capture("GET", "/", ts=0.1),
+        ]
+        summary = replay(live_server, records, speed=speed, concurrency=2)
+
+        assert summary["total"]["requests"] == 3
+        assert summary["total"]["errors"] == 0
+        assert set(summary["endpoints"]) == {"GET /", "GET /students"}
+
+    def test_unexpected_status_is_an_error(self, live_server):
+        # No student rows exist behind the mocked pool, so this returns 404
+        records = [_capture("GET", "/students/1", route="/students/<int:student_id>")]
+        summary = replay(live_server, records, speed=0)
+        assert summary["total"]["errors"] == 1
+
+    def test_diff_results(self):
+        a = {"endpoints": {"GET /": _load_stats(p95=10, p99=20, rps=1) | {"p50_ms": 5}}}
+        b = {"endpoints": {"GET /": _load_stats(p95=15, p99=20, rps=1) | {"p50_ms": 5}}}
+        rows = diff_results(a, b)
+        assert ("GET /", "p95_ms", 10, 15, 50.0) in rows
+        assert ("GET /", "p99_ms", 20, 20, 0.0) in rows
+
+
+def _capture(method, path, ts=0.0, status=200, query=None, route=None):
+    return {
+        "ts": ts,
+        "method": method,
+        "path": path,
+        "route": route or path,
+        "query": query or {},
+        "body_shape": None,
+        "status": status,
+    }
+
+
+def _load_stats(p95, p99, rps, error_rate=0.0):
+    return {"p95_ms": p95, "p99_ms": p99, "rps": rps, "error_rate": error_rate}
@@ -0,0 +1,135 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import DEFAULT, patch
+from urllib.parse import urlparse
+import psycopg2.pool
+import pytest
+from db.database import Database
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Seconds, measured in a fresh interpreter; generous next to the ~0.2 s the
+# import and app factory take, so only a real regression (such as connecting
+# at import time) fails them
+IMPORT_BUDGET = 2.0
+FIRST_REQUEST_BUDGET = 0.5
+FIRST_QUERY_BUDGET = 1.0
+
+COLD_START = """
+import json, time
+started = time.perf_counter()
+from app import create_app
+app = create_app()
+imported = time.perf_counter()
+response = app.test_client().get("/")
+served = time.perf_counter()
+from db.database import Database
+result = {
+    "import": imported - started,
+    "first_request": served - imported,
+    "status": response.status_code,
+    "pool_open": Database._pool is not None,
+}
+if QUERY:
+    Database().execute_query("SELECT 1")
+    result["first_query"] = time.perf_counter() - served
+print(json.dumps(result))
+"""
+
+
+def cold_start(tmp_path, env, query=False):
+    """Import the app in a new interpreter (outside the repo, so no .env) and time it."""
+    base = {
+        key: value
+        for key, value in os.environ.items()
+        if not key.startswith(("LOCAL_DB_", "AZURE_PG_"))
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", f"QUERY = {query}\n{COLD_START}"],
+        cwd=tmp_path,
+        env={**base, "PYTHONPATH": str(ROOT), "FLASK_ENV": "development", **env},
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+class TestColdStart:
+    def test_starts_without_database(self, tmp_path):
+        # Nothing listens on port 1: any connection attempt would fail
+        timings = cold_start(
+            tmp_path,
+            {
+                "LOCAL_DB_HOST": "127.0.0.1",
+                "LOCAL_DB_PORT": "1",
+                "LOCAL_DB_NAME": "school",
+                "LOCAL_DB_USER": "postgres",
+                "LOCAL_DB_PASSWORD": "postgres",
+            },
+        )
+
+        assert timings["status"] == 200
+        assert timings["pool_open"] is False
+        assert timings["import"] < IMPORT_BUDGET
+        assert timings["first_request"] < FIRST_REQUEST_BUDGET
+
+    def test_starts_without_settings(self, tmp_path):
+        timings = cold_start(tmp_path, {})
+        assert timings["status"] == 200
+
+    def test_first_query_opens_pool(self, tmp_path):
+        url = os.getenv("TEST_DATABASE_URL")
+        if not url:
+            pytest.skip("TEST_DATABASE_URL is not set")
+        parts = urlparse(url)
+        timings = cold_start(
+            tmp_path,
+            {
+                "LOCAL_DB_HOST": parts.hostname,
+                "LOCAL_DB_PORT": str(parts.port or 5432),
+                "LOCAL_DB_NAME": parts.path.lstrip("/"),
+                "LOCAL_DB_USER": parts.username,
+                # Required to be set, even where the server trusts the user
+                "LOCAL_DB_PASSWORD": parts.password or "unused",
+            },
+            query=True,
+        )
+
+        assert timings["pool_open"] is False
+        assert timings["first_query"] < FIRST_QUERY_BUDGET
+
+
+class TestLazyPool:
+    def test_constructing_does_not_connect(self):
+        with patch.object(Database, "_pool", None):
+            Database()
+            assert Database._pool is None
+
+    def test_first_query_opens_pool(self):
+        with patch.object(Database, "_pool", None):
+            Database().execute_query("SELECT 1")
+            assert Database._pool is psycopg2.pool.ThreadedConnectionPool.return_value
+
+    def test_prewarm_opens_pool(self):
+        with patch.object(Database, "_pool", None):
+            Database.prewarm().join(timeout=5)
+            assert Database._pool is psycopg2.pool.ThreadedConnectionPool.return_value
+
+    def test_prewarm_failure_is_retried_by_first_query(self):
+        with (
+            patch.object(Database, "_pool", None),
+            patch(
+                "psycopg2.pool.ThreadedConnectionPool",
+                side_effect=[psycopg2.OperationalError("down"), DEFAULT],
+            ) as connect,
+        ):
+            Database.prewarm().join(timeout=5)
+            assert Database._pool is None
+
+            Database().execute_query("SELECT 1")
+            assert Database._pool is connect.return_value
@@ -11,7 +11,7 @@ os.environ["LOCAL_DB_USER"] = "postgres"
 os.environ["LOCAL_DB_PASSWORD"] = "postgres"
 
 # Create a global patcher that starts before imports
-mock_pool_patcher = patch("psycopg2.pool.SimpleConnectionPool")
+mock_pool_patcher = patch("psycopg2.pool.ThreadedConnectionPool")
 mock_pool = mock_pool_patcher.start()
 
 # Create a mock pool instance
@@ -19,7 +19,7 @@ mock_pool_instance = MagicMock()
 mock_pool.return_value = mock_pool_instance
 
 # Mock the connection and cursor
-mock_conn = MagicMock()
+mock_conn = MagicMock(closed=0)
 mock_cursor = MagicMock()
 mock_cursor.fetchall.return_value = []
 mock_cursor.fetchone.return_value = None
@@ -31,6 +31,7 @@ mock_pool_instance.putconn.return_value = None
 
 # Now it's safe to import the app
 from app import create_app
+from tests.explain import EXPLAIN_SCALE, seeded_database
 
 
 @pytest.fixture
@@ -40,6 +41,13 @@ def client():
         yield client
 
 
+@pytest.fixture(scope="session")
+def pg():
+    """Connection to a PostgreSQL schema seeded with the synthetic dataset."""
+    with seeded_database(EXPLAIN_SCALE) as conn:
+        yield conn
+
+
 # Clean up the patcher when tests are done
 def pytest_unconfigure(config):
     mock_pool_patcher.stop()
@@ -1,6 +1,6 @@
 import pytest
 from datetime import date
-from unittest.mock import patch
+from unittest.mock import call, patch
 from app.models import (
     course_schedule_db_read_all,
     course_schedule_db_read_by_id,
@@ -112,20 +112,20 @@ def mock_db_read_many():
 
 
 @pytest.fixture
-def mock_db_create():
-    with patch("app.services.course_schedule.course_schedule_db_insert") as mock:
+def mock_db_create_many():
+    with patch("app.services.course_schedule.course_schedule_db_insert_many") as mock:
         yield mock
 
 
 @pytest.fixture
-def mock_db_update():
-    with patch("app.services.course_schedule.course_schedule_db_update") as mock:
+def mock_db_update_many():
+    with patch("app.services.course_schedule.course_schedule_db_update_many") as mock:
         yield mock
 
 
 @pytest.fixture
-def mock_db_archive():
-    with patch("app.services.course_schedule.course_schedule_db_archive") as mock:
+def mock_db_archive_many():
+    with patch("app.services.course_schedule.course_schedule_db_archive_many") as mock:
         yield mock
 
 
@@ -168,12 +168,12 @@ class TestCourseScheduleReadService:
 class TestCourseScheduleCreateService:
     def test_create_new_course_schedules(
         self,
-        mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_course_schedule_create_data,
         valid_course_schedule_rows,
     ):
-        mock_db_create.side_effect = [1, 2]
+        mock_db_create_many.return_value = [1, 2]
         mock_db_read_many.return_value = valid_course_schedule_rows
 
         results, error, status_code = create_new_course_schedules(
@@ -183,13 +183,13 @@ class TestCourseScheduleCreateService:
         assert len(results) == 2
         assert error is None
         assert status_code == 201
-        assert mock_db_create.call_count == 2
+        mock_db_create_many.assert_called_once()
         mock_db_read_many.assert_called_once_with([1, 2])
 
     def test_create_new_course_schedules_failure(
-        self, mock_db_create, mock_db_read_many, valid_course_schedule_create_data
+        self, mock_db_create_many, mock_db_read_many, valid_course_schedule_create_data
     ):
-        mock_db_create.side_effect = [None, None]
+        mock_db_create_many.return_value = []
         results, error, status_code = create_new_course_schedules(
             valid_course_schedule_create_data
         )
@@ -207,19 +207,15 @@ class TestCourseScheduleUpdateService:
         self,
         mock_dict_to_row,
         mock_db_instance,
-        mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_course_schedule_update_data,
         valid_course_schedule_row,
     ):
         # This test is fully mocked and does not require a real DB connection
-        mock_db_update.return_value = 1
+        mock_db_update_many.return_value = [1]
         mock_db_read_many.return_value = [valid_course_schedule_row]
 
-        # All data is now dict format for PostgreSQL
-        mock_db_read_one.return_value = valid_course_schedule_row
-
         mock_dict_to_row.return_value = (
             1,
             "Monday",
@@ -234,8 +230,8 @@ class TestCourseScheduleUpdateService:
         assert len(results) == 1
         assert error in (None, [])
         assert status_code == 200
-        assert mock_db_update.call_count == 1
-        mock_db_read_many.assert_called_once_with([1])
+        mock_db_update_many.assert_called_once()
+        assert mock_db_read_many.call_args_list == [call([1]), call([1])]
 
     @patch("app.models.course_schedule.db")  # Mock the db instance
     @patch("app.services.course_schedule.course_schedule_dict_to_row")
@@ -243,16 +239,15 @@ class TestCourseScheduleUpdateService:
         self,
         mock_dict_to_row,
         mock_db_instance,
-        mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_course_schedule_update_data,
         valid_course_schedule_row,
     ):
-        mock_db_update.return_value = 0  # Simulate no update
+        mock_db_update_many.return_value = []  # Simulate no update
 
         # All data is now dict format for PostgreSQL
-        mock_db_read_one.return_value = valid_course_schedule_row
+        mock_db_read_many.return_value = [valid_course_schedule_row]
 
         mock_dict_to_row.return_value = (
             1,
@@ -268,8 +263,8 @@ class TestCourseScheduleUpdateService:
         assert results == []
         assert error == [{"message": "Course schedule ID 1 not updated."}]
         assert status_code == 400
-        assert mock_db_update.call_count == 1
-        mock_db_read_many.assert_not_called()
+        mock_db_update_many.assert_called_once()
+        mock_db_read_many.assert_called_once_with([1])
 
     @patch("app.models.course_schedule.db")  # Mock the db instance
     @patch("app.services.course_schedule.course_schedule_dict_to_row")
@@ -277,9 +272,8 @@ class TestCourseScheduleUpdateService:
         self,
         mock_dict_to_row,
         mock_db_instance,
-        mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         course_schedule_missing_id,
     ):
         results, error, status_code = update_course_schedules(
@@ -289,7 +283,7 @@ class TestCourseScheduleUpdateService:
         assert results == []
         assert error == [{"message": "Missing course schedule ID for update."}]
         assert status_code == 400
-        mock_db_update.assert_not_called()
+        mock_db_update_many.assert_not_called()
         mock_db_read_many.assert_not_called()
 
 
@@ -298,16 +292,12 @@ class TestCourseScheduleArchiveService:
     def test_archive_course_schedules(
         self,
         mock_db_instance,
-        mock_db_archive,
-        mock_db_read_one,
+        mock_db_archive_many,
         mock_db_read_many,
         valid_course_schedule_ids,
         valid_course_schedule_row,
     ):
-        mock_db_archive.side_effect = [1, 1]
-        mock_db_read_one.return_value = (
-            valid_course_schedule_row  # Mock get_existing_func
-        )
+        mock_db_archive_many.return_value = [1, 2]
         mock_db_read_many.return_value = [
             valid_course_schedule_row,
             valid_course_schedule_row,
@@ -315,22 +305,18 @@ class TestCourseScheduleArchiveService:
         archived = archive_course_schedules(valid_course_schedule_ids)
 
         assert len(archived[0]) == 2
-        assert mock_db_archive.call_count == 2
+        mock_db_archive_many.assert_called_once_with([1, 2])
 
     @patch("app.models.course_schedule.db")  # Mock the db instance
     def test_archive_course_schedules_none_archived(
         self,
         mock_db_instance,
-        mock_db_archive,
-        mock_db_read_one,
+        mock_db_archive_many,
         mock_db_read_many,
         valid_course_schedule_ids,
         valid_course_schedule_row,
     ):
-        mock_db_archive.return_value = 0
-        mock_db_read_one.return_value = (
-            valid_course_schedule_row  # Mock get_existing_func
-        )
+        mock_db_archive_many.return_value = []
         archived = archive_course_schedules(valid_course_schedule_ids)
 
         assert archived[0] == []
@@ -396,8 +382,8 @@ class TestCourseScheduleModel:
         mock_execute.assert_called_once()
         # The model uses PostgreSQL syntax (%s)
         query_call = mock_execute.call_args.args[0]
-        assert "IN (%s,%s)" in query_call
-        assert mock_execute.call_args.args[1] == [1, 2]
+        assert "= ANY(%s)" in query_call
+        assert mock_execute.call_args.args[1] == ([1, 2],)
 
     @patch("app.models.course_schedule.db.execute_query")
     def test_course_schedule_db_insert_success(
@@ -1,6 +1,6 @@
 import pytest
 from datetime import date
-from unittest.mock import patch
+from unittest.mock import call, patch
 from app.models import (
     course_db_read_all,
     course_db_read_by_id,
@@ -112,20 +112,20 @@ def mock_db_read_many():
 
 
 @pytest.fixture
-def mock_db_create():
-    with patch("app.services.course.course_db_insert") as mock:
+def mock_db_create_many():
+    with patch("app.services.course.course_db_insert_many") as mock:
         yield mock
 
 
 @pytest.fixture
-def mock_db_update():
-    with patch("app.services.course.course_db_update") as mock:
+def mock_db_update_many():
+    with patch("app.services.course.course_db_update_many") as mock:
         yield mock
 
 
 @pytest.fixture
-def mock_db_archive():
-    with patch("app.services.course.course_db_archive") as mock:
+def mock_db_archive_many():
+    with patch("app.services.course.course_db_archive_many") as mock:
         yield mock
 
 
@@ -166,7 +166,7 @@ class TestCourseCreateService:
         self,
         mock_course_dict_to_row,
         mock_db_instance,
-        mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_course_create_data,
         valid_course_rows,
@@ -174,7 +174,7 @@ class TestCourseCreateService:
         # Mock the course_dict_to_row function
         mock_course_dict_to_row.return_value = ("title", "code", 1, 1)
 
-        mock_db_create.side_effect = [1, 2]
+        mock_db_create_many.return_value = [1, 2]
         mock_db_read_many.return_value = valid_course_rows
 
         results, error, status_code = create_new_courses(valid_course_create_data)
@@ -182,21 +182,21 @@ class TestCourseCreateService:
         assert len(results) == 2
         assert error is None
         assert status_code == 201
-        assert mock_db_create.call_count == 2
+        mock_db_create_many.assert_called_once()
         mock_db_read_many.assert_called_once_with([1, 2])
 
     def test_create_new_courses_failure(
         self,
         mock_course_dict_to_row,
         mock_db_instance,
-        mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_course_create_data,
     ):
         # Mock the course_dict_to_row function
         mock_course_dict_to_row.return_value = ("title", "code", 1, 1)
 
-        mock_db_create.side_effect = [None, None]
+        mock_db_create_many.return_value = []
         results, error, status_code = create_new_courses(valid_course_create_data)
 
         assert results == []
@@ -212,59 +212,55 @@ class TestCourseUpdateService:
         self,
         mock_course_dict_to_row,
         mock_db_instance,
-        mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_course_update_data,
         valid_course_row,
     ):
         # Mock the course_dict_to_row function
         mock_course_dict_to_row.return_value = ("title", "code", 1, 1)
 
-        mock_db_read_one.return_value = valid_course_row
-
-        mock_db_update.return_value = 1
         mock_db_read_many.return_value = [valid_course_row]
 
+        mock_db_update_many.return_value = [1]
+
         results, error, status_code = update_courses(valid_course_update_data)
 
         assert len(results) == 1
         assert error in (None, [])
         assert status_code == 200
-        assert mock_db_update.call_count == 1
-        mock_db_read_many.assert_called_once_with([1])
+        mock_db_update_many.assert_called_once()
+        assert mock_db_read_many.call_args_list == [call([1]), call([1])]
 
     def test_update_courses_no_success(
         self,
         mock_course_dict_to_row,
         mock_db_instance,
-        mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_course_update_data,
         valid_course_row,
     ):
         # Mock the course_dict_to_row function
         mock_course_dict_to_row.return_value = ("title", "code", 1, 1)
 
-        mock_db_read_one.return_value = valid_course_row
+        mock_db_read_many.return_value = [valid_course_row]
 
-        mock_db_update.return_value = 0
+        mock_db_update_many.return_value = []
         results, error, status_code = update_courses(valid_course_update_data)
 
         assert results == []
         assert error == [{"message": "Course ID 1 not updated."}]
         assert status_code == 400
-        mock_db_update.assert_called_once()
-        mock_db_read_many.assert_not_called()
+        mock_db_update_many.assert_called_once()
+        mock_db_read_many.assert_called_once_with([1])
 
     def test_update_courses_missing_id(
         self,
         mock_course_dict_to_row,
         mock_db_instance,
-        mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         course_missing_id,
     ):
         results, error, status_code = update_courses(course_missing_id)
@@ -272,7 +268,7 @@ class TestCourseUpdateService:
         assert results == []
         assert error == [{"message": "Missing course ID for update."}]
         assert status_code == 400
-        mock_db_update.assert_not_called()
+        mock_db_update_many.assert_not_called()
         mock_db_read_many.assert_not_called()
 
 
@@ -281,42 +277,40 @@ class TestCourseArchiveService:
     def test_archive_courses(
         self,
         mock_db_instance,
-        mock_db_archive,
-        mock_db_read_one,
+        mock_db_archive_many,
         mock_db_read_many,
         valid_course_ids,
         valid_course_row,
     ):
-        # Mock that courses exist
-        mock_db_read_one.return_value = valid_course_row  # Mock get_existing_func
         mock_db_read_many.return_value = [
             valid_course_row,
             valid_course_row,
         ]  # Mock read_by_ids_func
-        mock_db_archive.side_effect = [1, 1]
+        mock_db_archive_many.return_value = [1, 2]
         archived = archive_courses(valid_course_ids)
 
         assert len(archived[0]) == 2
-        assert mock_db_archive.call_count == 2
+        mock_db_archive_many.assert_called_once_with([1, 2])
 
     def test_archive_courses_none_archived(
         self,
         mock_db_instance,
-        mock_db_archive,
-        mock_db_read_one,
+        mock_db_archive_many,
         mock_db_read_many,
         valid_course_ids,
         valid_course_row,
     ):
-        # Mock that courses exist
-        mock_db_read_one.return_value = valid_course_row  # Mock get_existing_func
-        mock_db_archive.return_value = 0
+        mock_db_archive_many.return_value = []
         archived = archive_courses(valid_course_ids)
 
         assert archived[0] == []
 
     def test_archive_courses_invalid_ids(
-        self, mock_db_instance, mock_db_archive, mock_db_read_one, mock_db_read_many
+        self,
+        mock_db_instance,
+        mock_db_archive_many,
+        mock_db_read_one,
+        mock_db_read_many,
     ):
         results, errors, status = archive_courses(["one", 2])
         assert status == 400
@@ -373,8 +367,8 @@ class TestCourseModel:
 
         assert result == [{"id": 1}, {"id": 2}]
         mock_execute.assert_called_once()
-        assert "IN (%s,%s)" in mock_execute.call_args.args[0]
-        assert mock_execute.call_args.args[1] == [1, 2]
+        assert "= ANY(%s)" in mock_execute.call_args.args[0]
+        assert mock_execute.call_args.args[1] == ([1, 2],)
 
     @patch("app.models.course.db.execute_query")
     def test_course_db_insert_success(self, mock_execute, valid_course_row):
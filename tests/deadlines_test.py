@@ -0,0 +1,366 @@
+import asyncio
+import os
+import time
+from unittest.mock import patch
+import psycopg
+import psycopg2
+import pytest
+import httpx
+from flask import Flask
+from psycopg2.pool import PoolError
+from app.aio import create_asgi_app
+from app.aio.disconnect import CancelOnDisconnect
+from app.utils import handle_exceptions_read, handle_exceptions_write, query_deadline
+from db import deadlines
+from benchmarks.fake_db import FakeDatabase
+from db.async_database import AsyncDatabase
+from db.database import Database
+from db.deadlines import SET_STATEMENT_TIMEOUT, QueryTimeout
+from db.statements import FETCH_ALL, Statement
+from tests.fake_pool import ConnectingPool, ListPool, connection, installed
+from tests.query_budget import QueryCounter
+
+READ = Statement("deadlines_read", "SELECT id FROM things WHERE id = %s;", FETCH_ALL)
+SLEEP = "SELECT pg_sleep(%s);"
+
+
+@pytest.fixture
+def deadline():
+    """Run the test inside a deadline; call it with the seconds."""
+    tokens = []
+    yield lambda seconds: tokens.append(deadlines.begin(seconds))
+    for token in reversed(tokens):
+        deadlines.end(token)
+
+
+def executed(conn):
+    return [call.args for call in conn.cursor.return_value.execute.mock_calls]
+
+
+class TestLocalTimeout:
+    def test_connection_default_outside_deadline(self):
+        assert deadlines.local_timeout_ms() is None
+
+    def test_remaining_budget_inside_deadline(self, deadline):
+        deadline(30)
+        assert 29_000 < deadlines.local_timeout_ms() <= 30_000
+
+    def test_passed_deadline(self, deadline):
+        deadline(-1)
+        with pytest.raises(QueryTimeout):
+            deadlines.local_timeout_ms()
+
+
+class TestDatabase:
+    def test_pool_connections_get_default_timeout(self, monkeypatch):
+        monkeypatch.setenv("DB_STATEMENT_TIMEOUT_MS", "2500")
+        with (
+            patch.object(Database, "_pool", None),
+            patch("psycopg2.pool.ThreadedConnectionPool") as connect,
+        ):
+            Database.open_pool()
+        assert connect.call_args.kwargs["options"] == "-c statement_timeout=2500"
+
+    def test_no_timeout_option_when_disabled(self, monkeypatch):
+        monkeypatch.setenv("DB_STATEMENT_TIMEOUT_MS", "0")
+        with (
+            patch.object(Database, "_pool", None),
+            patch("psycopg2.pool.ThreadedConnectionPool") as connect,
+        ):
+            Database.open_pool()
+        assert "options" not in connect.call_args.kwargs
+
+    def test_no_extra_statement_outside_deadline(self):
+        conn = connection(rows=[(1,)])
+        with installed(ListPool(conn)):
+            Database().execute_query(READ, (1,))
+        assert SET_STATEMENT_TIMEOUT not in [args[0] for args in executed(conn)]
+
+    def test_deadline_sets_statement_timeout(self, deadline):
+        conn = connection(rows=[(1,)])
+        deadline(30)
+        with installed(ListPool(conn)):
+            Database().execute_query(READ, (1,))
+
+        [(sql, (timeout,)), *_] = executed(conn)
+        assert sql == SET_STATEMENT_TIMEOUT
+        assert 29_000 < int(timeout) <= 30_000
+
+    def test_passed_deadline_does_not_connect(self, deadline):
+        deadline(-1)
+        pool = ListPool()
+        with installed(pool), pytest.raises(QueryTimeout):
+            Database().execute_query(READ, (1,))
+        assert pool.returned == []
+
+    def test_canceled_statement_raises_query_timeout(self):
+        canceled = psycopg2.extensions.QueryCanceledError(
+            "canceling statement due to statement timeout"
+        )
+        pool = ListPool(connection(error=canceled))
+        with installed(pool), pytest.raises(QueryTimeout, match="statement timeout"):
+            Database().execute_query(READ, (1,))
+        assert len(pool.idle) == 1
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    budgets = []
+
+    @app.route("/export")
+    @handle_exceptions_read()
+    @query_deadline(60)
+    def export():
+        budgets.append(deadlines.remaining())
+        return Database().execute_query(READ, (1,))
+
+    @app.route("/things", methods=["POST"])
+    @handle_exceptions_write()
+    def create():
+        return Database().execute_query(READ, (1,))
+
+    def execute_query(self, query, params=()):
+        raise QueryTimeout("Query timed out: canceling statement")
+
+    with patch.object(Database, "execute_query", execute_query):
+        yield app.test_client(), budgets
+
+
+class TestRoutes:
+    def test_timeout_is_a_504(self, app):
+        client, budgets = app
+        response = client.get("/export")
+
+        assert response.status_code == 504
+        assert "too long" in response.get_json()["error"]
+        assert 59 < budgets[0] <= 60
+        assert deadlines.remaining() is None
+
+    def test_write_timeout_is_a_504(self, app):
+        client, _ = app
+        assert client.post("/things").status_code == 504
+
+
+STUDENT = {"first_name": "Ada", "last_name": "Lovelace", "email": "ada@example.com"}
+
+# (method, body, {statement: error}, statements the request may run)
+BULK_TIMEOUTS = {
+    "create": (
+        "POST",
+        [STUDENT, {**STUDENT, "email": "ada2@example.com"}],
+        {"students_insert_many": QueryTimeout("Query timed out")},
+        ["students_insert_many"],
+    ),
+    "create row by row": (
+        "POST",
+        [STUDENT, {**STUDENT, "email": "ada2@example.com"}],
+        {
+            "students_insert_many": ValueError("Integrity error: duplicate"),
+            "students_insert": QueryTimeout("Query timed out"),
+        },
+        ["students_insert_many", "students_insert"],
+    ),
+    "update": (
+        "PUT",
+        [{"id": 1, "city": "London"}, {"id": 2, "city": "Paris"}],
+        {"students_update_many": QueryTimeout("Query timed out")},
+        ["students_read_by_ids", "students_update_many"],
+    ),
+    "update row by row": (
+        "PUT",
+        [{"id": 1, "city": "London"}, {"id": 2, "city": "Paris"}],
+        {
+            "students_update_many": ValueError("Integrity error: fk"),
+            "students_update": QueryTimeout("Query timed out"),
+        },
+        ["students_read_by_ids", "students_update_many", "students_update"],
+    ),
+    "archive": (
+        "PATCH",
+        {"ids": [1, 2]},
+        {"students_archive_many": QueryTimeout("Query timed out")},
+        ["students_archive_many"],
+    ),
+}
+
+
+class FailingDatabase:
+    """FakeDatabase with two students, failing the statements named in errors."""
+
+    def __init__(self, errors):
+        self.fake = FakeDatabase()
+        self.fake.seed("students", [STUDENT, {**STUDENT, "email": "b@example.com"}])
+        self.errors = errors
+        self.statements = []
+
+    def execute_query(self, query, params=()):
+        self.statements.append(query.name)
+        if query.name in self.errors:
+            raise self.errors[query.name]
+        return self.fake.execute_query(query, params)
+
+
+class AsyncFailingDatabase(FailingDatabase):
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def execute_query(self, query, params=()):
+        return super().execute_query(query, params)
+
+
+@pytest.mark.parametrize("case", BULK_TIMEOUTS)
+class TestBulkRoutes:
+    """
+    A timeout in a bulk write fails the request with 504. It is neither
+    retried row by row nor reported as a per-item error.
+    """
+
+    def test_timeout_is_a_504(self, client, case):
+        method, body, errors, statements = BULK_TIMEOUTS[case]
+        backend = FailingDatabase(errors)
+        with QueryCounter(backend):
+            response = client.open("/students", method=method, json=body)
+
+        assert response.status_code == 504
+        assert backend.statements == statements
+
+    def test_async_timeout_is_a_504(self, case):
+        method, body, errors, statements = BULK_TIMEOUTS[case]
+        backend = AsyncFailingDatabase(errors)
+
+        async def run():
+            transport = httpx.ASGITransport(app=create_asgi_app(backend))
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as http:
+                return await http.request(method, "/students", json=body)
+
+        assert asyncio.run(run()).status_code == 504
+        assert backend.statements == statements
+
+
+class TestBulkRoutePoolErrors:
+    def test_exhausted_pool_is_a_503(self, client):
+        backend = FailingDatabase(
+            {"students_insert_many": PoolError("connection pool exhausted")}
+        )
+        with QueryCounter(backend):
+            response = client.post("/students", json=[STUDENT])
+
+        assert response.status_code == 503
+        assert backend.statements == ["students_insert_many"]
+
+
+async def call_asgi(app, messages):
+    """Run app for one request; messages are what the client sends, in order."""
+    received = asyncio.Queue()
+    for message in messages:
+        received.put_nowait(message)
+    sent = []
+
+    async def receive():
+        message = await received.get()
+        if message == "wait":
+            await asyncio.sleep(0.05)
+            return await received.get()
+        return message
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "path": "/things", "method": "GET"}
+    await CancelOnDisconnect(app)(scope, receive, send)
+    return sent
+
+
+REQUEST = {"type": "http.request", "body": b"", "more_body": False}
+DISCONNECT = {"type": "http.disconnect"}
+
+
+class TestCancelOnDisconnect:
+    def test_handler_is_canceled_when_client_leaves(self):
+        state = {}
+
+        async def app(scope, receive, send):
+            await receive()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                state["canceled"] = True
+                raise
+
+        started = time.monotonic()
+        sent = asyncio.run(call_asgi(app, [REQUEST, "wait", DISCONNECT]))
+
+        assert state == {"canceled": True}
+        assert sent == []
+        assert time.monotonic() - started < 5
+
+    def test_response_passes_through(self):
+        async def app(scope, receive, send):
+            assert await receive() == REQUEST
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+
+        sent = asyncio.run(call_asgi(app, [REQUEST, "wait", DISCONNECT]))
+        assert [message["type"] for message in sent] == [
+            "http.response.start",
+            "http.response.body",
+        ]
+
+
+class TestOnPostgres:
+    @pytest.fixture
+    def url(self):
+        url = os.getenv("TEST_DATABASE_URL")
+        if not url:
+            pytest.skip("TEST_DATABASE_URL is not set")
+        return url
+
+    def test_deadline_cancels_slow_statement(self, url, deadline):
+        pool = ConnectingPool(url)
+        deadline(0.2)
+        started = time.monotonic()
+        with installed(pool), pytest.raises(QueryTimeout):
+            Database().execute_query(SLEEP, (5,))
+        pool.closeall()
+        assert time.monotonic() - started < 2
+
+    def test_async_default_timeout(self, url, monkeypatch):
+        monkeypatch.setenv("DB_STATEMENT_TIMEOUT_MS", "200")
+
+        async def run():
+            db = AsyncDatabase(url, min_size=1, max_size=1)
+            try:
+                await db.execute_query(SLEEP, (5,))
+            finally:
+                await db.close()
+
+        with pytest.raises(QueryTimeout):
+            asyncio.run(run())
+
+    def test_cancelled_task_cancels_statement(self, url):
+        async def run():
+            db = AsyncDatabase(url, min_size=1, max_size=1)
+            try:
+                query = asyncio.create_task(db.execute_query(SLEEP, (5,)))
+                await asyncio.sleep(0.3)
+                query.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await query
+                # The connection is free again well before the sleep ends
+                return await asyncio.wait_for(db.execute_query("SELECT 1 AS one;"), 2)
+            finally:
+                await db.close()
+
+        assert asyncio.run(run()) == [{"one": 1}]
+        with psycopg.connect(url) as conn:
+            running = conn.execute(
+                "SELECT count(*) FROM pg_stat_activity"
+                " WHERE state = 'active' AND query LIKE 'SELECT pg_sleep%';"
+            ).fetchone()[0]
+        assert running == 0
@@ -1,6 +1,6 @@
 import pytest
 from datetime import date
-from unittest.mock import patch
+from unittest.mock import call, patch
 from app.models import (
     department_db_read_all,
     department_db_read_by_id,
@@ -99,20 +99,20 @@ def mock_db_read_many():
 
 
 @pytest.fixture
-def mock_db_create():
-    with patch("app.services.department.department_db_insert") as mock:
+def mock_db_create_many():
+    with patch("app.services.department.department_db_insert_many") as mock:
         yield mock
 
 
 @pytest.fixture
-def mock_db_update():
-    with patch("app.services.department.department_db_update") as mock:
+def mock_db_update_many():
+    with patch("app.services.department.department_db_update_many") as mock:
         yield mock
 
 
 @pytest.fixture
-def mock_db_archive():
-    with patch("app.services.department.department_db_archive") as mock:
+def mock_db_archive_many():
+    with patch("app.services.department.department_db_archive_many") as mock:
         yield mock
 
 
@@ -155,7 +155,7 @@ class TestDepartmentCreateService:
         self,
         mock_department_dict_to_row,
         mock_db_instance,
-        mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_department_create_data,
         valid_department_rows,
@@ -163,7 +163,7 @@ class TestDepartmentCreateService:
         # Mock the department_dict_to_row function
         mock_department_dict_to_row.return_value = ("Computer Science",)
 
-        mock_db_create.side_effect = [1, 2]
+        mock_db_create_many.return_value = [1, 2]
         mock_db_read_many.return_value = valid_department_rows
 
         results, error, status_code = create_new_departments(
@@ -173,21 +173,21 @@ class TestDepartmentCreateService:
         assert len(results) == 2
         assert error is None
         assert status_code == 201
-        assert mock_db_create.call_count == 2
+        mock_db_create_many.assert_called_once()
         mock_db_read_many.assert_called_once_with([1, 2])
 
     def test_create_new_departments_failure(
         self,
         mock_department_dict_to_row,
         mock_db_instance,
-        mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_department_create_data,
     ):
         # Mock the department_dict_to_row function
         mock_department_dict_to_row.return_value = ("Computer Science",)
 
-        mock_db_create.side_effect = [None, None]
+        mock_db_create_many.return_value = []
         results, error, status_code = create_new_departments(
             valid_department_create_data
         )
@@ -205,59 +205,55 @@ class TestDepartmentUpdateService:
         self,
         mock_department_dict_to_row,
         mock_db_instance,
-        mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_department_update_data,
         valid_department_row,
     ):
         # Mock the department_dict_to_row function
         mock_department_dict_to_row.return_value = ("Computer Science",)
 
-        mock_db_read_one.return_value = valid_department_row
-
-        mock_db_update.return_value = 1
         mock_db_read_many.return_value = [valid_department_row]
 
+        mock_db_update_many.return_value = [1]
+
         results, error, status_code = update_departments(valid_department_update_data)
 
         assert len(results) == 1
         assert error in (None, [])
         assert status_code == 200
-        assert mock_db_update.call_count == 1
-        mock_db_read_many.assert_called_once_with([1])
+        mock_db_update_many.assert_called_once()
+        assert mock_db_read_many.call_args_list == [call([1]), call([1])]
 
     def test_update_departments_no_success(
         self,
         mock_department_dict_to_row,
         mock_db_instance,
-        mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_department_update_data,
         valid_department_row,
     ):
         # Mock the department_dict_to_row function
         mock_department_dict_to_row.return_value = ("Computer Science",)
 
-        mock_db_read_one.return_value = valid_department_row
+        mock_db_read_many.return_value = [valid_department_row]
 
-        mock_db_update.return_value = 0
+        mock_db_update_many.return_value = []
         results, error, status_code = update_departments(valid_department_update_data)
 
         assert results == []
         assert error == [{"message": "Department ID 1 not updated."}]
         assert status_code == 400
-        mock_db_update.assert_called_once()
-        mock_db_read_many.assert_not_called()
+        mock_db_update_many.assert_called_once()
+        mock_db_read_many.assert_called_once_with([1])
 
     def test_update_departments_missing_id(
         self,
         mock_department_dict_to_row,
         mock_db_instance,
-        mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         department_missing_id,
     ):
         results, error, status_code = update_departments(department_missing_id)
@@ -265,7 +261,7 @@ class TestDepartmentUpdateService:
         assert results == []
         assert error == [{"message": "Missing department ID for update."}]
         assert status_code == 400
-        mock_db_update.assert_not_called()
+        mock_db_update_many.assert_not_called()
         mock_db_read_many.assert_not_called()
 
 
@@ -274,44 +270,41 @@ class TestDepartmentArchiveService:
     def test_archive_departments(
         self,
         mock_db_instance,
-        mock_db_archive,
-        mock_db_read_one,
+        mock_db_archive_many,
         mock_db_read_many,
         valid_department_ids,
         valid_department_row,
     ):
-        # Mock that departments exist
-        mock_db_read_one.return_value = valid_department_row
         mock_db_read_many.return_value = [
             valid_department_row,
             valid_department_row,
         ]
 
-        mock_db_archive.side_effect = [1, 1]
+        mock_db_archive_many.return_value = [1, 2]
         archived, errors, status_code = archive_departments(valid_department_ids)
 
         assert len(archived) == 2
-        assert mock_db_archive.call_count == 2
+        mock_db_archive_many.assert_called_once_with([1, 2])
 
     def test_archive_departments_none_archived(
         self,
         mock_db_instance,
-        mock_db_archive,
-        mock_db_read_one,
+        mock_db_archive_many,
         mock_db_read_many,
         valid_department_ids,
         valid_department_row,
     ):
-        # Mock that departments exist
-        mock_db_read_one.return_value = valid_department_row
-
-        mock_db_archive.return_value = 0
+        mock_db_archive_many.return_value = []
         archived, errors, status_code = archive_departments(valid_department_ids)
 
         assert archived == []
 
     def test_archive_departments_invalid_ids(
-        self, mock_db_instance, mock_db_archive, mock_db_read_one, mock_db_read_many
+        self,
+        mock_db_instance,
+        mock_db_archive_many,
+        mock_db_read_one,
+        mock_db_read_many,
     ):
         results, errors, status = archive_departments(["one", 2])
         assert status == 400
@@ -369,8 +362,8 @@ class TestDepartmentModel:
         mock_execute.assert_called_once()
 
         query_call = mock_execute.call_args.args[0]
-        assert "IN (%s,%s)" in query_call
-        assert mock_execute.call_args.args[1] == [1, 2]
+        assert "= ANY(%s)" in query_call
+        assert mock_execute.call_args.args[1] == ([1, 2],)
 
     @patch("app.models.department.db.execute_query")
     def test_department_db_insert_success(self, mock_execute, valid_department_row):
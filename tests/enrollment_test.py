@@ -1,6 +1,6 @@
 import pytest
 from datetime import date
-from unittest.mock import patch
+from unittest.mock import call, patch
 from app.models import (
     enrollment_db_read_all,
     enrollment_db_read_by_id,
@@ -8,6 +8,9 @@ from app.models import (
     enrollment_db_insert,
     enrollment_db_update,
     enrollment_db_archive,
+    enrollment_db_insert_many,
+    enrollment_db_update_many,
+    enrollment_db_archive_many,
 )
 from app.services import (
     get_all_enrollments,
@@ -114,6 +117,12 @@ def mock_db_create():
         yield mock
 
 
+@pytest.fixture
+def mock_db_create_many():
+    with patch("app.services.enrollment.enrollment_db_insert_many") as mock:
+        yield mock
+
+
 @pytest.fixture
 def mock_db_update():
     with patch("app.services.enrollment.enrollment_db_update") as mock:
@@ -121,8 +130,14 @@ def mock_db_update():
 
 
 @pytest.fixture
-def mock_db_archive():
-    with patch("app.services.enrollment.enrollment_db_archive") as mock:
+def mock_db_update_many():
+    with patch("app.services.enrollment.enrollment_db_update_many") as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_db_archive_many():
+    with patch("app.services.enrollment.enrollment_db_archive_many") as mock:
         yield mock
 
 
@@ -165,7 +180,7 @@ class TestEnrollmentCreateService:
         self,
         mock_enrollment_dict_to_row,
         mock_db_instance,
-        mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_enrollment_create_data,
         valid_enrollment_rows,
@@ -173,7 +188,7 @@ class TestEnrollmentCreateService:
         # Mock the enrollment_dict_to_row function
         mock_enrollment_dict_to_row.return_value = (1, 1, "A")
 
-        mock_db_create.side_effect = [1, 2]
+        mock_db_create_many.return_value = [1, 2]
         mock_db_read_many.return_value = valid_enrollment_rows
 
         results, error, status_code = create_new_enrollments(
@@ -183,21 +198,21 @@ class TestEnrollmentCreateService:
         assert len(results) == 2
         assert error is None
         assert status_code == 201
-        assert mock_db_create.call_count == 2
+        mock_db_create_many.assert_called_once()
         mock_db_read_many.assert_called_once_with([1, 2])
 
     def test_create_new_enrollments_failure(
         self,
         mock_enrollment_dict_to_row,
         mock_db_instance,
-        mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_enrollment_create_data,
     ):
         # Mock the enrollment_dict_to_row function
         mock_enrollment_dict_to_row.return_value = (1, 1, "A")
 
-        mock_db_create.side_effect = [None, None]
+        mock_db_create_many.return_value = []
         results, error, status_code = create_new_enrollments(
             valid_enrollment_create_data
         )
@@ -207,6 +222,49 @@ class TestEnrollmentCreateService:
         assert status_code == 400
         mock_db_read_many.assert_not_called()
 
+    def test_create_new_enrollments_batch_fallback(
+        self,
+        mock_enrollment_dict_to_row,
+        mock_db_instance,
+        mock_db_create_many,
+        mock_db_create,
+        mock_db_read_many,
+        valid_enrollment_create_data,
+        valid_enrollment_row,
+    ):
+        mock_enrollment_dict_to_row.return_value = (1, 1, "A")
+
+        # One bad row fails the whole batch; rows are then inserted one by one
+        mock_db_create_many.side_effect = ValueError("Integrity error")
+        mock_db_create.side_effect = [ValueError("Integrity error: duplicate"), 2]
+        mock_db_read_many.return_value = [valid_enrollment_row]
+
+        results, error, status_code = create_new_enrollments(
+            valid_enrollment_create_data
+        )
+
+        assert len(results) == 1
+        assert status_code == 201
+        assert mock_db_create.call_count == 2
+        mock_db_read_many.assert_called_once_with([2])
+
+    def test_create_new_enrollments_database_error_is_not_retried(
+        self,
+        mock_enrollment_dict_to_row,
+        mock_db_instance,
+        mock_db_create_many,
+        mock_db_create,
+        mock_db_read_many,
+        valid_enrollment_create_data,
+    ):
+        mock_enrollment_dict_to_row.return_value = (1, 1, "A")
+        mock_db_create_many.side_effect = RuntimeError("Database error")
+
+        with pytest.raises(RuntimeError):
+            create_new_enrollments(valid_enrollment_create_data)
+        mock_db_create.assert_not_called()
+        mock_db_read_many.assert_not_called()
+
 
 @patch("app.models.enrollment.db")
 @patch("app.services.enrollment.enrollment_dict_to_row")
@@ -215,59 +273,55 @@ class TestEnrollmentUpdateService:
         self,
         mock_enrollment_dict_to_row,
         mock_db_instance,
-        mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_enrollment_update_data,
         valid_enrollment_row,
     ):
         # Mock the enrollment_dict_to_row function
         mock_enrollment_dict_to_row.return_value = (1, 1, "A")
 
-        mock_db_read_one.return_value = valid_enrollment_row
-
-        mock_db_update.return_value = 1
         mock_db_read_many.return_value = [valid_enrollment_row]
 
+        mock_db_update_many.return_value = [1]
+
         results, error, status_code = update_enrollments(valid_enrollment_update_data)
 
         assert len(results) == 1
         assert error in (None, [])
         assert status_code == 200
-        assert mock_db_update.call_count == 1
-        mock_db_read_many.assert_called_once_with([1])
+        mock_db_update_many.assert_called_once()
+        assert mock_db_read_many.call_args_list == [call([1]), call([1])]
 
     def test_update_enrollments_no_success(
         self,
         mock_enrollment_dict_to_row,
         mock_db_instance,
-        mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_enrollment_update_data,
         valid_enrollment_row,
     ):
         # Mock the enrollment_dict_to_row function
         mock_enrollment_dict_to_row.return_value = (1, 1, "A")
 
-        mock_db_read_one.return_value = valid_enrollment_row
+        mock_db_read_many.return_value = [valid_enrollment_row]
 
-        mock_db_update.return_value = 0
+        mock_db_update_many.return_value = []
         results, error, status_code = update_enrollments(valid_enrollment_update_data)
 
         assert results == []
         assert error == [{"message": "Enrollment ID 1 not updated."}]
         assert status_code == 400
-        mock_db_update.assert_called_once()
-        mock_db_read_many.assert_not_called()
+        mock_db_update_many.assert_called_once()
+        mock_db_read_many.assert_called_once_with([1])
 
     def test_update_enrollments_missing_id(
         self,
         mock_enrollment_dict_to_row,
         mock_db_instance,
-        mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         enrollment_missing_id,
     ):
         results, error, status_code = update_enrollments(enrollment_missing_id)
@@ -275,53 +329,112 @@ class TestEnrollmentUpdateService:
         assert results == []
         assert error == [{"message": "Missing enrollment ID for update."}]
         assert status_code == 400
-        mock_db_update.assert_not_called()
+        mock_db_update_many.assert_not_called()
         mock_db_read_many.assert_not_called()
 
+    def test_update_enrollments_merges_repeated_ids(
+        self,
+        mock_enrollment_dict_to_row,
+        mock_db_instance,
+        mock_db_update_many,
+        mock_db_read_many,
+        valid_enrollment_row,
+    ):
+        mock_enrollment_dict_to_row.side_effect = lambda d: (
+            d["student_id"],
+            d["course_id"],
+            d["grade"],
+        )
+        mock_db_read_many.return_value = [valid_enrollment_row]
+        mock_db_update_many.return_value = [1]
+
+        results, error, status_code = update_enrollments(
+            [{"id": 1, "grade": "B"}, {"id": 1, "course_id": 7}]
+        )
+
+        assert status_code == 200
+        mock_db_update_many.assert_called_once_with([1], [(1, 7, "B")])
+
+    def test_update_enrollments_batch_fallback(
+        self,
+        mock_enrollment_dict_to_row,
+        mock_db_instance,
+        mock_db_update_many,
+        mock_db_update,
+        mock_db_read_many,
+        valid_enrollment_row,
+    ):
+        mock_enrollment_dict_to_row.return_value = (1, 1, "A")
+        mock_db_read_many.return_value = [valid_enrollment_row, {"id": 2}]
+
+        mock_db_update_many.side_effect = ValueError("Integrity error: fk")
+        mock_db_update.side_effect = [1, ValueError("Integrity error: fk")]
+
+        results, error, status_code = update_enrollments([{"id": 1}, {"id": 2}])
+
+        assert status_code == 200
+        assert error == [{"message": "Integrity error: fk"}]
+        assert mock_db_update.call_count == 2
+        assert mock_db_read_many.call_args_list[-1] == call([1])
+
+    def test_update_enrollments_database_error_is_not_retried(
+        self,
+        mock_enrollment_dict_to_row,
+        mock_db_instance,
+        mock_db_update_many,
+        mock_db_update,
+        mock_db_read_many,
+        valid_enrollment_row,
+    ):
+        mock_enrollment_dict_to_row.return_value = (1, 1, "A")
+        mock_db_read_many.return_value = [valid_enrollment_row]
+        mock_db_update_many.side_effect = RuntimeError("Database error")
+
+        with pytest.raises(RuntimeError):
+            update_enrollments([{"id": 1}])
+        mock_db_update.assert_not_called()
+
 
 @patch("app.models.enrollment.db")
 class TestEnrollmentArchiveService:
     def test_archive_enrollments(
         self,
         mock_db_instance,
-        mock_db_archive,
-        mock_db_read_one,
+        mock_db_archive_many,
         mock_db_read_many,
         valid_enrollment_ids,
         valid_enrollment_row,
     ):
-        # Mock that enrollments exist
-        mock_db_read_one.return_value = valid_enrollment_row
         mock_db_read_many.return_value = [
             valid_enrollment_row,
             valid_enrollment_row,
         ]
 
-        mock_db_archive.side_effect = [1, 1]
+        mock_db_archive_many.return_value = [1, 2]
         archived, errors, status_code = archive_enrollments(valid_enrollment_ids)
 
         assert len(archived) == 2
-        assert mock_db_archive.call_count == 2
+        mock_db_archive_many.assert_called_once_with([1, 2])
 
     def test_archive_enrollments_none_archived(
         self,
         mock_db_instance,
-        mock_db_archive,
-        mock_db_read_one,
+        mock_db_archive_many,
         mock_db_read_many,
         valid_enrollment_ids,
         valid_enrollment_row,
     ):
-        # Mock that enrollments exist
-        mock_db_read_one.return_value = valid_enrollment_row
-
-        mock_db_archive.return_value = 0
+        mock_db_archive_many.return_value = []
         archived, errors, status_code = archive_enrollments(valid_enrollment_ids)
 
         assert archived == []
 
     def test_archive_enrollments_invalid_ids(
-        self, mock_db_instance, mock_db_archive, mock_db_read_one, mock_db_read_many
+        self,
+        mock_db_instance,
+        mock_db_archive_many,
+        mock_db_read_one,
+        mock_db_read_many,
     ):
         results, errors, status = archive_enrollments(["one", 2])
         assert status == 400
@@ -374,8 +487,8 @@ class TestEnrollmentModel:
 
         # The model uses PostgreSQL syntax (%s)
         query_call = mock_execute.call_args.args[0]
-        assert "IN (%s,%s)" in query_call
-        assert mock_execute.call_args.args[1] == [1, 2]
+        assert "= ANY(%s)" in query_call
+        assert mock_execute.call_args.args[1] == ([1, 2],)
 
     @patch("app.models.enrollment.db.execute_query")
     def test_enrollment_db_insert_success(self, mock_execute, valid_enrollment_row):
@@ -429,6 +542,46 @@ class TestEnrollmentModel:
         result = enrollment_db_archive(999)
         assert result == 0
 
+    @patch("app.models.enrollment.db.execute_query")
+    def test_enrollment_db_insert_many(self, mock_execute):
+        mock_execute.return_value = [{"id": 10}, {"id": 11}]
+
+        result = enrollment_db_insert_many([(1, 2, "A"), (3, 4, None)])
+
+        assert result == [10, 11]
+        query, params = mock_execute.call_args.args
+        assert query.name == "enrollments_insert_many"
+        assert "unnest(%s::integer[], %s::integer[], %s::text[])" in query
+        assert params == ('{"1","3"}', '{"2","4"}', '{"A",NULL}')
+
+    @patch("app.models.enrollment.db.execute_query")
+    def test_enrollment_db_insert_many_empty(self, mock_execute):
+        assert enrollment_db_insert_many([]) == []
+        mock_execute.assert_not_called()
+
+    @patch("app.models.enrollment.db.execute_query")
+    def test_enrollment_db_update_many(self, mock_execute):
+        mock_execute.return_value = [{"id": 1}]
+
+        result = enrollment_db_update_many([1, 2], [(1, 2, "A"), (3, 4, "B")])
+
+        assert result == [1]
+        query, params = mock_execute.call_args.args
+        assert query.name == "enrollments_update_many"
+        assert "WHERE t.id = v.id AND t.is_archived = FALSE" in query
+        assert params == ('{"1","2"}', '{"1","3"}', '{"2","4"}', '{"A","B"}')
+
+    @patch("app.models.enrollment.db.execute_query")
+    def test_enrollment_db_archive_many(self, mock_execute):
+        mock_execute.return_value = [{"id": 2}]
+
+        result = enrollment_db_archive_many((1, 2))
+
+        assert result == [2]
+        query, params = mock_execute.call_args.args
+        assert query.name == "enrollments_archive_many"
+        assert params == ([1, 2],)
+
 
 # =======================
 # Route Tests
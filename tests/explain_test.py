@@ -0,0 +1,145 @@
+import pytest
+import psycopg2
+import app.models  # noqa: F401 - declares the statement catalog
+from db.init import schema_indexes
+from db.migrate import load_migrations
+from db.statements import get_statement
+from tests.explain import (
+    explain,
+    index_scans,
+    plan_nodes,
+    rolled_back,
+)
+
+REDUNDANT_INDEXES = [
+    "idx_students_email",
+    "idx_instructors_email",
+    "idx_courses_code",
+    "idx_terms_is_archived",
+    "idx_enrollments_is_archived",
+]
+
+# The only partial indexes: both keep live rows unique
+UNIQUE_LIVE_INDEXES = {
+    "idx_enrollments_student_course",
+    "idx_assignments_instructor_course",
+}
+
+
+def partial_indexes(conn):
+    with conn.cursor() as cursor:
+        cursor.execute(
+            "SELECT indexrelid::regclass::text FROM pg_index"
+            " JOIN pg_class ON pg_class.oid = indexrelid"
+            " WHERE indpred IS NOT NULL"
+            " AND relnamespace = current_schema()::regnamespace;"
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+
+class TestIndexMigration:
+    def test_builds_indexes_online(self):
+        migration = next(m for m in load_migrations() if m.version == 2)
+        assert not migration.transactional
+        for statement in migration.statements:
+            if "INDEX" in statement:
+                assert "CONCURRENTLY" in statement, statement
+
+    def test_redundant_indexes_are_not_rebuilt(self):
+        names = [name for name, _ in schema_indexes()]
+        assert not set(REDUNDANT_INDEXES) & set(names)
+        assert "idx_enrollments_student_course" in names
+
+
+class TestIndexUsage:
+    """Plans under default planner settings, on the synthetic dataset."""
+
+    def test_no_partial_indexes_for_active_lists(self, pg):
+        assert partial_indexes(pg) == UNIQUE_LIVE_INDEXES
+
+    def test_enrollment_lookup_uses_composite_index(self, pg):
+        plan = explain(
+            pg,
+            "SELECT id FROM enrollments"
+            " WHERE student_id = %s AND course_id = %s AND is_archived = FALSE;",
+            (1, 1),
+        )
+        assert "idx_enrollments_student_course" in index_scans(plan)
+
+    def test_bulk_archive_does_not_scan_the_table(self, pg):
+        plan = explain(pg, get_statement("enrollments_archive_many"), ([1, 2],))
+        assert index_scans(plan)
+        assert "Seq Scan" not in {node["Node Type"] for node in plan_nodes(plan)}
+
+    def test_redundant_indexes_are_dropped(self, pg):
+        with pg.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexname FROM pg_indexes WHERE schemaname = current_schema();"
+            )
+            indexes = {row[0] for row in cursor.fetchall()}
+        assert not set(REDUNDANT_INDEXES) & indexes
+        assert {"students_email_key", "courses_code_key"} <= indexes
+
+
+class TestUniqueness:
+    @pytest.fixture
+    def duplicate_enrollment(self, pg):
+        """A repeated live enrollment, with its unique index dropped, rolled back after."""
+        with rolled_back(pg) as cursor:
+            cursor.execute("DROP INDEX idx_enrollments_student_course;")
+            cursor.execute(
+                "INSERT INTO enrollments (student_id, course_id)"
+                " SELECT student_id, course_id FROM enrollments"
+                " WHERE is_archived = FALSE ORDER BY id LIMIT 1"
+                " RETURNING student_id, course_id;"
+            )
+            yield cursor, cursor.fetchone()
+
+    def test_migration_reports_duplicates_before_building(self, duplicate_enrollment):
+        cursor, (student_id, course_id) = duplicate_enrollment
+        migration = next(m for m in load_migrations() if m.version == 2)
+        check = next(s for s in migration.statements if "Live enrollments" in s)
+
+        with pytest.raises(psycopg2.errors.RaiseException) as raised:
+            cursor.execute(check)
+        assert f"student {student_id}, course {course_id}: ids" in str(raised.value)
+
+    def test_duplicate_active_enrollment_is_rejected(self, pg):
+        with rolled_back(pg) as cursor:
+            cursor.execute(
+                "SELECT student_id, course_id FROM enrollments"
+                " WHERE is_archived = FALSE LIMIT 1;"
+            )
+            student_id, course_id = cursor.fetchone()
+            with pytest.raises(psycopg2.errors.UniqueViolation):
+                cursor.execute(
+                    "INSERT INTO enrollments (student_id, course_id) VALUES (%s, %s);",
+                    (student_id, course_id),
+                )
+
+    def test_duplicate_active_assignment_is_rejected(self, pg):
+        with rolled_back(pg) as cursor:
+            cursor.execute(
+                "SELECT instructor_id, course_id FROM assignments"
+                " WHERE is_archived = FALSE LIMIT 1;"
+            )
+            instructor_id, course_id = cursor.fetchone()
+            with pytest.raises(psycopg2.errors.UniqueViolation):
+                cursor.execute(
+                    "INSERT INTO assignments (instructor_id, course_id)"
+                    " VALUES (%s, %s);",
+                    (instructor_id, course_id),
+                )
+
+    def test_archived_duplicates_are_allowed(self, pg):
+        with rolled_back(pg) as cursor:
+            cursor.execute(
+                "SELECT student_id, course_id FROM enrollments"
+                " WHERE is_archived = FALSE LIMIT 1;"
+            )
+            student_id, course_id = cursor.fetchone()
+            cursor.execute(
+                "INSERT INTO enrollments (student_id, course_id, is_archived)"
+                " VALUES (%s, %s, TRUE), (%s, %s, TRUE);",
+                (student_id, course_id, student_id, course_id),
+            )
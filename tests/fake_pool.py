@@ -0,0 +1,197 @@
+"""
+Stand-ins for the psycopg2 connection pools behind Database.
+
+ListPool hands out a fixed list of (usually mock) connections, like
+ThreadedConnectionPool, ConnectingPool opens real ones on demand
+(conftest replaces ThreadedConnectionPool with a mock) and ExhaustedPool
+has none to give. connection()
+builds a mock connection that can return rows, lose its server connection
+or fail a statement. installed() puts pools on Database for the duration
+of a with block.
+
+TransactionPooler stands in for PgBouncer in transaction mode: its client
+connections share a few real server connections, one per transaction.
+"""
+
+import queue
+import weakref
+from contextlib import ExitStack, contextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+import psycopg2
+from psycopg2.pool import PoolError
+from db.database import Database
+
+
+class ListPool:
+    """getconn / putconn over a list of connections, like ThreadedConnectionPool."""
+
+    maxconn = 3
+
+    def __init__(self, *connections):
+        self.idle = list(connections)
+        self.returned = []
+        # Lent connections, as ThreadedConnectionPool keeps them for pool_stats()
+        self._used = {}
+
+    @property
+    def _pool(self):
+        return self.idle
+
+    def getconn(self):
+        return self._lend(self.idle.pop(0))
+
+    def _lend(self, conn):
+        self._used[id(conn)] = conn
+        return conn
+
+    def putconn(self, conn, close=False):
+        self._used.pop(id(conn), None)
+        self.returned.append((conn, close))
+        if close:
+            conn.close()
+        else:
+            self.idle.insert(0, conn)
+
+    def closeall(self):
+        for conn in self.idle:
+            conn.close()
+
+
+class ConnectingPool(ListPool):
+    """A ListPool that connects to dsn whenever it has no idle connection."""
+
+    def __init__(self, dsn):
+        super().__init__()
+        self.dsn = dsn
+
+    def getconn(self):
+        return self._lend(self.idle.pop(0) if self.idle else psycopg2.connect(self.dsn))
+
+
+class ExhaustedPool(ListPool):
+    """A pool whose connections are all in use: getconn raises PoolError."""
+
+    def getconn(self):
+        raise PoolError("connection pool exhausted")
+
+
+class TransactionPooler:
+    """
+    PgBouncer in transaction mode, in process: each transaction of a client
+    connection runs on whichever server connection has been free longest, so
+    session state (PREPARE, SET) left by one transaction is usually not
+    there for the next. Clients queue while every server connection is busy.
+    """
+
+    def __init__(self, dsn, servers):
+        self.servers = [psycopg2.connect(dsn) for _ in range(servers)]
+        self.free = queue.Queue()
+        for server in self.servers:
+            self.free.put(server)
+
+    def client(self):
+        return PooledClient(self)
+
+    def closeall(self):
+        for server in self.servers:
+            server.close()
+
+
+class PooledClient:
+    """A client connection to a TransactionPooler; as much of one as Database uses."""
+
+    closed = 0
+
+    def __init__(self, pooler):
+        self.pooler = pooler
+        self.server = None
+        self.autocommit = False
+
+    def cursor(self):
+        return PooledCursor(self)
+
+    def acquire(self):
+        if self.server is None:
+            self.server = self.pooler.free.get(timeout=5)
+            self.server.autocommit = self.autocommit
+        return self.server
+
+    def release(self, end=None):
+        server, self.server = self.server, None
+        if server is not None:
+            try:
+                if end is not None:
+                    end(server)
+            finally:
+                self.pooler.free.put(server)
+
+    def commit(self):
+        self.release(lambda server: server.commit())
+
+    def rollback(self):
+        self.release(lambda server: server.rollback())
+
+    def close(self):
+        self.rollback()
+
+
+class PooledCursor:
+    """Runs each execute on the client's server connection for this transaction."""
+
+    def __init__(self, client):
+        self.client = client
+        self.cursor = None
+
+    def execute(self, sql, params=None):
+        self.cursor = self.client.acquire().cursor()
+        try:
+            self.cursor.execute(sql, params)
+        finally:
+            if self.client.autocommit:
+                self.client.release()
+
+    def __getattr__(self, name):
+        # fetchall, fetchone, description, rowcount: the results stay
+        # with the cursor once its server connection has moved on
+        return getattr(self.cursor, name)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def connection(rows=(), lost=None, error=None):
+    """A mock connection whose statements fail with lost (dropping it) or error."""
+    conn = MagicMock(closed=0)
+    cursor = conn.cursor.return_value
+    cursor.description = [SimpleNamespace(name="id")]
+    cursor.fetchall.return_value = list(rows)
+
+    def execute(*args):
+        if lost:
+            conn.closed = 2
+            raise lost
+        if error:
+            raise error
+
+    cursor.execute.side_effect = execute
+    return conn
+
+
+@contextmanager
+def installed(primary, replicas=None):
+    """Use primary (and {url: pool} replicas) as Database's pools."""
+    with ExitStack() as stack:
+        stack.enter_context(patch.object(Database, "_pool", primary))
+        stack.enter_context(patch.object(Database, "_replica_pools", replicas or {}))
+        stack.enter_context(patch.object(Database, "_db_config", {"database": "test"}))
+        stack.enter_context(
+            patch.object(Database, "_idle_since", weakref.WeakKeyDictionary())
+        )
+        yield primary
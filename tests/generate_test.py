@@ -0,0 +1,161 @@
+import pytest
+from collections import Counter
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from db.copy_stream import CopyStream, copy_line
+from db.database import Database
+from db.deadlines import SET_STATEMENT_TIMEOUT
+from db.generate import COLUMNS, TABLES, Scale, generate, load
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    scale = Scale(students=2000, enrollments_per_student=6)
+    return scale, {table: list(rows) for table, _, rows in generate(scale, seed=7)}
+
+
+@pytest.fixture
+def mock_pool():
+    pool = MagicMock()
+    conn = MagicMock(closed=0)
+    conn.cursor.return_value.description = [SimpleNamespace(name="setval")]
+    conn.cursor.return_value.fetchall.return_value = [(1,)]
+
+    def copy_expert(sql, stream, size):
+        while stream.read(size):
+            pass
+
+    conn.cursor.return_value.copy_expert.side_effect = copy_expert
+    pool.getconn.return_value = conn
+    with (
+        patch.object(Database, "_db_config", {"database": "test"}),
+        patch.object(Database, "_pool", pool),
+    ):
+        yield pool
+
+
+class TestScale:
+    def test_derived_counts(self):
+        scale = Scale(students=500_000)
+        assert scale.departments == 20
+        assert scale.programs == 80
+        assert scale.courses == 10_000
+        assert scale.instructors == 3333
+
+    def test_every_department_has_an_instructor(self):
+        scale = Scale(students=10, departments=8, courses=5)
+        assert scale.instructors == 8
+
+
+class TestGenerate:
+    def test_rows_match_columns(self, dataset):
+        _, rows = dataset
+        assert list(rows) == TABLES
+        for table, table_rows in rows.items():
+            assert table_rows, table
+            assert {len(row) for row in table_rows} == {len(COLUMNS[table])}
+
+    def test_counts(self, dataset):
+        scale, rows = dataset
+        assert len(rows["students"]) == scale.students
+        assert len(rows["courses"]) == scale.courses
+        assert len(rows["programs"]) == scale.programs
+        mean = len(rows["enrollments"]) / scale.students
+        assert 5 < mean < 7
+
+    def test_deterministic(self, dataset):
+        scale, rows = dataset
+        again = {table: list(r) for table, _, r in generate(scale, seed=7)}
+        other = {table: list(r) for table, _, r in generate(scale, seed=8)}
+        assert again == rows
+        assert other["students"] != rows["students"]
+
+    def test_unique_values(self, dataset):
+        _, rows = dataset
+        for table in TABLES:
+            ids = [row[0] for row in rows[table]]
+            assert ids == list(range(1, len(ids) + 1)), table
+        assert len({row[3] for row in rows["students"]}) == len(rows["students"])
+        assert len({row[3] for row in rows["instructors"]}) == len(rows["instructors"])
+        assert len({row[2] for row in rows["courses"]}) == len(rows["courses"])
+        pairs = [(row[1], row[2]) for row in rows["enrollments"]]
+        assert len(set(pairs)) == len(pairs)
+
+    def test_foreign_keys(self, dataset):
+        scale, rows = dataset
+        instructor_department = {row[0]: row[8] for row in rows["instructors"]}
+        course_department = {row[0]: row[4] for row in rows["courses"]}
+        assert {row[3] for row in rows["programs"]} <= set(
+            range(1, scale.departments + 1)
+        )
+        assert {row[3] for row in rows["courses"]} <= set(range(1, scale.terms + 1))
+        assert {row[12] for row in rows["students"]} <= set(
+            range(1, scale.programs + 1)
+        )
+        assert {row[2] for row in rows["enrollments"]} <= course_department.keys()
+        assert {row[1] for row in rows["course_schedule"]} == course_department.keys()
+        for _, instructor_id, course_id, *_ in rows["assignments"]:
+            assert instructor_department[instructor_id] == course_department[course_id]
+
+    def test_course_popularity_is_skewed(self, dataset):
+        _, rows = dataset
+        sizes = Counter(row[2] for row in rows["enrollments"]).most_common()
+        assert sizes[0][1] > 3 * sizes[len(sizes) // 2][1]
+
+    def test_terms_end_with_current_fall(self, dataset):
+        _, rows = dataset
+        assert rows["terms"][-1][1:4] == ("Fall 2025", "2025-09-01", "2025-12-20")
+        assert rows["terms"][-2][1] == "Summer 2025"
+        assert rows["terms"][-4][1] == "Fall 2024"
+
+
+class TestCopyStream:
+    def test_copy_line_escapes(self):
+        row = (1, "a\tb\\c\nd", None, True, date(2025, 9, 1))
+        assert copy_line(row) == "1\ta\\tb\\\\c\\nd\t\\N\tt\t2025-09-01\n"
+
+    def test_reads_in_chunks(self):
+        rows = [(i, f"name-{i}") for i in range(1000)]
+        stream = CopyStream(iter(rows))
+        chunks = []
+        while chunk := stream.read(100):
+            assert len(chunk) <= 100
+            chunks.append(chunk)
+
+        assert b"".join(chunks) == "".join(copy_line(r) for r in rows).encode()
+        assert stream.rows == 1000
+
+    def test_read_all(self):
+        assert CopyStream([(1,), (2,)]).read() == b"1\n2\n"
+
+
+class TestLoad:
+    def test_copy_rows(self, mock_pool):
+        copied = Database().copy_rows(
+            "terms", ["id", "name"], [(1, "Fall"), (2, "Winter")]
+        )
+
+        cursor = mock_pool.getconn.return_value.cursor.return_value
+        sql = cursor.copy_expert.call_args[0][0]
+        assert sql == "COPY terms (id, name) FROM STDIN"
+        assert copied == 2
+        mock_pool.getconn.return_value.commit.assert_called()
+
+    def test_load_copies_every_table(self, mock_pool, capsys):
+        counts = load(Database(), Scale(students=50), seed=1, truncate=True)
+
+        assert list(counts) == TABLES
+        assert counts["students"] == 50
+        conn = mock_pool.getconn.return_value
+        executed = [
+            call.args[0] for call in conn.cursor.return_value.execute.call_args_list
+        ]
+        assert executed[0].startswith("TRUNCATE departments, programs")
+        assert executed[1] == SET_STATEMENT_TIMEOUT
+        assert executed[2] == "DROP INDEX IF EXISTS idx_students_program_id;"
+        assert executed[-3].startswith(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_assignments_instructor_course"
+        )
+        assert executed[-1].startswith("ANALYZE")
+        assert "students: 50 rows" in capsys.readouterr().out
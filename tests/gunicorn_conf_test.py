@@ -0,0 +1,114 @@
+import gc
+import importlib.util
+import os
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+import pytest
+import app.models  # noqa: F401 - declares the statement catalog
+from db.database import Database
+from db.statements import get_statement
+
+CONFIG = Path(__file__).resolve().parent.parent / "gunicorn.conf.py"
+
+
+def load_config():
+    spec = importlib.util.spec_from_file_location("gunicorn_conf", CONFIG)
+    config = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(config)
+    return config
+
+
+@pytest.fixture
+def config(monkeypatch):
+    for name in ("WEB_CONCURRENCY", "GUNICORN_THREADS", "DB_MAX_CONNECTIONS"):
+        monkeypatch.delenv(name, raising=False)
+    # Loading the config sets it; restored after the test
+    monkeypatch.setenv("DB_POOL_MAX", "3")
+    return load_config
+
+
+class TestGunicornConfig:
+    def test_worker_count(self):
+        config = load_config()
+        assert config.worker_count(cpus=2, threads=4, connection_budget=100) == 5
+        assert config.worker_count(cpus=8, threads=4, connection_budget=20) == 5
+        assert config.worker_count(cpus=8, threads=4, connection_budget=3) == 1
+
+    def test_settings_from_environment(self, config, monkeypatch):
+        monkeypatch.setenv("GUNICORN_THREADS", "8")
+        monkeypatch.setenv("DB_MAX_CONNECTIONS", "16")
+        settings = config()
+
+        assert settings.preload_app is True
+        assert settings.worker_class == "gthread"
+        assert (settings.workers, settings.threads) == (2, 8)
+        assert settings.bind == "0.0.0.0:5000"
+        assert os.environ["DB_POOL_MAX"] == "8"
+
+    def test_web_concurrency_overrides_workers(self, config, monkeypatch):
+        monkeypatch.setenv("WEB_CONCURRENCY", "3")
+        monkeypatch.setenv("DB_MAX_CONNECTIONS", "1")
+        assert config().workers == 3
+
+    def test_pre_fork_closes_pool_and_freezes(self, config):
+        pool = MagicMock()
+        with patch.object(Database, "_pool", pool):
+            try:
+                config().pre_fork(server=None, worker=None)
+                assert gc.get_freeze_count() > 0
+            finally:
+                gc.unfreeze()
+
+            pool.closeall.assert_called_once()
+            assert Database._pool is None
+
+    def test_post_fork_prewarms_pool(self, config):
+        with patch.object(Database, "prewarm") as prewarm:
+            config().post_fork(server=None, worker=None)
+        prewarm.assert_called_once_with()
+
+
+class TestThreadedWorkers:
+    def test_threads_use_their_own_connections(self):
+        """Two threads in the same Database instance must not share a cursor."""
+        threads = 2
+        both_connected = threading.Barrier(threads, timeout=5)
+        connections = []
+
+        def getconn():
+            conn = MagicMock(closed=0)
+            conn.cursor.return_value.execute.side_effect = (
+                lambda *args: both_connected.wait()
+            )
+            connections.append(conn)
+            return conn
+
+        pool = MagicMock()
+        pool.getconn.side_effect = getconn
+        db = Database()
+        stmt = get_statement("students_archive")
+        errors = []
+
+        def archive():
+            try:
+                db.execute_query(stmt, (1,))
+            except Exception as e:
+                errors.append(e)
+
+        with (
+            patch.object(Database, "_pool", pool),
+            patch.object(Database, "_db_config", {"database": "test"}),
+        ):
+            workers = [threading.Thread(target=archive) for _ in range(threads)]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+
+        assert errors == []
+        assert len(connections) == threads
+        returned = [call.args[0] for call in pool.putconn.call_args_list]
+        assert sorted(map(id, returned)) == sorted(map(id, connections))
+        for conn in connections:
+            conn.commit.assert_called()
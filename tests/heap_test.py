@@ -0,0 +1,86 @@
+import pytest
+from unittest.mock import patch
+
+ADMIN = {"X-Admin-Token": "secret"}
+
+
+@pytest.fixture
+def admin_client(client, monkeypatch):
+    monkeypatch.setenv("ADMIN_TOKEN", "secret")
+    yield client
+    client.post("/debug/heap/stop", headers=ADMIN)
+
+
+class TestHeapEndpoints:
+    def test_requires_admin_token(self, admin_client):
+        assert admin_client.get("/debug/heap").status_code == 403
+        assert admin_client.post("/debug/heap/start").status_code == 403
+
+    def test_start_and_stop(self, admin_client):
+        data = admin_client.post("/debug/heap/start", headers=ADMIN).get_json()
+        assert data["data"]["tracing"] is True
+
+        data = admin_client.post("/debug/heap/stop", headers=ADMIN).get_json()
+        assert data["data"]["tracing"] is False
+
+    def test_snapshot_requires_tracing(self, admin_client):
+        response = admin_client.post("/debug/heap/snapshot", headers=ADMIN)
+        assert response.status_code == 409
+
+    def test_snapshot_and_diff(self, admin_client):
+        admin_client.post("/debug/heap/start", headers=ADMIN)
+        first = admin_client.post("/debug/heap/snapshot", headers=ADMIN)
+        assert first.status_code == 201
+
+        retained = [bytearray(1024) for _ in range(200)]
+        second = admin_client.post(
+            "/debug/heap/snapshot?group_by=filename", headers=ADMIN
+        )
+        old_id = first.get_json()["data"]["id"]
+        new_id = second.get_json()["data"]["id"]
+
+        response = admin_client.get(
+            f"/debug/heap/diff?from={old_id}&to={new_id}&limit=5", headers=ADMIN
+        )
+        diff = response.get_json()["data"]
+        assert response.status_code == 200
+        assert diff["size_diff_kb"] >= 200
+        assert len(diff["top"]) <= 5
+        assert any(item["file"] == __file__ for item in diff["top"])
+        del retained
+
+    def test_diff_unknown_snapshot(self, admin_client):
+        response = admin_client.get("/debug/heap/diff?from=998&to=999", headers=ADMIN)
+        assert response.status_code == 404
+
+    def test_diff_requires_ids(self, admin_client):
+        response = admin_client.get("/debug/heap/diff", headers=ADMIN)
+        assert response.status_code == 400
+
+
+class TestRouteAllocations:
+    def test_unknown_endpoint(self, admin_client):
+        response = admin_client.put(
+            "/debug/heap/route", json={"endpoint": "nope"}, headers=ADMIN
+        )
+        assert response.status_code == 404
+
+    @patch("app.routes.student.get_all_students")
+    def test_route_peak_recorded(self, mock_get_all, admin_client):
+        mock_get_all.side_effect = lambda active_only: [
+            {"id": i, "name": "x" * 100} for i in range(1000)
+        ]
+        admin_client.post("/debug/heap/start", headers=ADMIN)
+        admin_client.put(
+            "/debug/heap/route",
+            json={"endpoint": "student.handle_read_all_students"},
+            headers=ADMIN,
+        )
+
+        response = admin_client.get("/students")
+        assert float(response.headers["X-Alloc-Peak-KB"]) > 100
+        assert "X-Alloc-Peak-KB" not in admin_client.get("/").headers
+
+        data = admin_client.get("/debug/heap/route", headers=ADMIN).get_json()["data"]
+        assert data["requests"] == 1
+        assert data["samples"][0]["path"] == "/students"
@@ -0,0 +1,121 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+import psycopg2
+from db import data
+from db.database import Database
+from db.deadlines import SET_STATEMENT_TIMEOUT
+from db.db_utils import get_reset_sequences_query
+from db.init import load_tables, populate_sample_data, schema_indexes
+
+
+@pytest.fixture
+def mock_pool():
+    pool = MagicMock()
+    conn = MagicMock(closed=0)
+    conn.cursor.return_value.description = [SimpleNamespace(name="id")]
+    conn.cursor.return_value.fetchall.return_value = []
+    copied = {}
+
+    def copy_expert(sql, stream, size):
+        copied[sql] = b""
+        while chunk := stream.read(size):
+            copied[sql] += chunk
+
+    conn.cursor.return_value.copy_expert.side_effect = copy_expert
+    conn.copied = copied
+    pool.getconn.return_value = conn
+    with (
+        patch.object(Database, "_db_config", {"database": "test"}),
+        patch.object(Database, "_pool", pool),
+    ):
+        yield pool
+
+
+def executed(pool):
+    cursor = pool.getconn.return_value.cursor.return_value
+    return [call.args[0] for call in cursor.execute.call_args_list]
+
+
+class TestPopulateSampleData:
+    def test_single_transaction(self, mock_pool):
+        assert populate_sample_data() is True
+
+        conn = mock_pool.getconn.return_value
+        # One checkout for the "already populated?" check, one for the load
+        assert mock_pool.getconn.call_count == 2
+        calls = [name for name, _, _ in conn.mock_calls]
+        copies = [i for i, name in enumerate(calls) if "copy_expert" in name]
+        assert "commit" not in calls[copies[0] : copies[-1]]
+        assert "commit" in calls[copies[-1] :]
+        cursor = conn.cursor.return_value
+        assert cursor.executemany.call_count == 0
+        assert cursor.copy_expert.call_count == 9
+        # After the populated check and lifting statement_timeout: no index
+        # juggling for ten rows; one sequence reset, then ANALYZE
+        statements = executed(mock_pool)[2:]
+        assert len(statements) == 2
+        assert statements[0].count("setval(") == 9
+
+    def test_copies_sample_rows(self, mock_pool):
+        populate_sample_data()
+
+        copied = mock_pool.getconn.return_value.copied
+        terms = copied[
+            "COPY terms (id, name, start_date, end_date, created_at, updated_at) FROM STDIN"
+        ]
+        assert terms.decode().splitlines()[0].startswith("1\tFall 2024\t2024-09-01")
+        students_sql = next(sql for sql in copied if sql.startswith("COPY students "))
+        assert students_sql.endswith(
+            "program_id, created_at, updated_at, is_archived) FROM STDIN"
+        )
+        assert copied[students_sql].count(b"\n") == len(data.students)
+
+    def test_skips_populated_database(self, mock_pool):
+        cursor = mock_pool.getconn.return_value.cursor.return_value
+        cursor.fetchall.return_value = [(1,)]
+
+        assert populate_sample_data() is True
+        cursor.copy_expert.assert_not_called()
+
+    def test_failure_rolls_back(self, mock_pool, capsys):
+        cursor = mock_pool.getconn.return_value.cursor.return_value
+        cursor.copy_expert.side_effect = psycopg2.IntegrityError("duplicate key")
+
+        assert populate_sample_data() is False
+        mock_pool.getconn.return_value.rollback.assert_called_once()
+        assert "duplicate key" in capsys.readouterr().out
+
+
+class TestLoadTables:
+    def test_defer_indexes(self, mock_pool):
+        loads = [("terms", ["id", "name"], iter([(1, "Fall")]))]
+        counts = load_tables(Database(), loads, defer_indexes=True)
+
+        assert counts == {"terms": 1}
+        statements = executed(mock_pool)
+        assert statements.pop(0) == SET_STATEMENT_TIMEOUT
+        indexes = schema_indexes()
+        assert statements[: len(indexes)] == [
+            f"DROP INDEX IF EXISTS {name};" for name, _ in indexes
+        ]
+        assert statements[len(indexes) : 2 * len(indexes)] == [
+            sql for _, sql in indexes
+        ]
+        assert statements[-1] == "ANALYZE terms;"
+
+    def test_schema_indexes(self):
+        indexes = dict(schema_indexes())
+        assert indexes["idx_students_program_id"] == (
+            "CREATE INDEX IF NOT EXISTS idx_students_program_id ON students(program_id);"
+        )
+        # Built CONCURRENTLY by the migration, but inside the load transaction here
+        assert indexes["idx_enrollments_student_course"].startswith(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_enrollments_student_course"
+        )
+
+    def test_reset_sequences_query(self):
+        assert get_reset_sequences_query(["terms", "courses"]) == (
+            "SELECT setval('terms_id_seq', COALESCE((SELECT MAX(id) FROM terms), 0) + 1, false), "
+            "setval('courses_id_seq', COALESCE((SELECT MAX(id) FROM courses), 0) + 1, false);"
+        )
@@ -1,6 +1,6 @@
 import pytest
 from datetime import date
-from unittest.mock import patch
+from unittest.mock import call, patch
 from app.models import (
     instructor_db_read_all,
     instructor_db_read_by_id,
@@ -116,20 +116,20 @@ def mock_db_read_many():
 
 
 @pytest.fixture
-def mock_db_create():
-    with patch("app.services.instructor.instructor_db_insert") as mock:
+def mock_db_create_many():
+    with patch("app.services.instructor.instructor_db_insert_many") as mock:
         yield mock
 
 
 @pytest.fixture
-def mock_db_update():
-    with patch("app.services.instructor.instructor_db_update") as mock:
+def mock_db_update_many():
+    with patch("app.services.instructor.instructor_db_update_many") as mock:
         yield mock
 
 
 @pytest.fixture
-def mock_db_archive():
-    with patch("app.services.instructor.instructor_db_archive") as mock:
+def mock_db_archive_many():
+    with patch("app.services.instructor.instructor_db_archive_many") as mock:
         yield mock
 
 
@@ -172,7 +172,7 @@ class TestInstructorCreateService:
         self,
         mock_instructor_dict_to_row,
         mock_db_instance,
-        mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_instructor_create_data,
         valid_instructor_rows,
@@ -189,7 +189,7 @@ class TestInstructorCreateService:
             1,
         )
 
-        mock_db_create.side_effect = [1, 2]
+        mock_db_create_many.return_value = [1, 2]
         mock_db_read_many.return_value = valid_instructor_rows
 
         results, error, status_code = create_new_instructors(
@@ -199,14 +199,14 @@ class TestInstructorCreateService:
         assert len(results) == 2
         assert error is None
         assert status_code == 201
-        assert mock_db_create.call_count == 2
+        mock_db_create_many.assert_called_once()
         mock_db_read_many.assert_called_once_with([1, 2])
 
     def test_create_new_instructors_failure(
         self,
         mock_instructor_dict_to_row,
         mock_db_instance,
-        mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_instructor_create_data,
     ):
@@ -222,7 +222,7 @@ class TestInstructorCreateService:
             1,
         )
 
-        mock_db_create.side_effect = [None, None]
+        mock_db_create_many.return_value = []
         results, error, status_code = create_new_instructors(
             valid_instructor_create_data
         )
@@ -240,9 +240,8 @@ class TestInstructorUpdateService:
         self,
         mock_instructor_dict_to_row,
         mock_db_instance,
-        mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_instructor_update_data,
         valid_instructor_row,
     ):
@@ -258,26 +257,24 @@ class TestInstructorUpdateService:
             1,
         )
 
-        mock_db_read_one.return_value = valid_instructor_row
-
-        mock_db_update.return_value = 1
         mock_db_read_many.return_value = [valid_instructor_row]
 
+        mock_db_update_many.return_value = [1]
+
         results, error, status_code = update_instructors(valid_instructor_update_data)
 
         assert len(results) == 1
         assert error in (None, [])
         assert status_code == 200
-        assert mock_db_update.call_count == 1
-        mock_db_read_many.assert_called_once_with([1])
+        mock_db_update_many.assert_called_once()
+        assert mock_db_read_many.call_args_list == [call([1]), call([1])]
 
     def test_update_instructors_no_success(
         self,
         mock_instructor_dict_to_row,
         mock_db_instance,
-        mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_instructor_update_data,
         valid_instructor_row,
     ):
@@ -293,24 +290,23 @@ class TestInstructorUpdateService:
             1,
         )
 
-        mock_db_read_one.return_value = valid_instructor_row
+        mock_db_read_many.return_value = [valid_instructor_row]
 
-        mock_db_update.return_value = 0
+        mock_db_update_many.return_value = []
         results, error, status_code = update_instructors(valid_instructor_update_data)
 
         assert results == []
         assert error == [{"message": "Instructor ID 1 not updated."}]
         assert status_code == 400
-        mock_db_update.assert_called_once()
-        mock_db_read_many.assert_not_called()
+        mock_db_update_many.assert_called_once()
+        mock_db_read_many.assert_called_once_with([1])
 
     def test_update_instructors_missing_id(
         self,
         mock_instructor_dict_to_row,
         mock_db_instance,
-        mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         instructor_missing_id,
     ):
         results, error, status_code = update_instructors(instructor_missing_id)
@@ -318,7 +314,7 @@ class TestInstructorUpdateService:
         assert results == []
         assert error == [{"message": "Missing instructor ID for update."}]
         assert status_code == 400
-        mock_db_update.assert_not_called()
+        mock_db_update_many.assert_not_called()
         mock_db_read_many.assert_not_called()
 
 
@@ -327,44 +323,41 @@ class TestInstructorArchiveService:
     def test_archive_instructors(
         self,
         mock_db_instance,
-        mock_db_archive,
-        mock_db_read_one,
+        mock_db_archive_many,
         mock_db_read_many,
         valid_instructor_ids,
         valid_instructor_row,
     ):
-        # Mock that instructors exist
-        mock_db_read_one.return_value = valid_instructor_row
         mock_db_read_many.return_value = [
             valid_instructor_row,
             valid_instructor_row,
         ]
 
-        mock_db_archive.side_effect = [1, 1]
+        mock_db_archive_many.return_value = [1, 2]
         archived, errors, status_code = archive_instructors(valid_instructor_ids)
 
         assert len(archived) == 2
-        assert mock_db_archive.call_count == 2
+        mock_db_archive_many.assert_called_once_with([1, 2])
 
     def test_archive_instructors_none_archived(
         self,
         mock_db_instance,
-        mock_db_archive,
-        mock_db_read_one,
+        mock_db_archive_many,
         mock_db_read_many,
         valid_instructor_ids,
         valid_instructor_row,
     ):
-        # Mock that instructors exist
-        mock_db_read_one.return_value = valid_instructor_row
-
-        mock_db_archive.return_value = 0
+        mock_db_archive_many.return_value = []
         archived, errors, status_code = archive_instructors(valid_instructor_ids)
 
         assert archived == []
 
     def test_archive_instructors_invalid_ids(
-        self, mock_db_instance, mock_db_archive, mock_db_read_one, mock_db_read_many
+        self,
+        mock_db_instance,
+        mock_db_archive_many,
+        mock_db_read_one,
+        mock_db_read_many,
     ):
         results, errors, status = archive_instructors(["one", 2])
         assert status == 400
@@ -426,8 +419,8 @@ class TestInstructorModel:
 
         # The model uses PostgreSQL syntax (%s)
         query_call = mock_execute.call_args.args[0]
-        assert "IN (%s,%s)" in query_call
-        assert mock_execute.call_args.args[1] == [1, 2]
+        assert "= ANY(%s)" in query_call
+        assert mock_execute.call_args.args[1] == ([1, 2],)
 
     @patch("app.models.instructor.db.execute_query")
     def test_instructor_db_insert_success(self, mock_execute, valid_instructor_row):
@@ -0,0 +1,86 @@
+import logging
+from unittest.mock import MagicMock, patch
+from db.instrumentation import (
+    QueryEvent,
+    normalize_sql,
+    record_query,
+    add_query_listener,
+    remove_query_listener,
+)
+from app.utils import get_request_query_stats
+from app.utils.query_stats import RequestQueryStats
+
+
+class TestNormalizeSql:
+    def test_replaces_literals_and_placeholders(self):
+        sql = "SELECT * FROM students\n  WHERE status = 'active' AND id = %s LIMIT 10;"
+        assert normalize_sql(sql) == (
+            "SELECT * FROM students WHERE status = ? AND id = ? LIMIT ?;"
+        )
+
+    def test_collapses_in_lists(self):
+        assert normalize_sql("SELECT 1 WHERE id IN (%s,%s, %s)") == (
+            "SELECT ? WHERE id IN (...)"
+        )
+
+
+class TestRecordQuery:
+    def test_listeners_receive_events(self):
+        listener = MagicMock()
+        add_query_listener(listener)
+        add_query_listener(listener)
+        try:
+            event = QueryEvent("students_read_all", "SELECT 1", 0.001)
+            record_query(event)
+        finally:
+            remove_query_listener(listener)
+
+        listener.assert_called_once_with(event)
+
+    def test_slow_query_logged(self, monkeypatch, caplog):
+        monkeypatch.setenv("DB_SLOW_QUERY_MS", "10")
+        with caplog.at_level(logging.WARNING, logger="db.instrumentation"):
+            record_query(QueryEvent(None, "SELECT * FROM t WHERE id = 5", 0.02))
+
+        assert "Slow query" in caplog.text
+        assert "SELECT * FROM t WHERE id = ?" in caplog.text
+
+    def test_fast_query_not_logged(self, caplog):
+        with caplog.at_level(logging.WARNING, logger="db.instrumentation"):
+            record_query(QueryEvent(None, "SELECT 1", 0.0001))
+        assert "Slow query" not in caplog.text
+
+
+class TestRequestQueryStats:
+    def test_repeated_statements(self):
+        stats = RequestQueryStats()
+        for _ in range(3):
+            stats.add(QueryEvent("students_read_by_id", "SELECT", 0.01, 0.002, 1))
+        stats.add(QueryEvent("students_read_by_ids", "SELECT", 0.01, 0.0, 3))
+
+        assert stats.queries == 4
+        assert stats.rows == 6
+        assert round(stats.pool_wait, 3) == 0.006
+        assert stats.repeated(3) == {"students_read_by_id": 3}
+
+    def test_stats_collected_per_request(self, client):
+        client.get("/students")
+
+        stats = get_request_query_stats()
+        assert stats.queries == 1
+        assert stats.statements == {"students_read_all": 1}
+
+    def test_repeated_statements_warning(self, client, monkeypatch, caplog):
+        monkeypatch.setenv("DB_REPEATED_QUERY_WARN", "2")
+        # A failed batch insert falls back to one INSERT per item
+        with (
+            patch(
+                "app.services.student.student_db_insert_many",
+                side_effect=ValueError("Integrity error"),
+            ),
+            caplog.at_level(logging.WARNING, logger="app.utils.query_stats"),
+        ):
+            client.post("/students", json=[{"first_name": "A"}] * 3)
+
+        assert "repeated statements" in caplog.text
+        assert "students_insert" in caplog.text
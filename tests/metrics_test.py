@@ -0,0 +1,65 @@
+from unittest.mock import patch
+from prometheus_client import REGISTRY
+from db.instrumentation import QueryEvent, record_query
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class TestMetricsRoute:
+    def test_metrics_endpoint(self, client):
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.content_type.startswith("text/plain")
+        body = response.get_data(as_text=True)
+        assert "http_request_duration_seconds" in body
+        assert "db_pool_connections" in body
+
+    @patch("app.routes.student.get_all_students")
+    def test_request_metrics_recorded(self, mock_get_all, client):
+        mock_get_all.return_value = []
+        labels = {
+            "blueprint": "student",
+            "endpoint": "student.handle_read_all_students",
+            "method": "GET",
+            "status": "200",
+        }
+        before = sample("http_requests_total", **labels)
+
+        client.get("/students")
+
+        assert sample("http_requests_total", **labels) == before + 1
+        assert sample("http_request_duration_seconds_count", **labels) == before + 1
+
+    def test_metrics_endpoint_not_counted(self, client):
+        client.get("/metrics")
+        assert (
+            sample(
+                "http_requests_total",
+                blueprint="metrics",
+                endpoint="metrics.metrics",
+                method="GET",
+                status="200",
+            )
+            == 0
+        )
+
+
+class TestQueryMetrics:
+    def test_query_events_recorded(self, client):
+        before_hits = sample("db_statement_cache_total", result="hit")
+        before_queries = sample(
+            "db_query_duration_seconds_count", statement="students_read_all"
+        )
+
+        record_query(
+            QueryEvent("students_read_all", "SELECT", 0.002, 0.001, 5, cache="hit")
+        )
+
+        assert sample("db_statement_cache_total", result="hit") == before_hits + 1
+        assert (
+            sample("db_query_duration_seconds_count", statement="students_read_all")
+            == before_queries + 1
+        )
@@ -0,0 +1,222 @@
+import pytest
+from unittest.mock import MagicMock, patch
+import psycopg2
+from db.database import Database
+from db.db_utils import split_sql_statements
+from db.migrate import (
+    INSERT_APPLIED,
+    MigrationError,
+    Migrator,
+    load_migrations,
+    main,
+)
+
+
+@pytest.fixture
+def migrations_dir(tmp_path):
+    (tmp_path / "0001_tables.sql").write_text(
+        "CREATE TABLE a (id SERIAL PRIMARY KEY);\nCREATE TABLE b (id INTEGER);\n"
+    )
+    (tmp_path / "0002_indexes.sql").write_text(
+        "-- migrate: no-transaction\n"
+        "DROP INDEX CONCURRENTLY IF EXISTS idx_b_id;\n"
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_b_id ON b (id);\n"
+    )
+    (tmp_path / "README.md").write_text("not a migration")
+    return tmp_path
+
+
+@pytest.fixture
+def conn():
+    conn = MagicMock(closed=0)
+    conn.autocommit = False
+    cursor = conn.cursor.return_value
+    cursor.fetchone.return_value = (None,)  # no schema_migrations table yet
+    cursor.fetchall.return_value = []
+    pool = MagicMock()
+    pool.getconn.return_value = conn
+    with (
+        patch.object(Database, "_db_config", {"database": "test"}),
+        patch.object(Database, "_pool", pool),
+    ):
+        yield conn
+
+
+def executed(conn):
+    return [call.args[0] for call in conn.cursor.return_value.execute.call_args_list]
+
+
+def migrator(migrations_dir):
+    return Migrator(Database(), migrations_dir, lock_timeout="3s", out=lambda _: None)
+
+
+class TestLoadMigrations:
+    def test_ordered_by_version(self, migrations_dir):
+        (migrations_dir / "0010_later.sql").write_text("SELECT 1;")
+        migrations = load_migrations(migrations_dir)
+
+        assert [m.version for m in migrations] == [1, 2, 10]
+        assert [m.transactional for m in migrations] == [True, False, True]
+        assert migrations[1].statements[1].startswith("CREATE INDEX CONCURRENTLY")
+
+    def test_repository_migrations(self):
+        migrations = load_migrations()
+        assert migrations[0].filename == "0001_initial_schema.sql"
+        assert len({m.version for m in migrations}) == len(migrations)
+
+    def test_concurrently_requires_no_transaction(self, tmp_path):
+        (tmp_path / "0001_index.sql").write_text(
+            "CREATE INDEX CONCURRENTLY idx ON b (id);"
+        )
+        with pytest.raises(MigrationError, match="no-transaction"):
+            load_migrations(tmp_path)
+
+    @pytest.mark.parametrize("filename", ["initial.sql", "01-initial.sql"])
+    def test_bad_filename(self, tmp_path, filename):
+        (tmp_path / filename).write_text("SELECT 1;")
+        with pytest.raises(MigrationError, match="<version>_<name>.sql"):
+            load_migrations(tmp_path)
+
+    def test_duplicate_version(self, migrations_dir):
+        (migrations_dir / "02_other.sql").write_text("SELECT 1;")
+        with pytest.raises(MigrationError, match="already used by 0002_indexes.sql"):
+            load_migrations(migrations_dir)
+
+
+class TestMigrator:
+    def test_applies_pending_migrations(self, conn, migrations_dir):
+        applied = migrator(migrations_dir).migrate()
+
+        assert [m.version for m in applied] == [1, 2]
+        statements = executed(conn)
+        assert statements[0] == "SET statement_timeout = 0;"
+        assert (
+            statements[1]
+            .strip()
+            .startswith("CREATE TABLE IF NOT EXISTS schema_migrations")
+        )
+        assert statements[2] == "SELECT pg_advisory_lock(%s);"
+        assert "CREATE TABLE a (id SERIAL PRIMARY KEY)" in statements
+        assert (
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_b_id ON b (id)" in statements
+        )
+        assert statements[-2:] == [
+            "SELECT pg_advisory_unlock(%s);",
+            "RESET statement_timeout;",
+        ]
+        assert conn.autocommit is False
+
+    def test_transaction_modes(self, conn, migrations_dir):
+        calls = []
+        conn.cursor.return_value.execute.side_effect = lambda sql, *args: calls.append(
+            (sql, conn.autocommit)
+        )
+        migrator(migrations_dir).migrate()
+
+        # Leading comments stay attached to the first statement of a file
+        modes = {sql.splitlines()[-1]: autocommit for sql, autocommit in calls}
+        assert modes["SET LOCAL lock_timeout = %s;"] is False
+        assert modes["CREATE TABLE b (id INTEGER)"] is False
+        assert modes["SET lock_timeout = %s;"] is True
+        assert modes["DROP INDEX CONCURRENTLY IF EXISTS idx_b_id"] is True
+        assert [sql for sql, _ in calls].count(INSERT_APPLIED) == 2
+
+    def test_skips_applied(self, conn, migrations_dir):
+        first = load_migrations(migrations_dir)[0]
+        cursor = conn.cursor.return_value
+        cursor.fetchone.return_value = ("schema_migrations",)
+        cursor.fetchall.return_value = [(1, first.checksum)]
+
+        applied = migrator(migrations_dir).migrate()
+
+        assert [m.version for m in applied] == [2]
+        assert "CREATE TABLE a (id SERIAL PRIMARY KEY)" not in executed(conn)
+
+    def test_target(self, conn, migrations_dir):
+        applied = migrator(migrations_dir).migrate(target=1)
+        assert [m.version for m in applied] == [1]
+
+    def test_changed_migration_is_an_error(self, conn, migrations_dir):
+        cursor = conn.cursor.return_value
+        cursor.fetchone.return_value = ("schema_migrations",)
+        cursor.fetchall.return_value = [(1, "edited")]
+
+        with pytest.raises(MigrationError, match="0001_tables.sql"):
+            migrator(migrations_dir).migrate()
+
+    def test_dry_run_writes_nothing(self, conn, migrations_dir):
+        lines = []
+        runner = Migrator(Database(), migrations_dir, out=lines.append)
+
+        pending = runner.migrate(dry_run=True)
+
+        assert len(pending) == 2
+        assert executed(conn) == ["SELECT to_regclass('schema_migrations');"]
+        assert "-- 0002_indexes.sql (no transaction)" in lines
+        assert "CREATE TABLE b (id INTEGER);" in lines
+
+    def test_failed_migration_rolls_back(self, conn, migrations_dir):
+        def execute(sql, *args):
+            if sql.startswith("CREATE TABLE b"):
+                raise psycopg2.errors.LockNotAvailable("lock timeout")
+
+        conn.cursor.return_value.execute.side_effect = execute
+
+        with pytest.raises(
+            MigrationError, match="0001_tables.sql failed and was rolled back"
+        ):
+            migrator(migrations_dir).migrate()
+        conn.rollback.assert_called_once()
+
+    def test_failed_statement_without_transaction(self, conn, migrations_dir):
+        def execute(sql, *args):
+            if sql.startswith("CREATE INDEX"):
+                raise psycopg2.errors.LockNotAvailable("lock timeout")
+
+        conn.cursor.return_value.execute.side_effect = execute
+
+        with pytest.raises(MigrationError, match="statement 2 of 2"):
+            migrator(migrations_dir).migrate()
+        assert conn.autocommit is False
+
+    def test_status(self, conn, migrations_dir):
+        first = load_migrations(migrations_dir)[0]
+        cursor = conn.cursor.return_value
+        cursor.fetchone.return_value = ("schema_migrations",)
+        cursor.fetchall.return_value = [(1, first.checksum)]
+
+        states = [(m.version, state) for m, state in migrator(migrations_dir).status()]
+        assert states == [(1, "applied"), (2, "pending")]
+
+    def test_refuses_transaction_pooling(self, conn, migrations_dir, monkeypatch):
+        monkeypatch.setenv("DB_POOL_MODE", "transaction")
+        with pytest.raises(MigrationError, match="DB_POOL_MODE"):
+            migrator(migrations_dir).migrate()
+        assert executed(conn) == []
+
+    def test_cli_reports_failure(self, conn, capsys):
+        conn.cursor.return_value.fetchone.side_effect = psycopg2.OperationalError(
+            "down"
+        )
+        assert main(["--dry-run"]) == 1
+        assert "Migration failed: down" in capsys.readouterr().out
+
+
+class TestSplitSqlStatements:
+    def test_splits_on_top_level_semicolons(self):
+        script = """
+        -- leading comment; with a semicolon
+        CREATE TABLE t (note TEXT DEFAULT 'a;b');
+        /* block; comment */
+        CREATE FUNCTION f() RETURNS int AS $body$ SELECT 1; $body$ LANGUAGE sql;
+        INSERT INTO "odd;name" VALUES (1)
+        """
+        statements = split_sql_statements(script)
+
+        assert len(statements) == 3
+        assert statements[0].endswith("CREATE TABLE t (note TEXT DEFAULT 'a;b')")
+        assert "$body$ SELECT 1; $body$" in statements[1]
+        assert statements[2] == 'INSERT INTO "odd;name" VALUES (1)'
+
+    def test_comment_only_fragments_are_dropped(self):
+        assert split_sql_statements("-- nothing here;\n;  ;") == []
@@ -0,0 +1,166 @@
+"""
+DB_POOL_MODE=transaction, for running behind PgBouncer in transaction mode.
+
+The concurrency tests run Database from many threads against
+TEST_DATABASE_URL through tests.fake_pool.TransactionPooler, and through a
+real PgBouncer in front of the same database when PGBOUNCER_DATABASE_URL
+is set (docker compose --profile pgbouncer up; see README.md).
+"""
+
+import os
+import threading
+from contextlib import ExitStack, closing
+import psycopg2
+import pytest
+from db import deadlines
+from db.database import Database
+from db.deadlines import SET_STATEMENT_TIMEOUT
+from db.instrumentation import add_query_listener, remove_query_listener
+from db.statements import FETCH_ALL, FETCH_NONE, Statement
+from tests.fake_pool import ListPool, TransactionPooler, connection, installed
+
+READ = Statement("pgbouncer_read", "SELECT id FROM things WHERE id = %s;", FETCH_ALL)
+ECHO = Statement(
+    "pgbouncer_echo", "SELECT %s::int AS n, pg_backend_pid() AS pid;", FETCH_ALL
+)
+HIT = Statement(
+    "pgbouncer_hit", "INSERT INTO pgbouncer_test_hits (worker) VALUES (%s);", FETCH_NONE
+)
+PREPARED = Statement(
+    "pgbouncer_prepared",
+    "SELECT count(*) AS prepared FROM pg_prepared_statements;",
+    FETCH_ALL,
+)
+
+WORKERS = 16
+ROUNDS = 25
+
+
+@pytest.fixture
+def transaction_pooling(monkeypatch):
+    monkeypatch.setenv("DB_POOL_MODE", "transaction")
+
+
+class TestTransactionPoolingMode:
+    def test_statements_are_not_prepared(self, transaction_pooling):
+        conn = connection(rows=[(1,)])
+        events = []
+        add_query_listener(events.append)
+        try:
+            with installed(ListPool(conn)):
+                assert Database().execute_query(READ, (1,)) == [{"id": 1}]
+        finally:
+            remove_query_listener(events.append)
+
+        executed = [call.args for call in conn.cursor.return_value.execute.mock_calls]
+        # One round trip: the default statement_timeout comes from the role
+        assert executed == [(READ, (1,))]
+        assert events[0].cache is None
+
+    def test_deadline_is_set_with_the_transaction(self, transaction_pooling):
+        conn = connection(rows=[(1,)])
+        token = deadlines.begin(30)
+        try:
+            with installed(ListPool(conn)):
+                Database().execute_query(READ, (1,))
+        finally:
+            deadlines.end(token)
+
+        executed = [call.args for call in conn.cursor.return_value.execute.mock_calls]
+        assert [sql for sql, _ in executed] == [SET_STATEMENT_TIMEOUT, READ]
+
+
+def run_workers(clients):
+    """
+    WORKERS threads, all starting at once, each running ROUNDS reads and
+    writes through Database on a pool of the given client connections.
+    Returns the errors and the backend PIDs that served the reads.
+    """
+    errors = []
+    pids = set()
+    start = threading.Barrier(WORKERS)
+
+    def work(worker):
+        try:
+            start.wait()
+            for n in range(ROUNDS):
+                [row] = Database().execute_query(ECHO, (n,))
+                assert row["n"] == n
+                pids.add(row["pid"])
+                Database().execute_query(HIT, (worker,))
+                [state] = Database().execute_query(PREPARED)
+                assert state["prepared"] == 0
+        except Exception as e:
+            errors.append(e)
+
+    with installed(ListPool(*clients)):
+        threads = [
+            threading.Thread(target=work, args=(worker,)) for worker in range(WORKERS)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    return errors, pids
+
+
+class TestConcurrency:
+    @pytest.fixture
+    def hits(self):
+        """Connection to the database behind the pooler, with an empty hits table."""
+        url = os.getenv("TEST_DATABASE_URL")
+        if not url:
+            pytest.skip("TEST_DATABASE_URL is not set")
+        admin = psycopg2.connect(url)
+        admin.autocommit = True
+        with admin.cursor() as cursor:
+            cursor.execute("DROP TABLE IF EXISTS pgbouncer_test_hits;")
+            cursor.execute("CREATE TABLE pgbouncer_test_hits (worker INTEGER);")
+        yield admin
+        with admin.cursor() as cursor:
+            cursor.execute("DROP TABLE pgbouncer_test_hits;")
+        admin.close()
+
+    def count_hits(self, admin):
+        with admin.cursor() as cursor:
+            cursor.execute(
+                "SELECT count(*), count(DISTINCT worker) FROM pgbouncer_test_hits;"
+            )
+            return cursor.fetchone()
+
+    @pytest.fixture
+    def pooler(self, hits):
+        pooler = TransactionPooler(os.getenv("TEST_DATABASE_URL"), servers=4)
+        yield pooler
+        pooler.closeall()
+
+    def test_many_workers_behind_transaction_pooler(
+        self, transaction_pooling, hits, pooler
+    ):
+        errors, pids = run_workers([pooler.client() for _ in range(WORKERS)])
+
+        assert errors == []
+        assert self.count_hits(hits) == (WORKERS * ROUNDS, WORKERS)
+        # Transactions really did move between server connections
+        assert len(pids) > 1
+
+    def test_prepared_statements_break_behind_transaction_pooler(self, pooler):
+        with installed(ListPool(pooler.client())):
+            Database().execute_query(ECHO, (1,))
+            # PREPAREd on one server connection, EXECUTEd on the next
+            with pytest.raises(RuntimeError, match="does not exist"):
+                Database().execute_query(ECHO, (2,))
+
+    def test_many_workers_behind_pgbouncer(self, transaction_pooling, hits):
+        url = os.getenv("PGBOUNCER_DATABASE_URL")
+        if not url:
+            pytest.skip("PGBOUNCER_DATABASE_URL is not set")
+        with ExitStack() as stack:
+            clients = [
+                stack.enter_context(closing(psycopg2.connect(url)))
+                for _ in range(WORKERS)
+            ]
+            errors, _ = run_workers(clients)
+
+        assert errors == []
+        assert self.count_hits(hits) == (WORKERS * ROUNDS, WORKERS)
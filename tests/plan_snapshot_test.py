@@ -0,0 +1,112 @@
+import json
+import os
+from pathlib import Path
+import pytest
+import app.models  # noqa: F401 - declares the statement catalog
+from db.statements import all_statements
+from tests.explain import generic_plan, plan_nodes, plan_shape
+
+SNAPSHOTS = Path(__file__).with_name("plan_snapshots.json")
+
+# UPDATE_PLAN_SNAPSHOTS=1 (make plans) records the current plans instead of
+# comparing against them
+UPDATE = os.getenv("UPDATE_PLAN_SNAPSHOTS") == "1"
+
+STATEMENTS = all_statements()
+
+# Listings read the whole table (or every live row) by design
+LOOKUPS = [
+    s for s in STATEMENTS if not s.name.endswith(("_read_all", "_read_all_active"))
+]
+
+# Tables with at least this many rows must never be scanned by a lookup
+LARGE_TABLE_ROWS = 1000
+
+# A nested loop runs its inner side once per outer row
+NESTED_LOOP_MAX_OUTER_ROWS = 1000
+
+# Row estimates may drift by this factor between ANALYZE runs
+ROWS_TOLERANCE = 2
+
+
+@pytest.fixture(scope="module")
+def pg16(pg):
+    if pg.server_version < 160000:
+        pytest.skip("EXPLAIN (GENERIC_PLAN) needs PostgreSQL 16 or later")
+    return pg
+
+
+@pytest.fixture(scope="module")
+def snapshots():
+    recorded = json.loads(SNAPSHOTS.read_text()) if SNAPSHOTS.exists() else {}
+    yield recorded
+    if UPDATE:
+        # Catalog order keeps the diff of a re-recording readable
+        ordered = {s.name: recorded[s.name] for s in STATEMENTS if s.name in recorded}
+        SNAPSHOTS.write_text(json.dumps(ordered, indent=2) + "\n")
+
+
+@pytest.fixture(scope="module")
+def large_tables(pg16):
+    with pg16.cursor() as cursor:
+        cursor.execute(
+            "SELECT relname FROM pg_class WHERE relkind = 'r'"
+            " AND relnamespace = current_schema()::regnamespace"
+            " AND reltuples >= %s;",
+            (LARGE_TABLE_ROWS,),
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+
+def rows_close(actual, expected):
+    low, high = sorted((actual, expected))
+    return high + 1 <= (low + 1) * ROWS_TOLERANCE
+
+
+class TestPlanSnapshots:
+    @pytest.mark.parametrize("statement", STATEMENTS, ids=lambda s: s.name)
+    def test_matches_snapshot(self, pg16, snapshots, statement):
+        plan = generic_plan(pg16, statement)
+        current = {
+            "plan": plan_shape(plan),
+            "rows": [node["Plan Rows"] for node in plan_nodes(plan)],
+        }
+        if UPDATE:
+            snapshots[statement.name] = current
+            return
+
+        expected = snapshots.get(statement.name)
+        if expected is None:
+            pytest.fail(
+                f"No plan snapshot for {statement.name}, record it with make plans"
+            )
+        assert current["plan"] == expected["plan"]
+        for line, actual, recorded in zip(
+            current["plan"], current["rows"], expected["rows"]
+        ):
+            assert rows_close(actual, recorded), (
+                f"{line.strip()}: estimated {actual} rows, snapshot has {recorded}"
+            )
+
+    def test_no_stale_snapshots(self, snapshots):
+        if UPDATE:
+            pytest.skip("stale snapshots are dropped while recording")
+        assert not set(snapshots) - {s.name for s in STATEMENTS}
+
+
+class TestPlanShape:
+    @pytest.mark.parametrize("statement", LOOKUPS, ids=lambda s: s.name)
+    def test_lookup_does_not_scan_large_tables(self, pg16, large_tables, statement):
+        scanned = {
+            node["Relation Name"]
+            for node in plan_nodes(generic_plan(pg16, statement))
+            if node["Node Type"] == "Seq Scan"
+        }
+        assert not scanned & large_tables
+
+    @pytest.mark.parametrize("statement", STATEMENTS, ids=lambda s: s.name)
+    def test_nested_loops_stay_small(self, pg16, statement):
+        for node in plan_nodes(generic_plan(pg16, statement)):
+            if node["Node Type"] == "Nested Loop":
+                outer_rows = node["Plans"][0]["Plan Rows"]
+                assert outer_rows <= NESTED_LOOP_MAX_OUTER_ROWS, plan_shape(node)
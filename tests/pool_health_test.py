@@ -0,0 +1,174 @@
+import os
+import time
+from contextlib import ExitStack
+import psycopg2
+import pytest
+from db.database import Database, _retry_delay
+from db.instrumentation import add_query_listener, remove_query_listener
+from db.statements import FETCH_ALL, FETCH_NONE, Statement
+from tests.fake_pool import ConnectingPool, ListPool, connection, installed
+
+READ = Statement("pool_health_read", "SELECT id FROM things WHERE id = %s;", FETCH_ALL)
+WRITE = Statement(
+    "pool_health_write", "UPDATE things SET a = 1 WHERE id = %s;", FETCH_NONE
+)
+BACKEND_PID = Statement(
+    "pool_health_backend_pid", "SELECT pg_backend_pid();", FETCH_ALL
+)
+
+
+@pytest.fixture
+def use_pool(monkeypatch):
+    """Install a pool (and fresh idle times) on Database for the test."""
+    monkeypatch.setenv("DB_RETRY_BACKOFF_MS", "0")
+    with ExitStack() as stack:
+        yield lambda pool: stack.enter_context(installed(pool))
+
+
+@pytest.fixture
+def events():
+    recorded = []
+    add_query_listener(recorded.append)
+    yield recorded
+    remove_query_listener(recorded.append)
+
+
+class TestCheckout:
+    def test_recently_used_connection_is_not_checked(self, use_pool):
+        conn = connection(rows=[(1,)])
+        use_pool(ListPool(conn))
+        Database().execute_query(READ, (1,))
+        Database().execute_query(READ, (1,))
+
+        conn.cursor.return_value.__enter__.assert_not_called()
+
+    def test_idle_connection_is_checked(self, use_pool, monkeypatch):
+        monkeypatch.setenv("DB_POOL_CHECK_AFTER", "0")
+        conn = connection(rows=[(1,)])
+        use_pool(ListPool(conn))
+        Database().execute_query(READ, (1,))
+        Database().execute_query(READ, (1,))
+
+        check = conn.cursor.return_value.__enter__.return_value
+        check.execute.assert_called_once_with("SELECT 1;")
+        assert conn.autocommit is False
+
+    def test_dead_idle_connection_is_replaced(self, use_pool, monkeypatch, events):
+        monkeypatch.setenv("DB_POOL_CHECK_AFTER", "0")
+        dead, fresh = connection(), connection(rows=[(1,)])
+        dead.cursor.return_value.__enter__.return_value.execute.side_effect = (
+            psycopg2.OperationalError("server closed the connection unexpectedly")
+        )
+        pool = use_pool(ListPool(dead, fresh))
+        Database._idle_since[dead] = time.monotonic()
+
+        assert Database().execute_query(READ, (1,)) == [{"id": 1}]
+        assert pool.returned == [(dead, True), (fresh, False)]
+        assert [event.error for event in events] == [None]
+
+    def test_closed_connection_is_replaced(self, use_pool):
+        closed, fresh = connection(), connection(rows=[(1,)])
+        closed.closed = 1
+        pool = use_pool(ListPool(closed, fresh))
+        Database._idle_since[closed] = time.monotonic()
+
+        assert Database().execute_query(READ, (1,)) == [{"id": 1}]
+        assert pool.returned[0] == (closed, True)
+
+
+class TestEviction:
+    def test_broken_connection_is_not_returned(self, use_pool):
+        conn = connection(lost=psycopg2.OperationalError("terminating connection"))
+        pool = use_pool(ListPool(conn))
+
+        with pytest.raises(RuntimeError, match="terminating connection"):
+            Database().execute_query(WRITE, (1,))
+        assert pool.returned == [(conn, True)]
+        conn.commit.assert_not_called()
+
+
+class TestReadRetry:
+    def test_read_is_retried_on_fresh_connection(self, use_pool, events):
+        lost = psycopg2.OperationalError("server closed the connection unexpectedly")
+        broken, fresh = connection(lost=lost), connection(rows=[(1,)])
+        pool = use_pool(ListPool(broken, fresh))
+
+        assert Database().execute_query(READ, (1,)) == [{"id": 1}]
+        assert pool.returned == [(broken, True), (fresh, False)]
+        assert [event.error for event in events] == [lost, None]
+
+    def test_retries_are_bounded(self, use_pool, monkeypatch):
+        monkeypatch.setenv("DB_READ_RETRIES", "2")
+        lost = psycopg2.OperationalError("server closed the connection unexpectedly")
+        pool = use_pool(ListPool(*(connection(lost=lost) for _ in range(4))))
+
+        with pytest.raises(RuntimeError, match="server closed"):
+            Database().execute_query(READ, (1,))
+        assert len(pool.returned) == 3
+        assert len(pool.idle) == 1
+
+    def test_writes_are_not_retried(self, use_pool):
+        lost = psycopg2.OperationalError("server closed the connection unexpectedly")
+        pool = use_pool(ListPool(connection(lost=lost), connection()))
+
+        with pytest.raises(RuntimeError):
+            Database().execute_query(WRITE, (1,))
+        assert len(pool.idle) == 1
+
+    def test_query_errors_are_not_retried(self, use_pool):
+        canceled = psycopg2.extensions.QueryCanceledError("statement timeout")
+        pool = use_pool(ListPool(connection(error=canceled), connection()))
+
+        with pytest.raises(RuntimeError, match="statement timeout"):
+            Database().execute_query(READ, (1,))
+        assert len(pool.idle) == 2
+
+    def test_data_errors_are_value_errors(self, use_pool):
+        invalid = psycopg2.DataError("value too long for type character varying(5)")
+        pool = use_pool(ListPool(connection(error=invalid), connection()))
+
+        with pytest.raises(ValueError, match="Invalid data: value too long"):
+            Database().execute_query(WRITE, (1,))
+        assert len(pool.idle) == 2
+
+    def test_retry_delay_is_jittered(self, monkeypatch):
+        monkeypatch.setenv("DB_RETRY_BACKOFF_MS", "100")
+        delays = [_retry_delay(2) for _ in range(200)]
+
+        assert all(0 <= delay <= 0.4 for delay in delays)
+        assert len(set(delays)) > 100
+
+
+class TestOnPostgres:
+    @pytest.fixture
+    def real_pool(self, use_pool):
+        url = os.getenv("TEST_DATABASE_URL")
+        if not url:
+            pytest.skip("TEST_DATABASE_URL is not set")
+        pool = use_pool(ConnectingPool(url))
+        admin = psycopg2.connect(url)
+        admin.autocommit = True
+        yield admin
+        admin.close()
+        pool.closeall()
+
+    def terminate(self, admin, pid):
+        with admin.cursor() as cursor:
+            # Waits (up to 5 s) until the backend has exited
+            cursor.execute("SELECT pg_terminate_backend(%s, 5000);", (pid,))
+
+    def test_read_survives_terminated_connection(self, real_pool):
+        [before] = Database().execute_query(BACKEND_PID)
+        self.terminate(real_pool, before["pg_backend_pid"])
+
+        [after] = Database().execute_query(BACKEND_PID)
+        assert after["pg_backend_pid"] != before["pg_backend_pid"]
+
+    def test_checkout_replaces_terminated_connection(self, real_pool, monkeypatch):
+        monkeypatch.setenv("DB_POOL_CHECK_AFTER", "0")
+        monkeypatch.setenv("DB_READ_RETRIES", "0")
+        [before] = Database().execute_query(BACKEND_PID)
+        self.terminate(real_pool, before["pg_backend_pid"])
+
+        [after] = Database().execute_query(BACKEND_PID)
+        assert after["pg_backend_pid"] != before["pg_backend_pid"]
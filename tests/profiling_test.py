@@ -0,0 +1,145 @@
+import os
+import threading
+import time
+import pytest
+from flask import Flask
+from app.utils import init_request_profiler, sample_stacks, format_collapsed
+
+ADMIN = {"X-Admin-Token": "secret"}
+
+
+@pytest.fixture
+def admin_token(monkeypatch):
+    monkeypatch.setenv("ADMIN_TOKEN", "secret")
+
+
+class TestRequestProfiler:
+    def test_profile_header_ignored_without_token(self, client, admin_token):
+        response = client.get("/", headers={"X-Profile": "1"})
+
+        assert response.status_code == 200
+        assert response.is_json
+
+    def test_profile_returns_pstats(self, client, admin_token):
+        response = client.get("/", headers={"X-Profile": "1", **ADMIN})
+
+        assert response.status_code == 200
+        assert response.content_type.startswith("text/plain")
+        assert "function calls" in response.get_data(as_text=True)
+
+    def test_profile_stored_in_profile_dir(
+        self, client, admin_token, monkeypatch, tmp_path
+    ):
+        monkeypatch.setenv("PROFILE_DIR", str(tmp_path))
+        response = client.get("/", headers={"X-Profile": "1", **ADMIN})
+
+        assert response.is_json
+        path = response.headers["X-Profile-File"]
+        assert os.path.dirname(path) == str(tmp_path)
+        assert os.path.getsize(path) > 0
+
+
+@pytest.fixture
+def slow_app(admin_token):
+    """App whose /slow route holds the request until the returned event is set."""
+    app = Flask(__name__)
+    init_request_profiler(app)
+    entered = threading.Event()
+    release = threading.Event()
+
+    @app.route("/slow")
+    def slow():
+        entered.set()
+        release.wait(5)
+        return "ok"
+
+    @app.route("/fail")
+    def fail():
+        raise RuntimeError("boom")
+
+    return app, entered, release
+
+
+class TestOverlappingProfiles:
+    def test_second_profiled_request_is_a_409(self, slow_app):
+        app, entered, release = slow_app
+        first = {}
+
+        def profiled():
+            first["response"] = app.test_client().get(
+                "/slow", headers={"X-Profile": "1", **ADMIN}
+            )
+
+        thread = threading.Thread(target=profiled)
+        thread.start()
+        try:
+            assert entered.wait(5)
+            second = app.test_client().get("/slow", headers={"X-Profile": "1", **ADMIN})
+            assert second.status_code == 409
+            # Unprofiled requests are not held up
+            assert app.test_client().get("/slow").status_code == 200
+        finally:
+            release.set()
+            thread.join()
+
+        assert first["response"].status_code == 200
+        assert "function calls" in first["response"].get_data(as_text=True)
+        # Once the first finishes, the next profiled request runs
+        again = app.test_client().get("/slow", headers={"X-Profile": "1", **ADMIN})
+        assert again.status_code == 200
+
+    def test_failed_request_frees_the_profiler(self, slow_app):
+        app, _, release = slow_app
+        release.set()
+        client = app.test_client()
+
+        assert (
+            client.get("/fail", headers={"X-Profile": "1", **ADMIN}).status_code == 500
+        )
+        assert (
+            client.get("/slow", headers={"X-Profile": "1", **ADMIN}).status_code == 200
+        )
+
+
+class TestSamplingProfiler:
+    def test_sample_stacks_sees_other_threads(self):
+        stop = threading.Event()
+
+        def busy_worker():
+            while not stop.is_set():
+                time.sleep(0.001)
+
+        worker = threading.Thread(target=busy_worker, name="busy")
+        worker.start()
+        try:
+            stacks = sample_stacks(0.05, interval=0.001)
+        finally:
+            stop.set()
+            worker.join()
+
+        output = format_collapsed(stacks)
+        assert any(line.startswith("busy;") for line in output.splitlines())
+        assert "busy_worker" in output
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in output.splitlines())
+
+    def test_profile_endpoint_requires_token(self, client, admin_token):
+        response = client.get("/debug/profile?seconds=0.01")
+        assert response.status_code == 403
+
+    def test_profile_endpoint_disabled_without_admin_token(self, client):
+        response = client.get("/debug/profile?seconds=0.01", headers=ADMIN)
+        assert response.status_code == 403
+
+    def test_profile_endpoint_validates_seconds(self, client, admin_token):
+        response = client.get("/debug/profile?seconds=1000", headers=ADMIN)
+        assert response.status_code == 400
+
+    def test_profile_endpoint(self, client, admin_token, monkeypatch, tmp_path):
+        monkeypatch.setenv("PROFILE_DIR", str(tmp_path))
+        response = client.get(
+            "/debug/profile?seconds=0.02&interval_ms=1", headers=ADMIN
+        )
+
+        assert response.status_code == 200
+        assert response.content_type.startswith("text/plain")
+        assert os.path.exists(response.headers["X-Profile-File"])
@@ -1,6 +1,6 @@
 import pytest
 from datetime import date
-from unittest.mock import patch
+from unittest.mock import call, patch
 from app.models import (
     program_db_read_all,
     program_db_read_by_id,
@@ -109,20 +109,20 @@ def mock_db_read_many():
 
 
 @pytest.fixture
-def mock_db_create():
-    with patch("app.services.program.program_db_insert") as mock:
+def mock_db_create_many():
+    with patch("app.services.program.program_db_insert_many") as mock:
         yield mock
 
 
 @pytest.fixture
-def mock_db_update():
-    with patch("app.services.program.program_db_update") as mock:
+def mock_db_update_many():
+    with patch("app.services.program.program_db_update_many") as mock:
         yield mock
 
 
 @pytest.fixture
-def mock_db_archive():
-    with patch("app.services.program.program_db_archive") as mock:
+def mock_db_archive_many():
+    with patch("app.services.program.program_db_archive_many") as mock:
         yield mock
 
 
@@ -165,7 +165,7 @@ class TestProgramCreateService:
         self,
         mock_program_dict_to_row,
         mock_db_instance,
-        mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_program_create_data,
         valid_program_rows,
@@ -173,7 +173,7 @@ class TestProgramCreateService:
         # Mock the program_dict_to_row function
         mock_program_dict_to_row.return_value = ("Computer Science", "bachelor", 1)
 
-        mock_db_create.side_effect = [1, 2]
+        mock_db_create_many.return_value = [1, 2]
         mock_db_read_many.return_value = valid_program_rows
 
         results, error, status_code = create_new_programs(valid_program_create_data)
@@ -181,21 +181,21 @@ class TestProgramCreateService:
         assert len(results) == 2
         assert error is None
         assert status_code == 201
-        assert mock_db_create.call_count == 2
+        mock_db_create_many.assert_called_once()
         mock_db_read_many.assert_called_once_with([1, 2])
 
     def test_create_new_programs_failure(
         self,
         mock_program_dict_to_row,
         mock_db_instance,
-        mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_program_create_data,
     ):
         # Mock the program_dict_to_row function
         mock_program_dict_to_row.return_value = ("Computer Science", "bachelor", 1)
 
-        mock_db_create.side_effect = [None, None]
+        mock_db_create_many.return_value = []
         results, error, status_code = create_new_programs(valid_program_create_data)
 
         assert results == []
@@ -211,8 +211,7 @@ class TestProgramUpdateService:
         self,
         mock_program_dict_to_row,
         mock_db_instance,
-        mock_db_update,
-        mock_db_read_one,
+        mock_db_update_many,
         mock_db_read_many,
         valid_program_update_data,
         valid_program_row,
@@ -220,25 +219,23 @@ class TestProgramUpdateService:
         # Mock the program_dict_to_row function
         mock_program_dict_to_row.return_value = ("Computer Science", "bachelor", 1)
 
-        mock_db_read_one.return_value = valid_program_row
-
-        mock_db_update.return_value = 1
         mock_db_read_many.return_value = [valid_program_row]
 
+        mock_db_update_many.return_value = [1]
+
         results, error, status_code = update_programs(valid_program_update_data)
 
         assert len(results) == 1
         assert error in (None, [])
         assert status_code == 200
-        assert mock_db_update.call_count == 1
-        mock_db_read_many.assert_called_once_with([1])
+        mock_db_update_many.assert_called_once()
+        assert mock_db_read_many.call_args_list == [call([1]), call([1])]
 
     def test_update_programs_no_success(
         self,
         mock_program_dict_to_row,
         mock_db_instance,
-        mock_db_update,
-        mock_db_read_one,
+        mock_db_update_many,
         mock_db_read_many,
         valid_program_update_data,
         valid_program_row,
@@ -246,23 +243,22 @@ class TestProgramUpdateService:
         # Mock the program_dict_to_row function
         mock_program_dict_to_row.return_value = ("Computer Science", "bachelor", 1)
 
-        mock_db_read_one.return_value = valid_program_row
+        mock_db_read_many.return_value = [valid_program_row]
 
-        mock_db_update.return_value = 0
+        mock_db_update_many.return_value = []
         results, error, status_code = update_programs(valid_program_update_data)
 
         assert results == []
         assert error == [{"message": "Program ID 1 not updated."}]
         assert status_code == 400
-        mock_db_update.assert_called_once()
-        mock_db_read_many.assert_not_called()
+        mock_db_update_many.assert_called_once()
+        mock_db_read_many.assert_called_once_with([1])
 
     def test_update_programs_missing_id(
         self,
         mock_program_dict_to_row,
         mock_db_instance,
-        mock_db_update,
-        mock_db_read_one,
+        mock_db_update_many,
         mock_db_read_many,
         program_missing_id,
     ):
@@ -271,7 +267,7 @@ class TestProgramUpdateService:
         assert results == []
         assert error == [{"message": "Missing program ID for update."}]
         assert status_code == 400
-        mock_db_update.assert_not_called()
+        mock_db_update_many.assert_not_called()
         mock_db_read_many.assert_not_called()
 
 
@@ -280,41 +276,40 @@ class TestProgramArchiveService:
     def test_archive_programs(
         self,
         mock_db_instance,
-        mock_db_archive,
-        mock_db_read_one,
+        mock_db_archive_many,
         mock_db_read_many,
         valid_program_ids,
         valid_program_rows,
     ):
-        mock_db_archive.side_effect = [1, 1]
-        mock_db_read_one.side_effect = valid_program_rows
+        mock_db_archive_many.return_value = [1, 2]
         mock_db_read_many.return_value = valid_program_rows
         results, errors, status = archive_programs(valid_program_ids)
 
         assert len(results) == 2
         assert errors in (None, [])
         assert status == 200
-        assert mock_db_archive.call_count == 2
+        mock_db_archive_many.assert_called_once_with([1, 2])
 
     def test_archive_programs_none_archived(
         self,
         mock_db_instance,
-        mock_db_archive,
-        mock_db_read_one,
+        mock_db_archive_many,
         mock_db_read_many,
         valid_program_ids,
         valid_program_row,
     ):
-        mock_db_read_one.return_value = valid_program_row
-
-        mock_db_archive.return_value = 0
+        mock_db_archive_many.return_value = []
         results, errors, status = archive_programs(valid_program_ids)
 
         assert results == []
         assert len(errors) == 2
 
     def test_archive_programs_invalid_ids(
-        self, mock_db_instance, mock_db_archive, mock_db_read_one, mock_db_read_many
+        self,
+        mock_db_instance,
+        mock_db_archive_many,
+        mock_db_read_one,
+        mock_db_read_many,
     ):
         results, errors, status = archive_programs(["one", 2])
         assert status == 400
@@ -370,8 +365,8 @@ class TestProgramModel:
 
         assert result == [{"id": 1}, {"id": 2}]
         mock_execute.assert_called_once()
-        assert "IN (%s,%s)" in mock_execute.call_args.args[0]
-        assert mock_execute.call_args.args[1] == [1, 2]
+        assert "= ANY(%s)" in mock_execute.call_args.args[0]
+        assert mock_execute.call_args.args[1] == ([1, 2],)
 
     @patch("app.models.program.db.execute_query")
     def test_program_db_insert_success(self, mock_execute, valid_program_row):
@@ -0,0 +1,68 @@
+"""
+Per-request statement counting for route tests.
+
+QueryCounter patches Database.execute_query and Database.execute_many, so
+every statement the real services and models issue is captured and then
+answered by an in-memory FakeDatabase (benchmarks.fake_db).
+assert_query_budget() sends one request through the Flask test client and
+fails, listing the captured SQL, when the route runs more statements than
+its budget.
+"""
+
+import pytest
+from unittest.mock import patch
+from db.database import Database
+
+
+class QueryCounter:
+    def __init__(self, backend):
+        self.backend = backend  # object answering execute_query/execute_many
+        self.statements = []
+        self._patchers = []
+
+    def __len__(self):
+        return len(self.statements)
+
+    def __enter__(self):
+        counter = self
+
+        def execute_query(db, query, params=()):
+            counter.statements.append(query)
+            return counter.backend.execute_query(query, params)
+
+        def execute_many(db, query, param_list):
+            counter.statements.append(query)
+            return counter.backend.execute_many(query, param_list)
+
+        self._patchers = [
+            patch.object(Database, "execute_query", execute_query),
+            patch.object(Database, "execute_many", execute_many),
+        ]
+        for patcher in self._patchers:
+            patcher.start()
+        return self
+
+    def __exit__(self, *exc):
+        for patcher in reversed(self._patchers):
+            patcher.stop()
+        self._patchers = []
+
+    def format(self):
+        return "\n".join(
+            f"  {i}. [{getattr(query, 'name', None) or 'ad-hoc'}] {query}"
+            for i, query in enumerate(self.statements, 1)
+        )
+
+
+def assert_query_budget(client, backend, method, url, budget, **kwargs):
+    """Run one request and fail if it issued more than `budget` statements."""
+    with QueryCounter(backend) as counter:
+        response = client.open(url, method=method, **kwargs)
+
+    if len(counter) > budget:
+        pytest.fail(
+            f"{method} {url} ran {len(counter)} statements, budget is {budget}:\n"
+            f"{counter.format()}",
+            pytrace=False,
+        )
+    return response
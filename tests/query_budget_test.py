@@ -0,0 +1,153 @@
+import pytest
+from benchmarks.fake_db import FakeDatabase
+from db.database import Database
+from tests.query_budget import QueryCounter, assert_query_budget
+
+BULK_SIZE = 100
+
+# url prefix -> (table, payload for one entity)
+ENTITIES = {
+    "/assignments": ("assignments", {"instructor_id": 1, "course_id": 1}),
+    "/course_schedules": (
+        "course_schedule",
+        {"course_id": 1, "day": "Monday", "time": "09:00", "room": "A101"},
+    ),
+    "/courses": (
+        "courses",
+        {"title": "Databases", "code": "CS200", "term_id": 1, "department_id": 1},
+    ),
+    "/departments": ("departments", {"name": "Computer Science"}),
+    "/enrollments": ("enrollments", {"student_id": 1, "course_id": 1, "grade": "A"}),
+    "/instructors": (
+        "instructors",
+        {
+            "first_name": "Ada",
+            "last_name": "Lovelace",
+            "email": "ada@example.com",
+            "employment": "full-time",
+            "status": "active",
+            "department_id": 1,
+        },
+    ),
+    "/programs": (
+        "programs",
+        {"name": "Software", "type": "diploma", "department_id": 1},
+    ),
+    "/students": (
+        "students",
+        {
+            "first_name": "Grace",
+            "last_name": "Hopper",
+            "email": "grace@example.com",
+            "status": "active",
+            "coop": True,
+            "program_id": 1,
+        },
+    ),
+    "/terms": (
+        "terms",
+        {"name": "Fall 2025", "start_date": "2025-09-01", "end_date": "2025-12-19"},
+    ),
+}
+
+# (method, url rule) -> maximum statements per request. Bulk writes are
+# measured with BULK_SIZE items and must not grow with the batch.
+BUDGETS = {
+    ("GET", "/"): 0,
+    ("GET", "/metrics"): 0,
+    # Admin-only diagnostics never touch the database
+    ("GET", "/debug/profile"): 0,
+    ("GET", "/debug/heap"): 0,
+    ("POST", "/debug/heap/start"): 0,
+    ("POST", "/debug/heap/stop"): 0,
+    ("POST", "/debug/heap/snapshot"): 0,
+    ("GET", "/debug/heap/diff"): 0,
+    ("GET", "/debug/heap/route"): 0,
+    ("PUT", "/debug/heap/route"): 0,
+}
+for _prefix in ENTITIES:
+    _id_rule = f"{_prefix}/<int:{_prefix.strip('/').rstrip('s')}_id>"
+    BUDGETS[("GET", _prefix)] = 1
+    BUDGETS[("GET", _id_rule)] = 1
+    BUDGETS[("POST", _prefix)] = 2  # batch insert + read back
+    BUDGETS[("PUT", _prefix)] = 3  # read existing + batch update + read back
+    BUDGETS[("PATCH", _prefix)] = 2  # batch archive + read back
+
+
+@pytest.fixture
+def fake_db():
+    fake = FakeDatabase()
+    for table, payload in ENTITIES.values():
+        fake.seed(table, [payload for _ in range(BULK_SIZE)])
+    return fake
+
+
+def entity_cases():
+    for prefix, (_, payload) in ENTITIES.items():
+        ids = list(range(1, BULK_SIZE + 1))
+        yield "GET", prefix, {}, 200
+        yield "GET", f"{prefix}?active_only=true", {}, 200
+        yield "GET", f"{prefix}/1", {}, 200
+        yield "POST", prefix, {"json": [payload] * BULK_SIZE}, 201
+        yield "PUT", prefix, {"json": [{"id": i, **payload} for i in ids]}, 200
+        yield "PATCH", prefix, {"json": {"ids": ids}}, 200
+
+
+def budget_for(client, method, url):
+    adapter = client.application.url_map.bind("localhost")
+    rule, _ = adapter.match(url.split("?")[0], method=method, return_rule=True)
+    return BUDGETS[(method, rule.rule)]
+
+
+class TestQueryBudgets:
+    def test_every_route_has_a_budget(self, client):
+        routes = {
+            (method, rule.rule)
+            for rule in client.application.url_map.iter_rules()
+            if rule.endpoint != "static"
+            for method in rule.methods - {"HEAD", "OPTIONS"}
+        }
+        missing = routes - BUDGETS.keys()
+        assert not missing, f"Add query budgets for: {sorted(missing)}"
+
+    @pytest.mark.parametrize(
+        "method, url, kwargs, status",
+        list(entity_cases()),
+        ids=lambda value: value if isinstance(value, str) else "",
+    )
+    def test_entity_route_budget(self, client, fake_db, method, url, kwargs, status):
+        budget = budget_for(client, method, url)
+        response = assert_query_budget(client, fake_db, method, url, budget, **kwargs)
+        assert response.status_code == status, response.get_json()
+
+    @pytest.mark.parametrize(
+        "method, url",
+        [
+            (method, rule)
+            for method, rule in BUDGETS
+            if rule.split("/")[1] in ("", "metrics", "debug")
+        ],
+    )
+    def test_non_entity_route_budget(self, client, fake_db, method, url):
+        # Debug routes are requested without the admin token and rejected
+        # before doing any work.
+        response = assert_query_budget(
+            client, fake_db, method, url, BUDGETS[(method, url)]
+        )
+        assert response.status_code < 500
+
+
+class TestQueryCounter:
+    def test_over_budget_lists_statements(self, client, fake_db):
+        with pytest.raises(pytest.fail.Exception) as exc:
+            assert_query_budget(client, fake_db, "GET", "/students", 0)
+
+        message = str(exc.value)
+        assert "GET /students ran 1 statements, budget is 0" in message
+        assert "[students_read_all] SELECT * FROM students;" in message
+
+    def test_restores_database_methods(self, fake_db):
+        original = Database.execute_query
+        with QueryCounter(fake_db):
+            assert Database.execute_query is not original
+        assert Database.execute_query is original
@@ -0,0 +1,237 @@
+import os
+from unittest.mock import patch
+import psycopg2
+import pytest
+from flask import Flask
+from psycopg2.extensions import make_dsn
+from db import routing
+from db.database import Database
+from db.statements import FETCH_ALL, FETCH_NONE, Statement
+from app.utils import init_read_routing
+from app.utils.read_routing import CURRENT_LSN, LSN_COOKIE, LSN_HEADER
+from tests.fake_pool import (
+    ConnectingPool,
+    ExhaustedPool,
+    ListPool,
+    connection,
+    installed,
+)
+
+READ = Statement("routing_read", "SELECT id FROM things WHERE id = %s;", FETCH_ALL)
+WRITE = Statement("routing_write", "UPDATE things SET a = 1 WHERE id = %s;", FETCH_NONE)
+SERVER = Statement(
+    "routing_server", "SELECT current_setting('application_name') AS id;", FETCH_ALL
+)
+
+
+@pytest.fixture
+def replicas(monkeypatch):
+    """A primary and one replica, each with a single mock connection."""
+    monkeypatch.setenv("DB_REPLICA_URLS", "replica-a")
+    monkeypatch.setenv("DB_RETRY_BACKOFF_MS", "0")
+    monkeypatch.setattr(routing, "_replicas_down_until", 0.0)
+    primary = ListPool(connection(rows=[("primary",)]))
+    replica = ListPool(connection(rows=[("replica",)]))
+    with installed(primary, {"replica-a": replica}):
+        yield primary, replica
+
+
+@pytest.fixture
+def scope():
+    """Run the test inside a routing scope; call it to set its options."""
+    tokens = []
+
+    def begin(**options):
+        tokens.append(routing.begin(**options))
+        return routing.current()
+
+    yield begin
+    for token in reversed(tokens):
+        routing.end(token)
+
+
+def read():
+    return Database().execute_query(READ, (1,))[0]["id"]
+
+
+def replica_check(replica):
+    """The cursor that runs the replica's catch-up check."""
+    return replica.idle[0].cursor.return_value
+
+
+class TestRouting:
+    def test_reads_use_replica_and_writes_primary(self, replicas):
+        primary, replica = replicas
+
+        assert read() == "replica"
+        Database().execute_query(WRITE, (1,))
+        assert len(replica.returned) == len(primary.returned) == 1
+
+    def test_without_replicas_reads_use_primary(self, replicas, monkeypatch):
+        monkeypatch.delenv("DB_REPLICA_URLS")
+        assert read() == "primary"
+
+    def test_write_requests_read_from_primary(self, replicas, scope):
+        scope(primary=True)
+        assert read() == "primary"
+
+    def test_reads_after_a_write_stay_on_primary(self, replicas, scope):
+        scope()
+        assert read() == "replica"
+        Database().execute_query(WRITE, (1,))
+        assert read() == "primary"
+
+    def test_lagging_replica_is_skipped(self, replicas, scope):
+        _, replica = replicas
+        replica_check(replica).fetchone.return_value = (False,)
+        state = scope(min_lsn="0/3000060")
+
+        assert read() == "primary"
+        assert read() == "primary"
+        assert state.caught_up is False
+        replica_check(replica).execute.assert_any_call(
+            "SELECT pg_last_wal_replay_lsn() >= %s::pg_lsn;", ("0/3000060",)
+        )
+
+    def test_caught_up_replica_is_checked_once(self, replicas, scope):
+        _, replica = replicas
+        replica_check(replica).fetchone.return_value = (True,)
+        scope(min_lsn="0/3000060")
+
+        assert read() == "replica"
+        assert read() == "replica"
+        checks = [
+            call
+            for call in replica_check(replica).execute.call_args_list
+            if "pg_last_wal_replay_lsn" in call.args[0]
+        ]
+        assert len(checks) == 1
+
+    def test_failed_replica_falls_back_to_primary(self, replicas, monkeypatch):
+        monkeypatch.setenv("DB_READ_RETRIES", "0")
+        _, replica = replicas
+        lost = psycopg2.OperationalError("server closed the connection unexpectedly")
+        replica.idle = [connection(lost=lost)]
+
+        assert read() == "primary"
+        assert routing.use_replica() is False
+
+
+@pytest.fixture
+def routed_app(monkeypatch):
+    monkeypatch.setenv("DB_REPLICA_URLS", "replica-a")
+    app = Flask(__name__)
+    init_read_routing(app)
+    seen = []
+
+    @app.route("/things", methods=["GET", "POST"])
+    def things():
+        scope = routing.current()
+        seen.append((scope.primary, scope.min_lsn))
+        if scope.primary:
+            routing.note_write()
+        return "ok"
+
+    def execute_query(self, query, params=()):
+        assert query == CURRENT_LSN
+        return [{"lsn": "0/3000060"}]
+
+    with patch.object(Database, "execute_query", execute_query):
+        yield app.test_client(), seen
+
+
+class TestReadRoutingMiddleware:
+    def test_write_returns_its_lsn(self, routed_app):
+        client, seen = routed_app
+        response = client.post("/things")
+
+        assert response.headers[LSN_HEADER] == "0/3000060"
+        assert f"{LSN_COOKIE}=0/3000060" in response.headers["Set-Cookie"]
+        assert "HttpOnly" in response.headers["Set-Cookie"]
+        assert seen == [(True, None)]
+        assert routing.current() is None
+
+    def test_reads_carry_the_cookie(self, routed_app):
+        client, seen = routed_app
+        client.post("/things")
+        response = client.get("/things")
+
+        assert LSN_HEADER not in response.headers
+        assert seen[-1] == (False, "0/3000060")
+
+    def test_header_wins_over_cookie(self, routed_app):
+        client, seen = routed_app
+        client.set_cookie(LSN_COOKIE, "0/1")
+        client.get("/things", headers={LSN_HEADER: "1/a0"})
+        assert seen[-1] == (False, "1/A0")
+
+    def test_invalid_lsn_is_ignored(self, routed_app):
+        client, seen = routed_app
+        client.get("/things", headers={LSN_HEADER: "0/1'; DROP TABLE x"})
+        assert seen[-1] == (False, None)
+
+    def test_no_lsn_without_replicas(self, routed_app, monkeypatch):
+        monkeypatch.delenv("DB_REPLICA_URLS")
+        client, _ = routed_app
+        assert LSN_HEADER not in client.post("/things").headers
+
+    @pytest.mark.parametrize(
+        "pool",
+        [
+            ExhaustedPool(),
+            # Nothing listens on port 1: connecting fails with OperationalError
+            ConnectingPool("postgresql://127.0.0.1:1/none?connect_timeout=1"),
+        ],
+        ids=["pool exhausted", "connection refused"],
+    )
+    def test_committed_write_survives_a_failed_lsn_read(self, monkeypatch, pool):
+        monkeypatch.setenv("DB_REPLICA_URLS", "replica-a")
+        app = Flask(__name__)
+        init_read_routing(app)
+
+        @app.route("/things", methods=["POST"])
+        def things():
+            routing.note_write()
+            return "ok"
+
+        with installed(pool):
+            response = app.test_client().post("/things")
+
+        assert response.status_code == 200
+        assert LSN_HEADER not in response.headers
+        assert "Set-Cookie" not in response.headers
+
+
+class TestOnPostgres:
+    """The scratch database plays both roles, told apart by application_name."""
+
+    @pytest.fixture
+    def servers(self, monkeypatch):
+        url = os.getenv("TEST_DATABASE_URL")
+        if not url:
+            pytest.skip("TEST_DATABASE_URL is not set")
+        replica_url = make_dsn(url, application_name="replica")
+        monkeypatch.setenv("DB_REPLICA_URLS", replica_url)
+        monkeypatch.setattr(routing, "_replicas_down_until", 0.0)
+        primary = ConnectingPool(make_dsn(url, application_name="primary"))
+        replica = ConnectingPool(replica_url)
+        with installed(primary, {replica_url: replica}):
+            yield
+        primary.closeall()
+        replica.closeall()
+
+    def server(self):
+        return Database().execute_query(SERVER)[0]["id"]
+
+    def test_reads_use_replica(self, servers, scope):
+        scope()
+        assert self.server() == "replica"
+
+    def test_server_that_is_not_replaying_wal_is_skipped(self, servers, scope):
+        # pg_last_wal_replay_lsn() is NULL outside recovery
+        scope(min_lsn="0/0")
+        assert self.server() == "primary"
+
+    def test_current_lsn(self, servers):
+        [row] = Database().execute_query(CURRENT_LSN)
+        assert "/" in row["lsn"]
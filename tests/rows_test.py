@@ -0,0 +1,56 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from db.rows import Row, row_class, rows_from_cursor
+from app.utils.routes_helpers import api_response
+
+
+def make_cursor(*columns):
+    cursor = MagicMock()
+    cursor.description = [SimpleNamespace(name=name) for name in columns]
+    return cursor
+
+
+class TestRow:
+    def test_mapping_access(self):
+        row = row_class(("id", "name"))((1, "Ada"))
+
+        assert row["name"] == "Ada"
+        assert row.get("missing") is None
+        assert "id" in row
+        assert list(row) == ["id", "name"]
+        assert dict(row) == {"id": 1, "name": "Ada"}
+        assert {**row, "name": "Grace"} == {"id": 1, "name": "Grace"}
+        assert row == {"id": 1, "name": "Ada"}
+
+    def test_row_class_is_shared(self):
+        assert row_class(["id", "name"]) is row_class(("id", "name"))
+
+    def test_rows_have_no_instance_dict(self):
+        row = row_class(("id",))((1,))
+        assert not hasattr(row, "__dict__")
+
+    def test_rows_from_cursor(self):
+        cursor = make_cursor("id", "name")
+        rows = rows_from_cursor(cursor, [(1, "Ada"), (2, "Alan")])
+
+        assert all(isinstance(row, Row) for row in rows)
+        assert type(rows[0]) is type(rows[1])
+        assert rows[1]["name"] == "Alan"
+
+    def test_rows_from_cursor_empty(self):
+        assert rows_from_cursor(make_cursor("id"), []) == []
+
+
+class TestRowJSONEncoding:
+    def test_api_response_encodes_rows(self, client):
+        rows = rows_from_cursor(make_cursor("id", "name"), [(1, "Ada")])
+
+        with client.application.app_context():
+            response, status = api_response(rows)
+
+        assert status == 200
+        assert json.loads(response.get_data()) == {
+            "message": "Success",
+            "data": [{"id": 1, "name": "Ada"}],
+        }
@@ -0,0 +1,64 @@
+import time
+from unittest.mock import patch
+from flask import Flask
+from app.utils import add_timing, timed, timed_service
+from app.utils.server_timing import build_server_timing_header
+
+
+def parse_header(header):
+    timings = {}
+    for entry in header.split(", "):
+        name, dur, _ = entry.split(";")
+        timings[name] = float(dur.split("=")[1])
+    return timings
+
+
+class TestServerTimingHeader:
+    @patch("app.routes.student.get_all_students")
+    def test_header_absent_by_default(self, mock_get_all, client):
+        mock_get_all.return_value = []
+        response = client.get("/students")
+        assert "Server-Timing" not in response.headers
+
+    def test_header_enabled_by_request_header(self, client):
+        response = client.get("/students", headers={"X-Server-Timing": "1"})
+
+        timings = parse_header(response.headers["Server-Timing"])
+        assert set(timings) == {"pool", "db", "json", "total"}
+        assert timings["total"] >= timings["db"]
+
+    def test_header_enabled_by_config(self, client):
+        client.application.config["SERVER_TIMING"] = True
+        response = client.patch("/students", json={"ids": [1]})
+
+        timings = parse_header(response.headers["Server-Timing"])
+        assert "service" in timings
+
+
+class TestTimingHelpers:
+    def test_timed_accumulates(self):
+        app = Flask(__name__)
+        with app.test_request_context():
+            with timed("json"):
+                time.sleep(0.001)
+            add_timing("json", 0.5)
+
+            timings = parse_header(build_server_timing_header(1.0))
+            assert timings["json"] >= 500
+            assert timings["total"] == 1000.0
+
+    def test_timed_service_excludes_db_time(self):
+        app = Flask(__name__)
+
+        @timed_service
+        def service():
+            return "done"
+
+        with app.test_request_context():
+            with patch("app.utils.server_timing._db_seconds", side_effect=[0.0, 10.0]):
+                assert service() == "done"
+            timings = parse_header(build_server_timing_header(1.0))
+            assert timings["service"] == 0.0
+
+    def test_add_timing_outside_request(self):
+        add_timing("json", 1.0)
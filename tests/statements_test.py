@@ -0,0 +1,144 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from datetime import date
+import app.models  # noqa: F401 - declares the statement catalog
+from db.database import Database
+from db.db_utils import to_array_literal, to_column_arrays
+from db.statements import (
+    Statement,
+    declare_statement,
+    get_statement,
+    all_statements,
+    FETCH_ALL,
+    FETCH_NONE,
+)
+
+
+# =======================
+# Fixtures
+# =======================
+
+
+@pytest.fixture
+def mock_pool():
+    pool = MagicMock()
+    conn = MagicMock(closed=0)
+    conn.cursor.return_value.description = [SimpleNamespace(name="id")]
+    conn.cursor.return_value.fetchall.return_value = [(1,)]
+    pool.getconn.return_value = conn
+    with (
+        patch.object(Database, "_pool", pool),
+        patch.object(Database, "_db_config", {"database": "test"}),
+    ):
+        yield pool
+
+
+# =======================
+# Statement Tests
+# =======================
+
+
+class TestStatement:
+    def test_statement_metadata(self):
+        stmt = Statement(
+            "things_update", "UPDATE things\n SET a = %s WHERE id = %s;", FETCH_NONE
+        )
+        assert stmt == "UPDATE things SET a = %s WHERE id = %s;"
+        assert stmt.arity == 2
+        assert stmt.prepare_sql == (
+            "PREPARE things_update AS UPDATE things SET a = $1 WHERE id = $2"
+        )
+        assert stmt.execute_sql == "EXECUTE things_update (%s, %s)"
+
+    def test_statement_without_params(self):
+        stmt = Statement("things_read_all", "SELECT * FROM things;", FETCH_ALL)
+        assert stmt.arity == 0
+        assert stmt.execute_sql == "EXECUTE things_read_all"
+
+    def test_statement_question_mark_placeholders(self):
+        stmt = Statement("things_read", "SELECT * FROM things WHERE id = ?;", FETCH_ALL)
+        assert stmt == "SELECT * FROM things WHERE id = %s;"
+        assert stmt.arity == 1
+
+    def test_check_params_arity(self):
+        stmt = Statement(
+            "things_read", "SELECT * FROM things WHERE id = %s;", FETCH_ALL
+        )
+        stmt.check_params((1,))
+        with pytest.raises(ValueError):
+            stmt.check_params((1, 2))
+
+    def test_invalid_fetch_mode(self):
+        with pytest.raises(ValueError):
+            Statement("things_read", "SELECT 1;", "many")
+
+    def test_declare_duplicate_name(self):
+        with pytest.raises(ValueError):
+            declare_statement("students_read_all", "SELECT 1;", FETCH_ALL)
+
+    def test_declare_invalid_name(self):
+        with pytest.raises(ValueError):
+            declare_statement("students; DROP", "SELECT 1;", FETCH_ALL)
+
+    def test_catalog_contains_model_statements(self):
+        names = {stmt.name for stmt in all_statements()}
+        assert "students_read_by_ids" in names
+        assert "course_schedule_archive" in names
+        assert get_statement("enrollments_read_by_ids").arity == 1
+
+
+# =======================
+# Database Tests
+# =======================
+
+
+class TestArrayLiterals:
+    def test_to_array_literal(self):
+        literal = to_array_literal(["a", None, True, 3, date(2024, 1, 31)])
+        assert literal == '{"a",NULL,"t","3","2024-01-31"}'
+
+    def test_to_array_literal_escapes(self):
+        assert to_array_literal(['say "hi"', "back\\slash", "NULL"]) == (
+            '{"say \\"hi\\"","back\\\\slash","NULL"}'
+        )
+
+    def test_to_column_arrays(self):
+        assert to_column_arrays([(1, "a"), (2, "b")]) == ('{"1","2"}', '{"a","b"}')
+
+
+class TestDatabasePreparedStatements:
+    def test_prepares_once_per_connection(self, mock_pool):
+        stmt = get_statement("students_read_by_id")
+        db = Database()
+
+        assert db.execute_query(stmt, (1,)) == [{"id": 1}]
+        db.execute_query(stmt, (2,))
+
+        cursor = mock_pool.getconn.return_value.cursor.return_value
+        executed = [call.args[0] for call in cursor.execute.call_args_list]
+        assert executed == [
+            stmt.prepare_sql,
+            stmt.execute_sql,
+            stmt.execute_sql,
+        ]
+
+    def test_fetch_none_returns_cursor(self, mock_pool):
+        stmt = get_statement("students_archive")
+        cursor = Database().execute_query(stmt, (1,))
+
+        assert cursor is mock_pool.getconn.return_value.cursor.return_value
+        cursor.fetchall.assert_not_called()
+
+    def test_prepared_statements_disabled(self, mock_pool, monkeypatch):
+        monkeypatch.setenv("DB_PREPARED_STATEMENTS", "false")
+        stmt = get_statement("students_read_by_id")
+        Database().execute_query(stmt, (1,))
+
+        cursor = mock_pool.getconn.return_value.cursor.return_value
+        cursor.execute.assert_called_once_with(stmt, (1,))
+
+    def test_arity_mismatch_raises(self, mock_pool):
+        stmt = get_statement("students_read_by_id")
+        with pytest.raises(ValueError):
+            Database().execute_query(stmt, (1, 2))
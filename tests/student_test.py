@@ -1,6 +1,8 @@
+import os
 import pytest
 from datetime import date
-from unittest.mock import patch
+from unittest.mock import call, patch
+from psycopg2.extensions import make_dsn
 from app.models import (
     student_db_read_all,
     student_db_read_by_id,
@@ -16,6 +18,7 @@ from app.services import (
     update_students,
     archive_students,
 )
+from tests.fake_pool import ConnectingPool, installed
 
 # =======================
 # Fixtures
@@ -120,20 +123,20 @@ def mock_db_read_many():
 
 
 @pytest.fixture
-def mock_db_create():
-    with patch("app.services.student.student_db_insert") as mock:
+def mock_db_create_many():
+    with patch("app.services.student.student_db_insert_many") as mock:
         yield mock
 
 
 @pytest.fixture
-def mock_db_update():
-    with patch("app.services.student.student_db_update") as mock:
+def mock_db_update_many():
+    with patch("app.services.student.student_db_update_many") as mock:
         yield mock
 
 
 @pytest.fixture
-def mock_db_archive():
-    with patch("app.services.student.student_db_archive") as mock:
+def mock_db_archive_many():
+    with patch("app.services.student.student_db_archive_many") as mock:
         yield mock
 
 
@@ -176,7 +179,7 @@ class TestStudentCreateService:
         self,
         mock_student_dict_to_row,
         mock_db_instance,
-        mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_student_create_data,
         valid_student_rows,
@@ -189,7 +192,7 @@ class TestStudentCreateService:
             "MockCursor", (), {"lastrowid": None}
         )()
 
-        mock_db_create.side_effect = [1, 2]
+        mock_db_create_many.return_value = [1, 2]
         mock_db_read_many.return_value = valid_student_rows
 
         results, error, status_code = create_new_students(valid_student_create_data)
@@ -197,14 +200,14 @@ class TestStudentCreateService:
         assert len(results) == 2
         assert error is None
         assert status_code == 201
-        assert mock_db_create.call_count == 2
+        mock_db_create_many.assert_called_once()
         mock_db_read_many.assert_called_once_with([1, 2])
 
     def test_create_new_students_failure(
         self,
         mock_student_dict_to_row,
         mock_db_instance,
-        mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_student_create_data,
     ):
@@ -216,7 +219,7 @@ class TestStudentCreateService:
             "MockCursor", (), {"lastrowid": None}
         )()
 
-        mock_db_create.side_effect = [None, None]
+        mock_db_create_many.return_value = []
         results, error, status_code = create_new_students(valid_student_create_data)
 
         assert results == []
@@ -232,9 +235,8 @@ class TestStudentUpdateService:
         self,
         mock_student_dict_to_row,
         mock_db_instance,
-        mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_student_update_data,
         valid_student_row,
     ):
@@ -246,8 +248,7 @@ class TestStudentUpdateService:
             "MockCursor", (), {"rowcount": 1}
         )()
 
-        mock_db_update.return_value = 1
-        mock_db_read_one.return_value = valid_student_row
+        mock_db_update_many.return_value = [1]
         mock_db_read_many.return_value = [valid_student_row]
 
         results, error, status_code = update_students(valid_student_update_data)
@@ -255,16 +256,15 @@ class TestStudentUpdateService:
         assert len(results) == 1
         assert error in (None, [])
         assert status_code == 200
-        assert mock_db_update.call_count == 1
-        mock_db_read_many.assert_called_once_with([1])
+        mock_db_update_many.assert_called_once()
+        assert mock_db_read_many.call_args_list == [call([1]), call([1])]
 
     def test_update_students_no_success(
         self,
         mock_student_dict_to_row,
         mock_db_instance,
-        mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_student_update_data,
     ):
         # Mock the converter function
@@ -275,24 +275,23 @@ class TestStudentUpdateService:
             "MockCursor", (), {"rowcount": 0}
         )()
 
-        mock_db_read_one.return_value = {"id": 1}  # Record exists
+        mock_db_read_many.return_value = [{"id": 1}]
 
-        mock_db_update.return_value = 0
+        mock_db_update_many.return_value = []
         results, error, status_code = update_students(valid_student_update_data)
 
         assert results == []
         assert error == [{"message": "Student ID 1 not updated."}]
         assert status_code == 400
-        mock_db_update.assert_called_once()
-        mock_db_read_many.assert_not_called()
+        mock_db_update_many.assert_called_once()
+        mock_db_read_many.assert_called_once_with([1])
 
     def test_update_students_missing_id(
         self,
         mock_student_dict_to_row,
         mock_db_instance,
-        mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         student_missing_id,
     ):
         # Mock the converter function
@@ -308,17 +307,58 @@ class TestStudentUpdateService:
         assert results == []
         assert error == [{"message": "Missing student ID for update."}]
         assert status_code == 400
-        mock_db_update.assert_not_called()
+        mock_db_update_many.assert_not_called()
         mock_db_read_many.assert_not_called()
 
+    def test_update_students_string_id(
+        self,
+        mock_student_dict_to_row,
+        mock_db_instance,
+        mock_db_update_many,
+        mock_db_read_many,
+        valid_student_update_data,
+        valid_student_row,
+    ):
+        mock_student_dict_to_row.side_effect = lambda d: tuple(d.values())
+        mock_db_update_many.return_value = [1]
+        mock_db_read_many.return_value = [valid_student_row]
+        data = [{**item, "id": "1"} for item in valid_student_update_data]
+
+        results, error, status_code = update_students(data)
+
+        assert len(results) == 1
+        assert error is None
+        assert status_code == 200
+        assert mock_db_read_many.call_args_list == [call([1]), call([1])]
+        assert mock_db_update_many.call_args.args[0] == [1]
+
+    @pytest.mark.parametrize("entity_id", ["abc", "1.5", 1.5, True, [1]])
+    def test_update_students_invalid_id(
+        self,
+        mock_student_dict_to_row,
+        mock_db_instance,
+        mock_db_update_many,
+        mock_db_read_many,
+        valid_student_update_data,
+        entity_id,
+    ):
+        data = [{**item, "id": entity_id} for item in valid_student_update_data]
+
+        results, error, status_code = update_students(data)
+
+        assert results == []
+        assert error == [{"message": f"Student ID {entity_id} not found."}]
+        assert status_code == 400
+        mock_db_read_many.assert_not_called()
+        mock_db_update_many.assert_not_called()
+
 
 @patch("app.models.student.db")
 class TestStudentArchiveService:
     def test_archive_students(
         self,
         mock_db_instance,
-        mock_db_archive,
-        mock_db_read_one,
+        mock_db_archive_many,
         mock_db_read_many,
         valid_student_ids,
     ):
@@ -327,23 +367,19 @@ class TestStudentArchiveService:
             "MockCursor", (), {"rowcount": 1}
         )()
 
-        # Mock existing record lookup (bulk operations check if record exists first)
-        mock_db_read_one.return_value = {"id": 1}  # Record exists
-
         # Mock reading archived records at the end
         mock_db_read_many.return_value = [{"id": 1}, {"id": 2}]
 
-        mock_db_archive.side_effect = [1, 1]
+        mock_db_archive_many.return_value = [1, 2]
         archived = archive_students(valid_student_ids)
 
         assert len(archived[0]) == 2
-        assert mock_db_archive.call_count == 2
+        mock_db_archive_many.assert_called_once_with([1, 2])
 
     def test_archive_students_none_archived(
         self,
         mock_db_instance,
-        mock_db_archive,
-        mock_db_read_one,
+        mock_db_archive_many,
         mock_db_read_many,
         valid_student_ids,
     ):
@@ -352,13 +388,10 @@ class TestStudentArchiveService:
             "MockCursor", (), {"rowcount": 0}
         )()
 
-        # Mock existing record lookup (bulk operations check if record exists first)
-        mock_db_read_one.return_value = {"id": 1}  # Record exists
-
         # Mock reading archived records at the end (empty since none archived)
         mock_db_read_many.return_value = []
 
-        mock_db_archive.return_value = 0
+        mock_db_archive_many.return_value = []
         archived = archive_students(valid_student_ids)
 
         assert archived[0] == []
@@ -427,8 +460,8 @@ class TestStudentModel:
         mock_execute.assert_called_once()
 
         query_call = mock_execute.call_args.args[0]
-        assert "IN (%s,%s)" in query_call
-        assert mock_execute.call_args.args[1] == [1, 2]
+        assert "= ANY(%s)" in query_call
+        assert mock_execute.call_args.args[1] == ([1, 2],)
 
     @patch("app.models.student.db.execute_query")
     def test_student_db_insert_success(self, mock_execute, valid_student_row):
@@ -718,3 +751,32 @@ class TestStudentArchiveRoute:
 
         assert response.status_code == 500
         assert "internal server error: db failure." in data["error"].lower()
+
+
+class TestStudentRoutesOnPostgres:
+    def test_bulk_update_accepts_string_ids(self, client, pg):
+        with pg.cursor() as cursor:
+            cursor.execute("SELECT current_schema();")
+            [schema] = cursor.fetchone()
+            cursor.execute(
+                "SELECT id, city FROM students WHERE is_archived = FALSE"
+                " ORDER BY id LIMIT 2;"
+            )
+            students = cursor.fetchall()
+        pool = ConnectingPool(
+            make_dsn(
+                os.environ["TEST_DATABASE_URL"], options=f"-c search_path={schema}"
+            )
+        )
+
+        with installed(pool):
+            response = client.put(
+                "/students",
+                json=[{"id": str(id), "city": city} for id, city in students],
+            )
+        pool.closeall()
+
+        assert response.status_code == 200
+        assert [student["id"] for student in response.get_json()["data"]] == [
+            id for id, _ in students
+        ]
@@ -1,6 +1,6 @@
 import pytest
 from datetime import date
-from unittest.mock import patch
+from unittest.mock import call, patch
 from app.models import (
     term_db_read_all,
     term_db_read_by_id,
@@ -109,14 +109,14 @@ def mock_db_read_many():
 
 
 @pytest.fixture
-def mock_db_create():
-    with patch("app.services.term.term_db_insert") as mock:
+def mock_db_create_many():
+    with patch("app.services.term.term_db_insert_many") as mock:
         yield mock
 
 
 @pytest.fixture
-def mock_db_update():
-    with patch("app.services.term.term_db_update") as mock:
+def mock_db_update_many():
+    with patch("app.services.term.term_db_update_many") as mock:
         yield mock
 
 
@@ -126,8 +126,8 @@ def valid_term_ids():
 
 
 @pytest.fixture
-def mock_db_archive():
-    with patch("app.services.term.term_db_archive") as mock:
+def mock_db_archive_many():
+    with patch("app.services.term.term_db_archive_many") as mock:
         yield mock
 
 
@@ -173,7 +173,7 @@ class TestTermCreateService:
         self,
         mock_term_dict_to_row,
         mock_db_instance,
-        mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_term_create_data,
         valid_term_rows,
@@ -187,7 +187,7 @@ class TestTermCreateService:
         )()
 
         # PostgreSQL insert returns IDs via RETURNING
-        mock_db_create.side_effect = [1, 2]
+        mock_db_create_many.return_value = [1, 2]
 
         # Handle PostgreSQL format for read_many
         mock_db_read_many.return_value = valid_term_rows
@@ -197,14 +197,14 @@ class TestTermCreateService:
         assert len(results) == 2
         assert error is None
         assert status_code == 201
-        assert mock_db_create.call_count == 2
+        mock_db_create_many.assert_called_once()
         mock_db_read_many.assert_called_once_with([1, 2])
 
     def test_create_new_terms_failure(
         self,
         mock_term_dict_to_row,
         mock_db_instance,
-        mock_db_create,
+        mock_db_create_many,
         mock_db_read_many,
         valid_term_create_data,
     ):
@@ -216,7 +216,7 @@ class TestTermCreateService:
             "MockCursor", (), {"lastrowid": None}
         )()
 
-        mock_db_create.side_effect = [None, None]
+        mock_db_create_many.return_value = []
         results, error, status_code = create_new_terms(valid_term_create_data)
 
         assert results == []
@@ -232,9 +232,8 @@ class TestTermUpdateService:
         self,
         mock_term_dict_to_row,
         mock_db_instance,
-        mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_term_update_data,
         valid_term_row,
     ):
@@ -246,10 +245,9 @@ class TestTermUpdateService:
             "MockCursor", (), {"rowcount": 1}
         )()
 
-        mock_db_update.return_value = 1
+        mock_db_update_many.return_value = [1]
 
-        # Handle PostgreSQL format for read_one (used by bulk operations)
-        mock_db_read_one.return_value = valid_term_row
+        # Existing rows are read in one batch, then re-read after the update
         mock_db_read_many.return_value = [valid_term_row]
 
         results, error, status_code = update_terms(valid_term_update_data)
@@ -257,16 +255,15 @@ class TestTermUpdateService:
         assert len(results) == 1
         assert error in (None, [])
         assert status_code == 200
-        assert mock_db_update.call_count == 1
-        mock_db_read_many.assert_called_once_with([1])
+        mock_db_update_many.assert_called_once()
+        assert mock_db_read_many.call_args_list == [call([1]), call([1])]
 
     def test_update_terms_no_success(
         self,
         mock_term_dict_to_row,
         mock_db_instance,
-        mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         valid_term_update_data,
     ):
         # Mock the converter function
@@ -278,24 +275,23 @@ class TestTermUpdateService:
         )()
 
         # Mock existing record lookup (bulk operations check if record exists first)
-        mock_db_read_one.return_value = {"id": 1}  # Record exists
+        mock_db_read_many.return_value = [{"id": 1}]
 
-        mock_db_update.return_value = 0
+        mock_db_update_many.return_value = []
         results, error, status_code = update_terms(valid_term_update_data)
 
         assert results == []
         assert error == [{"message": "Term ID 1 not updated."}]
         assert status_code == 400
-        mock_db_update.assert_called_once()
-        mock_db_read_many.assert_not_called()
+        mock_db_update_many.assert_called_once()
+        mock_db_read_many.assert_called_once_with([1])
 
     def test_update_terms_missing_id(
         self,
         mock_term_dict_to_row,
         mock_db_instance,
-        mock_db_update,
+        mock_db_update_many,
         mock_db_read_many,
-        mock_db_read_one,
         term_missing_id,
     ):
         # Mock the converter function
@@ -311,7 +307,7 @@ class TestTermUpdateService:
         assert results == []
         assert error == [{"message": "Missing term ID for update."}]
         assert status_code == 400
-        mock_db_update.assert_not_called()
+        mock_db_update_many.assert_not_called()
         mock_db_read_many.assert_not_called()
 
 
@@ -320,8 +316,7 @@ class TestTermArchiveService:
     def test_archive_terms(
         self,
         mock_db_instance,
-        mock_db_archive,
-        mock_db_read_one,
+        mock_db_archive_many,
         mock_db_read_many,
         valid_term_ids,
     ):
@@ -330,23 +325,19 @@ class TestTermArchiveService:
             "MockCursor", (), {"rowcount": 1}
         )()
 
-        # Mock existing record lookup (bulk operations check if record exists first)
-        mock_db_read_one.return_value = {"id": 1}  # Record exists
-
         # Mock reading archived records at the end
         mock_db_read_many.return_value = [{"id": 1}, {"id": 2}]
 
-        mock_db_archive.side_effect = [1, 1]
+        mock_db_archive_many.return_value = [1, 2]
         archived, errors, status_code = archive_terms(valid_term_ids)
 
         assert len(archived) == 2
-        assert mock_db_archive.call_count == 2
+        mock_db_archive_many.assert_called_once_with([1, 2])
 
     def test_archive_terms_none_archived(
         self,
         mock_db_instance,
-        mock_db_archive,
-        mock_db_read_one,
+        mock_db_archive_many,
         mock_db_read_many,
         valid_term_ids,
     ):
@@ -355,13 +346,10 @@ class TestTermArchiveService:
             "MockCursor", (), {"rowcount": 0}
         )()
 
-        # Mock existing record lookup (bulk operations check if record exists first)
-        mock_db_read_one.return_value = {"id": 1}  # Record exists
-
         # Mock reading archived records at the end (empty since none archived)
         mock_db_read_many.return_value = []
 
-        mock_db_archive.return_value = 0
+        mock_db_archive_many.return_value = []
         archived, errors, status_code = archive_terms(valid_term_ids)
 
         assert archived == []
@@ -417,8 +405,8 @@ class TestTermModel:
 
         assert result == [{"id": "t1"}, {"id": "t2"}]
         mock_execute.assert_called_once()
-        assert "IN (%s,%s)" in mock_execute.call_args.args[0]
-        assert mock_execute.call_args.args[1] == [1, 2]
+        assert "= ANY(%s)" in mock_execute.call_args.args[0]
+        assert mock_execute.call_args.args[1] == ([1, 2],)
 
     @patch("app.models.term.db.execute_query")
     def test_term_db_insert_success(self, mock_execute, valid_term_row):
@@ -0,0 +1,95 @@
+import json
+import pytest
+from app.utils import start_span, traced
+from app.utils.tracing import FileExporter, Trace, Span, set_exporter, to_otlp_payload
+
+
+class ListExporter:
+    def __init__(self):
+        self.traces = []
+
+    def export(self, spans):
+        self.traces.append(list(spans))
+
+
+@pytest.fixture
+def exporter():
+    exporter = ListExporter()
+    set_exporter(exporter)
+    yield exporter
+    set_exporter(None)
+
+
+def by_name(spans):
+    return {span.name: span for span in spans}
+
+
+class TestRequestTracing:
+    def test_not_sampled_by_default(self, client, exporter):
+        client.get("/students")
+        assert exporter.traces == []
+
+    def test_span_hierarchy(self, client, exporter, monkeypatch):
+        monkeypatch.setenv("TRACE_SAMPLE_RATE", "1")
+        response = client.patch("/students", json={"ids": [1]})
+
+        assert len(exporter.traces) == 1
+        spans = by_name(exporter.traces[0])
+        root = spans["PATCH /students"]
+        service = spans["student.archive_students"]
+        helper = spans["service_helper.bulk_archive_entities"]
+        items = spans["bulk_archive_entities.items"]
+        query = spans["db.students_archive_many"]
+
+        assert root.parent_span_id is None
+        assert service.parent_span_id == root.span_id
+        assert helper.parent_span_id == service.span_id
+        assert items.parent_span_id == helper.span_id
+        assert query.parent_span_id == items.span_id
+        assert query.attributes["db.statement"].startswith("UPDATE students")
+        assert root.attributes["http.response.status_code"] == 422
+        assert len({span.trace.trace_id for span in spans.values()}) == 1
+        assert root.trace.trace_id in response.headers["traceparent"]
+
+    def test_incoming_traceparent(self, client, exporter):
+        trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+        parent_id = "00f067aa0ba902b7"
+        client.get("/", headers={"traceparent": f"00-{trace_id}-{parent_id}-01"})
+
+        root = exporter.traces[0][-1]
+        assert root.trace.trace_id == trace_id
+        assert root.parent_span_id == parent_id
+
+    def test_incoming_traceparent_not_sampled(self, client, exporter, monkeypatch):
+        monkeypatch.setenv("TRACE_SAMPLE_RATE", "1")
+        trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+        client.get("/", headers={"traceparent": f"00-{trace_id}-00f067aa0ba902b7-00"})
+        assert exporter.traces == []
+
+
+class TestSpanApi:
+    def test_start_span_without_trace_is_noop(self):
+        with start_span("nothing") as span:
+            assert span is None
+
+    def test_traced_without_trace(self):
+        @traced
+        def add(a, b):
+            return a + b
+
+        assert add(1, 2) == 3
+
+    def test_file_exporter(self, tmp_path):
+        trace = Trace()
+        span = Span(trace, "GET /")
+        span.set_attribute("http.response.status_code", 200)
+        span.end()
+
+        path = tmp_path / "traces.jsonl"
+        FileExporter(str(path)).export(trace.spans)
+
+        payload = json.loads(path.read_text())
+        assert payload == to_otlp_payload(trace.spans)
+        otlp_span = payload["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+        assert otlp_span["traceId"] == trace.trace_id
+        assert otlp_span["attributes"][0]["value"] == {"intValue": "200"}
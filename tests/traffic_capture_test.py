@@ -0,0 +1,106 @@
+import json
+import pytest
+from unittest.mock import patch
+from werkzeug.datastructures import MultiDict
+from app.utils import body_shape, sanitize_query
+
+
+@pytest.fixture
+def capture_file(tmp_path, monkeypatch):
+    path = tmp_path / "capture.jsonl"
+    monkeypatch.setenv("TRAFFIC_CAPTURE_FILE", str(path))
+    return path
+
+
+def read_records(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestBodyShape:
+    def test_scalars(self):
+        assert body_shape("Ada") == "str"
+        assert body_shape("2025-09-01") == "date"
+        assert body_shape(3) == "int"
+        assert body_shape(1.5) == "float"
+        assert body_shape(True) == "bool"
+        assert body_shape(None) == "null"
+
+    def test_ids_are_kept(self):
+        shape = body_shape({"ids": [1, 2], "program_id": 7, "credits": 3})
+        assert shape == {"ids": [1, 2], "program_id": 7, "credits": "int"}
+
+    def test_lists_record_length_and_first_item(self):
+        shape = body_shape([{"email": "ada@example.com", "credits": 3}] * 3)
+        assert shape == {"$list": 3, "item": {"email": "str", "credits": "int"}}
+        assert body_shape(["a", "b"]) == {"$list": 2, "item": "str"}
+        assert body_shape([]) == {"$list": 0, "item": None}
+
+    def test_lists_keep_the_ids_of_every_item(self):
+        shape = body_shape(
+            [
+                {"id": 1, "grade": "B", "course_id": 5},
+                {"id": 2, "grade": "A"},
+                {"id": 1, "grade": "C", "course_id": "x"},
+            ]
+        )
+        assert shape == {
+            "$list": 3,
+            "item": {"grade": "str"},
+            "$ids": {"id": [1, 2, 1], "course_id": [5, None, "str"]},
+        }
+
+    def test_archive_ids_are_kept(self):
+        assert body_shape([3, 1, 2]) == [3, 1, 2]
+        assert body_shape({"ids": [3, 1]}) == {"ids": [3, 1]}
+
+
+class TestSanitizeQuery:
+    def test_sensitive_keys_are_redacted(self):
+        args = MultiDict([("active_only", "true"), ("api_key", "abc"), ("tag", "a")])
+        args.add("tag", "b")
+        assert sanitize_query(args) == {
+            "active_only": ["true"],
+            "api_key": "[redacted]",
+            "tag": ["a", "b"],
+        }
+
+
+class TestCaptureMiddleware:
+    def test_disabled_by_default(self, client, tmp_path, monkeypatch):
+        monkeypatch.delenv("TRAFFIC_CAPTURE_FILE", raising=False)
+        client.get("/")
+        assert list(tmp_path.iterdir()) == []
+
+    @patch("app.routes.student.create_new_students")
+    def test_records_sanitized_request(self, mock_create, client, capture_file):
+        mock_create.return_value = ([{"id": 1}], None, None)
+        body = [{"first_name": "Ada", "email": "ada@example.com", "program_id": 2}]
+        client.post("/students?token=secret", json=body)
+
+        [record] = read_records(capture_file)
+        assert record["method"] == "POST"
+        assert record["route"] == "/students"
+        assert record["query"] == {"token": "[redacted]"}
+        assert record["body_shape"] == {
+            "$list": 1,
+            "item": {"first_name": "str", "email": "str"},
+            "$ids": {"program_id": [2]},
+        }
+        assert record["body_bytes"] > 0
+        assert "ada@example.com" not in capture_file.read_text()
+        assert record["status"] == 201
+        assert record["duration_ms"] >= 0
+
+    def test_skips_metrics_and_debug(self, client, capture_file):
+        client.get("/metrics")
+        client.get("/debug/heap")
+        assert not capture_file.exists()
+
+    def test_sample_rate(self, client, capture_file, monkeypatch):
+        monkeypatch.setenv("TRAFFIC_CAPTURE_SAMPLE_RATE", "0")
+        client.get("/")
+        assert not capture_file.exists()
+
+    def test_write_failure_does_not_break_request(self, client, tmp_path, monkeypatch):
+        monkeypatch.setenv("TRAFFIC_CAPTURE_FILE", str(tmp_path / "missing" / "x"))
+        assert client.get("/").status_code == 200